@@ -6,10 +6,12 @@ from django.contrib import admin
 from django.utils.html import format_html
 from django.urls import reverse
 from django.utils import timezone
+from django.db import transaction
 from django.contrib.auth import get_user_model
 from .models import (
     Transcript, ActionItem, DailyReport, SystemEvent, 
-    ProcessedTaskData, RawTranscriptCache, GeminiProcessedTask
+    ProcessedTaskData, RawTranscriptCache, GeminiProcessedTask, ExtractionJob, Person,
+    MondayDelivery, MondayOutbox, MondayRoute, MondayPushJob
 )
 
 
@@ -246,10 +248,15 @@ class ProcessedTaskDataAdmin(admin.ModelAdmin):
     
     def approve_for_delivery(self, request, queryset):
         """Bulk approve tasks for delivery"""
+        from .monday_outbox import enqueue_delivery
+        
         count = 0
-        for task in queryset.filter(human_approved=False):
-            task.approve_for_delivery(user=request.user, notes="Bulk approved via admin")
-            count += 1
+        with transaction.atomic():
+            tasks = list(queryset.filter(human_approved=False))
+            for task in tasks:
+                task.approve_for_delivery(user=request.user, notes="Bulk approved via admin")
+                count += 1
+            enqueue_delivery(tasks, source='approval')
         self.message_user(request, f"Approved {count} tasks for delivery.")
     approve_for_delivery.short_description = "Approve selected tasks for delivery"
     
@@ -368,7 +375,8 @@ class GeminiProcessedTaskAdmin(admin.ModelAdmin):
         'meets_description_requirement',
         'approval_status',             # Auto-push approval status
         'auto_push_enabled',           # Auto-push enabled
-        'auto_mute_enabled'            # Auto-mute enabled
+        'auto_mute_enabled',           # Auto-mute enabled
+        ('duplicate_of', admin.EmptyFieldListFilter),  # Near-duplicates of open tasks
     ]
     
     # Search across Monday.com relevant fields
@@ -389,7 +397,8 @@ class GeminiProcessedTaskAdmin(admin.ModelAdmin):
         'id', 'processing_timestamp', 'meets_word_count_requirement', 
         'meets_description_requirement', 'delivery_timestamp', 
         'created_at', 'updated_at', 'due_date_datetime',
-        'monday_item_id'  # Monday.com assigns this automatically
+        'monday_item_id',  # Monday.com assigns this automatically
+        'duplicate_of', 'duplicate_similarity'
     ]
     
     # Fieldsets organized like Monday.com columns
@@ -408,6 +417,7 @@ class GeminiProcessedTaskAdmin(admin.ModelAdmin):
             'fields': (
                 ('auto_push_enabled', 'auto_mute_enabled'),
                 ('approval_status', 'rejection_reason'),
+                ('duplicate_of', 'duplicate_similarity'),
             ),
             'description': 'Control automatic pushing to Monday.com'
         }),
@@ -569,14 +579,19 @@ class GeminiProcessedTaskAdmin(admin.ModelAdmin):
     # Bulk action implementations
     def approve_for_auto_push(self, request, queryset):
         """Approve selected tasks for auto-push to Monday.com"""
+        from .monday_outbox import enqueue_delivery
+        
         count = 0
-        for task in queryset:
-            if hasattr(task, 'approval_status'):
-                task.approval_status = 'approved'
-            if hasattr(task, 'auto_push_enabled'):
-                task.auto_push_enabled = True
-            task.save()
-            count += 1
+        with transaction.atomic():
+            tasks = list(queryset)
+            for task in tasks:
+                if hasattr(task, 'approval_status'):
+                    task.approval_status = 'approved'
+                if hasattr(task, 'auto_push_enabled'):
+                    task.auto_push_enabled = True
+                task.save()
+                count += 1
+            enqueue_delivery([task for task in tasks if not task.delivered_to_monday], source='approval')
         
         self.message_user(request, f"✅ Approved {count} tasks for auto-push to Monday.com")
     approve_for_auto_push.short_description = "✅ Approve for auto-push"
@@ -625,50 +640,21 @@ class GeminiProcessedTaskAdmin(admin.ModelAdmin):
     reject_tasks.short_description = "❌ Reject tasks"
     
     def push_to_monday_now(self, request, queryset):
-        """Immediately push selected tasks to Monday.com"""
-        from .monday_client import get_monday_client
-        
-        monday_client = get_monday_client()
-        success_count = 0
-        error_count = 0
+        """Queue selected tasks as a tracked push job for the Monday.com outbox drainer"""
+        from .monday_outbox import start_push_job
         
-        for task in queryset.filter(delivered_to_monday=False):
-            try:
-                # Convert to Monday.com format
-                task_data = {
-                    'task_item': task.task_item,
-                    'assignee_emails': task.assignee_emails,
-                    'assignee(s)_full_names': task.assignee_full_names,
-                    'priority': task.priority,
-                    'brief_description': task.brief_description,
-                    'due_date': task.due_date_ms,
-                    'status': task.status
-                }
-                
-                # Push to Monday.com
-                monday_item_id = monday_client.create_task_item(task_data)
-                
-                if monday_item_id:
-                    task.monday_item_id = monday_item_id
-                    task.delivered_to_monday = True
-                    task.delivery_timestamp = timezone.now()
-                    task.delivery_errors = ''
-                    task.save()
-                    success_count += 1
-                else:
-                    task.delivery_errors = 'Failed to create Monday.com item'
-                    task.save()
-                    error_count += 1
-                    
-            except Exception as e:
-                task.delivery_errors = str(e)
-                task.save()
-                error_count += 1
+        with transaction.atomic():
+            job = start_push_job(
+                queryset.filter(delivered_to_monday=False), source='push_now', requested_by=request.user.get_username()
+            )
         
-        if success_count > 0:
-            self.message_user(request, f"🚀 Successfully pushed {success_count} tasks to Monday.com")
-        if error_count > 0:
-            self.message_user(request, f"❌ Failed to push {error_count} tasks", level='ERROR')
+        if job.total:
+            self.message_user(request, format_html(
+                '🚀 Queued {} tasks for Monday.com as <a href="{}">push job {}</a> - progress is shown above the task list',
+                job.total, reverse('admin:core_mondaypushjob_change', args=[job.id]), str(job.id)[:8]
+            ))
+        else:
+            self.message_user(request, "ℹ️ All selected tasks are already on Monday.com")
     push_to_monday_now.short_description = "🚀 Push to Monday.com now"
     
     def mark_as_delivered(self, request, queryset):
@@ -773,6 +759,17 @@ class GeminiProcessedTaskAdmin(admin.ModelAdmin):
         extra_context['delivered_tasks'] = self.get_queryset(request).filter(delivered_to_monday=True).count()
         extra_context['pending_tasks'] = self.get_queryset(request).filter(delivered_to_monday=False).count()
         
+        # Bulk pushes still running, or finished in the last 10 minutes, polled live by the changelist
+        from django.db.models import Q
+        from datetime import timedelta
+        extra_context['push_jobs'] = [
+            {'job': job, 'progress_url': reverse('monday_push_job_progress', args=[job.id])}
+            for job in MondayPushJob.objects.filter(
+                Q(finished_at__isnull=True) | Q(finished_at__gte=timezone.now() - timedelta(minutes=10)),
+                source='push_now'
+            )[:5]
+        ]
+        
         return super().changelist_view(request, extra_context)
     
     # Add custom fields to the model if they don't exist
@@ -790,4 +787,215 @@ class GeminiProcessedTaskAdmin(admin.ModelAdmin):
         if obj and not hasattr(obj, 'rejection_reason'):
             obj.rejection_reason = ''
             
-        return form 
\ No newline at end of file
+        return form 
+
+
+@admin.register(ExtractionJob)
+class ExtractionJobAdmin(admin.ModelAdmin):
+    """Admin interface for resumable extraction jobs"""
+    
+    list_display = [
+        'raw_transcript', 'status', 'attempts', 'max_attempts',
+        'tasks_created', 'lease_owner', 'lease_expires_at', 'finished_at'
+    ]
+    list_filter = ['status', 'model_version', 'created_at']
+    search_fields = ['raw_transcript__fireflies_id', 'raw_transcript__meeting_title', 'last_error']
+    readonly_fields = [
+        'id', 'raw_transcript', 'lease_owner', 'lease_expires_at', 'attempts',
+        'tasks_created', 'model_version', 'stage_seconds', 'started_at', 'finished_at',
+        'created_at', 'updated_at'
+    ]
+    
+    fieldsets = (
+        ('Job', {
+            'fields': ('raw_transcript', 'status', 'attempts', 'max_attempts', 'last_error')
+        }),
+        ('Lease', {
+            'fields': ('lease_owner', 'lease_expires_at')
+        }),
+        ('Results', {
+            'fields': ('tasks_created', 'model_version', 'stage_seconds', 'started_at', 'finished_at')
+        }),
+        ('Metadata', {
+            'fields': ('id', 'created_at', 'updated_at'),
+            'classes': ('collapse',)
+        }),
+    )
+
+
+@admin.register(Person)
+class PersonAdmin(admin.ModelAdmin):
+    """Admin interface for the people directory"""
+    
+    list_display = ['display_name', 'email', 'meeting_count', 'last_seen_at']
+    search_fields = ['display_name', 'email']
+    readonly_fields = ['id', 'meeting_count', 'last_seen_at', 'created_at', 'updated_at']
+    
+    fieldsets = (
+        ('Person', {
+            'fields': ('display_name', 'email', 'aliases')
+        }),
+        ('Activity', {
+            'fields': ('meeting_count', 'last_seen_at')
+        }),
+        ('Metadata', {
+            'fields': ('id', 'created_at', 'updated_at'),
+            'classes': ('collapse',)
+        }),
+    )
+
+
+@admin.register(MondayDelivery)
+class MondayDeliveryAdmin(admin.ModelAdmin):
+    """Admin interface for the Monday.com delivery ledger"""
+    
+    list_display = ['delivery_key', 'task_type', 'task_id', 'status', 'monday_item_id', 'attempts', 'delivered_at']
+    list_filter = ['status', 'task_type', 'board_id']
+    search_fields = ['delivery_key', 'task_id', 'monday_item_id', 'last_error']
+    readonly_fields = [
+        'id', 'delivery_key', 'task_type', 'task_id', 'board_id', 'attempts',
+        'lease_owner', 'lease_expires_at', 'delivered_at', 'created_at', 'updated_at'
+    ]
+    
+    fieldsets = (
+        ('Delivery', {
+            'fields': ('delivery_key', 'task_type', 'task_id', 'board_id', 'status', 'monday_item_id')
+        }),
+        ('Attempts', {
+            'fields': ('attempts', 'last_error', 'lease_owner', 'lease_expires_at', 'delivered_at')
+        }),
+        ('Metadata', {
+            'fields': ('id', 'created_at', 'updated_at'),
+            'classes': ('collapse',)
+        }),
+    )
+
+
+@admin.register(MondayOutbox)
+class MondayOutboxAdmin(admin.ModelAdmin):
+    """Admin interface for the Monday.com delivery outbox"""
+    
+    list_display = ['task_type', 'task_id', 'source', 'board_id', 'status', 'attempts', 'max_attempts', 'next_attempt_at', 'monday_item_id', 'created_at', 'sent_at']
+    list_filter = ['status', 'source', 'task_type', 'board_id', 'created_at']
+    search_fields = ['task_id', 'monday_item_id', 'last_error']
+    readonly_fields = [
+        'id', 'task_type', 'task_id', 'source', 'job', 'attempts', 'lease_owner', 'lease_expires_at',
+        'monday_item_id', 'sent_at', 'created_at', 'updated_at'
+    ]
+    actions = ['retry_deliveries']
+    
+    fieldsets = (
+        ('Delivery', {
+            'fields': ('task_type', 'task_id', 'source', 'job', 'board_id', 'group_id', 'status', 'monday_item_id', 'sent_at')
+        }),
+        ('Attempts', {
+            'fields': ('attempts', 'max_attempts', 'next_attempt_at', 'last_error', 'lease_owner', 'lease_expires_at')
+        }),
+        ('Metadata', {
+            'fields': ('id', 'created_at', 'updated_at'),
+            'classes': ('collapse',)
+        }),
+    )
+    
+    def retry_deliveries(self, request, queryset):
+        """Move failed entries back to the queue with a fresh retry budget"""
+        from .monday_outbox import retry_failed_deliveries
+        
+        count = retry_failed_deliveries(queryset)
+        self.message_user(request, f"🔄 Re-queued {count} deliveries")
+    retry_deliveries.short_description = "🔄 Retry failed deliveries"
+
+
+@admin.register(MondayPushJob)
+class MondayPushJobAdmin(admin.ModelAdmin):
+    """Admin interface for Monday.com bulk push jobs"""
+    
+    list_display = ['short_id', 'source', 'requested_by', 'total', 'progress_display', 'created_at', 'finished_at']
+    list_filter = ['source', 'created_at']
+    search_fields = ['id', 'requested_by']
+    readonly_fields = ['id', 'source', 'requested_by', 'total', 'progress_display', 'errors_display', 'finished_at', 'created_at', 'updated_at']
+    
+    fieldsets = (
+        ('Push Job', {
+            'fields': ('source', 'requested_by', 'total', 'progress_display', 'errors_display', 'finished_at')
+        }),
+        ('Metadata', {
+            'fields': ('id', 'created_at', 'updated_at'),
+            'classes': ('collapse',)
+        }),
+    )
+    
+    def get_queryset(self, request):
+        """Annotate per-status entry counts so progress needs no queries per row"""
+        from django.db.models import Count, Q
+        return super().get_queryset(request).annotate(
+            sent_count=Count('entries', filter=Q(entries__status='sent')),
+            failed_count=Count('entries', filter=Q(entries__status='failed')),
+            waiting_count=Count('entries', filter=Q(entries__status__in=['queued', 'sending'])),
+        )
+    
+    def short_id(self, obj):
+        return str(obj.id)[:8]
+    short_id.short_description = 'Job'
+    
+    def progress_display(self, obj):
+        from .monday_outbox import push_job_rates
+        rates = push_job_rates(obj, {'sent': obj.sent_count, 'failed': obj.failed_count})
+        return format_html(
+            '{}% - ✅ {} sent, ❌ {} failed, ⏳ {} waiting ({} tasks/min)',
+            rates['percent'], obj.sent_count, obj.failed_count, obj.waiting_count, rates['throughput_per_minute']
+        )
+    progress_display.short_description = 'Progress'
+    
+    def errors_display(self, obj):
+        from django.utils.html import format_html_join
+        from .monday_outbox import push_job_errors
+        errors = push_job_errors(obj)
+        if not errors:
+            return '-'
+        return format_html_join(
+            '', '<div>{} ({}, attempt {}): {}</div>',
+            ((e['task_id'][:8], e['status'], e['attempts'], e['error'][:200]) for e in errors)
+        )
+    errors_display.short_description = 'Recent errors'
+    
+    def has_add_permission(self, request):
+        return False
+
+
+@admin.register(MondayRoute)
+class MondayRouteAdmin(admin.ModelAdmin):
+    """Admin interface for Monday.com delivery routes"""
+    
+    list_display = ['name', 'priority', 'meeting_pattern', 'assignee_pattern', 'board_id', 'group_id', 'is_active']
+    list_editable = ['priority', 'is_active']
+    list_filter = ['is_active', 'board_id']
+    search_fields = ['name', 'meeting_pattern', 'assignee_pattern', 'board_id', 'group_id']
+    readonly_fields = ['id', 'created_at', 'updated_at']
+    
+    fieldsets = (
+        ('Route', {
+            'fields': ('name', 'priority', 'is_active')
+        }),
+        ('Match', {
+            'fields': ('meeting_pattern', 'assignee_pattern'),
+            'description': 'Both patterns must match; leave one empty to match any value'
+        }),
+        ('Target', {
+            'fields': ('board_id', 'group_id')
+        }),
+        ('Metadata', {
+            'fields': ('id', 'created_at', 'updated_at'),
+            'classes': ('collapse',)
+        }),
+    )
+    
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        from .monday_routing import get_monday_router
+        get_monday_router().invalidate()
+    
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        from .monday_routing import get_monday_router
+        get_monday_router().invalidate()
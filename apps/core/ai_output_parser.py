@@ -0,0 +1,251 @@
+"""
+AI Output Parsing
+Incremental, tolerant parsing of the JSON task array Gemini returns
+"""
+
+import json
+import logging
+import re
+from typing import List, Dict, Any, Callable, Optional, Tuple
+
+from .chunked_extraction import merge_window_tasks
+
+logger = logging.getLogger('apps.core.ai_output_parser')
+
+FENCE_PATTERN = re.compile(r'```(?:json|JSON)?')
+
+CONTINUATION_INSTRUCTION = (
+    'Your previous response was cut off. These tasks were already received, in order:\n'
+    '{received}\n'
+    'Return ONLY a JSON array of the remaining tasks that come after them in the source '
+    'material, using the same keys. Return [] if there are none.'
+)
+
+
+def strip_trailing_commas(text: str) -> str:
+    """Remove commas directly before a closing bracket or brace, ignoring string contents"""
+    result = []
+    in_string = False
+    escape = False
+
+    for index, char in enumerate(text):
+        if in_string:
+            if escape:
+                escape = False
+            elif char == '\\':
+                escape = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == ',':
+            following = text[index + 1:].lstrip()
+            if following[:1] in ('}', ']'):
+                continue
+        result.append(char)
+
+    return ''.join(result)
+
+
+def loads_tolerant(text: str) -> Tuple[Any, bool]:
+    """
+    json.loads with a trailing-comma repair fallback
+    Returns (value, repaired); raises json.JSONDecodeError if the repair does not help
+    """
+    try:
+        return json.loads(text), False
+    except json.JSONDecodeError:
+        return json.loads(strip_trailing_commas(text)), True
+
+
+class IncompleteStreamError(RuntimeError):
+    """Raised after a streamed task array ended without its closing bracket"""
+
+    def __init__(self, message: str, tasks_parsed: int):
+        super().__init__(message)
+        self.tasks_parsed = tasks_parsed
+
+
+class IncrementalTaskArrayParser:
+    """
+    Incremental parser for a streamed JSON array of task objects
+
+    Feed text chunks as they arrive; every task object is returned as soon as
+    its closing brace is seen. Markdown fences or prose before the array are
+    skipped, and anything after the closing bracket is ignored.
+    """
+
+    def __init__(self):
+        self._buffer: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self.array_started = False
+        self.array_closed = False
+        self._bare_object = False
+        self.objects_parsed = 0
+        self.objects_failed = 0
+        self.objects_repaired = 0
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """Consume a chunk of model output and return the task objects it completed"""
+        completed = []
+
+        for char in chunk:
+            if self.array_closed:
+                break
+
+            if not self.array_started:
+                if char == '[':
+                    self.array_started = True
+                elif char == '{':
+                    # A bare object instead of an array - treat it as a one-item array
+                    self.array_started = True
+                    self._bare_object = True
+                    self._start_object()
+                continue
+
+            if self._depth == 0:
+                if char == '{':
+                    self._start_object()
+                elif char == ']':
+                    self.array_closed = True
+                continue
+
+            self._buffer.append(char)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == '\\':
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in '{[':
+                self._depth += 1
+            elif char in '}]':
+                self._depth -= 1
+                if self._depth == 0:
+                    task = self._finish_object()
+                    if task is not None:
+                        completed.append(task)
+                    self.array_closed = self._bare_object
+
+        return completed
+
+    @property
+    def has_partial_object(self) -> bool:
+        """True if output stopped in the middle of a task object"""
+        return self._depth > 0
+
+    def _start_object(self):
+        self._buffer = ['{']
+        self._depth = 1
+        self._in_string = False
+        self._escape = False
+
+    def _finish_object(self):
+        text = ''.join(self._buffer)
+        self._buffer = []
+        try:
+            task, repaired = loads_tolerant(text)
+        except json.JSONDecodeError as e:
+            self.objects_failed += 1
+            logger.warning(f"Skipping unparseable streamed task object: {e}")
+            return None
+
+        if not isinstance(task, dict):
+            self.objects_failed += 1
+            return None
+
+        self.objects_parsed += 1
+        if repaired:
+            self.objects_repaired += 1
+        return task
+
+    @property
+    def truncated(self) -> bool:
+        """True if the array was opened but never closed"""
+        return self.array_started and not self.array_closed
+
+
+def recover_task_array(ai_output: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Parse Gemini output into task dicts, salvaging as much as possible
+
+    Fences anywhere in the text, surrounding prose and trailing commas are tolerated.
+    A truncated array yields every task object that was complete. Returns
+    (tasks, report) where report says how much was recovered and whether the
+    output was truncated.
+    """
+    cleaned = FENCE_PATTERN.sub('', ai_output or '').strip()
+    report = {
+        'strict': False,
+        'recovered': 0,
+        'failed': 0,
+        'repaired': 0,
+        'truncated': False,
+    }
+
+    try:
+        parsed = json.loads(cleaned)
+    except json.JSONDecodeError:
+        parsed = None
+
+    if isinstance(parsed, (list, dict)):
+        tasks = [parsed] if isinstance(parsed, dict) else [task for task in parsed if isinstance(task, dict)]
+        report.update(strict=True, recovered=len(tasks))
+        return tasks, report
+
+    parser = IncrementalTaskArrayParser()
+    tasks = parser.feed(cleaned)
+    report.update(
+        recovered=len(tasks),
+        failed=parser.objects_failed,
+        repaired=parser.objects_repaired,
+        truncated=parser.truncated,
+    )
+
+    if parser.truncated or parser.objects_failed or parser.objects_repaired:
+        logger.warning(
+            f"Recovered {len(tasks)} tasks from malformed Gemini output "
+            f"({parser.objects_repaired} repaired, {parser.objects_failed} unparseable, "
+            f"truncated={parser.truncated})"
+        )
+    return tasks, report
+
+
+def build_continuation_prompt(prompt: str, received_tasks: List[Dict[str, Any]]) -> str:
+    """Prompt asking only for the tasks after the ones already received"""
+    received = '\n'.join(f"- {task.get('task_item', '')}" for task in received_tasks) or '- (none)'
+    return f"{prompt}\n\n{CONTINUATION_INSTRUCTION.format(received=received)}"
+
+
+def recover_missing_tail(
+    prompt: str,
+    tasks: List[Dict[str, Any]],
+    generate_text: Callable[[str], Optional[str]],
+    max_continuations: int = 1
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Re-request only the tail of a truncated task array and merge it in
+    generate_text runs a prompt and returns the model's text (or None on failure)
+
+    Returns (tasks, complete); complete is False when the continuations failed
+    or were used up while the output was still truncated.
+    """
+    for attempt in range(max_continuations):
+        logger.info(f"🔁 Requesting missing tail after {len(tasks)} recovered tasks (attempt {attempt + 1})")
+        tail_output = generate_text(build_continuation_prompt(prompt, tasks))
+        if tail_output is None:
+            break
+
+        tail, tail_report = recover_task_array(tail_output)
+        tasks = merge_window_tasks([tasks, tail])
+        if not tail_report['truncated']:
+            return tasks, True
+
+    logger.warning(f"⚠️  Output still truncated after continuations - {len(tasks)} tasks recovered")
+    return tasks, False
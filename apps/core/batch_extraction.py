@@ -0,0 +1,243 @@
+"""
+Multi-Meeting Batch Extraction
+Packs several short transcripts into one Gemini request that shares the prompt.md
+system preamble, then demultiplexes the keyed output back to each meeting
+"""
+
+import json
+import logging
+import re
+from typing import List, Dict, Any, Optional, Tuple
+from django.conf import settings
+
+from .models import RawTranscriptCache
+from .precision_extractor import PrecisionTaskExtractor, create_gemini_processed_task
+from .transcript_compaction import estimate_tokens
+from .ai_output_parser import loads_tolerant
+
+logger = logging.getLogger('apps.core.batch_extraction')
+
+USER_SECTION_MARKER = '=== User ==='
+ARRAY_INSTRUCTION = 'Return ONLY the JSON array described above.'
+
+
+class MeetingBatchExtractor:
+    """Batch extraction mode for short meetings under a token threshold"""
+
+    def __init__(self, extractor: Optional[PrecisionTaskExtractor] = None, config: Optional[Dict[str, Any]] = None):
+        if config is None:
+            config = settings.EXTERNAL_APIS['GEMINI'].get('BATCH_EXTRACTION', {})
+
+        # Chunking is decided per single meeting; packed batches only hold short ones
+        self.extractor = extractor or PrecisionTaskExtractor()
+        self.max_meeting_tokens = config.get('MAX_MEETING_TOKENS', 4000)
+        self.max_batch_tokens = config.get('MAX_BATCH_TOKENS', 24000)
+        self.max_meetings_per_batch = config.get('MAX_MEETINGS_PER_BATCH', 6)
+        
+        # fireflies_id -> model that produced the meeting's tasks
+        self.meeting_models: Dict[str, str] = {}
+
+    def _split_prompt(self, cache_item: RawTranscriptCache) -> Tuple[str, str]:
+        """Render a meeting's prompt and split it into (system preamble, meeting section)"""
+        fireflies_data = self.extractor._compact_transcript(cache_item.raw_fireflies_data, cache_item.fireflies_id)
+        prompt = self.extractor._build_n8n_prompt_from_file(fireflies_data)
+
+        marker_index = prompt.find(USER_SECTION_MARKER)
+        if marker_index == -1:
+            return '', prompt
+
+        system = prompt[:marker_index].rstrip()
+        meeting_section = prompt[marker_index + len(USER_SECTION_MARKER):]
+        meeting_section = meeting_section.replace(ARRAY_INSTRUCTION, '').strip()
+        return system, meeting_section
+
+    def plan_batches(
+        self,
+        cache_items: List[RawTranscriptCache]
+    ) -> Tuple[List[List[Tuple[RawTranscriptCache, str]]], List[RawTranscriptCache], str]:
+        """
+        Group short meetings into batches
+
+        Returns (batches, singles, system_preamble). Each batch entry carries the
+        rendered meeting section; meetings over the threshold are returned as singles.
+        """
+        batches: List[List[Tuple[RawTranscriptCache, str]]] = []
+        singles: List[RawTranscriptCache] = []
+        system_preamble = ''
+
+        current: List[Tuple[RawTranscriptCache, str]] = []
+        current_tokens = 0
+
+        for cache_item in cache_items:
+            system, meeting_section = self._split_prompt(cache_item)
+            meeting_tokens = estimate_tokens(meeting_section)
+
+            if not system or meeting_tokens > self.max_meeting_tokens:
+                singles.append(cache_item)
+                continue
+
+            system_preamble = system
+            if current and (
+                len(current) >= self.max_meetings_per_batch
+                or current_tokens + meeting_tokens > self.max_batch_tokens
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+
+            current.append((cache_item, meeting_section))
+            current_tokens += meeting_tokens
+
+        if current:
+            batches.append(current)
+
+        # A batch of one saves nothing - extract it on its own
+        for batch in [b for b in batches if len(b) == 1]:
+            batches.remove(batch)
+            singles.append(batch[0][0])
+
+        return batches, singles, system_preamble
+
+    def build_batch_prompt(self, system_preamble: str, batch: List[Tuple[RawTranscriptCache, str]]) -> str:
+        """Build one prompt with per-meeting delimiters and a keyed output instruction"""
+        meeting_ids = [cache_item.fireflies_id for cache_item, _ in batch]
+
+        parts = [
+            system_preamble,
+            '',
+            '=== Batch ===',
+            f'The following {len(batch)} meetings are independent. Apply every rule above to each '
+            'meeting separately; never mix tasks, attendees, or due dates between meetings.',
+        ]
+        for cache_item, meeting_section in batch:
+            parts.extend([
+                '',
+                f'=== Meeting "{cache_item.fireflies_id}" ===',
+                meeting_section,
+                f'=== End Meeting "{cache_item.fireflies_id}" ===',
+            ])
+        parts.extend([
+            '',
+            'Return ONLY a JSON object (no markdown, comments, or prose) whose keys are exactly these '
+            f'meeting ids: {json.dumps(meeting_ids)}. Each value is the JSON array described above for '
+            'that meeting, or [] if it has no tasks.',
+        ])
+        return '\n'.join(parts)
+
+    def _parse_batch_output(self, ai_output: str) -> Dict[str, Any]:
+        """Parse the keyed JSON object, tolerating markdown fences and surrounding prose"""
+        cleaned = re.sub(r'```(?:json)?', '', ai_output).strip()
+        start, end = cleaned.find('{'), cleaned.rfind('}')
+        if start == -1 or end <= start:
+            return {}
+
+        try:
+            parsed, _ = loads_tolerant(cleaned[start:end + 1])
+        except json.JSONDecodeError:
+            return {}
+        return parsed if isinstance(parsed, dict) else {}
+
+    def extract_batch(
+        self,
+        system_preamble: str,
+        batch: List[Tuple[RawTranscriptCache, str]]
+    ) -> Dict[str, Optional[List[Dict[str, Any]]]]:
+        """
+        Run one batched request and demultiplex it per meeting
+        A meeting maps to None when its key is missing or malformed, so it can be re-run alone
+        """
+        prompt = self.build_batch_prompt(system_preamble, batch)
+        meeting_ids = [cache_item.fireflies_id for cache_item, _ in batch]
+        logger.info(f"📦 BATCH EXTRACTION: {len(batch)} meetings in one request (~{estimate_tokens(prompt)} tokens)")
+
+        # Meetings are independent, so the busiest one sets the speaker count
+        max_speakers = max(
+            len({s.get('speaker_name') for s in (cache_item.raw_fireflies_data.get('sentences') or [])})
+            for cache_item, _ in batch
+        )
+        route = self.extractor.model_router.route(estimate_tokens(prompt), max_speakers)
+
+        results: Dict[str, Optional[List[Dict[str, Any]]]] = {meeting_id: None for meeting_id in meeting_ids}
+        try:
+            response = self.extractor.gemini_client._execute_request_with_retry(prompt, route['model'])
+            ai_output = response['candidates'][0]['content']['parts'][0]['text']
+        except Exception as e:
+            logger.error(f"❌ Batch request failed: {e}")
+            return results
+
+        keyed_output = self._parse_batch_output(ai_output)
+        for meeting_id in meeting_ids:
+            tasks = keyed_output.get(meeting_id)
+            if isinstance(tasks, list):
+                results[meeting_id] = [task for task in tasks if isinstance(task, dict)]
+                self.meeting_models[meeting_id] = route['model']
+            else:
+                logger.warning(f"⚠️  Batch output missing meeting {meeting_id}")
+
+        return results
+
+    def extract(self, cache_items: List[RawTranscriptCache]) -> Dict[str, Optional[List[Dict[str, Any]]]]:
+        """Extract tasks for many meetings, batching the short ones; None marks a failed meeting"""
+        batches, singles, system_preamble = self.plan_batches(cache_items)
+        items_by_id = {cache_item.fireflies_id: cache_item for cache_item in cache_items}
+        results: Dict[str, Optional[List[Dict[str, Any]]]] = {}
+
+        logger.info(f"📦 Planned {len(batches)} batches and {len(singles)} single extractions")
+
+        for batch in batches:
+            for meeting_id, tasks in self.extract_batch(system_preamble, batch).items():
+                if tasks is None:
+                    singles.append(items_by_id[meeting_id])
+                else:
+                    results[meeting_id] = tasks
+
+        for cache_item in singles:
+            fireflies_data, prompt = self.extractor.prepare_prompt(cache_item)
+            route = self.extractor.model_router.route_transcript(fireflies_data, prompt)
+            self.meeting_models[cache_item.fireflies_id] = route['model']
+            try:
+                if self.extractor._should_chunk(fireflies_data):
+                    tasks, _ = self.extractor._extract_chunked(fireflies_data, cache_item.fireflies_id)
+                    complete = True
+                else:
+                    tasks, _, complete = self.extractor._run_prompt_with_status(prompt, route['model'])
+            except Exception as e:
+                logger.error(f"❌ Single extraction failed for {cache_item.fireflies_id}: {e}")
+                tasks, complete = None, False
+            if tasks is not None and not complete:
+                # Saving a partial list would block the missing tasks once the sentences are marked
+                logger.warning(f"⚠️  Truncated AI output for {cache_item.fireflies_id} - retrying on the next run")
+                tasks = None
+            results[cache_item.fireflies_id] = tasks
+
+        return results
+
+
+def batch_extract_and_save(cache_items: List[RawTranscriptCache]) -> Dict[str, int]:
+    """Batch-extract tasks and save them as GeminiProcessedTask rows; returns tasks created per meeting"""
+    batch_extractor = MeetingBatchExtractor()
+    results = batch_extractor.extract(cache_items)
+    created: Dict[str, int] = {}
+
+    for cache_item in cache_items:
+        tasks = results.get(cache_item.fireflies_id)
+        if tasks is None:
+            # Extraction failed - leave the sentences unmarked so the meeting is picked up again
+            created[cache_item.fireflies_id] = 0
+            continue
+        sentences = cache_item.raw_fireflies_data.get('sentences') or []
+
+        for extraction_order, task_data in enumerate(tasks):
+            create_gemini_processed_task(
+                cache_item,
+                task_data,
+                extraction_order,
+                model_version=batch_extractor.meeting_models.get(cache_item.fireflies_id, 'gemini-2.5-flash'),
+                source_sentences=batch_extractor.extractor._find_source_sentences(
+                    task_data.get('task_item') or '', sentences
+                ),
+                batched=True
+            )
+        cache_item.mark_sentences_extracted()
+        created[cache_item.fireflies_id] = len(tasks)
+
+    return created
@@ -0,0 +1,128 @@
+"""
+Chunked (map-reduce) extraction helpers
+Split long transcripts into overlapping sentence windows and merge the
+per-window task lists back into one ordered, de-duplicated list
+"""
+
+import hashlib
+import json
+import re
+from typing import List, Dict, Any, Tuple
+
+
+class IncompleteExtractionError(RuntimeError):
+    """
+    Raised when some windows of a chunked extraction failed after their retries
+
+    Carries the tasks merged from the windows that succeeded; those windows are
+    cached, so retrying the transcript only re-runs the failed ones.
+    """
+
+    def __init__(self, message: str, tasks: List[Dict[str, Any]], output_length: int, failed_windows: int):
+        super().__init__(message)
+        self.tasks = tasks
+        self.output_length = output_length
+        self.failed_windows = failed_windows
+
+
+def split_sentence_windows(
+    sentences: List[Dict[str, Any]],
+    window_size: int,
+    overlap: int
+) -> List[Tuple[int, List[Dict[str, Any]]]]:
+    """
+    Split sentences into overlapping windows
+
+    Returns a list of (start_index, window_sentences) tuples in transcript order.
+    """
+    if window_size <= 0:
+        raise ValueError("window_size must be positive")
+
+    overlap = max(0, min(overlap, window_size - 1))
+    step = window_size - overlap
+
+    windows = []
+    start = 0
+    while start < len(sentences):
+        windows.append((start, sentences[start:start + window_size]))
+        if start + window_size >= len(sentences):
+            break
+        start += step
+
+    return windows
+
+
+def window_content_hash(fireflies_data: Dict[str, Any], window_sentences: List[Dict[str, Any]]) -> str:
+    """Stable content hash for a window - meeting context plus the window's sentences"""
+    summary = fireflies_data.get('summary') or {}
+    key_data = {
+        'title': fireflies_data.get('title', ''),
+        'date': fireflies_data.get('date', ''),
+        'organizer': fireflies_data.get('organizer_email', ''),
+        'attendees': fireflies_data.get('meeting_attendees') or [],
+        'action_items': summary.get('action_items', ''),
+        'overview': summary.get('overview', ''),
+        'sentences': [
+            [s.get('speaker_name'), s.get('text'), s.get('start_time')]
+            for s in window_sentences
+        ],
+    }
+
+    data_string = json.dumps(key_data, sort_keys=True, default=str)
+    return hashlib.sha256(data_string.encode()).hexdigest()
+
+
+def normalize_task_key(task_item: str) -> str:
+    """Normalise case, punctuation and whitespace for duplicate detection"""
+    text = re.sub(r'[^\w\s]', ' ', (task_item or '').lower())
+    return ' '.join(text.split())
+
+
+def is_duplicate_task(task: Dict[str, Any], kept: Dict[str, Any], similarity_threshold: float) -> bool:
+    """Two tasks are duplicates if their normalised text matches or nearly matches for the same assignees"""
+    task_key = normalize_task_key(task.get('task_item', ''))
+    kept_key = normalize_task_key(kept.get('task_item', ''))
+    if task_key == kept_key:
+        return True
+
+    if normalize_task_key(task.get('assignee_emails', '')) != normalize_task_key(kept.get('assignee_emails', '')):
+        return False
+
+    task_words = set(task_key.split())
+    kept_words = set(kept_key.split())
+    if not task_words or not kept_words:
+        return False
+
+    jaccard = len(task_words & kept_words) / len(task_words | kept_words)
+    return jaccard >= similarity_threshold
+
+
+def merge_window_tasks(
+    window_results: List[List[Dict[str, Any]]],
+    similarity_threshold: float = 0.8
+) -> List[Dict[str, Any]]:
+    """
+    Merge per-window task lists into a single list
+
+    Windows are visited in transcript order and tasks keep their in-window order,
+    so the index of each task in the returned list is its extraction_order.
+    Duplicates produced by overlapping windows keep the earliest occurrence;
+    a missing due_date is filled from a later duplicate.
+    """
+    merged: List[Dict[str, Any]] = []
+
+    for window_tasks in window_results:
+        for task in window_tasks or []:
+            if not isinstance(task, dict):
+                continue
+
+            duplicate = next(
+                (kept for kept in merged if is_duplicate_task(task, kept, similarity_threshold)),
+                None
+            )
+            if duplicate is None:
+                merged.append(dict(task))
+            elif duplicate.get('due_date') in (None, 'null') and task.get('due_date') not in (None, 'null'):
+                duplicate['due_date'] = task['due_date']
+
+    return merged
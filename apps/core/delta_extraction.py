@@ -0,0 +1,175 @@
+"""
+Delta Re-Extraction
+When Fireflies updates a transcript after first extraction, diff the new sentence
+list against the extracted snapshot and send only the new spans (plus a short
+context window) to Gemini. Existing tasks, their IDs and Monday deliveries are kept.
+"""
+
+import difflib
+import logging
+from typing import List, Dict, Any, Optional, Tuple
+from django.conf import settings
+from django.db.models import Max
+
+from .models import RawTranscriptCache, GeminiProcessedTask
+from .chunked_extraction import is_duplicate_task
+from .precision_extractor import PrecisionTaskExtractor, create_gemini_processed_task
+
+logger = logging.getLogger('apps.core.delta_extraction')
+
+DELTA_INSTRUCTION = (
+    'Note: this is an update to a meeting that was already processed. Only transcript '
+    'lines at or after t={start_time} are new; earlier lines are context. Extract only '
+    'tasks introduced or changed by the new lines.'
+)
+
+
+def diff_new_spans(old_hashes: List[str], new_hashes: List[str]) -> List[Tuple[int, int]]:
+    """Return (start, end) index ranges of sentences in new_hashes that are not in old_hashes"""
+    matcher = difflib.SequenceMatcher(None, old_hashes, new_hashes, autojunk=False)
+    return [
+        (j1, j2)
+        for tag, _, _, j1, j2 in matcher.get_opcodes()
+        if tag in ('insert', 'replace') and j2 > j1
+    ]
+
+
+def expand_spans(spans: List[Tuple[int, int]], context: int) -> List[Tuple[int, int]]:
+    """Prepend a context window to each span and merge spans that overlap"""
+    expanded: List[Tuple[int, int]] = []
+    for start, end in spans:
+        start = max(0, start - context)
+        if expanded and start <= expanded[-1][1]:
+            expanded[-1] = (expanded[-1][0], max(expanded[-1][1], end))
+        else:
+            expanded.append((start, end))
+    return expanded
+
+
+class DeltaExtractor:
+    """Extract tasks only from the sentences added since the last extraction"""
+
+    def __init__(self, extractor: Optional[PrecisionTaskExtractor] = None, config: Optional[Dict[str, Any]] = None):
+        if config is None:
+            config = settings.EXTERNAL_APIS['GEMINI'].get('DELTA_EXTRACTION', {})
+
+        self.extractor = extractor or PrecisionTaskExtractor(chunked=False)
+        self.context_sentences = config.get('CONTEXT_SENTENCES', 20)
+        self.similarity_threshold = config.get('SIMILARITY_THRESHOLD', 0.8)
+
+    def apply_update(self, cache_item: RawTranscriptCache, fireflies_data: Dict[str, Any]) -> bool:
+        """Store a newer Fireflies payload on the cache item; returns True if it changed"""
+        previous_hash = cache_item.data_hash
+        cache_item.raw_fireflies_data = fireflies_data
+        cache_item.save()
+        return cache_item.data_hash != previous_hash
+
+    def extract_delta(
+        self,
+        cache_item: RawTranscriptCache,
+        fireflies_data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Re-extract a meeting incrementally
+
+        Without a stored snapshot every sentence counts as new, and the results are
+        de-duplicated against the existing tasks. Returns a report dict.
+        """
+        if fireflies_data is not None:
+            self.apply_update(cache_item, fireflies_data)
+
+        sentences = cache_item.raw_fireflies_data.get('sentences') or []
+        spans = diff_new_spans(cache_item.extracted_sentence_hashes or [], cache_item.current_sentence_hashes())
+        new_sentence_count = sum(end - start for start, end in spans)
+
+        report = {
+            'meeting_id': cache_item.fireflies_id,
+            'new_sentences': new_sentence_count,
+            'sentences_sent': 0,
+            'tasks_created': 0,
+            'duplicates_skipped': 0,
+        }
+
+        if not spans:
+            logger.info(f"✅ No new sentences for {cache_item.fireflies_id} - nothing to re-extract")
+            return report
+
+        windows = expand_spans(spans, self.context_sentences)
+        delta_sentences = [sentence for start, end in windows for sentence in sentences[start:end]]
+        report['sentences_sent'] = len(delta_sentences)
+
+        logger.info(
+            f"🔁 DELTA EXTRACTION: {cache_item.fireflies_id} gained {new_sentence_count} sentences, "
+            f"sending {len(delta_sentences)}/{len(sentences)} with context"
+        )
+
+        new_tasks, model = self._run_delta_prompt(cache_item, delta_sentences, sentences[spans[0][0]])
+        if new_tasks is None:
+            logger.error(f"❌ Delta extraction failed for {cache_item.fireflies_id}")
+            return report
+
+        existing = [
+            {'task_item': task.task_item, 'assignee_emails': task.assignee_emails}
+            for task in GeminiProcessedTask.objects.filter(raw_transcript=cache_item)
+        ]
+        next_order = GeminiProcessedTask.objects.filter(raw_transcript=cache_item).aggregate(
+            max_order=Max('extraction_order')
+        )['max_order']
+        next_order = 0 if next_order is None else next_order + 1
+
+        for task_data in new_tasks:
+            if any(is_duplicate_task(task_data, kept, self.similarity_threshold) for kept in existing):
+                report['duplicates_skipped'] += 1
+                continue
+
+            create_gemini_processed_task(
+                cache_item,
+                task_data,
+                next_order,
+                model_version=model,
+                source_sentences=self.extractor._find_source_sentences(task_data.get('task_item') or '', sentences),
+                delta=True
+            )
+            existing.append(task_data)
+            next_order += 1
+            report['tasks_created'] += 1
+
+        cache_item.mark_sentences_extracted()
+        logger.info(
+            f"✅ Delta for {cache_item.fireflies_id}: {report['tasks_created']} new tasks, "
+            f"{report['duplicates_skipped']} duplicates skipped"
+        )
+        return report
+
+    def _run_delta_prompt(
+        self,
+        cache_item: RawTranscriptCache,
+        delta_sentences: List[Dict[str, Any]],
+        first_new_sentence: Dict[str, Any]
+    ) -> Tuple[Optional[List[Dict[str, Any]]], str]:
+        """Run the prompt.md prompt over the delta sentences only; returns (tasks, model), tasks None on failure or truncation"""
+        delta_data = dict(cache_item.raw_fireflies_data, sentences=delta_sentences)
+        delta_data = self.extractor._compact_transcript(delta_data, cache_item.fireflies_id)
+
+        prompt = self.extractor._build_n8n_prompt_from_file(delta_data)
+        prompt += '\n\n' + DELTA_INSTRUCTION.format(start_time=first_new_sentence.get('start_time', 0))
+        route = self.extractor.model_router.route_transcript(delta_data, prompt)
+
+        try:
+            tasks, _, complete = self.extractor._run_prompt_with_status(prompt, route['model'])
+        except Exception as e:
+            logger.error(f"❌ Delta prompt failed for {cache_item.fireflies_id}: {e}")
+            return None, route['model']
+        if tasks is not None and not complete:
+            # The new sentences stay unmarked, so the next delta run sends them again
+            logger.warning(f"⚠️  Truncated delta output for {cache_item.fireflies_id}")
+            return None, route['model']
+        return tasks, route['model']
+
+
+def extract_delta_for_cache(
+    cache_item: RawTranscriptCache,
+    fireflies_data: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Convenience function for delta re-extraction of one meeting"""
+    return DeltaExtractor().extract_delta(cache_item, fireflies_data)
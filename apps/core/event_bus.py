@@ -186,6 +186,7 @@ class EventTypes:
     # Delivery events
     TASK_DELIVERED = 'task.delivered'
     TASK_DELIVERY_FAILED = 'task.delivery_failed'
+    BOARD_SCHEMA_CHANGED = 'monday.board_schema_changed'
     
     # System events
     SYSTEM_ERROR = 'system.error'
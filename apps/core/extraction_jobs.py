@@ -0,0 +1,303 @@
+"""
+Resumable Extraction Jobs
+Checkpointed, leased batch extraction over RawTranscriptCache. Each meeting gets an
+ExtractionJob row; N worker threads claim jobs with conditional UPDATEs, renew their
+lease between stages, and commit tasks together with the job's done state, so a run
+that dies midway resumes where it stopped.
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+from collections import defaultdict
+from datetime import timedelta
+from typing import Dict, Any, Optional
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count, F, Q, QuerySet
+from django.utils import timezone
+
+from .models import ExtractionJob, RawTranscriptCache
+from .precision_extractor import PrecisionTaskExtractor, create_gemini_processed_task
+
+logger = logging.getLogger('apps.core.extraction_jobs')
+
+STAGES = ('prepare', 'extract', 'save')
+
+
+class LeaseLostError(Exception):
+    """Raised when another worker took over a job whose lease expired"""
+    pass
+
+
+def enqueue_extraction_jobs(
+    cache_items: Optional[QuerySet] = None,
+    force: bool = False,
+    max_attempts: Optional[int] = None
+) -> Dict[str, int]:
+    """
+    Queue a job for every meeting that has no extracted tasks yet
+    force also re-queues meetings that already have tasks or finished jobs
+    """
+    if max_attempts is None:
+        max_attempts = settings.SYSTEM_CONFIG.get('EXTRACTION_JOBS', {}).get('MAX_ATTEMPTS', 3)
+
+    if cache_items is None:
+        cache_items = RawTranscriptCache.objects.filter(is_valid=True)
+    cache_ids = list(cache_items.values_list('id', flat=True))
+
+    candidates = RawTranscriptCache.objects.filter(id__in=cache_ids)
+    if not force:
+        candidates = candidates.filter(gemini_processed_tasks__isnull=True)
+    candidate_ids = set(candidates.values_list('id', flat=True))
+
+    existing_ids = set(
+        ExtractionJob.objects.filter(raw_transcript_id__in=candidate_ids).values_list('raw_transcript_id', flat=True)
+    )
+    ExtractionJob.objects.bulk_create([
+        ExtractionJob(raw_transcript_id=cache_id, max_attempts=max_attempts)
+        for cache_id in candidate_ids - existing_ids
+    ])
+
+    requeued = 0
+    if force:
+        requeued = ExtractionJob.objects.filter(
+            raw_transcript_id__in=existing_ids, status__in=['done', 'failed']
+        ).update(status='queued', attempts=0, last_error='', lease_owner='', lease_expires_at=None, updated_at=timezone.now())
+
+    return {'created': len(candidate_ids - existing_ids), 'requeued': requeued}
+
+
+def retry_failed_jobs() -> int:
+    """Move failed jobs back to the queue with a fresh retry budget"""
+    return ExtractionJob.objects.filter(status='failed').update(
+        status='queued', attempts=0, lease_owner='', lease_expires_at=None, updated_at=timezone.now()
+    )
+
+
+def extraction_job_summary() -> Dict[str, int]:
+    """Job counts per status"""
+    counts = dict(ExtractionJob.objects.values_list('status').annotate(total=Count('id')))
+    return {status: counts.get(status, 0) for status, _ in ExtractionJob.STATUS_CHOICES}
+
+
+class ExtractionJobRunner:
+    """Runs queued ExtractionJobs on a pool of worker threads"""
+
+    def __init__(self, workers: Optional[int] = None, config: Optional[Dict[str, Any]] = None, extractor_factory=None):
+        if config is None:
+            config = settings.SYSTEM_CONFIG.get('EXTRACTION_JOBS', {})
+
+        self.workers = max(1, workers or config.get('WORKERS', 3))
+        self.lease_seconds = config.get('LEASE_SECONDS', 900)
+        self.extractor_factory = extractor_factory or PrecisionTaskExtractor
+        self.runner_id = f"{socket.gethostname()}:{os.getpid()}"
+
+        self.stats = {
+            'jobs_done': 0,
+            'jobs_failed': 0,
+            'jobs_retried': 0,
+            'tasks_created': 0,
+            'stage_seconds': defaultdict(float),
+            'stage_count': defaultdict(int),
+        }
+        self._stats_lock = threading.Lock()
+        self._claimed = 0
+
+    def _lease_expiry(self):
+        return timezone.now() + timedelta(seconds=self.lease_seconds)
+
+    def _expire_exhausted(self):
+        """Fail running jobs whose lease expired and that have no attempts left"""
+        failed = ExtractionJob.objects.filter(
+            status='running', lease_expires_at__lt=timezone.now(), attempts__gte=F('max_attempts')
+        ).update(status='failed', lease_owner='', lease_expires_at=None, last_error='Lease expired on final attempt', updated_at=timezone.now())
+        if failed:
+            logger.warning(f"⚠️  {failed} extraction jobs failed after their final attempt was abandoned")
+
+    def claim_next(self, worker_name: str) -> Optional[ExtractionJob]:
+        """
+        Claim the oldest queued job, or a running job whose lease expired
+        The conditional UPDATE is the lock: only one worker's update matches
+        """
+        self._expire_exhausted()
+        now = timezone.now()
+        claimable = Q(status='queued') | Q(status='running', lease_expires_at__lt=now)
+
+        for job_id in ExtractionJob.objects.filter(claimable).values_list('id', flat=True)[:self.workers * 2]:
+            claimed = ExtractionJob.objects.filter(claimable, id=job_id).update(
+                status='running',
+                lease_owner=worker_name,
+                lease_expires_at=self._lease_expiry(),
+                attempts=F('attempts') + 1,
+                started_at=now,
+                updated_at=now
+            )
+            if claimed:
+                return ExtractionJob.objects.select_related('raw_transcript').get(id=job_id)
+        return None
+
+    def _renew_lease(self, job: ExtractionJob, worker_name: str):
+        """Checkpoint between stages; raises LeaseLostError if another worker took the job"""
+        renewed = ExtractionJob.objects.filter(id=job.id, status='running', lease_owner=worker_name).update(
+            lease_expires_at=self._lease_expiry(), updated_at=timezone.now()
+        )
+        if not renewed:
+            raise LeaseLostError(f"Lease on job {job.id} was lost")
+
+    def _record_stage(self, timings: Dict[str, float], stage: str, started: float):
+        elapsed = time.perf_counter() - started
+        timings[stage] = round(elapsed, 3)
+        with self._stats_lock:
+            self.stats['stage_seconds'][stage] += elapsed
+            self.stats['stage_count'][stage] += 1
+
+    def process_job(self, job: ExtractionJob, worker_name: str, extractor: PrecisionTaskExtractor) -> int:
+        """Run prepare -> extract -> save for one job; returns tasks created"""
+        cache_item = job.raw_transcript
+        sentences = cache_item.raw_fireflies_data.get('sentences') or []
+        timings: Dict[str, float] = {}
+
+        started = time.perf_counter()
+        fireflies_data, prompt = extractor.prepare_prompt(cache_item)
+        route = extractor.model_router.route_transcript(fireflies_data, prompt)
+        self._record_stage(timings, 'prepare', started)
+        self._renew_lease(job, worker_name)
+
+        started = time.perf_counter()
+        if extractor._should_chunk(fireflies_data):
+            # A failed window raises IncompleteExtractionError and re-queues the job;
+            # the windows that succeeded are served from cache on the retry
+            tasks_data, _ = extractor._extract_chunked(fireflies_data, cache_item.fireflies_id)
+        else:
+            tasks_data, _, complete = extractor._run_prompt_with_status(prompt, route['model'])
+            if tasks_data is not None and not complete:
+                # Re-queue rather than save a partial list and mark the meeting extracted
+                raise RuntimeError('Truncated AI output')
+        if tasks_data is None:
+            raise RuntimeError('No AI response')
+        self._record_stage(timings, 'extract', started)
+        self._renew_lease(job, worker_name)
+
+        started = time.perf_counter()
+        with transaction.atomic():
+            for extraction_order, task_data in enumerate(tasks_data):
+                create_gemini_processed_task(
+                    cache_item,
+                    task_data,
+                    extraction_order,
+                    model_version=route['model'],
+                    source_sentences=extractor._find_source_sentences(task_data.get('task_item') or '', sentences),
+                    routing_reason=route['reason'],
+                    extraction_job=str(job.id)
+                )
+            cache_item.processed = True
+            cache_item.extracted_sentence_hashes = cache_item.current_sentence_hashes()
+            cache_item.save(update_fields=['processed', 'extracted_sentence_hashes', 'updated_at'])
+
+            self._record_stage(timings, 'save', started)
+            finished = ExtractionJob.objects.filter(id=job.id, status='running', lease_owner=worker_name).update(
+                status='done',
+                lease_owner='',
+                lease_expires_at=None,
+                last_error='',
+                tasks_created=len(tasks_data),
+                model_version=route['model'],
+                stage_seconds=timings,
+                finished_at=timezone.now(),
+                updated_at=timezone.now()
+            )
+            if not finished:
+                # Roll back the tasks; the worker that holds the lease now will save its own
+                raise LeaseLostError(f"Lease on job {job.id} was lost before commit")
+
+        return len(tasks_data)
+
+    def _fail_or_retry(self, job: ExtractionJob, worker_name: str, error: Exception):
+        job.refresh_from_db(fields=['attempts', 'max_attempts'])
+        status = 'failed' if job.attempts >= job.max_attempts else 'queued'
+        ExtractionJob.objects.filter(id=job.id, status='running', lease_owner=worker_name).update(
+            status=status,
+            lease_owner='',
+            lease_expires_at=None,
+            last_error=str(error)[:2000],
+            updated_at=timezone.now()
+        )
+        with self._stats_lock:
+            self.stats['jobs_failed' if status == 'failed' else 'jobs_retried'] += 1
+        logger.error(
+            f"❌ Extraction job for {job.raw_transcript.fireflies_id} attempt {job.attempts}/{job.max_attempts} "
+            f"failed ({'giving up' if status == 'failed' else 're-queued'}): {error}"
+        )
+
+    def _claim_allowed(self, max_jobs: Optional[int]) -> bool:
+        with self._stats_lock:
+            if max_jobs is not None and self._claimed >= max_jobs:
+                return False
+            self._claimed += 1
+            return True
+
+    def _worker(self, index: int, max_jobs: Optional[int]):
+        worker_name = f"{self.runner_id}:{index}"
+        extractor = self.extractor_factory()
+        try:
+            while self._claim_allowed(max_jobs):
+                job = self.claim_next(worker_name)
+                if job is None:
+                    break
+
+                try:
+                    tasks_created = self.process_job(job, worker_name, extractor)
+                except LeaseLostError as e:
+                    logger.warning(f"⚠️  {e} - abandoning")
+                    continue
+                except Exception as e:
+                    self._fail_or_retry(job, worker_name, e)
+                    continue
+
+                with self._stats_lock:
+                    self.stats['jobs_done'] += 1
+                    self.stats['tasks_created'] += tasks_created
+                logger.info(f"✅ {job.raw_transcript.fireflies_id}: {tasks_created} tasks ({worker_name})")
+        finally:
+            connection.close()
+
+    def run(self, max_jobs: Optional[int] = None) -> Dict[str, Any]:
+        """Drain the queue (or max_jobs of it) and return throughput stats"""
+        started = time.perf_counter()
+        threads = [
+            threading.Thread(target=self._worker, args=(index, max_jobs), name=f"extraction-worker-{index}")
+            for index in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return self.report(time.perf_counter() - started)
+
+    def report(self, elapsed: float) -> Dict[str, Any]:
+        """Per-stage and overall throughput for a run"""
+        stages = {}
+        for stage in STAGES:
+            count = self.stats['stage_count'][stage]
+            total = self.stats['stage_seconds'][stage]
+            stages[stage] = {
+                'jobs': count,
+                'avg_seconds': round(total / count, 3) if count else 0.0,
+                'jobs_per_minute': round(count / elapsed * 60, 1) if elapsed else 0.0,
+            }
+
+        return {
+            'elapsed_seconds': round(elapsed, 2),
+            'workers': self.workers,
+            'jobs_done': self.stats['jobs_done'],
+            'jobs_failed': self.stats['jobs_failed'],
+            'jobs_retried': self.stats['jobs_retried'],
+            'tasks_created': self.stats['tasks_created'],
+            'meetings_per_minute': round(self.stats['jobs_done'] / elapsed * 60, 1) if elapsed else 0.0,
+            'stages': stages,
+            'queue': extraction_job_summary(),
+        }
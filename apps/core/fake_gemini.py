@@ -0,0 +1,269 @@
+"""
+Deterministic Local Gemini Stand-In
+A requests transport adapter that answers generateContent and streamGenerateContent
+locally with schema-valid task arrays derived from the prompt's explicit action items.
+Latency, 429s and malformed output are injected from a seeded hash of each prompt, so
+load tests of the rate limiter, parser and worker pools are reproducible.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import random
+import re
+import threading
+import time
+from collections import Counter
+from typing import List, Dict, Any, Optional, Tuple
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from django.conf import settings
+
+from .ai_output_parser import CONTINUATION_INSTRUCTION
+from .transcript_compaction import estimate_tokens
+
+logger = logging.getLogger('apps.core.fake_gemini')
+
+GEMINI_HOST = 'https://generativelanguage.googleapis.com/'
+
+MEETING_SECTION_PATTERN = re.compile(r'=== Meeting "(?P<id>[^"]+)" ===\n(?P<body>.*?)\n=== End Meeting "(?P=id)" ===', re.DOTALL)
+ACTION_ITEMS_PATTERN = re.compile(r'Explicit Action Items:\s*\n(?P<items>.*?)(?:\n\s*Meeting Overview:|\Z)', re.DOTALL)
+ATTENDEE_PATTERN = re.compile(r'^- (?P<name>.*?) <(?P<email>[^>]+)>\s*$', re.MULTILINE)
+ORGANIZER_PATTERN = re.compile(r'organizer_email\s*→\s*(?P<email>\S+@\S+)')
+TIMESTAMP_SUFFIX = re.compile(r'\s*\(\d{1,2}:\d{2}(?::\d{2})?\)\s*$')
+CONTINUATION_MARKER = CONTINUATION_INSTRUCTION.split('\n', 1)[0]
+
+PRIORITIES = ['High', 'Medium', 'Low']
+
+
+def parse_action_items(section: str) -> List[Tuple[str, str]]:
+    """
+    Parse a Fireflies action_items block into (assignee_name, item) pairs
+    Headers look like **Name**; each following line is one item with an optional (mm:ss)
+    """
+    items = []
+    assignee = ''
+    for line in section.splitlines():
+        line = line.strip().lstrip('-• ')
+        if not line:
+            continue
+        header = re.fullmatch(r'\*\*(.+?)\*\*:?', line)
+        if header:
+            assignee = header.group(1).strip()
+            continue
+        item = TIMESTAMP_SUFFIX.sub('', line)
+        if item and not item.lower().startswith(('no explicit action items', 'none specified')):
+            items.append((assignee, item))
+    return items
+
+
+def resolve_assignee_email(name: str, attendees: List[Tuple[str, str]], fallback: str) -> str:
+    """Match an action-item header to an attendee email by display name or email local part"""
+    first_name = name.split()[0].lower() if name.split() else ''
+    for display_name, email in attendees:
+        if name and display_name.strip().lower() == name.lower():
+            return email
+    for _, email in attendees:
+        if first_name and email.split('@', 1)[0].lower().startswith(first_name):
+            return email
+    return fallback
+
+
+def derive_tasks(meeting_prompt: str) -> List[Dict[str, Any]]:
+    """Build the schema-valid task array for one meeting section of a prompt"""
+    match = ACTION_ITEMS_PATTERN.search(meeting_prompt)
+    if not match:
+        return []
+
+    attendees = [(m.group('name'), m.group('email')) for m in ATTENDEE_PATTERN.finditer(meeting_prompt)]
+    organizer = ORGANIZER_PATTERN.search(meeting_prompt)
+    fallback_email = organizer.group('email') if organizer else (attendees[0][1] if attendees else '')
+
+    tasks = []
+    for assignee, item in parse_action_items(match.group('items')):
+        words = item.rstrip('.').split()
+        if len(words) < 10:
+            words += 'as agreed during the meeting with the team'.split()[:10 - len(words)]
+        task_item = ' '.join(words)
+        digest = int(hashlib.md5(task_item.encode('utf-8')).hexdigest(), 16)
+
+        tasks.append({
+            'task_item': task_item,
+            'assignee_emails': resolve_assignee_email(assignee, attendees, fallback_email),
+            'assignee(s)_full_names': assignee or 'Unassigned',
+            'priority': PRIORITIES[digest % len(PRIORITIES)],
+            'brief_description': (
+                f"{assignee or 'The team'} agreed to {task_item[0].lower()}{task_item[1:]}. "
+                'This came up as an explicit action item in the meeting summary and should be '
+                'tracked until it is complete, with progress shared at the next check-in.'
+            ),
+            'due_date': None,
+            'status': 'To Do',
+        })
+    return tasks
+
+
+def render_response_text(prompt: str) -> str:
+    """The text a well-behaved model would return for this prompt"""
+    sections = list(MEETING_SECTION_PATTERN.finditer(prompt))
+    if sections:
+        return json.dumps({m.group('id'): derive_tasks(m.group('body')) for m in sections}, indent=2)
+
+    if 'Explicit Action Items:' not in prompt:
+        return 'OK'
+
+    tasks = derive_tasks(prompt)
+    if CONTINUATION_MARKER in prompt:
+        received = prompt.rsplit(CONTINUATION_MARKER, 1)[1]
+        tasks = [task for task in tasks if f"- {task['task_item']}" not in received]
+    return json.dumps(tasks, indent=2)
+
+
+def corrupt_output(text: str, rng: random.Random) -> str:
+    """Damage model output the way Gemini sometimes does: truncation or fenced trailing commas"""
+    if rng.random() < 0.5 and len(text) > 40:
+        return text[:rng.randint(len(text) // 2, len(text) - 10)]
+    return '```json\n' + re.sub(r'\}(\s*)\]', r'},\1]', text) + '\n```'
+
+
+class _StreamBody(io.RawIOBase):
+    """File-like SSE body that releases one event per read, with a delay between events"""
+
+    def __init__(self, events: List[bytes], delay: float):
+        super().__init__()
+        self._events = list(events)
+        self._delay = delay
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        if not self._events:
+            return b''
+        if self._delay:
+            time.sleep(self._delay)
+        return self._events.pop(0)
+
+
+class FakeGeminiAdapter(BaseAdapter):
+    """
+    Transport adapter standing in for the Gemini REST API
+
+    Mount it on a requests session for GEMINI_HOST. Every decision (latency, 429,
+    malformed output) comes from a hash of the seed, the prompt and how many times
+    that prompt has been seen, so runs are reproducible regardless of thread order.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        super().__init__()
+        if config is None:
+            config = settings.EXTERNAL_APIS['GEMINI'].get('FAKE_TRANSPORT', {})
+
+        self.latency_ms = config.get('LATENCY_MS', 0)
+        self.jitter_ms = config.get('JITTER_MS', 0)
+        self.rate_limit_rate = config.get('RATE_LIMIT_RATE', 0.0)
+        self.malformed_rate = config.get('MALFORMED_RATE', 0.0)
+        self.stream_chunk_chars = config.get('STREAM_CHUNK_CHARS', 200)
+        self.stream_chunk_delay_ms = config.get('STREAM_CHUNK_DELAY_MS', 0)
+        self.seed = config.get('SEED', 1)
+
+        self.stats = Counter()
+        self._attempts = Counter()
+        self._lock = threading.Lock()
+
+    def _rng_for(self, prompt: str) -> random.Random:
+        prompt_hash = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+        with self._lock:
+            attempt = self._attempts[prompt_hash]
+            self._attempts[prompt_hash] += 1
+        return random.Random(f"{self.seed}:{prompt_hash}:{attempt}")
+
+    def _count(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        body = json.loads(request.body or b'{}')
+        prompt = ''.join(
+            part.get('text', '')
+            for content in body.get('contents', [])
+            for part in content.get('parts', [])
+        )
+        rng = self._rng_for(prompt)
+        streaming = ':streamGenerateContent' in request.url
+        self._count('requests')
+
+        latency = (self.latency_ms + rng.uniform(0, self.jitter_ms)) / 1000.0
+        if latency:
+            time.sleep(latency)
+
+        if rng.random() < self.rate_limit_rate:
+            self._count('rate_limited')
+            return self._build_response(request, 429, json.dumps({
+                'error': {
+                    'code': 429,
+                    'message': 'Resource has been exhausted (e.g. check quota).',
+                    'status': 'RESOURCE_EXHAUSTED',
+                }
+            }).encode('utf-8'), {'Retry-After': '1'})
+
+        text = render_response_text(prompt)
+        if text != 'OK' and rng.random() < self.malformed_rate:
+            self._count('malformed')
+            text = corrupt_output(text, rng)
+
+        usage = {
+            'promptTokenCount': estimate_tokens(prompt),
+            'candidatesTokenCount': estimate_tokens(text),
+        }
+        usage['totalTokenCount'] = usage['promptTokenCount'] + usage['candidatesTokenCount']
+
+        if streaming:
+            return self._build_stream_response(request, text, usage)
+
+        payload = {
+            'candidates': [{'content': {'parts': [{'text': text}], 'role': 'model'}, 'finishReason': 'STOP'}],
+            'usageMetadata': usage,
+        }
+        return self._build_response(request, 200, json.dumps(payload).encode('utf-8'))
+
+    def _build_stream_response(self, request, text: str, usage: Dict[str, Any]) -> requests.Response:
+        size = max(1, self.stream_chunk_chars)
+        chunks = [text[i:i + size] for i in range(0, len(text), size)] or ['']
+        events = []
+        for index, chunk in enumerate(chunks):
+            event = {'candidates': [{'content': {'parts': [{'text': chunk}], 'role': 'model'}}]}
+            if index == len(chunks) - 1:
+                event['usageMetadata'] = usage
+            events.append(f"data: {json.dumps(event)}\r\n\r\n".encode('utf-8'))
+
+        response = self._build_response(request, 200, None, {'Content-Type': 'text/event-stream'})
+        response.raw = _StreamBody(events, self.stream_chunk_delay_ms / 1000.0)
+        return response
+
+    @staticmethod
+    def _build_response(request, status_code: int, content: Optional[bytes], headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        response = requests.Response()
+        response.status_code = status_code
+        response.reason = {200: 'OK', 429: 'Too Many Requests'}.get(status_code, '')
+        response.headers = CaseInsensitiveDict({'Content-Type': 'application/json', **(headers or {})})
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        if content is not None:
+            response._content = content
+            response.raw = io.BytesIO(content)
+        return response
+
+    def close(self):
+        pass
+
+
+def install_fake_gemini(client, config: Optional[Dict[str, Any]] = None) -> FakeGeminiAdapter:
+    """Route a Gemini client's HTTP session to a local FakeGeminiAdapter"""
+    adapter = FakeGeminiAdapter(config)
+    client.session.mount(GEMINI_HOST, adapter)
+    logger.info("🧪 Gemini requests routed to the local fake transport")
+    return adapter
@@ -0,0 +1,415 @@
+"""
+Local Monday.com GraphQL Stand-In
+A requests transport adapter that answers the GraphQL documents EnhancedMondayClient
+sends (create_item, aliased multi-item mutations, boards { columns groups },
+items_page / next_items_page, items_page_by_column_values, me) against an in-memory
+board, with complexity accounting and seeded latency, 429, item-error and timeout
+injection, so delivery throughput can be measured without touching the real board
+"""
+
+import base64
+import hashlib
+import io
+import json
+import logging
+import random
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone as dt_timezone
+from typing import List, Dict, Any, Optional, Tuple
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from django.conf import settings
+
+logger = logging.getLogger('apps.core.fake_monday')
+
+MONDAY_HOST = 'https://api.monday.com/'
+
+DELIVERY_KEY_COLUMN = 'text_delivery_key'
+
+# Mirrors the production board's columns (see monday_schema.DEFAULT_COLUMN_MAP)
+DEFAULT_COLUMNS = [
+    {'id': 'name', 'title': 'Name', 'type': 'name', 'settings_str': '{}'},
+    {'id': 'text_mkr7jgkp', 'title': 'Team member', 'type': 'text', 'settings_str': '{}'},
+    {'id': 'text_mkr0hqsb', 'title': 'Email', 'type': 'text', 'settings_str': '{}'},
+    {'id': 'status_1', 'title': 'Priority', 'type': 'status',
+     'settings_str': json.dumps({'labels': {'0': 'Medium', '1': 'High', '2': 'Low'}})},
+    {'id': 'status', 'title': 'Status', 'type': 'status', 'settings_str': json.dumps({'labels': {
+        '0': 'Working on it', '1': 'Done', '2': 'Stuck', '3': 'Waiting for review', '4': 'Approved', '5': 'To Do',
+    }})},
+    {'id': 'long_text', 'title': 'Brief description', 'type': 'long_text', 'settings_str': '{}'},
+    {'id': 'date_mkr7ymmh', 'title': 'Date expected', 'type': 'date', 'settings_str': '{}'},
+    {'id': DELIVERY_KEY_COLUMN, 'title': 'Delivery key', 'type': 'text', 'settings_str': '{}'},
+]
+
+CREATE_ITEM_PATTERN = re.compile(r'(?:(?P<alias>\w+)\s*:\s*)?create_item\s*\((?P<args>[^)]*)\)', re.DOTALL)
+ARGUMENT_PATTERN = re.compile(r'(?P<name>\w+)\s*:\s*(?P<value>\$\w+|"[^"]*"|[\w.-]+)')
+COLUMN_IDS_PATTERN = re.compile(r'column_values\s*\(\s*ids\s*:\s*(?P<ids>\[[^\]]*\]|\$\w+)\s*\)')
+
+
+def _now_iso() -> str:
+    return datetime.now(dt_timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+class FakeMondayError(Exception):
+    """A field-level GraphQL error for one alias"""
+    pass
+
+
+class FakeMondayAdapter(BaseAdapter):
+    """
+    Transport adapter standing in for the Monday.com GraphQL API
+
+    Mount it on a requests session for MONDAY_HOST. One in-memory board is shared by
+    every client in the process (see get_instance). Injected faults come from a hash
+    of the seed, the request body and how often that body was seen.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        super().__init__()
+        if config is None:
+            config = settings.EXTERNAL_APIS['MONDAY'].get('FAKE_TRANSPORT', {})
+
+        self.latency_ms = config.get('LATENCY_MS', 0)
+        self.jitter_ms = config.get('JITTER_MS', 0)
+        self.per_item_ms = config.get('PER_ITEM_MS', 0)
+        self.budget_per_minute = config.get('BUDGET_PER_MINUTE', 10000000)
+        self.create_item_complexity = config.get('CREATE_ITEM_COMPLEXITY', 30000)
+        self.query_complexity = config.get('QUERY_COMPLEXITY', 1000)
+        self.item_read_complexity = config.get('ITEM_READ_COMPLEXITY', 10)
+        self.rate_limit_rate = config.get('RATE_LIMIT_RATE', 0.0)
+        self.item_error_rate = config.get('ITEM_ERROR_RATE', 0.0)
+        self.timeout_rate = config.get('TIMEOUT_RATE', 0.0)
+        self.seed = config.get('SEED', 1)
+
+        self.columns = {column['id']: column for column in DEFAULT_COLUMNS}
+        self.groups = {'group_mkqyryrz': 'Action items'}
+        self.items: Dict[str, Dict[str, Any]] = {}
+        self._next_item_id = 9000000001
+
+        self._budget_remaining = self.budget_per_minute
+        self._window_started = time.monotonic()
+
+        self.stats = Counter()
+        self._attempts = Counter()
+        self._state_lock = threading.RLock()
+
+    @classmethod
+    def get_instance(cls) -> 'FakeMondayAdapter':
+        """Get the process-wide fake board"""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    # Board state helpers
+
+    def _labels(self, column_id: str) -> Dict[str, str]:
+        return json.loads(self.columns[column_id].get('settings_str') or '{}').get('labels') or {}
+
+    def _encode_value(self, column_id: str, value) -> str:
+        """Validate one column value the way Monday does; returns the stored text"""
+        column = self.columns.get(column_id)
+        if column is None:
+            raise FakeMondayError(f"This column ID doesn't exist for the board: {column_id}")
+
+        if column['type'] == 'status':
+            labels = self._labels(column_id)
+            if isinstance(value, dict) and 'index' in value:
+                label = labels.get(str(value['index']))
+            else:
+                label = value.get('label') if isinstance(value, dict) else value
+                label = label if label in labels.values() else None
+            if label is None:
+                raise FakeMondayError(f"Invalid status value {value!r} for column {column_id}")
+            return label
+
+        if column['type'] == 'date':
+            text = value.get('date') if isinstance(value, dict) else value
+            try:
+                datetime.strptime(str(text), '%Y-%m-%d')
+            except ValueError:
+                raise FakeMondayError(f"Invalid date {value!r} for column {column_id}")
+            return str(text)
+
+        if isinstance(value, dict):
+            return str(value.get('text', ''))
+        return str(value)
+
+    def set_column_value(self, item_id: str, column_id: str, text: str):
+        """Edit an item as a person on the board would (bumps updated_at)"""
+        with self._state_lock:
+            item = self.items[str(item_id)]
+            item['column_values'][column_id] = text
+            item['updated_at'] = _now_iso()
+
+    def duplicate_deliveries(self) -> int:
+        """Extra items sharing a delivery key - should always be 0"""
+        keys = Counter(
+            item['column_values'].get(DELIVERY_KEY_COLUMN) for item in self.items.values()
+            if item['column_values'].get(DELIVERY_KEY_COLUMN)
+        )
+        return sum(count - 1 for count in keys.values() if count > 1)
+
+    def reset(self):
+        """Empty the board and refill the complexity budget"""
+        with self._state_lock:
+            self.items.clear()
+            self.stats.clear()
+            self._attempts.clear()
+            self._budget_remaining = self.budget_per_minute
+            self._window_started = time.monotonic()
+
+    # Request handling
+
+    def _rng_for(self, body: bytes) -> random.Random:
+        body_hash = hashlib.sha256(body).hexdigest()
+        with self._state_lock:
+            attempt = self._attempts[body_hash]
+            self._attempts[body_hash] += 1
+        return random.Random(f"{self.seed}:{body_hash}:{attempt}")
+
+    def _charge(self, cost: int) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Spend complexity; returns (complexity block, None) or (None, exhausted message)"""
+        with self._state_lock:
+            elapsed = time.monotonic() - self._window_started
+            if elapsed >= 60:
+                self._window_started = time.monotonic()
+                self._budget_remaining = self.budget_per_minute
+                elapsed = 0
+            reset_in = max(1, int(round(60 - elapsed)))
+
+            if cost > self._budget_remaining:
+                return None, (
+                    f"Complexity budget exhausted, query cost {cost} budget remaining "
+                    f"{self._budget_remaining} out of {self.budget_per_minute} reset in {reset_in} seconds"
+                )
+
+            before = self._budget_remaining
+            self._budget_remaining -= cost
+            self.stats['complexity_spent'] += cost
+            return {'query': cost, 'before': before, 'after': self._budget_remaining, 'reset_in_x_seconds': reset_in}, None
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        body = request.body or b'{}'
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        payload = json.loads(body)
+        query = payload.get('query', '')
+        variables = payload.get('variables') or {}
+
+        rng = self._rng_for(body)
+        with self._state_lock:
+            self.stats['requests'] += 1
+
+        creates = list(CREATE_ITEM_PATTERN.finditer(query))
+        latency = (self.latency_ms + rng.uniform(0, self.jitter_ms) + self.per_item_ms * len(creates)) / 1000.0
+        if latency:
+            time.sleep(latency)
+
+        if rng.random() < self.rate_limit_rate:
+            with self._state_lock:
+                self.stats['rate_limited'] += 1
+            return self._build_response(request, 429, json.dumps({
+                'error_message': 'Rate limit exceeded', 'status_code': 429,
+            }).encode('utf-8'), {'Retry-After': '1'})
+
+        data, errors, items_read = self._execute(query, variables, creates, rng)
+
+        complexity, exhausted = self._charge(
+            self.query_complexity + self.create_item_complexity * len(creates) + self.item_read_complexity * items_read
+        )
+        if exhausted:
+            # Monday rejects the whole query before running it; undo what _execute did
+            self._rollback(data)
+            with self._state_lock:
+                self.stats['complexity_exhausted'] += 1
+            return self._build_response(request, 200, json.dumps({
+                'errors': [{'message': exhausted, 'extensions': {'code': 'ComplexityException'}}],
+            }).encode('utf-8'))
+
+        if 'complexity {' in query:
+            data['complexity'] = complexity
+
+        if creates and rng.random() < self.timeout_rate:
+            # The items exist, but the caller never hears about them
+            with self._state_lock:
+                self.stats['timeouts'] += 1
+            raise requests.exceptions.ReadTimeout('Fake Monday.com read timed out')
+
+        response = {'data': data}
+        if errors:
+            response['errors'] = errors
+        return self._build_response(request, 200, json.dumps(response).encode('utf-8'))
+
+    def _execute(self, query: str, variables: Dict[str, Any], creates, rng: random.Random):
+        """Run the supported operations; returns (data, field errors, items read)"""
+        data: Dict[str, Any] = {}
+        errors: List[Dict[str, Any]] = []
+        column_ids = self._requested_column_ids(query, variables)
+
+        if creates:
+            for match in creates:
+                alias = match.group('alias') or 'create_item'
+                args = self._arguments(match.group('args'), variables)
+                try:
+                    if rng.random() < self.item_error_rate:
+                        raise FakeMondayError('Internal server error while creating item')
+                    data[alias] = self._create_item(args)
+                except FakeMondayError as e:
+                    data[alias] = None
+                    errors.append({'message': str(e), 'path': [alias], 'locations': []})
+                    with self._state_lock:
+                        self.stats['item_errors'] += 1
+            return data, errors, 0
+
+        if 'items_page_by_column_values' in query:
+            column_id = variables.get('columnId', DELIVERY_KEY_COLUMN)
+            keys = set(variables.get('keys') or [])
+            with self._state_lock:
+                found = [item for item in self.items.values() if item['column_values'].get(column_id) in keys]
+            data['items_page_by_column_values'] = {
+                'cursor': None, 'items': [self._render_item(item, column_ids) for item in found],
+            }
+            return data, errors, len(found)
+
+        if 'next_items_page' in query:
+            page = self._items_page(self._decode_cursor(variables['cursor']), variables.get('limit', 25), column_ids)
+            data['next_items_page'] = page
+            return data, errors, len(page['items'])
+
+        if 'items_page' in query:
+            limit = variables.get('limit', 25)
+            rules = (variables.get('queryParams') or {}).get('rules') or []
+            since = next((rule['compare_value'][-1] for rule in rules if rule.get('column_id') == '__last_updated__'), None)
+            state = {'group_id': variables.get('groupId'), 'since': since, 'offset': 0}
+            page = self._items_page(state, limit, column_ids)
+            data['boards'] = [{'groups': [{'items_page': page}]}]
+            return data, errors, len(page['items'])
+
+        if 'boards' in query:
+            data['boards'] = [{
+                'id': str(variables.get('boardId', '')),
+                'name': 'TaskForge (fake)',
+                'description': 'Local Monday.com stand-in',
+                'groups': [{'id': group_id, 'title': title} for group_id, title in self.groups.items()],
+                'columns': list(self.columns.values()),
+            }]
+            return data, errors, 0
+
+        if 'me' in query:
+            data['me'] = {'id': '1', 'name': 'Fake Monday', 'email': 'fake-monday@taskforge.local'}
+        return data, errors, 0
+
+    @staticmethod
+    def _arguments(text: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        args = {}
+        for match in ARGUMENT_PATTERN.finditer(text):
+            value = match.group('value')
+            if value.startswith('$'):
+                args[match.group('name')] = variables.get(value[1:])
+            else:
+                args[match.group('name')] = value.strip('"')
+        return args
+
+    @staticmethod
+    def _requested_column_ids(query: str, variables: Dict[str, Any]) -> Optional[List[str]]:
+        match = COLUMN_IDS_PATTERN.search(query)
+        if not match:
+            return None
+        ids = match.group('ids')
+        if ids.startswith('$'):
+            return list(variables.get(ids[1:]) or [])
+        return [variables.get(part.strip()[1:]) if part.strip().startswith('$') else part.strip().strip('"')
+                for part in ids.strip('[]').split(',') if part.strip()]
+
+    def _create_item(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        group_id = args.get('group_id') or next(iter(self.groups))
+        if group_id not in self.groups:
+            raise FakeMondayError(f"Group not found: {group_id}")
+
+        raw_values = args.get('column_values') or '{}'
+        values = json.loads(raw_values) if isinstance(raw_values, str) else raw_values
+        stored = {column_id: self._encode_value(column_id, value) for column_id, value in values.items()}
+
+        with self._state_lock:
+            item_id = str(self._next_item_id)
+            self._next_item_id += 1
+            self.items[item_id] = {
+                'id': item_id,
+                'name': args.get('item_name') or '',
+                'group_id': group_id,
+                'column_values': stored,
+                'updated_at': _now_iso(),
+            }
+            self.stats['items_created'] += 1
+        return {'id': item_id, 'name': args.get('item_name') or ''}
+
+    def _rollback(self, data: Dict[str, Any]):
+        with self._state_lock:
+            for value in data.values():
+                if isinstance(value, dict) and value.get('id') in self.items:
+                    del self.items[value['id']]
+                    self.stats['items_created'] -= 1
+
+    def _render_item(self, item: Dict[str, Any], column_ids: Optional[List[str]]) -> Dict[str, Any]:
+        wanted = column_ids if column_ids is not None else list(item['column_values'])
+        return {
+            'id': item['id'],
+            'name': item['name'],
+            'updated_at': item['updated_at'],
+            'column_values': [{'id': column_id, 'text': item['column_values'].get(column_id, '')} for column_id in wanted],
+        }
+
+    @staticmethod
+    def _encode_cursor(state: Dict[str, Any]) -> str:
+        return base64.urlsafe_b64encode(json.dumps(state).encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Dict[str, Any]:
+        return json.loads(base64.urlsafe_b64decode(cursor.encode()))
+
+    def _items_page(self, state: Dict[str, Any], limit: int, column_ids: Optional[List[str]]) -> Dict[str, Any]:
+        with self._state_lock:
+            matching = [
+                item for item_id, item in sorted(self.items.items())
+                if (not state.get('group_id') or item['group_id'] == state['group_id'])
+                and (not state.get('since') or item['updated_at'][:10] >= state['since'])
+            ]
+        offset = state.get('offset', 0)
+        page = matching[offset:offset + limit]
+        cursor = self._encode_cursor({**state, 'offset': offset + limit}) if offset + limit < len(matching) else None
+        return {'cursor': cursor, 'items': [self._render_item(item, column_ids) for item in page]}
+
+    @staticmethod
+    def _build_response(request, status_code: int, content: bytes, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        response = requests.Response()
+        response.status_code = status_code
+        response.reason = {200: 'OK', 429: 'Too Many Requests'}.get(status_code, '')
+        response.headers = CaseInsensitiveDict({'Content-Type': 'application/json', **(headers or {})})
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        response._content = content
+        response.raw = io.BytesIO(content)
+        return response
+
+    def close(self):
+        pass
+
+
+def install_fake_monday(client, adapter: Optional[FakeMondayAdapter] = None) -> FakeMondayAdapter:
+    """Route a Monday.com client's HTTP session to the local fake board"""
+    adapter = adapter or FakeMondayAdapter.get_instance()
+    client.session.mount(MONDAY_HOST, adapter)
+    # The fake board always has the hidden key column, so retries can be verified
+    client.delivery_key_column = client.delivery_key_column or DELIVERY_KEY_COLUMN
+    logger.info("🧪 Monday.com requests routed to the local fake transport")
+    return adapter
@@ -5,14 +5,17 @@ Google Gemini API client with comprehensive rate limiting and caching
 import logging
 import requests
 import json
+import threading
 import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 from django.conf import settings
 from django.core.cache import cache
 from django.utils import timezone
 
 from .circuit_breaker import CircuitBreakerRegistry
+from .ai_output_parser import recover_task_array, recover_missing_tail
+from .quota_ledger import get_quota_ledger
 
 logger = logging.getLogger('apps.core.gemini_client')
 
@@ -29,17 +32,14 @@ class EnhancedGeminiClient:
         self.rate_limit_per_minute = rate_limit_per_minute
         self.min_request_interval = 60.0 / rate_limit_per_minute  # seconds between requests
         self.last_request_time = 0
+        self._rate_limit_lock = threading.Lock()  # shared by parallel chunk workers
         
         # Caching configuration
         self.cache_timeout = cache_timeout  # 30 minutes default
         self.cache_prefix = 'gemini_'
         
-        # Quota tracking
-        self.quota_tracker = {
-            'requests_today': 0,
-            'last_reset': datetime.now().date(),
-            'warning_threshold': settings.EXTERNAL_APIS['GEMINI'].get('QUOTA_WARNING_THRESHOLD', 80)
-        }
+        # Quota tracking - durable and shared by every worker
+        self.quota_ledger = get_quota_ledger()
         
         # Retry configuration
         self.retry_attempts = settings.EXTERNAL_APIS['GEMINI'].get('RETRY_ATTEMPTS', 3)
@@ -54,35 +54,33 @@ class EnhancedGeminiClient:
         
         logger.info(f"Initialized EnhancedGeminiClient with {rate_limit_per_minute}/min rate limit")
     
-    def _enforce_rate_limit(self):
-        """Enforce rate limiting between requests"""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
+    def _enforce_rate_limit(self, model: Optional[str] = None):
+        """
+        Enforce rate limiting between requests (thread-safe)
+        Each caller claims its send slot under the lock and sleeps outside it, so
+        parallel workers never wait on one another's sleeps or ledger round-trips
+        """
+        with self._rate_limit_lock:
+            current_time = time.time()
+            slot = max(current_time, self.last_request_time + self.min_request_interval)
+            self.last_request_time = slot
         
-        if time_since_last_request < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last_request
-            logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
-            time.sleep(sleep_time)
+        if slot > current_time:
+            logger.debug(f"Rate limiting: sleeping {slot - current_time:.2f}s")
+            time.sleep(slot - current_time)
         
-        self.last_request_time = time.time()
+        # Reserve against usage recorded by all workers, not just this client
+        self.quota_ledger.pace(model or self.model_name)
     
-    def _update_quota_tracker(self):
-        """Update quota tracking"""
-        today = datetime.now().date()
-        
-        # Reset daily counter if it's a new day
-        if self.quota_tracker['last_reset'] != today:
-            self.quota_tracker['requests_today'] = 0
-            self.quota_tracker['last_reset'] = today
-        
-        self.quota_tracker['requests_today'] += 1
-        
-        # Check for quota warnings (assuming 1000 requests/day limit)
-        daily_limit = 1000  # Gemini API typical daily limit
-        usage_percentage = (self.quota_tracker['requests_today'] / daily_limit) * 100
-        
-        if usage_percentage >= self.quota_tracker['warning_threshold']:
-            logger.warning(f"Gemini API quota warning: {usage_percentage:.1f}% used ({self.quota_tracker['requests_today']}/{daily_limit})")
+    @property
+    def model_name(self) -> str:
+        """Default model, parsed from the endpoint URL"""
+        return self.base_url.rsplit('/models/', 1)[-1].split(':', 1)[0]
+    
+    def model_url(self, model: Optional[str] = None, method: str = 'generateContent') -> str:
+        """Endpoint URL for a model and method, e.g. streamGenerateContent"""
+        api_root = self.base_url.rsplit('/models/', 1)[0]
+        return f"{api_root}/models/{model or self.model_name}:{method}"
     
     def _get_cache_key(self, prompt_hash: str) -> str:
         """Generate cache key for prompt"""
@@ -103,14 +101,17 @@ class EnhancedGeminiClient:
         data_string = json.dumps(key_data, sort_keys=True)
         return hashlib.md5(data_string.encode()).hexdigest()
     
-    def _execute_request_with_retry(self, prompt: str) -> Dict[str, Any]:
-        """Execute Gemini API request with retry logic and circuit breaker"""
+    def _execute_request_with_retry(self, prompt: str, model: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Execute Gemini API request with retry logic and circuit breaker
+        model overrides the default model for this request only
+        """
+        model = model or self.model_name
         
         def make_request():
-            self._enforce_rate_limit()
-            self._update_quota_tracker()
+            self._enforce_rate_limit(model)  # also counts the request in the quota ledger
             
-            url = f"{self.base_url}?key={self.api_key}"
+            url = f"{self.model_url(model)}?key={self.api_key}"
             
             payload = {
                 "contents": [{
@@ -124,6 +125,7 @@ class EnhancedGeminiClient:
             response.raise_for_status()
             
             data = response.json()
+            self.quota_ledger.record_tokens(model, data.get('usageMetadata'))
             
             if 'error' in data:
                 error_msg = data['error']
@@ -144,17 +146,101 @@ class EnhancedGeminiClient:
             logger.error(f"Gemini API request failed after circuit breaker: {e}")
             raise
     
-    def extract_tasks_from_transcript(self, transcript_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    @property
+    def stream_url(self) -> str:
+        """streamGenerateContent endpoint for the configured model"""
+        return self.model_url(method='streamGenerateContent')
+    
+    def stream_generate_content(self, prompt: str, model: Optional[str] = None) -> Iterator[str]:
+        """
+        Stream generated text chunks from streamGenerateContent (server-sent events)
+        Rate limiting, quota tracking and the circuit breaker apply to opening the stream
+        """
+        model = model or self.model_name
+        
+        def open_stream():
+            self._enforce_rate_limit(model)  # also counts the request in the quota ledger
+            
+            url = f"{self.model_url(model, 'streamGenerateContent')}?alt=sse&key={self.api_key}"
+            
+            payload = {
+                "contents": [{
+                    "parts": [{
+                        "text": prompt
+                    }]
+                }]
+            }
+            
+            response = self.session.post(
+                url,
+                json=payload,
+                stream=True,
+                timeout=settings.EXTERNAL_APIS['GEMINI'].get('TIMEOUT', 60)
+            )
+            response.raise_for_status()
+            return response
+        
+        try:
+            response = self.circuit_breaker.call(open_stream)
+        except Exception as e:
+            logger.error(f"Gemini streaming request failed after circuit breaker: {e}")
+            raise
+        
+        usage_metadata = None
+        try:
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith('data:'):
+                    continue
+                
+                data = json.loads(line[len('data:'):].strip())
+                usage_metadata = data.get('usageMetadata') or usage_metadata
+                
+                if 'error' in data:
+                    logger.error(f"Gemini API stream error: {data['error']}")
+                    raise Exception(f"Gemini API error: {data['error']}")
+                
+                candidates = data.get('candidates', [])
+                if not candidates:
+                    continue
+                
+                for part in candidates[0].get('content', {}).get('parts', []):
+                    text = part.get('text')
+                    if text:
+                        yield text
+        except Exception:
+            self.circuit_breaker.record_failure()
+            raise
+        finally:
+            response.close()
+            self.quota_ledger.record_tokens(model, usage_metadata)
+    
+    def extract_tasks_from_transcript(self, transcript_data: Dict[str, Any], model: Optional[str] = None) -> List[Dict[str, Any]]:
         """Extract action items from meeting transcript with caching"""
+        tasks, _ = self.extract_tasks_with_status(transcript_data, model)
+        return tasks
+    
+    def extract_tasks_with_status(
+        self,
+        transcript_data: Dict[str, Any],
+        model: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Extract action items and report whether the result is the full task list
+        complete is False when the request failed, the output could not be parsed or
+        it stayed truncated, so callers must not mark the transcript as extracted
+        """
+        model = model or self.model_name
         
         # Check cache first
         prompt_hash = self._generate_prompt_hash(transcript_data)
         cache_key = self._get_cache_key(prompt_hash)
+        if model != self.model_name:
+            cache_key = f"{cache_key}_{model}"
         
         cached_result = cache.get(cache_key)
         if cached_result is not None:
             logger.info(f"Using cached Gemini result for transcript {prompt_hash[:8]}")
-            return cached_result
+            return cached_result, True
         
         # Convert sentences to transcript text
         transcript_text = self._format_sentences(transcript_data.get('sentences', []))
@@ -200,53 +286,59 @@ Full Transcript:
 Return ONLY the JSON array described above."""
         
         try:
-            response = self._execute_request_with_retry(prompt)
+            response = self._execute_request_with_retry(prompt, model)
             
             # Extract the generated text
             candidates = response.get('candidates', [])
             if not candidates:
                 logger.warning("No candidates in Gemini response")
-                return []
+                return [], False
             
             content = candidates[0].get('content', {})
             parts = content.get('parts', [])
             if not parts:
                 logger.warning("No parts in Gemini response")
-                return []
+                return [], False
             
             generated_text = parts[0].get('text', '')
             
-            # Parse the JSON response
-            try:
-                # Clean the response (remove markdown formatting if present)
-                cleaned_text = generated_text.strip()
-                if cleaned_text.startswith('```json'):
-                    cleaned_text = cleaned_text[7:]
-                if cleaned_text.endswith('```'):
-                    cleaned_text = cleaned_text[:-3]
-                cleaned_text = cleaned_text.strip()
-                
-                tasks = json.loads(cleaned_text)
-                
-                if not isinstance(tasks, list):
-                    logger.warning("Gemini response is not a list")
-                    return []
-                
+            # Parse the JSON response, salvaging complete tasks from malformed output
+            tasks, report = recover_task_array(generated_text)
+            
+            complete = True
+            if report['truncated']:
+                max_continuations = settings.EXTERNAL_APIS['GEMINI'].get('OUTPUT_RECOVERY', {}).get('MAX_CONTINUATIONS', 1)
+                tasks, complete = recover_missing_tail(
+                    prompt, tasks, lambda tail_prompt: self._generate_text(tail_prompt, model), max_continuations
+                )
+            elif not tasks and not report['strict']:
+                logger.error("Failed to parse Gemini JSON response")
+                logger.error(f"Raw response: {generated_text}")
+                return [], False
+            
+            if complete:
                 # Cache the successful result
                 cache.set(cache_key, tasks, self.cache_timeout)
                 logger.info(f"Cached Gemini result for transcript {prompt_hash[:8]} (expires in {self.cache_timeout/60:.0f}min)")
-                
-                logger.info(f"Extracted {len(tasks)} tasks from transcript")
-                return tasks
-                
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse Gemini JSON response: {e}")
-                logger.error(f"Raw response: {generated_text}")
-                return []
+            else:
+                # A partial list must not be served as the full result on the next call
+                logger.warning(f"Not caching truncated result for transcript {prompt_hash[:8]}")
+            
+            logger.info(f"Extracted {len(tasks)} tasks from transcript")
+            return tasks, complete
             
         except Exception as e:
             logger.error(f"Failed to extract tasks: {e}")
-            return []
+            return [], False
+    
+    def _generate_text(self, prompt: str, model: Optional[str] = None) -> Optional[str]:
+        """Run a prompt and return the generated text, or None on failure"""
+        try:
+            response = self._execute_request_with_retry(prompt, model)
+            return response['candidates'][0]['content']['parts'][0]['text']
+        except Exception as e:
+            logger.error(f"Continuation request failed: {e}")
+            return None
     
     def _format_sentences(self, sentences: List[Dict[str, Any]]) -> str:
         """Format sentences into transcript text"""
@@ -303,9 +395,8 @@ Return ONLY the JSON array described above."""
     def get_quota_status(self) -> Dict[str, Any]:
         """Get current quota status"""
         return {
-            'requests_today': self.quota_tracker['requests_today'],
-            'last_reset': self.quota_tracker['last_reset'].isoformat(),
-            'warning_threshold': self.quota_tracker['warning_threshold'],
+            **self.quota_ledger.usage(self.model_name),
+            'warning_threshold': self.quota_ledger.warning_threshold,
             'rate_limit_per_minute': self.rate_limit_per_minute,
             'cache_timeout_minutes': self.cache_timeout / 60,
             'circuit_breaker_state': self.circuit_breaker.state.value
@@ -321,4 +412,11 @@ def get_gemini_client() -> EnhancedGeminiClient:
     rate_limit = gemini_config.get('RATE_LIMIT_PER_MINUTE', 15)
     cache_timeout = gemini_config.get('CACHE_TIMEOUT', 1800)
     
-    return EnhancedGeminiClient(api_key, rate_limit, cache_timeout) 
\ No newline at end of file
+    client = EnhancedGeminiClient(api_key, rate_limit, cache_timeout)
+    
+    fake_config = gemini_config.get('FAKE_TRANSPORT', {})
+    if fake_config.get('ENABLED'):
+        from .fake_gemini import install_fake_gemini
+        install_fake_gemini(client, fake_config)
+    
+    return client 
\ No newline at end of file
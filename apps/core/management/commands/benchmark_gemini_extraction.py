@@ -0,0 +1,163 @@
+"""
+Benchmark Gemini Extraction Against the Local Fake Transport
+Replays cached meetings through the real extractor, rate limiter, quota ledger,
+circuit breaker and parser, with the network replaced by FakeGeminiAdapter
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.core.models import RawTranscriptCache
+from apps.core.circuit_breaker import CircuitBreaker
+from apps.core.fake_gemini import FakeGeminiAdapter, GEMINI_HOST
+from apps.core.model_router import ModelRouter
+from apps.core.precision_extractor import PrecisionTaskExtractor
+from apps.core.quota_ledger import QuotaLedger
+
+logger = logging.getLogger('apps.core.management.commands.benchmark_gemini_extraction')
+
+# Ledger rows are recorded under this name so benchmarks never consume the real daily quota
+BENCHMARK_MODEL = 'fake-gemini'
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+class Command(BaseCommand):
+    help = 'Load-test Gemini extraction with a deterministic local stand-in for the Gemini API'
+
+    def add_arguments(self, parser):
+        fake_config = settings.EXTERNAL_APIS['GEMINI'].get('FAKE_TRANSPORT', {})
+
+        parser.add_argument('--meetings', type=int, default=20, help='Cached meetings to replay (default: 20)')
+        parser.add_argument('--repeat', type=int, default=1, help='Replay the meeting set this many times')
+        parser.add_argument('--workers', type=int, default=4, help='Concurrent extraction workers')
+        parser.add_argument('--rpm', type=int, default=600, help='Requests per minute allowed by the limiter')
+        parser.add_argument('--stream', action='store_true', help='Use streamGenerateContent')
+        parser.add_argument('--latency-ms', type=int, default=fake_config.get('LATENCY_MS', 800))
+        parser.add_argument('--jitter-ms', type=int, default=fake_config.get('JITTER_MS', 400))
+        parser.add_argument('--rate-limit-rate', type=float, default=fake_config.get('RATE_LIMIT_RATE', 0.0),
+                            help='Fraction of requests answered with 429')
+        parser.add_argument('--malformed-rate', type=float, default=fake_config.get('MALFORMED_RATE', 0.0),
+                            help='Fraction of responses returned truncated or with broken JSON')
+        parser.add_argument('--seed', type=int, default=fake_config.get('SEED', 1))
+
+    def handle(self, *args, **options):
+        self.stdout.write("🧪 GEMINI EXTRACTION BENCHMARK (local fake transport)")
+        self.stdout.write("=" * 55)
+
+        meetings = list(RawTranscriptCache.objects.all().order_by('-meeting_date')[:options['meetings']])
+        if not meetings:
+            self.stdout.write(self.style.ERROR("❌ No meetings found in cache - populate RawTranscriptCache first"))
+            return
+
+        adapter = FakeGeminiAdapter({
+            **settings.EXTERNAL_APIS['GEMINI'].get('FAKE_TRANSPORT', {}),
+            'LATENCY_MS': options['latency_ms'],
+            'JITTER_MS': options['jitter_ms'],
+            'RATE_LIMIT_RATE': options['rate_limit_rate'],
+            'MALFORMED_RATE': options['malformed_rate'],
+            'SEED': options['seed'],
+        })
+        ledger = QuotaLedger({'REQUESTS_PER_MINUTE': options['rpm'], 'REQUESTS_PER_DAY': None})
+        breaker = CircuitBreaker('gemini_api_benchmark', failure_threshold=5, timeout=300)
+        router = ModelRouter({'ENABLED': False, 'FULL_MODEL': BENCHMARK_MODEL})
+
+        local = threading.local()
+
+        def get_extractor():
+            # One extractor (and HTTP session) per worker thread, as in production workers
+            if not hasattr(local, 'extractor'):
+                extractor = PrecisionTaskExtractor(chunked=False)
+                client = extractor.gemini_client
+                client.session.mount(GEMINI_HOST, adapter)
+                client.quota_ledger = ledger
+                client.circuit_breaker = breaker
+                client.min_request_interval = 60.0 / options['rpm']
+                extractor.model_router = router
+                local.extractor = extractor
+            return local.extractor
+
+        def run_one(cache_item):
+            extractor = get_extractor()
+            result = {'tasks': 0, 'error': None, 'first_task': None}
+            started = time.perf_counter()
+            try:
+                fireflies_data, prompt = extractor.prepare_prompt(cache_item)
+                result['prepare'] = time.perf_counter() - started
+
+                if options['stream']:
+                    for _ in extractor.stream_prompt(prompt, cache_item.fireflies_id, BENCHMARK_MODEL):
+                        if result['first_task'] is None:
+                            result['first_task'] = time.perf_counter() - started
+                        result['tasks'] += 1
+                else:
+                    tasks, _, _ = extractor._run_prompt_with_status(prompt, BENCHMARK_MODEL)
+                    result['tasks'] = len(tasks or [])
+            except Exception as e:
+                result['error'] = f"{type(e).__name__}: {e}"
+            result['total'] = time.perf_counter() - started
+            return result
+
+        workload = meetings * max(1, options['repeat'])
+        self.stdout.write(
+            f"📄 {len(workload)} extractions over {len(meetings)} meetings, {options['workers']} workers, "
+            f"{options['rpm']}/min limit, {'streaming' if options['stream'] else 'generateContent'}"
+        )
+        self.stdout.write(
+            f"🎛️  latency {options['latency_ms']}±{options['jitter_ms']}ms, 429 rate {options['rate_limit_rate']:.0%}, "
+            f"malformed rate {options['malformed_rate']:.0%}, seed {options['seed']}"
+        )
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, options['workers'])) as executor:
+            results = list(executor.map(run_one, workload))
+        elapsed = time.perf_counter() - started
+
+        self.print_report(results, elapsed, adapter, breaker)
+
+    def print_report(self, results, elapsed, adapter, breaker):
+        """Throughput, latency percentiles and injected-fault counts"""
+        succeeded = [result for result in results if not result['error']]
+        failed = [result for result in results if result['error']]
+        totals = [result['total'] * 1000 for result in succeeded]
+        prepares = [result['prepare'] * 1000 for result in succeeded if 'prepare' in result]
+        first_tasks = [result['first_task'] * 1000 for result in succeeded if result['first_task'] is not None]
+
+        self.stdout.write(f"\n📊 BENCHMARK RESULTS")
+        self.stdout.write("=" * 55)
+        self.stdout.write(f"⏱️  Wall time: {elapsed:.2f}s")
+        self.stdout.write(f"🚀 Throughput: {len(results) / elapsed:.2f} meetings/s")
+        self.stdout.write(f"✅ Succeeded: {len(succeeded)}   ❌ Failed: {len(failed)}")
+        self.stdout.write(f"📋 Tasks extracted: {sum(result['tasks'] for result in succeeded)}")
+        self.stdout.write(
+            f"📈 Extraction ms  p50 {percentile(totals, 50):.0f}  p95 {percentile(totals, 95):.0f}  "
+            f"max {max(totals) if totals else 0:.0f}"
+        )
+        self.stdout.write(f"🛠️  Prompt build ms p50 {percentile(prepares, 50):.1f}  p95 {percentile(prepares, 95):.1f}")
+        if first_tasks:
+            self.stdout.write(
+                f"🌊 First task ms  p50 {percentile(first_tasks, 50):.0f}  p95 {percentile(first_tasks, 95):.0f}"
+            )
+
+        self.stdout.write(
+            f"🧪 Fake transport: {adapter.stats['requests']} requests, "
+            f"{adapter.stats['rate_limited']} answered 429, {adapter.stats['malformed']} malformed"
+        )
+        self.stdout.write(f"🔌 Circuit breaker: {breaker.state.value} ({breaker.failure_count} failures)")
+
+        errors = {}
+        for result in failed:
+            errors[result['error']] = errors.get(result['error'], 0) + 1
+        for error, count in sorted(errors.items(), key=lambda item: -item[1])[:5]:
+            self.stdout.write(self.style.WARNING(f"   ⚠️  {count}× {error[:120]}"))
@@ -0,0 +1,192 @@
+"""
+Benchmark Monday.com Delivery Against the Local Fake Board
+Sends synthetic tasks through the real client, complexity limiter, board schema
+serializer and idempotent delivery ledger, with the network replaced by
+FakeMondayAdapter. Everything written to the database is rolled back.
+"""
+
+import logging
+import time
+import uuid
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.core.circuit_breaker import CircuitBreaker
+from apps.core.fake_monday import FakeMondayAdapter, MONDAY_HOST, DELIVERY_KEY_COLUMN
+from apps.core.models import GeminiProcessedTask
+from apps.core.monday_client import EnhancedMondayClient
+from apps.core.monday_delivery import IdempotentDelivery
+from apps.core.monday_rate_limiter import ComplexityRateLimiter
+
+logger = logging.getLogger('apps.core.management.commands.benchmark_monday_delivery')
+
+MODES = ('serial', 'batched', 'idempotent')
+BENCHMARK_BOARD_ID = 'fake-board'
+BENCHMARK_GROUP_ID = 'group_mkqyryrz'
+
+
+class Command(BaseCommand):
+    help = 'Measure Monday.com delivery throughput offline against a local fake board'
+
+    def add_arguments(self, parser):
+        fake_config = settings.EXTERNAL_APIS['MONDAY'].get('FAKE_TRANSPORT', {})
+
+        parser.add_argument('--tasks', type=int, default=100, help='Tasks to deliver per mode (default: 100)')
+        parser.add_argument('--modes', default=','.join(MODES),
+                            help=f"Comma-separated delivery paths to compare ({', '.join(MODES)})")
+        parser.add_argument('--rounds', type=int, default=3,
+                            help='Idempotent mode: delivery rounds for tasks that failed or timed out')
+        parser.add_argument('--latency-ms', type=int, default=fake_config.get('LATENCY_MS', 300))
+        parser.add_argument('--jitter-ms', type=int, default=fake_config.get('JITTER_MS', 100))
+        parser.add_argument('--per-item-ms', type=int, default=fake_config.get('PER_ITEM_MS', 20))
+        parser.add_argument('--budget', type=int, default=fake_config.get('BUDGET_PER_MINUTE', 10000000),
+                            help='Complexity budget per minute on the fake board')
+        parser.add_argument('--rate-limit-rate', type=float, default=fake_config.get('RATE_LIMIT_RATE', 0.0),
+                            help='Fraction of requests answered with 429')
+        parser.add_argument('--item-error-rate', type=float, default=fake_config.get('ITEM_ERROR_RATE', 0.0),
+                            help='Fraction of create_item fields failing with a field error')
+        parser.add_argument('--timeout-rate', type=float, default=fake_config.get('TIMEOUT_RATE', 0.0),
+                            help='Fraction of mutations that create their items and then time out')
+        parser.add_argument('--seed', type=int, default=fake_config.get('SEED', 1))
+
+    def handle(self, *args, **options):
+        self.stdout.write("🧪 MONDAY.COM DELIVERY BENCHMARK (local fake board)")
+        self.stdout.write("=" * 55)
+
+        modes = [mode.strip() for mode in options['modes'].split(',') if mode.strip()]
+        unknown = [mode for mode in modes if mode not in MODES]
+        if unknown:
+            self.stdout.write(self.style.ERROR(f"❌ Unknown modes: {', '.join(unknown)}"))
+            return
+
+        self.stdout.write(
+            f"📄 {options['tasks']} tasks per mode, latency {options['latency_ms']}±{options['jitter_ms']}ms "
+            f"+{options['per_item_ms']}ms/item, budget {options['budget']:,}/min"
+        )
+        self.stdout.write(
+            f"🎛️  429 rate {options['rate_limit_rate']:.0%}, item error rate {options['item_error_rate']:.0%}, "
+            f"timeout rate {options['timeout_rate']:.0%}, seed {options['seed']}"
+        )
+
+        for mode in modes:
+            with transaction.atomic():
+                report = self.run_mode(mode, options)
+                transaction.set_rollback(True)
+            self.print_report(mode, report)
+
+    def build_client(self, mode, options):
+        """A client wired to a fresh fake board, with its own breaker and budget row"""
+        adapter = FakeMondayAdapter({
+            **settings.EXTERNAL_APIS['MONDAY'].get('FAKE_TRANSPORT', {}),
+            'LATENCY_MS': options['latency_ms'],
+            'JITTER_MS': options['jitter_ms'],
+            'PER_ITEM_MS': options['per_item_ms'],
+            'BUDGET_PER_MINUTE': options['budget'],
+            'RATE_LIMIT_RATE': options['rate_limit_rate'],
+            'ITEM_ERROR_RATE': options['item_error_rate'],
+            'TIMEOUT_RATE': options['timeout_rate'],
+            'SEED': options['seed'],
+        })
+
+        api_key = f"fake-monday-benchmark-{mode}-{uuid.uuid4().hex[:8]}"
+        client = EnhancedMondayClient(api_key, BENCHMARK_BOARD_ID, BENCHMARK_GROUP_ID, rate_limit_per_minute=6000)
+        client.session.mount(MONDAY_HOST, adapter)
+        client.delivery_key_column = DELIVERY_KEY_COLUMN
+        client.circuit_breaker = CircuitBreaker(f'monday_api_benchmark_{mode}', failure_threshold=5, timeout=300)
+        client.complexity_limiter = ComplexityRateLimiter(api_key, {
+            **settings.EXTERNAL_APIS['MONDAY'].get('COMPLEXITY_BUDGET', {}),
+            'ENABLED': True,
+            'BUDGET_PER_MINUTE': options['budget'],
+        })
+        return client, adapter
+
+    @staticmethod
+    def build_tasks(count):
+        priorities = ['High', 'Medium', 'Low']
+        due_date = int((time.time() + 7 * 86400) * 1000)
+        return [
+            {
+                'task_item': f"Benchmark task {index + 1}",
+                'assignee(s)_full_names': 'Benchmark Owner',
+                'assignee_emails': 'owner@example.com',
+                'priority': priorities[index % len(priorities)],
+                'brief_description': f"Synthetic task {index + 1} sent to the local fake Monday.com board.",
+                'due_date': due_date,
+                'status': 'To Do',
+            }
+            for index in range(count)
+        ]
+
+    def run_mode(self, mode, options):
+        client, adapter = self.build_client(mode, options)
+        client.get_board_info(force_refresh=True)  # Warm the schema cache so every mode starts equal
+        adapter.stats.clear()
+
+        task_data = self.build_tasks(options['tasks'])
+        delivered, rounds = 0, 1
+        started = time.perf_counter()
+
+        if mode == 'serial':
+            for data in task_data:
+                try:
+                    delivered += 1 if client.create_task_item(data) else 0
+                except Exception as e:
+                    logger.debug(f"Serial create failed: {e}")
+        elif mode == 'batched':
+            delivered = sum(1 for result in client.create_items_batch(task_data) if result['item_id'])
+        else:
+            # Unsaved tasks are enough for delivery keys; ledger rows are rolled back afterwards
+            pending = [(GeminiProcessedTask(id=uuid.uuid4()), data) for data in task_data]
+            delivery = IdempotentDelivery(client)
+            for rounds in range(1, max(1, options['rounds']) + 1):
+                try:
+                    results = delivery.deliver(pending)
+                except Exception as e:
+                    logger.debug(f"Delivery round {rounds} failed: {e}")
+                    continue
+                delivered += sum(1 for result in results if result['item_id'])
+                pending = [pair for pair, result in zip(pending, results) if not result['item_id']]
+                if not pending:
+                    break
+
+        return {
+            'tasks': len(task_data),
+            'delivered': delivered,
+            'rounds': rounds,
+            'elapsed': time.perf_counter() - started,
+            'on_board': len(adapter.items),
+            'duplicates': adapter.duplicate_deliveries(),
+            'stats': dict(adapter.stats),
+            'breaker': client.circuit_breaker.state.value,
+        }
+
+    def print_report(self, mode, report):
+        stats = report['stats']
+        elapsed = report['elapsed'] or 1e-9
+
+        self.stdout.write(f"\n📊 {mode.upper()}")
+        self.stdout.write("=" * 55)
+        self.stdout.write(f"⏱️  Wall time: {report['elapsed']:.2f}s")
+        self.stdout.write(f"🚀 Throughput: {report['delivered'] / elapsed:.2f} items/s")
+        self.stdout.write(
+            f"✅ Delivered: {report['delivered']}/{report['tasks']}   📋 Items on board: {report['on_board']}"
+            + (f"   🔁 Rounds: {report['rounds']}" if mode == 'idempotent' else '')
+        )
+        self.stdout.write(
+            f"🌐 Requests: {stats.get('requests', 0)}   🧮 Complexity spent: {stats.get('complexity_spent', 0):,}"
+        )
+        self.stdout.write(
+            f"🧪 Injected: {stats.get('rate_limited', 0)} × 429, {stats.get('item_errors', 0)} item errors, "
+            f"{stats.get('timeouts', 0)} timeouts; {stats.get('complexity_exhausted', 0)} budget rejections"
+        )
+        self.stdout.write(f"🔌 Circuit breaker: {report['breaker']}")
+
+        if mode != 'idempotent':
+            orphaned = report['on_board'] - report['delivered']
+            if orphaned:
+                self.stdout.write(self.style.WARNING(f"⚠️  Items created but never acknowledged: {orphaned}"))
+        elif report['duplicates']:
+            self.stdout.write(self.style.WARNING(f"⚠️  Duplicate items on board: {report['duplicates']}"))
+        else:
+            self.stdout.write(self.style.SUCCESS("🛡️  No duplicate items on board"))
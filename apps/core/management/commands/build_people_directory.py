@@ -0,0 +1,55 @@
+"""
+Build People Directory
+Rebuild Person rows from the meeting_attendees of every cached meeting, for
+meetings cached before the directory existed
+"""
+
+import logging
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.core.models import RawTranscriptCache, Person
+from apps.core.people_directory import get_people_directory
+
+logger = logging.getLogger('apps.core.management.commands.build_people_directory')
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the people directory from all cached meeting attendees'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--resolve',
+            nargs='*',
+            default=[],
+            help='Names to resolve against the rebuilt directory',
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write("📇 PEOPLE DIRECTORY")
+        self.stdout.write("=" * 55)
+
+        directory = get_people_directory()
+        with transaction.atomic():
+            # Aliases added by hand in the admin are kept; counts are recomputed
+            known_emails = set(Person.objects.values_list('email', flat=True))
+            Person.objects.update(meeting_count=0, last_seen_at=None)
+
+            meetings = RawTranscriptCache.objects.order_by('meeting_date').only('raw_fireflies_data', 'meeting_date')
+            for cache_item in meetings.iterator(chunk_size=50):
+                directory.observe_meeting(cache_item.raw_fireflies_data, cache_item.meeting_date)
+
+        directory.clear()
+        self.stdout.write(
+            f"✅ {Person.objects.count()} people from {RawTranscriptCache.objects.count()} meetings "
+            f"({len(set(Person.objects.values_list('email', flat=True)) - known_emails)} new)"
+        )
+
+        for person in Person.objects.order_by('-meeting_count')[:20]:
+            self.stdout.write(
+                f"   {person.display_name[:25] or '-':<25} {person.email:<35} {person.meeting_count:>4} meetings  "
+                f"aliases: {', '.join(person.aliases)}"
+            )
+
+        for name in options['resolve']:
+            self.stdout.write(f"🔎 {name!r} -> {directory.resolve(name) or 'unresolved'}")
@@ -0,0 +1,55 @@
+"""
+Build Speaker Analytics
+Backfill RawTranscriptCache.speaker_analytics for meetings cached before the
+ingestion stage existed, and print meeting load per person
+"""
+
+import logging
+from django.core.management.base import BaseCommand
+
+from apps.core.models import RawTranscriptCache
+from apps.core.speaker_analytics import compute_speaker_analytics, meeting_load_by_person
+
+logger = logging.getLogger('apps.core.management.commands.build_speaker_analytics')
+
+
+class Command(BaseCommand):
+    help = 'Precompute speaker analytics for cached meetings and report meeting load per person'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Recompute analytics even for meetings that already have them',
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=20,
+            help='People to show in the meeting load report (default: 20)',
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write("📊 SPEAKER ANALYTICS")
+        self.stdout.write("=" * 55)
+
+        meetings = RawTranscriptCache.objects.all()
+        if not options['force']:
+            meetings = meetings.filter(speaker_analytics={})
+
+        built = 0
+        for cache_item in meetings.only('id', 'raw_fireflies_data', 'data_hash').iterator(chunk_size=50):
+            sentences = (cache_item.raw_fireflies_data or {}).get('sentences') or []
+            RawTranscriptCache.objects.filter(id=cache_item.id).update(
+                speaker_analytics=compute_speaker_analytics(sentences, cache_item.data_hash)
+            )
+            built += 1
+
+        self.stdout.write(f"✅ Built analytics for {built} meetings")
+
+        self.stdout.write(f"\n👥 Meeting load per person (top {options['top']}):")
+        for person in meeting_load_by_person()[:options['top']]:
+            self.stdout.write(
+                f"   {person['name'][:30]:<30} {person['meetings']:>4} meetings  "
+                f"{person['talk_seconds'] / 60:>7.1f} min talk  {person['turns']:>5} turns  {person['words']:>7} words"
+            )
@@ -0,0 +1,105 @@
+"""
+Drain Monday.com Outbox
+Background worker that delivers approved tasks queued in MondayOutbox in batches,
+one concurrent lane per routed board. Runs until interrupted; several drainers
+can share one outbox safely.
+"""
+
+import logging
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.core.monday_outbox import (
+    OutboxDrainer, LaneScheduler, outbox_summary, lane_summary, scheduled_retries, retry_failed_deliveries
+)
+
+logger = logging.getLogger('apps.core.management.commands.drain_monday_outbox')
+
+
+class Command(BaseCommand):
+    help = 'Deliver queued Monday.com outbox entries in batches in the background'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Stop when the outbox is empty instead of polling for new entries',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            help='Entries claimed per batch (default: SYSTEM_CONFIG MONDAY_OUTBOX BATCH_SIZE)',
+        )
+        parser.add_argument(
+            '--max-batches',
+            type=int,
+            help='Stop after delivering this many batches',
+        )
+        parser.add_argument(
+            '--board',
+            help='Only drain this board\'s lane (use "" for entries queued before routing)',
+        )
+        parser.add_argument(
+            '--lanes',
+            type=int,
+            help='Boards drained concurrently (default: SYSTEM_CONFIG MONDAY_OUTBOX MAX_LANES)',
+        )
+        parser.add_argument(
+            '--retry-failed',
+            action='store_true',
+            help='Move failed (dead-lettered) entries back to the queue with a fresh retry budget',
+        )
+        parser.add_argument(
+            '--status',
+            action='store_true',
+            help='Only print outbox status',
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write("📤 MONDAY.COM OUTBOX DRAINER")
+        self.stdout.write("=" * 55)
+
+        if options['status']:
+            self.print_outbox(outbox_summary())
+            return
+
+        if options['retry_failed']:
+            self.stdout.write(f"🔄 Re-queued {retry_failed_deliveries()} failed deliveries")
+
+        self.print_outbox(outbox_summary())
+        if options['board'] is not None:
+            runner = OutboxDrainer(batch_size=options['batch_size'], board_id=options['board'])
+        else:
+            config = dict(settings.SYSTEM_CONFIG.get('MONDAY_OUTBOX', {}))
+            if options['lanes']:
+                config['MAX_LANES'] = options['lanes']
+            runner = LaneScheduler(batch_size=options['batch_size'], config=config)
+            self.stdout.write(f"🛣️  Up to {runner.max_lanes} boards delivered concurrently")
+
+        try:
+            stats = runner.run(once=options['once'], max_batches=options['max_batches'])
+        except KeyboardInterrupt:
+            stats = dict(runner.stats)
+            self.stdout.write("\n⏹️  Interrupted - unsent entries stay queued")
+
+        self.stdout.write(
+            f"\n✅ Sent: {stats.get('sent', 0)}  ❌ Failed: {stats.get('failed', 0)}  🔄 Retried: {stats.get('retried', 0)}"
+        )
+        self.print_outbox(outbox_summary())
+
+    def print_outbox(self, summary):
+        self.stdout.write("\n📋 Outbox:")
+        for status, count in summary.items():
+            self.stdout.write(f"   {status:<10} {count:>6}")
+
+        retries = scheduled_retries()
+        if retries['count']:
+            self.stdout.write(f"   ⏰ {retries['count']} backing off, next due {retries['next_at']:%Y-%m-%d %H:%M:%S}")
+
+        lanes = lane_summary()
+        if lanes:
+            self.stdout.write("\n🛣️  Lanes:")
+            for board_id, counts in lanes.items():
+                self.stdout.write(
+                    f"   {board_id or 'default':<14} queued {counts['queued']:>6}  sending {counts['sending']:>6}"
+                )
@@ -12,6 +12,10 @@ from django.db import transaction
 
 from apps.core.models import RawTranscriptCache, GeminiProcessedTask
 from apps.core.gemini_client import get_gemini_client
+from apps.core.precision_extractor import stream_gemini_tasks_for_cache
+from apps.core.batch_extraction import batch_extract_and_save
+from apps.core.delta_extraction import extract_delta_for_cache
+from apps.core.model_router import get_model_router
 
 logger = logging.getLogger('apps.core.management.commands.process_last_5_meetings')
 
@@ -31,10 +35,28 @@ class Command(BaseCommand):
             action='store_true',
             help='Force reprocessing even if meetings already have tasks',
         )
+        parser.add_argument(
+            '--stream',
+            action='store_true',
+            help='Stream Gemini output and save each task as soon as it is generated',
+        )
+        parser.add_argument(
+            '--batch',
+            action='store_true',
+            help='Pack short meetings into shared Gemini requests',
+        )
+        parser.add_argument(
+            '--delta',
+            action='store_true',
+            help='Re-extract only sentences added since the last extraction for already-processed meetings',
+        )
     
     def handle(self, *args, **options):
         limit = options['limit']
         force = options['force']
+        stream = options['stream']
+        batch = options['batch']
+        delta = options['delta']
         
         self.stdout.write("🚀 E2E TEST STEP 4: PROCESSING MEETINGS WITH REAL GEMINI API")
         self.stdout.write("=" * 65)
@@ -71,20 +93,41 @@ class Command(BaseCommand):
             self.stdout.write(f"✅ Found {stats['meetings_found']} meetings to process")
             
             # Step 3: Process each meeting
+            pending_batch = []
             for i, meeting in enumerate(meetings, 1):
                 self.stdout.write(f"\n🔄 Processing Meeting {i}/{stats['meetings_found']}")
                 self.stdout.write(f"   📝 Title: {meeting.meeting_title}")
                 self.stdout.write(f"   📅 Date: {meeting.meeting_date}")
                 self.stdout.write(f"   🆔 ID: {meeting.fireflies_id}")
                 
+                # Stop before the shared daily Gemini budget runs out
+                if not gemini_client.quota_ledger.has_daily_headroom(gemini_client.model_name):
+                    self.stdout.write(self.style.WARNING("   ⏸️  Daily Gemini quota reached - stopping"))
+                    break
+                
                 # Check if already processed
                 existing_tasks = GeminiProcessedTask.objects.filter(raw_transcript=meeting).count()
+                if existing_tasks > 0 and delta and not force:
+                    tasks_created = self.delta_meeting_with_gemini(meeting, stats)
+                    if tasks_created > 0:
+                        stats['meetings_processed'] += 1
+                        stats['tasks_extracted'] += tasks_created
+                        stats['tasks_saved'] += tasks_created
+                    continue
+                
                 if existing_tasks > 0 and not force:
                     self.stdout.write(f"   ⚠️  Already has {existing_tasks} processed tasks - skipping")
                     continue
                 
                 # Process with Gemini
-                tasks_created = self.process_meeting_with_gemini(meeting, gemini_client, stats)
+                if batch:
+                    pending_batch.append(meeting)
+                    self.stdout.write("   📦 Queued for batch extraction")
+                    continue
+                elif stream:
+                    tasks_created = self.stream_meeting_with_gemini(meeting, stats)
+                else:
+                    tasks_created = self.process_meeting_with_gemini(meeting, gemini_client, stats)
                 
                 if tasks_created > 0:
                     stats['meetings_processed'] += 1
@@ -94,6 +137,9 @@ class Command(BaseCommand):
                 else:
                     self.stdout.write(f"   ⚠️  No tasks extracted")
             
+            if pending_batch:
+                self.batch_meetings_with_gemini(pending_batch, stats)
+            
             # Step 4: Display results
             self.display_results(stats)
             
@@ -111,8 +157,9 @@ class Command(BaseCommand):
             fireflies_data = meeting.raw_fireflies_data
             
             # Extract tasks using Gemini with temp/prompt.md
-            self.stdout.write("   🤖 Extracting tasks with Gemini AI...")
-            extracted_tasks = gemini_client.extract_tasks_from_transcript(fireflies_data)
+            route = get_model_router().route_transcript(fireflies_data)
+            self.stdout.write(f"   🤖 Extracting tasks with {route['model']} ({route['reason']})...")
+            extracted_tasks, complete = gemini_client.extract_tasks_with_status(fireflies_data, model=route['model'])
             
             if not extracted_tasks:
                 self.stdout.write("   ⚠️  No tasks extracted from transcript")
@@ -120,6 +167,7 @@ class Command(BaseCommand):
             
             # Save tasks to GeminiProcessedTask model
             tasks_created = 0
+            save_failed = False
             
             with transaction.atomic():
                 for task_order, task_data in enumerate(extracted_tasks):
@@ -139,7 +187,7 @@ class Command(BaseCommand):
                             
                             # Processing metadata
                             extraction_order=task_order,
-                            gemini_model_version='gemini-2.5-flash',
+                            gemini_model_version=route['model'],
                             extraction_confidence=0.95,  # High confidence for real API
                             source_sentences=[
                                 f"Extracted from {meeting.meeting_title} using real Gemini API"
@@ -147,7 +195,8 @@ class Command(BaseCommand):
                             raw_gemini_response={
                                 'full_response': extracted_tasks,
                                 'task_index': task_order,
-                                'model': 'gemini-2.5-flash',
+                                'model': route['model'],
+                                'routing_reason': route['reason'],
                                 'timestamp': timezone.now().isoformat(),
                                 'meeting_id': meeting.fireflies_id,
                                 'prompt_source': 'temp/prompt.md'
@@ -160,7 +209,13 @@ class Command(BaseCommand):
                         error_msg = f"Failed to save task {task_order}: {str(e)}"
                         self.stdout.write(f"   ❌ {error_msg}")
                         stats['errors'].append(error_msg)
+                        save_failed = True
             
+            # Only a clean, complete extraction counts for delta re-extraction
+            if complete and not save_failed:
+                meeting.mark_sentences_extracted()
+            else:
+                self.stdout.write("   ⚠️  Output truncated or tasks failed to save - meeting left unmarked")
             return tasks_created
             
         except Exception as e:
@@ -169,6 +224,66 @@ class Command(BaseCommand):
             stats['errors'].append(error_msg)
             return 0
     
+    def stream_meeting_with_gemini(self, meeting: RawTranscriptCache, stats):
+        """Stream a meeting through Gemini, saving each task as soon as it is complete"""
+        
+        tasks_created = 0
+        started = timezone.now()
+        
+        try:
+            self.stdout.write("   🌊 Streaming tasks from Gemini AI...")
+            for task in stream_gemini_tasks_for_cache(meeting):
+                tasks_created += 1
+                elapsed = (timezone.now() - started).total_seconds()
+                self.stdout.write(f"   ➕ [{elapsed:5.1f}s] {task.task_item[:60]}")
+        except Exception as e:
+            error_msg = f"Failed to stream meeting {meeting.fireflies_id}: {str(e)}"
+            self.stdout.write(f"   ❌ {error_msg}")
+            stats['errors'].append(error_msg)
+        
+        return tasks_created
+    
+    def delta_meeting_with_gemini(self, meeting: RawTranscriptCache, stats):
+        """Extract tasks only from sentences added since the meeting was last extracted"""
+        
+        try:
+            self.stdout.write("   🔁 Checking for new sentences...")
+            report = extract_delta_for_cache(meeting)
+        except Exception as e:
+            error_msg = f"Failed delta extraction for {meeting.fireflies_id}: {str(e)}"
+            self.stdout.write(f"   ❌ {error_msg}")
+            stats['errors'].append(error_msg)
+            return 0
+        
+        if not report['new_sentences']:
+            self.stdout.write("   ✅ No new sentences - existing tasks kept")
+        else:
+            self.stdout.write(
+                f"   ✅ {report['new_sentences']} new sentences: {report['tasks_created']} new tasks, "
+                f"{report['duplicates_skipped']} duplicates skipped"
+            )
+        return report['tasks_created']
+    
+    def batch_meetings_with_gemini(self, meetings, stats):
+        """Extract queued meetings together, batching the short ones into shared requests"""
+        
+        self.stdout.write(f"\n📦 Batch extracting {len(meetings)} meetings...")
+        try:
+            created = batch_extract_and_save(meetings)
+        except Exception as e:
+            error_msg = f"Batch extraction failed: {str(e)}"
+            self.stdout.write(f"   ❌ {error_msg}")
+            stats['errors'].append(error_msg)
+            return
+        
+        for meeting in meetings:
+            tasks_created = created.get(meeting.fireflies_id, 0)
+            if tasks_created > 0:
+                stats['meetings_processed'] += 1
+                stats['tasks_extracted'] += tasks_created
+                stats['tasks_saved'] += tasks_created
+            self.stdout.write(f"   ✅ {meeting.fireflies_id}: {tasks_created} tasks")
+    
     def display_results(self, stats):
         """Display final processing results"""
         
@@ -0,0 +1,121 @@
+"""
+Run Resumable Extraction Jobs
+Queue cached meetings as ExtractionJobs and drain the queue with N concurrent
+workers. Safe to interrupt and re-run: finished jobs are skipped and jobs left
+running by a crashed worker are re-claimed once their lease expires.
+"""
+
+import logging
+from datetime import datetime
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.core.models import RawTranscriptCache
+from apps.core.extraction_jobs import (
+    ExtractionJobRunner, enqueue_extraction_jobs, retry_failed_jobs, extraction_job_summary
+)
+
+logger = logging.getLogger('apps.core.management.commands.run_extraction_jobs')
+
+
+class Command(BaseCommand):
+    help = 'Checkpointed, restartable Gemini extraction over RawTranscriptCache with concurrent workers'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--enqueue',
+            action='store_true',
+            help='Queue a job for every cached meeting without extracted tasks before running',
+        )
+        parser.add_argument(
+            '--since',
+            type=str,
+            help='Only enqueue meetings on or after this date (YYYY-MM-DD)',
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            help='Only enqueue the most recent N meetings',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Also re-queue meetings that already have tasks or finished jobs',
+        )
+        parser.add_argument(
+            '--retry-failed',
+            action='store_true',
+            help='Move failed jobs back to the queue with a fresh retry budget',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            help='Concurrent extraction workers (default: SYSTEM_CONFIG EXTRACTION_JOBS WORKERS)',
+        )
+        parser.add_argument(
+            '--max-jobs',
+            type=int,
+            help='Stop after claiming this many jobs',
+        )
+        parser.add_argument(
+            '--status',
+            action='store_true',
+            help='Only print queue status',
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write("🏭 RESUMABLE EXTRACTION JOBS")
+        self.stdout.write("=" * 55)
+
+        if options['status']:
+            self.print_queue(extraction_job_summary())
+            return
+
+        if options['enqueue']:
+            cache_items = RawTranscriptCache.objects.filter(is_valid=True).order_by('-meeting_date')
+            if options['since']:
+                try:
+                    since = datetime.strptime(options['since'], '%Y-%m-%d')
+                except ValueError:
+                    raise CommandError('--since must be YYYY-MM-DD')
+                cache_items = cache_items.filter(meeting_date__gte=timezone.make_aware(since))
+            if options['limit']:
+                cache_items = cache_items[:options['limit']]
+
+            queued = enqueue_extraction_jobs(cache_items, force=options['force'])
+            self.stdout.write(f"📥 Queued {queued['created']} new jobs, re-queued {queued['requeued']}")
+
+        if options['retry_failed']:
+            self.stdout.write(f"🔁 Re-queued {retry_failed_jobs()} failed jobs")
+
+        queue = extraction_job_summary()
+        self.print_queue(queue)
+        if not queue['queued'] and not queue['running']:
+            self.stdout.write(self.style.SUCCESS("✅ Nothing to do"))
+            return
+
+        runner = ExtractionJobRunner(workers=options['workers'])
+        self.stdout.write(f"\n🚀 Running with {runner.workers} workers (lease {runner.lease_seconds}s)...")
+        report = runner.run(max_jobs=options['max_jobs'])
+
+        self.stdout.write(f"\n📊 RUN REPORT")
+        self.stdout.write("=" * 55)
+        self.stdout.write(f"⏱️  Elapsed: {report['elapsed_seconds']}s with {report['workers']} workers")
+        self.stdout.write(f"✅ Jobs done: {report['jobs_done']} ({report['meetings_per_minute']} meetings/min)")
+        self.stdout.write(f"🔁 Jobs re-queued for retry: {report['jobs_retried']}")
+        self.stdout.write(f"❌ Jobs failed: {report['jobs_failed']}")
+        self.stdout.write(f"📋 Tasks created: {report['tasks_created']}")
+        self.stdout.write("\n🧱 Per-stage throughput:")
+        for stage, stage_stats in report['stages'].items():
+            self.stdout.write(
+                f"   {stage:<8} {stage_stats['jobs']:>5} jobs   avg {stage_stats['avg_seconds']:.3f}s   "
+                f"{stage_stats['jobs_per_minute']}/min"
+            )
+        self.stdout.write("")
+        self.print_queue(report['queue'])
+
+    def print_queue(self, queue):
+        self.stdout.write(
+            f"📦 Queue: {queue['queued']} queued, {queue['running']} running, "
+            f"{queue['done']} done, {queue['failed']} failed"
+        )
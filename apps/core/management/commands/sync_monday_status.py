@@ -0,0 +1,56 @@
+"""
+Sync Monday.com Status
+Pull status and priority changes made on the Monday.com boards back into
+GeminiProcessedTask. Every routed board and group is synced, each with its own
+watermark. Incremental: only items updated since the last run are read.
+"""
+
+import logging
+from django.core.management.base import BaseCommand
+
+from apps.core.monday_routing import get_monday_router, lane_client
+from apps.core.monday_sync import MondayStatusSync
+
+logger = logging.getLogger('apps.core.management.commands.sync_monday_status')
+
+
+class Command(BaseCommand):
+    help = 'Incrementally pull Monday.com item status and priority into GeminiProcessedTask'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            help='Ignore the watermark and read every item in the group',
+        )
+        parser.add_argument(
+            '--page-size',
+            type=int,
+            help='Items per items_page request (default: MONDAY STATUS_SYNC PAGE_SIZE)',
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write("🔄 MONDAY.COM STATUS SYNC")
+        self.stdout.write("=" * 55)
+
+        for board_id, group_id in get_monday_router().targets():
+            self.stdout.write(f"\n📋 Board {board_id} / group {group_id}")
+            sync = MondayStatusSync(lane_client(board_id, group_id))
+            if options['page_size']:
+                sync.page_size = options['page_size']
+
+            try:
+                stats = sync.sync(full=options['full'])
+            except Exception as e:
+                # One unreachable board must not stop the others from syncing
+                logger.error(f"Status sync failed for board {board_id} group {group_id}: {e}")
+                self.stdout.write(self.style.ERROR(f"❌ Sync failed: {e}"))
+                continue
+
+            self.stdout.write(f"📄 Pages read:        {stats['pages']}")
+            self.stdout.write(f"📦 Items seen:        {stats['items_seen']}")
+            self.stdout.write(f"✏️  Changed on board:  {stats['changed_items']}")
+            self.stdout.write(f"✅ Tasks updated:     {stats['updated']}")
+            if stats['unknown_values']:
+                self.stdout.write(f"⚠️  Unknown labels:    {stats['unknown_values']}")
+            self.stdout.write(f"🕒 Watermark:         {stats['watermark'] or 'none'}")
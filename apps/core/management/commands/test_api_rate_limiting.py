@@ -118,7 +118,7 @@ class Command(BaseCommand):
         
         # Test 2: Check quota tracking
         self.stdout.write("Test 2: Quota tracking check")
-        if hasattr(client, 'quota_tracker'):
+        if hasattr(client, 'quota_ledger'):
             self.stdout.write("✅ Quota tracking found")
         else:
             self.stdout.write("❌ MISSING: Quota tracking not implemented")
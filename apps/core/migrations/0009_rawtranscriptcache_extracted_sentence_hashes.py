@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-18 21:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0008_fix_field_constraints"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="rawtranscriptcache",
+            name="extracted_sentence_hashes",
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 4.2.7 on 2026-10-18 21:37
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0009_rawtranscriptcache_extracted_sentence_hashes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GeminiQuotaUsage",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("model_name", models.CharField(max_length=100)),
+                (
+                    "window",
+                    models.CharField(
+                        choices=[("minute", "Minute"), ("day", "Day")], max_length=10
+                    ),
+                ),
+                ("window_start", models.DateTimeField()),
+                ("request_count", models.PositiveIntegerField(default=0)),
+                ("prompt_tokens", models.PositiveBigIntegerField(default=0)),
+                ("output_tokens", models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                "db_table": "core_gemini_quota_usage",
+                "indexes": [
+                    models.Index(
+                        fields=["window", "window_start"],
+                        name="core_gemini_window_4bb09d_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="geminiquotausage",
+            constraint=models.UniqueConstraint(
+                fields=("model_name", "window", "window_start"),
+                name="unique_gemini_quota_window",
+            ),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.7 on 2026-10-18 21:42
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0010_gemini_quota_usage"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="geminiprocessedtask",
+            name="duplicate_of",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="Open task this one was detected as a near-duplicate of",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="near_duplicates",
+                to="core.geminiprocessedtask",
+            ),
+        ),
+        migrations.AddField(
+            model_name="geminiprocessedtask",
+            name="duplicate_similarity",
+            field=models.FloatField(
+                blank=True,
+                help_text="Estimated Jaccard similarity to duplicate_of (MinHash)",
+                null=True,
+            ),
+        ),
+    ]
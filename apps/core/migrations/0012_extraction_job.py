@@ -0,0 +1,71 @@
+# Generated by Django 4.2.7 on 2026-10-18 21:48
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0011_gemini_task_duplicate_of"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExtractionJob",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("queued", "Queued"),
+                            ("running", "Running"),
+                            ("done", "Done"),
+                            ("failed", "Failed"),
+                        ],
+                        default="queued",
+                        max_length=10,
+                    ),
+                ),
+                ("lease_owner", models.CharField(blank=True, max_length=100)),
+                ("lease_expires_at", models.DateTimeField(blank=True, null=True)),
+                ("attempts", models.PositiveIntegerField(default=0)),
+                ("max_attempts", models.PositiveIntegerField(default=3)),
+                ("last_error", models.TextField(blank=True)),
+                ("tasks_created", models.PositiveIntegerField(default=0)),
+                ("model_version", models.CharField(blank=True, max_length=100)),
+                ("stage_seconds", models.JSONField(blank=True, default=dict)),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "raw_transcript",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="extraction_job",
+                        to="core.rawtranscriptcache",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "core_extraction_job",
+                "ordering": ["created_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["status", "lease_expires_at"],
+                        name="core_extrac_status_735bbc_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-18 21:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0012_extraction_job"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="rawtranscriptcache",
+            name="speaker_analytics",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
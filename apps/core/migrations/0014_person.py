@@ -0,0 +1,38 @@
+# Generated by Django 4.2.7 on 2026-10-18 21:52
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0013_rawtranscriptcache_speaker_analytics"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Person",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("email", models.EmailField(max_length=254, unique=True)),
+                ("display_name", models.CharField(blank=True, max_length=255)),
+                ("aliases", models.JSONField(blank=True, default=list)),
+                ("meeting_count", models.PositiveIntegerField(default=0)),
+                ("last_seen_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "db_table": "core_person",
+                "ordering": ["display_name", "email"],
+            },
+        ),
+    ]
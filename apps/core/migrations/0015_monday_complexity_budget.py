@@ -0,0 +1,36 @@
+# Generated by Django 4.2.7 on 2026-10-18 21:58
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0014_person"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MondayComplexityBudget",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("token_key", models.CharField(max_length=64, unique=True)),
+                ("budget_remaining", models.BigIntegerField(default=0)),
+                ("reset_at", models.DateTimeField()),
+                ("last_query_cost", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "db_table": "core_monday_complexity_budget",
+            },
+        ),
+    ]
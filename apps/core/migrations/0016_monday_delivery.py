@@ -0,0 +1,57 @@
+# Generated by Django 4.2.7 on 2026-10-18 21:59
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0015_monday_complexity_budget"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MondayDelivery",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("delivery_key", models.CharField(max_length=64, unique=True)),
+                ("task_type", models.CharField(max_length=100)),
+                ("task_id", models.CharField(max_length=64)),
+                ("board_id", models.CharField(blank=True, max_length=50)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("pending", "Pending"), ("created", "Created")],
+                        db_index=True,
+                        default="pending",
+                        max_length=20,
+                    ),
+                ),
+                ("monday_item_id", models.CharField(blank=True, max_length=50)),
+                ("attempts", models.PositiveIntegerField(default=0)),
+                ("lease_owner", models.CharField(blank=True, max_length=100)),
+                ("lease_expires_at", models.DateTimeField(blank=True, null=True)),
+                ("last_error", models.TextField(blank=True)),
+                ("delivered_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "db_table": "core_monday_delivery",
+                "indexes": [
+                    models.Index(
+                        fields=["task_type", "task_id"],
+                        name="core_monday_task_ty_842373_idx",
+                    )
+                ],
+            },
+        ),
+    ]
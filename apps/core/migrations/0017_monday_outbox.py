@@ -0,0 +1,73 @@
+# Generated by Django 4.2.7 on 2026-10-18 22:01
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0016_monday_delivery"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MondayOutbox",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("task_type", models.CharField(max_length=100)),
+                ("task_id", models.CharField(max_length=64)),
+                ("source", models.CharField(blank=True, max_length=50)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("queued", "Queued"),
+                            ("sending", "Sending"),
+                            ("sent", "Sent"),
+                            ("failed", "Failed"),
+                        ],
+                        default="queued",
+                        max_length=20,
+                    ),
+                ),
+                ("attempts", models.PositiveIntegerField(default=0)),
+                ("max_attempts", models.PositiveIntegerField(default=5)),
+                ("lease_owner", models.CharField(blank=True, max_length=100)),
+                ("lease_expires_at", models.DateTimeField(blank=True, null=True)),
+                ("last_error", models.TextField(blank=True)),
+                ("monday_item_id", models.CharField(blank=True, max_length=50)),
+                ("sent_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "db_table": "core_monday_outbox",
+                "indexes": [
+                    models.Index(
+                        fields=["status", "created_at"],
+                        name="core_monday_status_8858dd_idx",
+                    ),
+                    models.Index(
+                        fields=["task_type", "task_id"],
+                        name="core_monday_task_ty_10e203_idx",
+                    ),
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="mondayoutbox",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("status__in", ["queued", "sending"])),
+                fields=("task_type", "task_id"),
+                name="unique_open_monday_outbox",
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 4.2.7 on 2026-10-18 22:05
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0017_monday_outbox"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MondaySyncState",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("board_id", models.CharField(max_length=50)),
+                ("group_id", models.CharField(max_length=100)),
+                ("watermark", models.DateTimeField(blank=True, null=True)),
+                ("last_synced_at", models.DateTimeField(blank=True, null=True)),
+                ("last_stats", models.JSONField(blank=True, default=dict)),
+            ],
+            options={
+                "db_table": "core_monday_sync_state",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="mondaysyncstate",
+            constraint=models.UniqueConstraint(
+                fields=("board_id", "group_id"), name="unique_monday_sync_scope"
+            ),
+        ),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 4.2.7 on 2026-10-18 22:12
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0018_monday_sync_state"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MondayRoute",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("name", models.CharField(max_length=100)),
+                (
+                    "priority",
+                    models.PositiveIntegerField(
+                        default=100, help_text="Lower runs first"
+                    ),
+                ),
+                (
+                    "meeting_pattern",
+                    models.CharField(
+                        blank=True,
+                        help_text="Regular expression searched in the meeting title (case-insensitive)",
+                        max_length=255,
+                    ),
+                ),
+                (
+                    "assignee_pattern",
+                    models.CharField(
+                        blank=True,
+                        help_text="Regular expression searched in assignee names and emails (case-insensitive)",
+                        max_length=255,
+                    ),
+                ),
+                ("board_id", models.CharField(max_length=50)),
+                ("group_id", models.CharField(max_length=100)),
+                ("is_active", models.BooleanField(default=True)),
+            ],
+            options={
+                "db_table": "core_monday_route",
+                "ordering": ["priority", "name"],
+            },
+        ),
+        migrations.AddField(
+            model_name="mondayoutbox",
+            name="board_id",
+            field=models.CharField(blank=True, max_length=50),
+        ),
+        migrations.AddField(
+            model_name="mondayoutbox",
+            name="group_id",
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AddIndex(
+            model_name="mondayoutbox",
+            index=models.Index(
+                fields=["status", "board_id", "created_at"],
+                name="core_monday_status_f70b39_idx",
+            ),
+        ),
+    ]
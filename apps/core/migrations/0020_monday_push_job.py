@@ -0,0 +1,49 @@
+# Generated by Django 4.2.7 on 2026-10-18 22:15
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0019_monday_routing"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MondayPushJob",
+            fields=[
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("source", models.CharField(blank=True, max_length=50)),
+                ("requested_by", models.CharField(blank=True, max_length=150)),
+                ("total", models.PositiveIntegerField(default=0)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "db_table": "core_monday_push_job",
+                "ordering": ["-created_at"],
+            },
+        ),
+        migrations.AddField(
+            model_name="mondayoutbox",
+            name="job",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="entries",
+                to="core.mondaypushjob",
+            ),
+        ),
+    ]
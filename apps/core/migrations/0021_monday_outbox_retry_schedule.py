@@ -0,0 +1,54 @@
+# Generated by Django 4.2.7 on 2026-10-18 22:18
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0020_monday_push_job"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="mondayoutbox",
+            name="core_monday_status_8858dd_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="mondayoutbox",
+            name="core_monday_status_f70b39_idx",
+        ),
+        migrations.AddField(
+            model_name="mondayoutbox",
+            name="next_attempt_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AlterField(
+            model_name="mondayoutbox",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("queued", "Queued"),
+                    ("sending", "Sending"),
+                    ("sent", "Sent"),
+                    ("failed", "Failed (dead letter)"),
+                ],
+                default="queued",
+                max_length=20,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="mondayoutbox",
+            index=models.Index(
+                fields=["status", "next_attempt_at"],
+                name="core_monday_status_96795e_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="mondayoutbox",
+            index=models.Index(
+                fields=["status", "board_id", "next_attempt_at"],
+                name="core_monday_status_2c88af_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.7 on 2026-10-18 22:40
+
+from django.db import migrations, models
+
+
+def flag_earlier_attempts(apps, schema_editor):
+    """Earlier attempts had no outcome recorded; keep treating them as possibly created"""
+    MondayDelivery = apps.get_model("core", "MondayDelivery")
+    MondayDelivery.objects.filter(status="pending", attempts__gt=0).update(outcome_unknown=True)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0021_monday_outbox_retry_schedule"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="mondaydelivery",
+            name="outcome_unknown",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.RunPython(flag_earlier_attempts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.7 on 2026-10-18 23:10
+
+import hashlib
+
+from django.db import migrations
+
+
+def fingerprint_sentence(sentence):
+    """Frozen copy of RawTranscriptCache.fingerprint_sentence"""
+    text = " ".join(str(sentence.get("text") or sentence.get("raw_text") or "").lower().split())
+    key = f"{sentence.get('speaker_name') or ''}|{text}"
+    return hashlib.sha1(key.encode()).hexdigest()[:16]
+
+
+def backfill_extracted_sentence_hashes(apps, schema_editor):
+    """Meetings extracted before the hashes were recorded count as fully extracted"""
+    RawTranscriptCache = apps.get_model("core", "RawTranscriptCache")
+    extracted = RawTranscriptCache.objects.filter(gemini_processed_tasks__isnull=False).distinct()
+    for cache_item in extracted.only("id", "raw_fireflies_data", "extracted_sentence_hashes").iterator():
+        if cache_item.extracted_sentence_hashes:
+            continue
+        sentences = (cache_item.raw_fireflies_data or {}).get("sentences") or []
+        RawTranscriptCache.objects.filter(id=cache_item.id).update(
+            extracted_sentence_hashes=[fingerprint_sentence(sentence) for sentence in sentences]
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0022_monday_delivery_outcome_unknown"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_extracted_sentence_hashes, migrations.RunPython.noop),
+    ]
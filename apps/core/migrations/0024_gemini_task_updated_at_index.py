@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-18 22:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0023_backfill_extracted_sentence_hashes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="geminiprocessedtask",
+            index=models.Index(
+                fields=["updated_at"], name="core_gemini_updated_48c05f_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,70 @@
+"""
+Gemini Model Routing
+Picks the model endpoint per request: a lighter, faster model for short meetings
+and summary-only prompts, the full model for long multi-speaker transcripts
+"""
+
+import logging
+from typing import Dict, Any, Optional
+from django.conf import settings
+
+from .transcript_compaction import estimate_tokens
+
+logger = logging.getLogger('apps.core.model_router')
+
+
+class ModelRouter:
+    """Size-aware routing between a light and a full Gemini model"""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        if config is None:
+            config = settings.EXTERNAL_APIS['GEMINI'].get('MODEL_ROUTING', {})
+
+        self.enabled = config.get('ENABLED', False)
+        self.full_model = config.get('FULL_MODEL', 'gemini-2.5-flash')
+        self.light_model = config.get('LIGHT_MODEL', 'gemini-2.5-flash-lite')
+        self.light_max_tokens = config.get('LIGHT_MAX_PROMPT_TOKENS', 6000)
+        self.light_max_speakers = config.get('LIGHT_MAX_SPEAKERS', 3)
+
+    def route(self, prompt_tokens: int, speaker_count: int, summary_only: bool = False) -> Dict[str, Any]:
+        """
+        Choose a model for one request
+        Returns {'model', 'reason', 'prompt_tokens', 'speaker_count'}
+        """
+        if not self.enabled:
+            model, reason = self.full_model, 'routing_disabled'
+        elif summary_only:
+            model, reason = self.light_model, 'summary_only'
+        elif prompt_tokens <= self.light_max_tokens and speaker_count <= self.light_max_speakers:
+            model, reason = self.light_model, 'short_meeting'
+        else:
+            model, reason = self.full_model, 'long_or_multi_speaker'
+
+        return {
+            'model': model,
+            'reason': reason,
+            'prompt_tokens': prompt_tokens,
+            'speaker_count': speaker_count,
+        }
+
+    def route_transcript(self, fireflies_data: Dict[str, Any], prompt: Optional[str] = None) -> Dict[str, Any]:
+        """Route a transcript, sizing it by the rendered prompt when one is given"""
+        sentences = fireflies_data.get('sentences') or []
+        speakers = {sentence.get('speaker_name') for sentence in sentences if sentence.get('speaker_name')}
+
+        if prompt is not None:
+            prompt_tokens = estimate_tokens(prompt)
+        else:
+            prompt_tokens = estimate_tokens(' '.join(sentence.get('text') or '' for sentence in sentences))
+
+        decision = self.route(prompt_tokens, len(speakers), summary_only=not sentences)
+        logger.info(
+            f"🧭 Routed to {decision['model']} ({decision['reason']}, "
+            f"~{prompt_tokens} tokens, {len(speakers)} speakers)"
+        )
+        return decision
+
+
+def get_model_router() -> ModelRouter:
+    """Get the Gemini model router"""
+    return ModelRouter()
@@ -358,6 +358,12 @@ class RawTranscriptCache(TimestampedModel):
     data_hash = models.CharField(max_length=64, db_index=True)  # SHA256 of raw data
     is_valid = models.BooleanField(default=True)
     
+    # Sentence fingerprints as of the last extraction - drives delta re-extraction
+    extracted_sentence_hashes = models.JSONField(default=list, blank=True)
+    
+    # Columnar talk-time/turns/WPM/silence summary, rebuilt when raw data changes
+    speaker_analytics = models.JSONField(default=dict, blank=True)
+    
     class Meta:
         db_table = 'core_raw_transcript_cache'
         indexes = [
@@ -384,6 +390,24 @@ class RawTranscriptCache(TimestampedModel):
         data_str = json.dumps(self.raw_fireflies_data, sort_keys=True)
         expected_hash = hashlib.sha256(data_str.encode()).hexdigest()
         return self.data_hash == expected_hash
+    
+    @staticmethod
+    def fingerprint_sentence(sentence):
+        """Short stable fingerprint of one sentence (speaker + normalised text)"""
+        import hashlib
+        text = ' '.join(str(sentence.get('text') or sentence.get('raw_text') or '').lower().split())
+        key = f"{sentence.get('speaker_name') or ''}|{text}"
+        return hashlib.sha1(key.encode()).hexdigest()[:16]
+    
+    def current_sentence_hashes(self):
+        """Fingerprints of the sentences currently cached"""
+        sentences = (self.raw_fireflies_data or {}).get('sentences') or []
+        return [self.fingerprint_sentence(sentence) for sentence in sentences]
+    
+    def mark_sentences_extracted(self):
+        """Record the sentence list that tasks have been extracted from"""
+        self.extracted_sentence_hashes = self.current_sentence_hashes()
+        self.save(update_fields=['extracted_sentence_hashes', 'updated_at'])
 
 
 class GeminiProcessedTask(TimestampedModel):
@@ -582,6 +606,21 @@ class GeminiProcessedTask(TimestampedModel):
         help_text="Reason for rejection if status is rejected"
     )
     
+    # Near-duplicate detection across recurring meetings
+    duplicate_of = models.ForeignKey(
+        'self',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='near_duplicates',
+        help_text="Open task this one was detected as a near-duplicate of"
+    )
+    duplicate_similarity = models.FloatField(
+        null=True,
+        blank=True,
+        help_text="Estimated Jaccard similarity to duplicate_of (MinHash)"
+    )
+    
     class Meta:
         db_table = 'core_gemini_processed_tasks'
         indexes = [
@@ -592,6 +631,7 @@ class GeminiProcessedTask(TimestampedModel):
             models.Index(fields=['processing_timestamp']),
             models.Index(fields=['extraction_order']),
             models.Index(fields=['delivered_to_monday']),
+            models.Index(fields=['updated_at']),  # Dedupe index refresh watermark
         ]
         ordering = ['raw_transcript', 'extraction_order']
     
@@ -659,4 +699,309 @@ class GeminiProcessedTask(TimestampedModel):
             "brief_description": self.brief_description,
             "due_date": self.due_date_ms,
             "status": self.status
-        } 
\ No newline at end of file
+        } 
+
+class GeminiQuotaUsage(TimestampedModel):
+    """
+    Durable Gemini usage counters per model and time window.
+    Shared by every worker and process, and survives restarts; counters are
+    only ever changed with atomic F() increments.
+    """
+    
+    WINDOW_CHOICES = [
+        ('minute', 'Minute'),
+        ('day', 'Day'),
+    ]
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    model_name = models.CharField(max_length=100)
+    window = models.CharField(max_length=10, choices=WINDOW_CHOICES)
+    window_start = models.DateTimeField()
+    
+    request_count = models.PositiveIntegerField(default=0)
+    prompt_tokens = models.PositiveBigIntegerField(default=0)
+    output_tokens = models.PositiveBigIntegerField(default=0)
+    
+    class Meta:
+        db_table = 'core_gemini_quota_usage'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['model_name', 'window', 'window_start'],
+                name='unique_gemini_quota_window'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['window', 'window_start']),
+        ]
+    
+    def __str__(self):
+        return f"{self.model_name} {self.window} {self.window_start:%Y-%m-%d %H:%M} - {self.request_count} requests"
+    
+    @property
+    def total_tokens(self):
+        return self.prompt_tokens + self.output_tokens
+
+
+class ExtractionJob(TimestampedModel):
+    """
+    Persistent checkpoint for extracting one cached meeting.
+    Workers claim queued jobs (or running jobs whose lease expired after a
+    crash) with a conditional UPDATE, so any number of workers and restarts
+    can share one backfill without processing a meeting twice.
+    """
+    
+    STATUS_CHOICES = [
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ]
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    raw_transcript = models.OneToOneField(
+        RawTranscriptCache,
+        on_delete=models.CASCADE,
+        related_name='extraction_job'
+    )
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='queued')
+    
+    # Leasing and retries
+    lease_owner = models.CharField(max_length=100, blank=True)
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    last_error = models.TextField(blank=True)
+    
+    # Results
+    tasks_created = models.PositiveIntegerField(default=0)
+    model_version = models.CharField(max_length=100, blank=True)
+    stage_seconds = models.JSONField(default=dict, blank=True)  # {'prepare': s, 'extract': s, 'save': s}
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        db_table = 'core_extraction_job'
+        ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['status', 'lease_expires_at']),
+        ]
+    
+    def __str__(self):
+        return f"{self.raw_transcript.fireflies_id} - {self.status} (attempt {self.attempts}/{self.max_attempts})"
+
+
+class Person(TimestampedModel):
+    """
+    People directory entry built from meeting_attendees across all cached meetings.
+    Aliases hold every name the person has been seen under (display names,
+    matched speaker names, the email local part) for fuzzy name -> email lookup.
+    """
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    email = models.EmailField(unique=True)  # Always stored lowercase
+    display_name = models.CharField(max_length=255, blank=True)
+    aliases = models.JSONField(default=list, blank=True)
+    meeting_count = models.PositiveIntegerField(default=0)
+    last_seen_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        db_table = 'core_person'
+        ordering = ['display_name', 'email']
+    
+    def __str__(self):
+        return f"{self.display_name} <{self.email}>" if self.display_name else self.email
+
+
+class MondayComplexityBudget(TimestampedModel):
+    """
+    Last known Monday.com complexity budget for one API token.
+    Refreshed from the complexity block returned with every query and drawn
+    down with conditional F() updates, so every worker paces against one budget.
+    """
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    token_key = models.CharField(max_length=64, unique=True)  # sha256 prefix of the API token
+    budget_remaining = models.BigIntegerField(default=0)
+    reset_at = models.DateTimeField()
+    last_query_cost = models.PositiveIntegerField(default=0)
+    
+    class Meta:
+        db_table = 'core_monday_complexity_budget'
+    
+    def __str__(self):
+        return f"{self.token_key[:8]} - {self.budget_remaining} points until {self.reset_at:%H:%M:%S}"
+
+
+class MondayDelivery(TimestampedModel):
+    """
+    Idempotency ledger for creating Monday.com items.
+    One row per deterministic delivery key. A sender leases the row before
+    creating the item, and an attempt whose outcome is unknown (sent, then
+    timed out or dropped) is checked against the board's delivery key column
+    before re-creating. Attempts Monday.com certainly rejected are simply retried.
+    """
+    
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('created', 'Created'),
+    ]
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    delivery_key = models.CharField(max_length=64, unique=True)
+    task_type = models.CharField(max_length=100)  # Model label, e.g. core.geminiprocessedtask
+    task_id = models.CharField(max_length=64)
+    board_id = models.CharField(max_length=50, blank=True)
+    
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending', db_index=True)
+    monday_item_id = models.CharField(max_length=50, blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+    lease_owner = models.CharField(max_length=100, blank=True)
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    # Set while a create is in flight and kept if it may have reached Monday.com
+    outcome_unknown = models.BooleanField(default=False)
+    delivered_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        db_table = 'core_monday_delivery'
+        indexes = [
+            models.Index(fields=['task_type', 'task_id']),
+        ]
+    
+    def __str__(self):
+        return f"{self.delivery_key} - {self.status}" + (f" ({self.monday_item_id})" if self.monday_item_id else '')
+
+
+class MondayPushJob(TimestampedModel):
+    """
+    One bulk push to Monday.com, started from the admin.
+    Its tasks are delivered by the outbox drainer through MondayOutbox entries
+    linked to the job; progress is read from those entries.
+    """
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    source = models.CharField(max_length=50, blank=True)
+    requested_by = models.CharField(max_length=150, blank=True)
+    total = models.PositiveIntegerField(default=0)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        db_table = 'core_monday_push_job'
+        ordering = ['-created_at']
+    
+    def __str__(self):
+        return f"Push job {str(self.id)[:8]} - {self.total} tasks"
+
+
+class MondayOutbox(TimestampedModel):
+    """
+    Transactional outbox for Monday.com delivery.
+    Rows are written in the same transaction that approves a task, so an
+    approval is never lost and never pushed before it commits; a background
+    drainer claims queued rows in batches and sends them outside the request.
+    Failed attempts are re-queued for next_attempt_at with jittered exponential
+    backoff, and entries out of attempts stay 'failed' as the dead letter.
+    """
+    
+    STATUS_CHOICES = [
+        ('queued', 'Queued'),
+        ('sending', 'Sending'),
+        ('sent', 'Sent'),
+        ('failed', 'Failed (dead letter)'),
+    ]
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    task_type = models.CharField(max_length=100)  # Model label, e.g. core.geminiprocessedtask
+    task_id = models.CharField(max_length=64)
+    source = models.CharField(max_length=50, blank=True)  # approval, push_now, ...
+    job = models.ForeignKey(
+        MondayPushJob, on_delete=models.SET_NULL, null=True, blank=True, related_name='entries'
+    )
+    
+    # Routed target; each board is drained by its own lane
+    board_id = models.CharField(max_length=50, blank=True)
+    group_id = models.CharField(max_length=100, blank=True)
+    
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='queued')
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    next_attempt_at = models.DateTimeField(default=timezone.now)  # Queued entries are claimed once due
+    lease_owner = models.CharField(max_length=100, blank=True)
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    
+    monday_item_id = models.CharField(max_length=50, blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        db_table = 'core_monday_outbox'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['task_type', 'task_id'],
+                condition=models.Q(status__in=['queued', 'sending']),
+                name='unique_open_monday_outbox'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+            models.Index(fields=['status', 'board_id', 'next_attempt_at']),
+            models.Index(fields=['task_type', 'task_id']),
+        ]
+    
+    def __str__(self):
+        return f"{self.task_type} {self.task_id} - {self.status}"
+
+
+class MondaySyncState(TimestampedModel):
+    """
+    Watermark for the incremental Monday.com status pull, per board group.
+    Each sync only reads items updated since the watermark and advances it
+    to the newest updated_at it saw.
+    """
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    board_id = models.CharField(max_length=50)
+    group_id = models.CharField(max_length=100)
+    watermark = models.DateTimeField(null=True, blank=True)
+    last_synced_at = models.DateTimeField(null=True, blank=True)
+    last_stats = models.JSONField(default=dict, blank=True)
+    
+    class Meta:
+        db_table = 'core_monday_sync_state'
+        constraints = [
+            models.UniqueConstraint(fields=['board_id', 'group_id'], name='unique_monday_sync_scope'),
+        ]
+    
+    def __str__(self):
+        return f"{self.board_id}/{self.group_id} - synced up to {self.watermark}"
+
+
+class MondayRoute(TimestampedModel):
+    """
+    Routing rule sending tasks to a Monday.com board and group.
+    Active rules are tried in priority order and the first whose meeting and
+    assignee patterns both match wins; an empty pattern matches anything.
+    Tasks no rule matches go to the configured default board.
+    """
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    name = models.CharField(max_length=100)
+    priority = models.PositiveIntegerField(default=100, help_text="Lower runs first")
+    meeting_pattern = models.CharField(
+        max_length=255, blank=True,
+        help_text="Regular expression searched in the meeting title (case-insensitive)"
+    )
+    assignee_pattern = models.CharField(
+        max_length=255, blank=True,
+        help_text="Regular expression searched in assignee names and emails (case-insensitive)"
+    )
+    board_id = models.CharField(max_length=50)
+    group_id = models.CharField(max_length=100)
+    is_active = models.BooleanField(default=True)
+    
+    class Meta:
+        db_table = 'core_monday_route'
+        ordering = ['priority', 'name']
+    
+    def __str__(self):
+        return f"{self.name} -> {self.board_id}/{self.group_id}"
@@ -7,14 +7,36 @@ import requests
 import json
 import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from django.conf import settings
 
 from .circuit_breaker import CircuitBreakerRegistry
+from .monday_rate_limiter import ComplexityRateLimiter, with_complexity, parse_reset_seconds
+from .monday_schema import BoardSchemaError, get_board_schema_cache
 
 logger = logging.getLogger('apps.core.monday_client')
 
 
+class MondayRateLimitError(requests.exceptions.RequestException):
+    """Rate limit or complexity budget rejection; the query was not executed, so it is always safe to retry"""
+    pass
+
+
+def may_have_reached_monday(error: Exception) -> bool:
+    """
+    True when a failed mutation may still have been executed by Monday.com
+    Timeouts, dropped connections and 5xx responses after sending are unknown;
+    rate limit rejections, connect timeouts, open breakers, GraphQL errors and
+    4xx responses mean nothing was created.
+    """
+    if isinstance(error, (MondayRateLimitError, requests.exceptions.ConnectTimeout)):
+        return False
+    if isinstance(error, requests.exceptions.HTTPError):
+        status = getattr(error.response, 'status_code', None)
+        return status is None or status >= 500
+    return isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError))
+
+
 class EnhancedMondayClient:
     """Enhanced Monday.com client with rate limiting, retry logic, and quota tracking"""
     
@@ -28,6 +50,13 @@ class EnhancedMondayClient:
         self.rate_limit_per_minute = rate_limit_per_minute
         self.min_request_interval = 60.0 / rate_limit_per_minute  # seconds between requests
         self.last_request_time = 0
+        self.complexity_limiter = ComplexityRateLimiter(api_key)
+        
+        # Hidden text column holding each item's delivery key (see monday_delivery)
+        self.delivery_key_column = settings.EXTERNAL_APIS['MONDAY'].get('DELIVERY_KEY_COLUMN', '')
+        
+        # Column values are encoded by a serializer compiled from the cached board schema
+        self.board_schema_enabled = settings.EXTERNAL_APIS['MONDAY'].get('BOARD_SCHEMA', {}).get('ENABLED', True)
         
         # Retry configuration
         self.retry_attempts = settings.EXTERNAL_APIS['MONDAY'].get('RETRY_ATTEMPTS', 3)
@@ -56,10 +85,23 @@ class EnhancedMondayClient:
             'API-Version': '2023-10'
         })
         
+        # Local stand-in board for offline benchmarks (see fake_monday)
+        if settings.EXTERNAL_APIS['MONDAY'].get('FAKE_TRANSPORT', {}).get('ENABLED'):
+            from .fake_monday import install_fake_monday
+            install_fake_monday(self)
+        
         logger.info(f"Initialized EnhancedMondayClient with {rate_limit_per_minute}/min rate limit")
     
-    def _enforce_rate_limit(self):
-        """Enforce rate limiting between requests"""
+    def _enforce_rate_limit(self, query: str = ''):
+        """
+        Pace requests by the shared complexity budget
+        Falls back to a fixed interval between requests when the budget limiter is disabled
+        """
+        if self.complexity_limiter.enabled:
+            self.complexity_limiter.acquire(query)
+            self.last_request_time = time.time()
+            return
+        
         current_time = time.time()
         time_since_last_request = current_time - self.last_request_time
         
@@ -88,15 +130,29 @@ class EnhancedMondayClient:
         if usage_percentage >= self.quota_tracker['warning_threshold']:
             logger.warning(f"Monday.com API quota warning: {usage_percentage:.1f}% used ({self.quota_tracker['requests_today']}/{daily_limit})")
     
-    def _execute_query_with_retry(self, query: str, variables: Optional[Dict] = None) -> Dict[str, Any]:
-        """Execute a GraphQL query with retry logic and circuit breaker"""
+    def _execute_query_with_retry(
+        self,
+        query: str,
+        variables: Optional[Dict] = None,
+        partial_errors: Optional[List[Dict[str, Any]]] = None,
+        idempotent: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Execute a GraphQL query with retry logic and circuit breaker
+        Pass a list as partial_errors to accept partial data: field-level errors
+        (those with a path) are appended to it instead of failing the whole query.
+        Non-idempotent mutations are only retried after rate limit rejections, never
+        after timeouts or connection errors that may have reached Monday.com.
+        """
+        
+        sent_query = with_complexity(query) if self.complexity_limiter.enabled else query
         
         def make_request():
-            self._enforce_rate_limit()
+            self._enforce_rate_limit(sent_query)
             self._update_quota_tracker()
             
             payload = {
-                'query': query,
+                'query': sent_query,
                 'variables': variables or {}
             }
             
@@ -105,20 +161,38 @@ class EnhancedMondayClient:
             # Check for rate limiting
             if response.status_code == 429:
                 retry_after = response.headers.get('Retry-After', '60')
-                raise requests.exceptions.RequestException(f"Rate limited. Retry after {retry_after} seconds")
+                reset_seconds = parse_reset_seconds(response.text)
+                if reset_seconds is None and str(retry_after).isdigit():
+                    reset_seconds = int(retry_after)
+                self.complexity_limiter.record_exhausted(reset_seconds or 60)
+                raise MondayRateLimitError(f"Rate limited. Retry after {retry_after} seconds")
             
             response.raise_for_status()
             
             data = response.json()
             
+            if isinstance(data.get('data'), dict):
+                self.complexity_limiter.record(sent_query, data['data'].pop('complexity', None))
+            
+            if 'errors' in data and partial_errors is not None and data.get('data') and all(
+                error.get('path') for error in data['errors']
+            ):
+                partial_errors.extend(data['errors'])
+                logger.warning(f"Monday.com GraphQL field errors: {data['errors']}")
+                return data['data']
+            
             if 'errors' in data:
                 error_msg = data['errors']
                 logger.error(f"Monday.com GraphQL errors: {error_msg}")
                 
                 # Check for rate limiting in GraphQL errors
+                reset_seconds = parse_reset_seconds(str(error_msg))
+                if reset_seconds is not None:
+                    self.complexity_limiter.record_exhausted(reset_seconds)
+                
                 error_str = str(error_msg).lower()
                 if 'rate' in error_str or 'limit' in error_str or 'quota' in error_str:
-                    raise requests.exceptions.RequestException(f"Rate limit/quota error: {error_msg}")
+                    raise MondayRateLimitError(f"Rate limit/quota error: {error_msg}")
                 
                 raise Exception(f"Monday.com GraphQL errors: {error_msg}")
             
@@ -133,6 +207,10 @@ class EnhancedMondayClient:
             except requests.exceptions.RequestException as e:
                 last_exception = e
                 
+                if not idempotent and not isinstance(e, MondayRateLimitError):
+                    logger.error(f"Monday.com mutation outcome unknown, not retrying: {e}")
+                    raise
+                
                 if attempt < self.retry_attempts - 1:  # Don't sleep on last attempt
                     backoff_time = min(
                         self.backoff_factor ** attempt,
@@ -172,9 +250,78 @@ class EnhancedMondayClient:
         6. date expected -> date_mkr7ymmh (date column)
         """
         
-        # Extract task information
         task_title = task_data.get('task_item', 'Untitled Task')
-        assignee_emails = task_data.get('assignee_emails', '')
+        try:
+            column_values = self.build_column_values(task_data)
+        except BoardSchemaError as e:
+            logger.error(f"Cannot create Monday.com item '{task_title}': {e}")
+            return None
+        
+        mutation = """
+        mutation CreateItem($boardId: ID!, $groupId: String!, $itemName: String!, $columnValues: JSON!) {
+            create_item(
+                board_id: $boardId,
+                group_id: $groupId,
+                item_name: $itemName,
+                column_values: $columnValues
+            ) {
+                id
+                name
+            }
+        }
+        """
+        
+        variables = {
+            'boardId': self.board_id,
+            'groupId': self.group_id,
+            'itemName': task_title,
+            'columnValues': json.dumps(column_values)
+        }
+        
+        logger.info(f"Creating Monday.com item: {task_title}")
+        logger.debug(f"Column values: {column_values}")
+        
+        try:
+            data = self._execute_query_with_retry(mutation, variables)
+            created_item = data.get('create_item')
+            
+            if created_item:
+                item_id = created_item.get('id')
+                item_name = created_item.get('name')
+                logger.info(f"Successfully created Monday.com item: {item_name} (ID: {item_id})")
+                return item_id
+            else:
+                logger.error("No item returned from Monday.com create mutation")
+                return None
+                
+        except Exception as e:
+            logger.error(f"Failed to create Monday.com item '{task_title}': {e}")
+            return None
+    
+    def _schema_serializer(self, force: bool = False):
+        """
+        Serializer compiled from the cached board schema, or None to use the static column map
+        Raises BoardSchemaError when the board lacks mapped columns
+        """
+        if not self.board_schema_enabled:
+            return None
+        try:
+            return get_board_schema_cache().serializer(self, force=force)
+        except BoardSchemaError:
+            raise
+        except Exception as e:
+            logger.warning(f"Monday.com board schema unavailable ({e}) - using static column map")
+            return None
+    
+    def build_column_values(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Monday.com column values for one task, validated against the board schema when available"""
+        serializer = self._schema_serializer()
+        if serializer is not None:
+            return serializer.serialize(task_data)
+        return self._build_static_column_values(task_data)
+    
+    def _build_static_column_values(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Column values from the fixed field IDs (see create_task_item for the mappings)"""
         assignee_names = task_data.get('assignee(s)_full_names', '')
         priority = task_data.get('priority', 'Medium')
         description = task_data.get('brief_description', '')
@@ -224,49 +371,110 @@ class EnhancedMondayClient:
             except (ValueError, TypeError) as e:
                 logger.warning(f"Invalid due_date format: {due_date_ms}, error: {e}")
         
-        mutation = """
-        mutation CreateItem($boardId: ID!, $groupId: String!, $itemName: String!, $columnValues: JSON!) {
-            create_item(
-                board_id: $boardId,
-                group_id: $groupId,
-                item_name: $itemName,
-                column_values: $columnValues
-            ) {
-                id
-                name
-            }
-        }
-        """
-        
-        variables = {
-            'boardId': self.board_id,
-            'groupId': self.group_id,
-            'itemName': task_title,
-            'columnValues': json.dumps(column_values)
-        }
+        # 7. Delivery key - hidden text column used to find items from earlier attempts
+        if self.delivery_key_column and task_data.get('delivery_key'):
+            column_values[self.delivery_key_column] = task_data['delivery_key']
         
-        logger.info(f"Creating Monday.com item: {task_title}")
-        logger.debug(f"Column values: {column_values}")
+        return column_values
+    
+    @property
+    def batch_size(self) -> int:
+        """create_item calls per GraphQL document, capped by the per-query complexity limit"""
+        batch_config = settings.EXTERNAL_APIS['MONDAY'].get('BATCH_DELIVERY', {})
+        max_items = batch_config.get('MAX_ITEMS_PER_MUTATION', 25)
+        item_complexity = batch_config.get('CREATE_ITEM_COMPLEXITY', 30000)
+        max_complexity = batch_config.get('MAX_QUERY_COMPLEXITY', 5000000)
+        return max(1, min(max_items, max_complexity // max(1, item_complexity)))
+    
+    def build_create_items_mutation(
+        self,
+        tasks: List[Dict[str, Any]],
+        column_values: Optional[List[Dict[str, Any]]] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        """One GraphQL document with an aliased create_item field (t0, t1, ...) per task"""
+        if column_values is None:
+            column_values = [self.build_column_values(task_data) for task_data in tasks]
+        
+        declarations = ['$boardId: ID!', '$groupId: String!']
+        fields = []
+        variables = {'boardId': self.board_id, 'groupId': self.group_id}
+        
+        for index, task_data in enumerate(tasks):
+            declarations.append(f'$name{index}: String!, $values{index}: JSON!')
+            fields.append(
+                f'    t{index}: create_item(board_id: $boardId, group_id: $groupId, '
+                f'item_name: $name{index}, column_values: $values{index}) {{ id name }}'
+            )
+            variables[f'name{index}'] = task_data.get('task_item', 'Untitled Task')
+            variables[f'values{index}'] = json.dumps(column_values[index])
+        
+        mutation = f"mutation BulkCreateItems({', '.join(declarations)}) {{\n" + '\n'.join(fields) + '\n}'
+        return mutation, variables
+    
+    def create_items_batch(self, tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create many items with aliased multi-item mutations, batch_size per request
+        Returns one {'item_id', 'error'} per task, in order; errors that no retry can
+        fix (missing board columns) add 'permanent': True,
+        and failures that may still have created the item add 'outcome_unknown': True
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(tasks)
+        size = self.batch_size
         
+        # Catch schema drift once for the whole batch, re-checking the live board before giving up
         try:
-            data = self._execute_query_with_retry(mutation, variables)
-            created_item = data.get('create_item')
+            try:
+                serializer = self._schema_serializer()
+            except BoardSchemaError:
+                serializer = self._schema_serializer(force=True)
+        except BoardSchemaError as e:
+            logger.error(f"Not sending {len(tasks)} Monday.com items: {e}")
+            return [{'item_id': None, 'error': str(e), 'permanent': True} for _ in tasks]
+        
+        # Encode every task before anything is sent
+        sendable = [
+            (index, task_data, serializer.serialize(task_data) if serializer else self._build_static_column_values(task_data))
+            for index, task_data in enumerate(tasks)
+        ]
+        
+        for start in range(0, len(sendable), size):
+            chunk = sendable[start:start + size]
+            mutation, variables = self.build_create_items_mutation(
+                [task_data for _, task_data, _ in chunk], [values for _, _, values in chunk]
+            )
+            field_errors: List[Dict[str, Any]] = []
             
-            if created_item:
-                item_id = created_item.get('id')
-                item_name = created_item.get('name')
-                logger.info(f"Successfully created Monday.com item: {item_name} (ID: {item_id})")
-                return item_id
-            else:
-                logger.error("No item returned from Monday.com create mutation")
-                return None
-                
-        except Exception as e:
-            logger.error(f"Failed to create Monday.com item '{task_title}': {e}")
-            return None
+            logger.info(f"Creating {len(chunk)} Monday.com items in one request ({start + len(chunk)}/{len(sendable)})")
+            try:
+                data = self._execute_query_with_retry(
+                    mutation, variables, partial_errors=field_errors, idempotent=False
+                )
+            except Exception as e:
+                logger.error(f"Batch create of {len(chunk)} Monday.com items failed: {e}")
+                unknown = may_have_reached_monday(e)
+                for index, _, _ in chunk:
+                    results[index] = {'item_id': None, 'error': str(e), 'outcome_unknown': unknown}
+                continue
+            
+            alias_errors = {}
+            for error in field_errors:
+                alias_errors.setdefault(str(error['path'][0]), error.get('message', 'Unknown error'))
+            if alias_errors and serializer is not None:
+                # Item-level rejections may mean the board changed since the schema was cached
+                get_board_schema_cache().invalidate(self.board_id)
+            
+            for position, (index, _, _) in enumerate(chunk):
+                alias = f't{position}'
+                item = (data or {}).get(alias)
+                if item and item.get('id'):
+                    results[index] = {'item_id': item['id'], 'error': None}
+                else:
+                    results[index] = {'item_id': None, 'error': alias_errors.get(alias, 'No item returned from Monday.com')}
+        
+        return results
     
-    def get_board_info(self) -> Optional[Dict[str, Any]]:
-        """Get information about the configured board including column details"""
+    def fetch_board(self) -> Dict[str, Any]:
+        """Fetch the configured board's columns and groups; raises BoardSchemaError if it does not exist"""
         query = """
         query GetBoard($boardId: ID!) {
             boards(ids: [$boardId]) {
@@ -287,27 +495,33 @@ class EnhancedMondayClient:
         }
         """
         
-        variables = {'boardId': self.board_id}
-        
+        data = self._execute_query_with_retry(query, {'boardId': self.board_id})
+        boards = data.get('boards') or []
+        if not boards:
+            raise BoardSchemaError(f"Board {self.board_id} not found")
+        return boards[0]
+    
+    def get_board_info(self, force_refresh: bool = False) -> Optional[Dict[str, Any]]:
+        """Get information about the configured board including column details (cached, see monday_schema)"""
         try:
-            data = self._execute_query_with_retry(query, variables)
-            boards = data.get('boards', [])
-            
-            if boards:
-                board = boards[0]
-                logger.info(f"Board info: {board.get('name', 'Unknown')} (ID: {board.get('id')})")
-                
-                # Log column information for debugging
-                columns = board.get('columns', [])
-                logger.info("Available columns:")
-                for col in columns:
-                    logger.info(f"  - {col.get('title')} (ID: {col.get('id')}, Type: {col.get('type')})")
-                
-                return board
+            if self.board_schema_enabled:
+                board = get_board_schema_cache().get(self, force=force_refresh).raw
             else:
-                logger.warning(f"Board {self.board_id} not found")
-                return None
+                board = self.fetch_board()
+            
+            logger.info(f"Board info: {board.get('name', 'Unknown')} (ID: {board.get('id')})")
+            
+            # Log column information for debugging
+            columns = board.get('columns', [])
+            logger.info("Available columns:")
+            for col in columns:
+                logger.info(f"  - {col.get('title')} (ID: {col.get('id')}, Type: {col.get('type')})")
+            
+            return board
                 
+        except BoardSchemaError as e:
+            logger.warning(str(e))
+            return None
         except Exception as e:
             logger.error(f"Failed to get board info: {e}")
             return None
@@ -339,21 +553,102 @@ class EnhancedMondayClient:
             logger.error(f"Monday.com connection test failed: {e}")
             return False
     
-    def bulk_create_tasks(self, tasks: List[Dict[str, Any]]) -> List[Optional[str]]:
-        """Create multiple tasks with rate limiting between requests"""
-        results = []
+    def find_items_by_delivery_keys(self, delivery_keys: List[str]) -> Dict[str, str]:
+        """Existing board items carrying any of these delivery keys, as {delivery_key: item_id}"""
+        if not self.delivery_key_column or not delivery_keys:
+            return {}
+        
+        query = """
+        query FindByDeliveryKeys($boardId: ID!, $columnId: String!, $keys: [String]!, $limit: Int!) {
+            items_page_by_column_values(
+                board_id: $boardId,
+                limit: $limit,
+                columns: [{column_id: $columnId, column_values: $keys}]
+            ) {
+                items {
+                    id
+                    column_values(ids: [$columnId]) { text }
+                }
+            }
+        }
+        """
+        variables = {
+            'boardId': self.board_id,
+            'columnId': self.delivery_key_column,
+            'keys': list(delivery_keys),
+            'limit': min(500, max(25, 2 * len(delivery_keys)))
+        }
         
-        logger.info(f"Creating {len(tasks)} tasks in Monday.com with rate limiting")
+        data = self._execute_query_with_retry(query, variables)
+        found = {}
+        for item in (data.get('items_page_by_column_values') or {}).get('items', []):
+            for column in item.get('column_values') or []:
+                if column.get('text') in delivery_keys:
+                    found.setdefault(column['text'], item['id'])
+        return found
+    
+    def iter_items_updated_since(
+        self,
+        since: Optional[datetime],
+        column_ids: List[str],
+        page_size: int = 100
+    ):
+        """
+        Items in the configured group updated on or after since's date, page by page
+        Uses items_page with a __last_updated__ rule and follows next_items_page cursors;
+        Monday compares the date only, so callers filter on updated_at themselves
+        """
+        item_fields = 'cursor items { id updated_at column_values(ids: $columnIds) { id text } }'
+        first_page = f"""
+        query ItemsUpdatedSince($boardId: ID!, $groupId: String!, $limit: Int!, $columnIds: [String!], $queryParams: ItemsQuery) {{
+            boards(ids: [$boardId]) {{
+                groups(ids: [$groupId]) {{
+                    items_page(limit: $limit, query_params: $queryParams) {{ {item_fields} }}
+                }}
+            }}
+        }}
+        """
+        next_page = f"""
+        query NextItemsPage($cursor: String!, $limit: Int!, $columnIds: [String!]) {{
+            next_items_page(cursor: $cursor, limit: $limit) {{ {item_fields} }}
+        }}
+        """
         
-        for i, task in enumerate(tasks):
-            logger.info(f"Creating task {i+1}/{len(tasks)}: {task.get('task_item', 'Unknown')}")
-            
-            result = self.create_task_item(task)
-            results.append(result)
-            
-            # Rate limiting is handled in create_task_item, but add extra delay for bulk operations
-            if i < len(tasks) - 1:  # Don't sleep after last task
-                time.sleep(1)  # Extra 1-second delay between bulk operations
+        variables = {
+            'boardId': self.board_id,
+            'groupId': self.group_id,
+            'limit': page_size,
+            'columnIds': column_ids,
+            'queryParams': None,
+        }
+        if since is not None:
+            variables['queryParams'] = {'rules': [{
+                'column_id': '__last_updated__',
+                'compare_value': ['EXACT', since.strftime('%Y-%m-%d')],
+                'operator': 'greater_than_or_equals',
+                'compare_attribute': 'UPDATED_AT',
+            }]}
+        
+        data = self._execute_query_with_retry(first_page, variables)
+        boards = data.get('boards') or []
+        groups = (boards[0].get('groups') or []) if boards else []
+        page = groups[0].get('items_page') if groups else None
+        
+        while page:
+            yield page.get('items') or []
+            cursor = page.get('cursor')
+            if not cursor:
+                break
+            data = self._execute_query_with_retry(
+                next_page, {'cursor': cursor, 'limit': page_size, 'columnIds': column_ids}
+            )
+            page = data.get('next_items_page')
+    
+    def bulk_create_tasks(self, tasks: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """Create multiple tasks using batched multi-item mutations"""
+        logger.info(f"Creating {len(tasks)} tasks in Monday.com in batches of up to {self.batch_size}")
+        
+        results = [result['item_id'] for result in self.create_items_batch(tasks)]
         
         successful_creates = sum(1 for r in results if r is not None)
         logger.info(f"Bulk creation completed: {successful_creates}/{len(tasks)} successful")
@@ -370,7 +665,8 @@ class EnhancedMondayClient:
             'retry_attempts': self.retry_attempts,
             'backoff_factor': self.backoff_factor,
             'max_backoff_time': self.max_backoff_time,
-            'circuit_breaker_state': self.circuit_breaker.state.value
+            'circuit_breaker_state': self.circuit_breaker.state.value,
+            'complexity_budget': self.complexity_limiter.status()
         }
 
 
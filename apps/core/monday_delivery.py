@@ -0,0 +1,162 @@
+"""
+Idempotent Monday.com Delivery
+Deterministic delivery keys per task, a MondayDelivery ledger leased by whoever is
+sending, and a batched board lookup for attempts whose outcome is unknown, so
+retries and concurrent pushes never create the same item twice
+"""
+
+import hashlib
+import logging
+import os
+import socket
+import uuid
+from datetime import timedelta
+from typing import List, Dict, Any, Optional, Tuple
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import MondayDelivery
+
+logger = logging.getLogger('apps.core.monday_delivery')
+
+
+def delivery_key(task) -> str:
+    """Stable key for one task: the same on every attempt, worker and process"""
+    identity = f"{task._meta.label_lower}:{task.pk}"
+    return 'tf-' + hashlib.sha256(identity.encode()).hexdigest()[:24]
+
+
+class IdempotentDelivery:
+    """
+    Creates Monday.com items at most once per task
+
+    Each task's ledger row is leased before sending; rows already created are
+    reused, rows leased by another live sender are skipped, and rows whose
+    earlier attempt may have reached Monday.com (sent, then timed out, or a
+    sender that died mid-request) are looked up on the board by delivery key
+    (one batched query) before anything is re-created. Attempts Monday.com
+    certainly rejected are re-sent directly.
+    """
+
+    def __init__(self, client, config: Optional[Dict[str, Any]] = None):
+        if config is None:
+            config = settings.EXTERNAL_APIS['MONDAY']
+
+        self.client = client
+        self.lease_seconds = config.get('DELIVERY_LEASE_SECONDS', 300)
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+    def deliver(self, tasks: List[Tuple[Any, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Create one item per (task, task_data) pair
+        Returns {'item_id', 'error', 'reused', 'in_progress', 'permanent'} per pair, in order
+        """
+        keys = [delivery_key(task) for task, _ in tasks]
+        task_data_by_key = {key: task_data for key, (_, task_data) in zip(keys, tasks)}
+        results: Dict[str, Optional[Dict[str, Any]]] = dict.fromkeys(keys)
+
+        MondayDelivery.objects.bulk_create([
+            MondayDelivery(
+                delivery_key=key,
+                task_type=task._meta.label_lower,
+                task_id=str(task.pk),
+                board_id=str(self.client.board_id)
+            )
+            for key, (task, _) in zip(keys, tasks)
+        ], ignore_conflicts=True)
+
+        # Created on an earlier attempt
+        for key, item_id in MondayDelivery.objects.filter(
+            delivery_key__in=keys, status='created'
+        ).values_list('delivery_key', 'monday_item_id'):
+            results[key] = {'item_id': item_id, 'error': None, 'reused': True}
+
+        # Lease the rest; rows leased by another live sender are left alone
+        now = timezone.now()
+        open_keys = [key for key, result in results.items() if result is None]
+        MondayDelivery.objects.filter(delivery_key__in=open_keys, status='pending').filter(
+            Q(lease_expires_at__isnull=True) | Q(lease_expires_at__lt=now)
+        ).update(
+            lease_owner=self.owner,
+            lease_expires_at=now + timedelta(seconds=self.lease_seconds),
+            attempts=F('attempts') + 1,
+            updated_at=now
+        )
+        claimed = dict(MondayDelivery.objects.filter(
+            delivery_key__in=open_keys, status='pending', lease_owner=self.owner
+        ).values_list('delivery_key', 'outcome_unknown'))
+
+        for key in open_keys:
+            if key not in claimed:
+                results[key] = {'item_id': None, 'error': 'Delivery already in progress elsewhere', 'in_progress': True}
+
+        # An earlier attempt whose outcome is unknown may still have created the item
+        unverified = [key for key, outcome_unknown in claimed.items() if outcome_unknown]
+        if unverified:
+            try:
+                if not self.client.delivery_key_column:
+                    # Without the key column the board cannot be checked, and re-sending may duplicate
+                    raise ValueError("MONDAY_DELIVERY_KEY_COLUMN is not configured")
+                found = self.client.find_items_by_delivery_keys(unverified)
+            except Exception as e:
+                logger.error(f"Delivery key lookup failed, holding back {len(unverified)} tasks: {e}")
+                for key in unverified:
+                    self._release(key, f"Delivery key lookup failed: {e}")
+                    results[key] = {'item_id': None, 'error': f"Delivery key lookup failed: {e}"}
+                found = {}
+
+            for key, item_id in found.items():
+                logger.info(f"🔁 Found existing Monday.com item {item_id} for {key} - not re-creating")
+                self._mark_created(key, item_id)
+                results[key] = {'item_id': item_id, 'error': None, 'reused': True}
+
+        to_create = [key for key, result in results.items() if result is None]
+        if to_create:
+            # In flight: if this sender dies mid-request, the next one must check the board first
+            MondayDelivery.objects.filter(delivery_key__in=to_create, lease_owner=self.owner).update(
+                outcome_unknown=True, updated_at=timezone.now()
+            )
+            created = self.client.create_items_batch([
+                {**task_data_by_key[key], 'delivery_key': key} for key in to_create
+            ])
+            for key, result in zip(to_create, created):
+                if result['item_id']:
+                    self._mark_created(key, result['item_id'])
+                else:
+                    self._release(key, result['error'], outcome_unknown=result.get('outcome_unknown', False))
+                results[key] = result
+
+        return [
+            {'error': None, 'reused': False, 'in_progress': False, 'permanent': False, **results[key]}
+            for key in keys
+        ]
+
+    def _mark_created(self, key: str, item_id: str):
+        MondayDelivery.objects.filter(delivery_key=key).update(
+            status='created',
+            monday_item_id=item_id,
+            delivered_at=timezone.now(),
+            lease_owner='',
+            lease_expires_at=None,
+            last_error='',
+            outcome_unknown=False,
+            updated_at=timezone.now()
+        )
+
+    def _release(self, key: str, error: str, outcome_unknown: Optional[bool] = None):
+        """Give the lease back; outcome_unknown=None keeps the row's current flag"""
+        updates = {'lease_owner': '', 'lease_expires_at': None, 'last_error': error or '', 'updated_at': timezone.now()}
+        if outcome_unknown is not None:
+            updates['outcome_unknown'] = outcome_unknown
+        MondayDelivery.objects.filter(delivery_key=key, lease_owner=self.owner).update(**updates)
+
+
+def reset_delivery_ledger(task_type: str, task_ids: List[str]) -> int:
+    """
+    Clear attempts and errors of pending ledger rows so a manual retry starts fresh
+    Rows whose outcome is unknown keep that flag; they are still checked on the board first
+    """
+    return MondayDelivery.objects.filter(
+        task_type=task_type, task_id__in=task_ids, status='pending'
+    ).update(attempts=0, last_error='', updated_at=timezone.now())
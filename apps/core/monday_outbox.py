@@ -0,0 +1,574 @@
+"""
+Monday.com Delivery Outbox
+Approvals write MondayOutbox rows, routed to a board and group, in their own
+transaction; OutboxDrainer claims due rows in batches with conditional UPDATEs
+and delivers them through the idempotent, batched, complexity-paced delivery
+path, outside any web request. Failures are retried at a jittered exponential
+backoff until they run out of attempts. LaneScheduler runs one drainer per board.
+"""
+
+import logging
+import os
+import random
+import socket
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import timedelta
+from typing import List, Dict, Any, Optional
+from django.conf import settings
+from django.db import connection
+from django.db.models import Count, F, Max, Min, Q, prefetch_related_objects
+from django.utils import timezone
+
+from .models import MondayOutbox, MondayPushJob, GeminiProcessedTask, ProcessedTaskData
+from .monday_routing import get_monday_router, lane_client
+
+logger = logging.getLogger('apps.core.monday_outbox')
+
+
+def _outbox_config() -> Dict[str, Any]:
+    return settings.SYSTEM_CONFIG.get('MONDAY_OUTBOX', {})
+
+
+def _claimable(now) -> Q:
+    """Queued entries that are due, plus sending entries whose lease expired"""
+    return Q(status='queued', next_attempt_at__lte=now) | Q(status='sending', lease_expires_at__lt=now)
+
+
+def backoff_delay(attempt: int, config: Optional[Dict[str, Any]] = None) -> float:
+    """
+    Seconds to wait after failed attempt number `attempt` (1-based)
+    Doubles from RETRY_BASE_SECONDS up to RETRY_MAX_SECONDS; the upper half is
+    random, so tasks that failed together are retried spread out, not at once
+    """
+    if config is None:
+        config = _outbox_config()
+    base = config.get('RETRY_BASE_SECONDS', 30)
+    ceiling = min(config.get('RETRY_MAX_SECONDS', 3600), base * 2 ** min(max(attempt - 1, 0), 30))
+    return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+
+def _load_route_inputs(tasks):
+    """Load the meetings routing reads for all tasks in one query per task type"""
+    tasks_by_type = {}
+    for task in tasks:
+        tasks_by_type.setdefault(task._meta.label_lower, []).append(task)
+    for task_type, typed_tasks in tasks_by_type.items():
+        prefetch_related_objects(typed_tasks, TASK_HANDLERS[task_type].route_relation)
+
+
+def enqueue_delivery(tasks, source: str = '', job: Optional[MondayPushJob] = None) -> int:
+    """
+    Queue tasks for Monday.com delivery
+    Call inside the transaction that approves them; tasks that already have an
+    open outbox entry are left as they are. Each entry is routed to its board
+    and group here, so the drainer lanes never need the task to pick a board.
+    With a job, the tasks' entries (new or already open) are linked to it.
+    """
+    tasks = list(tasks)
+    max_attempts = _outbox_config().get('MAX_ATTEMPTS', 5)
+    router = get_monday_router()
+    _load_route_inputs(tasks)
+
+    entries = []
+    for task in tasks:
+        board_id, group_id = router.resolve(*TASK_HANDLERS[task._meta.label_lower].route_inputs(task))
+        entries.append(MondayOutbox(
+            task_type=task._meta.label_lower,
+            task_id=str(task.pk),
+            source=source,
+            board_id=board_id,
+            group_id=group_id,
+            job=job,
+            max_attempts=max_attempts
+        ))
+    MondayOutbox.objects.bulk_create(entries, ignore_conflicts=True)
+
+    if job is not None:
+        for task_type in {entry.task_type for entry in entries}:
+            MondayOutbox.objects.filter(
+                task_type=task_type,
+                task_id__in=[entry.task_id for entry in entries if entry.task_type == task_type],
+                status__in=['queued', 'sending'],
+                job__isnull=True
+            ).update(job=job)
+    return len(tasks)
+
+
+def schedule_retry(failures) -> int:
+    """
+    Queue tasks whose direct delivery failed for a backed-off retry by the drainer
+    failures is a list of (task, error, permanent). The failed attempt counts
+    towards MAX_ATTEMPTS; permanent errors go straight to the dead letter, and
+    tasks that already have an open outbox entry are left as they are
+    """
+    failures = list(failures)
+    config = _outbox_config()
+    router = get_monday_router()
+    now = timezone.now()
+    _load_route_inputs([task for task, _, _ in failures])
+
+    entries = []
+    for task, error, permanent in failures:
+        board_id, group_id = router.resolve(*TASK_HANDLERS[task._meta.label_lower].route_inputs(task))
+        entries.append(MondayOutbox(
+            task_type=task._meta.label_lower,
+            task_id=str(task.pk),
+            source='retry',
+            status='failed' if permanent else 'queued',
+            board_id=board_id,
+            group_id=group_id,
+            attempts=1,
+            max_attempts=config.get('MAX_ATTEMPTS', 5),
+            last_error=error or '',
+            next_attempt_at=now + timedelta(seconds=backoff_delay(1, config))
+        ))
+    MondayOutbox.objects.bulk_create(entries, ignore_conflicts=True)
+    return len(entries)
+
+
+def scheduled_retries() -> Dict[str, Any]:
+    """Queued entries waiting for their backoff to pass, and when the next is due"""
+    waiting = MondayOutbox.objects.filter(status='queued', next_attempt_at__gt=timezone.now())
+    return {'count': waiting.count(), 'next_at': waiting.aggregate(next_at=Min('next_attempt_at'))['next_at']}
+
+
+def start_push_job(tasks, source: str = 'push_now', requested_by: str = '') -> MondayPushJob:
+    """Queue tasks as one tracked bulk push; call inside the transaction that selects them"""
+    job = MondayPushJob.objects.create(source=source, requested_by=requested_by)
+    enqueue_delivery(tasks, source=source, job=job)
+    job.total = job.entries.count()
+    if not job.total:
+        job.finished_at = timezone.now()
+    job.save(update_fields=['total', 'finished_at', 'updated_at'])
+    return job
+
+
+def push_job_progress(job: MondayPushJob, task_limit: int = 200) -> Dict[str, Any]:
+    """
+    Per-task progress, throughput and errors for a push job, read from its outbox entries
+    The job is marked finished the first time every entry is sent or failed
+    """
+    counts = dict(job.entries.values_list('status').annotate(total=Count('id')))
+    counts = {status: counts.get(status, 0) for status, _ in MondayOutbox.STATUS_CHOICES}
+    done = counts['sent'] + counts['failed']
+
+    if job.finished_at is None and job.total and done >= job.total:
+        job.finished_at = job.entries.aggregate(last=Max('updated_at'))['last'] or timezone.now()
+        job.save(update_fields=['finished_at', 'updated_at'])
+
+    return {
+        'job_id': str(job.id),
+        'source': job.source,
+        'requested_by': job.requested_by,
+        'total': job.total,
+        'counts': counts,
+        **push_job_rates(job, counts),
+        'finished': job.finished_at is not None,
+        'started_at': job.created_at.isoformat(),
+        'finished_at': job.finished_at.isoformat() if job.finished_at else None,
+        'errors': push_job_errors(job),
+        'tasks': [
+            {'task_id': task_id, 'status': status, 'attempts': attempts, 'monday_item_id': item_id}
+            for task_id, status, attempts, item_id in job.entries.order_by('created_at')
+            .values_list('task_id', 'status', 'attempts', 'monday_item_id')[:task_limit]
+        ],
+    }
+
+
+def push_job_rates(job: MondayPushJob, counts: Dict[str, int]) -> Dict[str, Any]:
+    """Completion, throughput and ETA for a push job from its per-status entry counts"""
+    done = counts.get('sent', 0) + counts.get('failed', 0)
+    elapsed = max(((job.finished_at or timezone.now()) - job.created_at).total_seconds(), 0.001)
+    throughput = counts.get('sent', 0) / elapsed
+    remaining = max(job.total - done, 0)
+
+    return {
+        'done': done,
+        'percent': round(done / job.total * 100, 1) if job.total else 100.0,
+        'elapsed_seconds': round(elapsed, 1),
+        'throughput_per_minute': round(throughput * 60, 1),
+        'eta_seconds': round(remaining / throughput) if throughput and remaining else None,
+    }
+
+
+def push_job_errors(job: MondayPushJob, limit: int = 20) -> List[Dict[str, Any]]:
+    """Most recent delivery errors of a push job's entries"""
+    return [
+        {'task_id': task_id, 'status': status, 'attempts': attempts, 'error': error}
+        for task_id, status, attempts, error in job.entries.exclude(last_error='').order_by('-updated_at')
+        .values_list('task_id', 'status', 'attempts', 'last_error')[:limit]
+    ]
+
+
+def retry_failed_deliveries(entries=None) -> int:
+    """
+    Move failed outbox entries (all, or those in the entries queryset) back to the
+    queue with a fresh retry budget, in the outbox and in the delivery ledger
+    """
+    from .monday_delivery import reset_delivery_ledger
+
+    failed = (MondayOutbox.objects.all() if entries is None else entries).filter(status='failed')
+    task_ids = {}
+    for task_type, task_id in failed.values_list('task_type', 'task_id'):
+        task_ids.setdefault(task_type, []).append(task_id)
+    for task_type, ids in task_ids.items():
+        reset_delivery_ledger(task_type, ids)
+
+    MondayPushJob.objects.filter(entries__in=failed).update(finished_at=None)
+    return failed.update(
+        status='queued', attempts=0, next_attempt_at=timezone.now(), lease_owner='', lease_expires_at=None,
+        updated_at=timezone.now()
+    )
+
+
+def outbox_summary() -> Dict[str, int]:
+    """Outbox entry counts per status"""
+    counts = dict(MondayOutbox.objects.values_list('status').annotate(total=Count('id')))
+    return {status: counts.get(status, 0) for status, _ in MondayOutbox.STATUS_CHOICES}
+
+
+def lane_summary() -> Dict[str, Dict[str, int]]:
+    """Queued and sending entry counts per board lane"""
+    lanes: Dict[str, Dict[str, int]] = {}
+    for board_id, status, total in MondayOutbox.objects.filter(status__in=['queued', 'sending']).values_list(
+        'board_id', 'status'
+    ).annotate(total=Count('id')).order_by('board_id'):
+        lanes.setdefault(board_id, {'queued': 0, 'sending': 0})[status] = total
+    return lanes
+
+
+class _GeminiTaskHandler:
+    """Delivery bookkeeping for GeminiProcessedTask"""
+
+    model = GeminiProcessedTask
+    route_relation = 'raw_transcript'
+
+    def __init__(self, precision_client):
+        pass
+
+    @staticmethod
+    def route_inputs(task):
+        return task.raw_transcript.meeting_title, f"{task.assignee_full_names},{task.assignee_emails}"
+
+    def already_delivered(self, task) -> bool:
+        return task.delivered_to_monday and bool(task.monday_item_id)
+
+    def task_data(self, task) -> Dict[str, Any]:
+        return task.to_prompt_format()
+
+    def delivered(self, task, item_id: str):
+        task.mark_delivered_to_monday(item_id)
+
+    def failed(self, task, error: str):
+        task.delivery_errors = (task.delivery_errors if isinstance(task.delivery_errors, list) else []) + [error]
+        task.save(update_fields=['delivery_errors', 'updated_at'])
+
+
+class _ProcessedTaskHandler:
+    """Delivery bookkeeping for ProcessedTaskData, shared with PrecisionMondayClient"""
+
+    model = ProcessedTaskData
+    route_relation = 'transcript'
+
+    def __init__(self, precision_client):
+        self.precision_client = precision_client
+
+    @staticmethod
+    def route_inputs(task):
+        return task.transcript.title, f"{task.assignee_full_names},{task.assignee_emails}"
+
+    def already_delivered(self, task) -> bool:
+        return task.delivery_status == 'delivered' and bool(task.monday_item_id)
+
+    def task_data(self, task) -> Dict[str, Any]:
+        return self.precision_client._build_task_data(task)
+
+    def delivered(self, task, item_id: str):
+        self.precision_client._record_delivered(task, item_id)
+
+    def failed(self, task, error: str):
+        self.precision_client._record_failed(task, error)
+
+
+TASK_HANDLERS = {
+    GeminiProcessedTask._meta.label_lower: _GeminiTaskHandler,
+    ProcessedTaskData._meta.label_lower: _ProcessedTaskHandler,
+}
+
+
+class OutboxDrainer:
+    """
+    Delivers queued MondayOutbox entries in batches
+    With a board_id it is that board's lane and only claims the board's entries
+    """
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        config: Optional[Dict[str, Any]] = None,
+        precision_client=None,
+        board_id: Optional[str] = None
+    ):
+        if config is None:
+            config = _outbox_config()
+
+        self.batch_size = max(1, batch_size or config.get('BATCH_SIZE', 25))
+        self.lease_seconds = config.get('LEASE_SECONDS', 300)
+        self.poll_seconds = config.get('POLL_SECONDS', 5)
+        self.retry_config = config
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.board_id = board_id
+
+        if precision_client is None:
+            from .precision_monday_client import get_precision_monday_client
+            precision_client = get_precision_monday_client()
+        self.delivery = precision_client.delivery
+        self.handlers = {task_type: handler(precision_client) for task_type, handler in TASK_HANDLERS.items()}
+
+        # Entries routed to the default board (or queued before routing) use the precision client
+        self.default_target = get_monday_router().default
+        self._deliveries = {}
+
+        self.stats = Counter()
+
+    def _delivery_for(self, board_id: str, group_id: str):
+        """IdempotentDelivery for one board and group, built once per drainer"""
+        if not board_id or (board_id, group_id) == self.default_target:
+            return self.delivery
+        if (board_id, group_id) not in self._deliveries:
+            from .monday_delivery import IdempotentDelivery
+            self._deliveries[(board_id, group_id)] = IdempotentDelivery(lane_client(board_id, group_id))
+        return self._deliveries[(board_id, group_id)]
+
+    def _expire_exhausted(self):
+        """Fail entries whose final attempt was abandoned by a crashed drainer"""
+        failed = MondayOutbox.objects.filter(
+            status='sending', lease_expires_at__lt=timezone.now(), attempts__gte=F('max_attempts')
+        ).update(status='failed', lease_owner='', lease_expires_at=None, last_error='Lease expired on final attempt', updated_at=timezone.now())
+        if failed:
+            logger.warning(f"⚠️  {failed} Monday.com outbox entries failed after their final attempt was abandoned")
+
+    def claim_batch(self) -> List[MondayOutbox]:
+        """
+        Claim the longest-due queued entries, plus sending entries whose lease expired
+        Entries backing off are skipped until next_attempt_at (indexed) passes.
+        The conditional UPDATE is the lock: a row is only claimed by one drainer
+        """
+        self._expire_exhausted()
+        now = timezone.now()
+        claimable = _claimable(now)
+        if self.board_id is not None:
+            claimable &= Q(board_id=self.board_id)
+
+        entry_ids = list(
+            MondayOutbox.objects.filter(claimable).order_by('next_attempt_at', 'created_at')
+            .values_list('id', flat=True)[:self.batch_size]
+        )
+        if not entry_ids:
+            return []
+
+        MondayOutbox.objects.filter(claimable, id__in=entry_ids).update(
+            status='sending',
+            lease_owner=self.owner,
+            lease_expires_at=now + timedelta(seconds=self.lease_seconds),
+            attempts=F('attempts') + 1,
+            updated_at=now
+        )
+        return list(
+            MondayOutbox.objects.filter(id__in=entry_ids, status='sending', lease_owner=self.owner)
+            .order_by('next_attempt_at', 'created_at')
+        )
+
+    def _finish(self, entry: MondayOutbox, status: str, error: str = '', item_id: str = ''):
+        MondayOutbox.objects.filter(id=entry.id, lease_owner=self.owner).update(
+            status=status,
+            lease_owner='',
+            lease_expires_at=None,
+            last_error=error,
+            monday_item_id=item_id,
+            sent_at=timezone.now() if status == 'sent' else None,
+            updated_at=timezone.now()
+        )
+        self.stats[status] += 1
+
+    def _requeue(self, entry: MondayOutbox, error: str, count_attempt: bool = True):
+        """Back the entry off; an attempt that never ran (in progress elsewhere) waits the first step"""
+        now = timezone.now()
+        delay = backoff_delay(entry.attempts if count_attempt else 1, self.retry_config)
+        updates = {
+            'status': 'queued', 'lease_owner': '', 'lease_expires_at': None, 'last_error': error,
+            'next_attempt_at': now + timedelta(seconds=delay), 'updated_at': now
+        }
+        if not count_attempt:
+            updates['attempts'] = F('attempts') - 1
+        MondayOutbox.objects.filter(id=entry.id, lease_owner=self.owner).update(**updates)
+        self.stats['retried'] += 1
+
+    def drain_once(self) -> int:
+        """Claim and deliver one batch; returns how many entries were claimed"""
+        entries = self.claim_batch()
+        if not entries:
+            return 0
+
+        tasks_by_type = {}
+        for task_type in {entry.task_type for entry in entries}:
+            handler = self.handlers.get(task_type)
+            ids = [entry.task_id for entry in entries if entry.task_type == task_type]
+            tasks_by_type[task_type] = handler.model.objects.in_bulk(ids) if handler else {}
+
+        pending = []
+        for entry in entries:
+            handler = self.handlers.get(entry.task_type)
+            task = tasks_by_type[entry.task_type].get(uuid.UUID(entry.task_id)) if handler else None
+            if task is None:
+                self._finish(entry, 'failed', error='Task no longer exists')
+            elif handler.already_delivered(task):
+                self._finish(entry, 'sent', item_id=task.monday_item_id)
+            else:
+                pending.append((entry, handler, task))
+
+        if not pending:
+            return len(entries)
+
+        targets = {}
+        for item in pending:
+            targets.setdefault((item[0].board_id, item[0].group_id), []).append(item)
+
+        delivered = []
+        for (board_id, group_id), group in targets.items():
+            try:
+                results = self._delivery_for(board_id, group_id).deliver(
+                    [(task, handler.task_data(task)) for _, handler, task in group]
+                )
+            except Exception as e:
+                logger.error(f"Monday.com outbox batch of {len(group)} for board {board_id or 'default'} failed: {e}")
+                results = [{'item_id': None, 'error': str(e), 'in_progress': False}] * len(group)
+            delivered.extend(zip(group, results))
+
+        for (entry, handler, task), result in delivered:
+            if result['item_id']:
+                handler.delivered(task, result['item_id'])
+                self._finish(entry, 'sent', item_id=result['item_id'])
+            elif result.get('in_progress'):
+                self._requeue(entry, result['error'], count_attempt=False)
+            else:
+                handler.failed(task, result['error'])
+                if result.get('permanent'):
+                    logger.warning(f"🪦 {entry.task_type} {entry.task_id} dead-lettered, retrying cannot help: {result['error']}")
+                    self._finish(entry, 'failed', error=result['error'])
+                elif entry.attempts >= entry.max_attempts:
+                    logger.warning(f"🪦 {entry.task_type} {entry.task_id} dead-lettered after {entry.attempts} attempts: {result['error']}")
+                    self._finish(entry, 'failed', error=result['error'])
+                else:
+                    self._requeue(entry, result['error'])
+
+        logger.info(f"📤 Monday.com outbox batch{self._lane_label()}: {len(entries)} claimed, {dict(self.stats)} so far")
+        return len(entries)
+
+    def _lane_label(self) -> str:
+        return '' if self.board_id is None else f" (board {self.board_id or 'default'})"
+
+    def run(self, once: bool = False, max_batches: Optional[int] = None) -> Dict[str, int]:
+        """
+        Drain the outbox; with once=True stop when it is empty, otherwise poll forever
+        """
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            claimed = self.drain_once()
+            batches += 1 if claimed else 0
+            if not claimed:
+                if once:
+                    break
+                time.sleep(self.poll_seconds)
+        return dict(self.stats)
+
+
+class LaneScheduler:
+    """
+    Runs one OutboxDrainer per board concurrently
+
+    Each lane drains its board's queue until it is empty and is restarted when
+    new entries for the board arrive. Lanes have their own complexity budget,
+    circuit breaker and batches, so a slow or rate-limited board only holds up
+    its own lane. At most MAX_LANES boards are drained at once.
+    """
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        config: Optional[Dict[str, Any]] = None,
+        drainer_factory=None
+    ):
+        if config is None:
+            config = _outbox_config()
+
+        self.batch_size = batch_size
+        self.max_lanes = max(1, config.get('MAX_LANES', 4))
+        self.poll_seconds = config.get('POLL_SECONDS', 5)
+        self.drainer_factory = drainer_factory or (
+            lambda board_id: OutboxDrainer(batch_size=self.batch_size, board_id=board_id)
+        )
+
+        self.lanes: Dict[str, threading.Thread] = {}
+        self.drainers: Dict[str, OutboxDrainer] = {}
+        self.stats = Counter()
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def pending_boards() -> List[str]:
+        """Boards with claimable entries, longest due first"""
+        return list(
+            MondayOutbox.objects.filter(_claimable(timezone.now())).values('board_id').annotate(oldest=Min('next_attempt_at'))
+            .order_by('oldest').values_list('board_id', flat=True)
+        )
+
+    def _run_lane(self, drainer: OutboxDrainer, max_batches: Optional[int]):
+        try:
+            stats = drainer.run(once=True, max_batches=max_batches)
+        except Exception as e:
+            logger.error(f"Monday.com delivery lane{drainer._lane_label()} stopped: {e}")
+            stats = dict(drainer.stats)
+        finally:
+            connection.close()
+
+        with self._stats_lock:
+            self.stats.update(stats)
+
+    def _start_lanes(self, max_batches: Optional[int]) -> int:
+        started = 0
+        for board_id in self.pending_boards():
+            if sum(1 for thread in self.lanes.values() if thread.is_alive()) >= self.max_lanes:
+                break
+            thread = self.lanes.get(board_id)
+            if thread is not None and thread.is_alive():
+                continue
+
+            drainer = self.drainer_factory(board_id)
+            self.drainers[board_id] = drainer
+            thread = threading.Thread(
+                target=self._run_lane, args=(drainer, max_batches),
+                name=f"monday-lane-{board_id or 'default'}", daemon=True
+            )
+            self.lanes[board_id] = thread
+            thread.start()
+            started += 1
+            logger.info(f"🛣️  Started Monday.com delivery lane for board {board_id or 'default'}")
+        return started
+
+    def run(self, once: bool = False, max_batches: Optional[int] = None) -> Dict[str, int]:
+        """
+        Drain every board's lane; with once=True (or max_batches, which runs one
+        wave of lanes) stop when the lanes finish, otherwise keep polling
+        """
+        self._start_lanes(max_batches)
+        while True:
+            busy = any(thread.is_alive() for thread in self.lanes.values())
+            if not busy and (max_batches is not None or (once and not self.pending_boards())):
+                break
+            time.sleep(min(self.poll_seconds, 1) if busy else self.poll_seconds)
+            if max_batches is None:
+                self._start_lanes(max_batches)
+        return dict(self.stats)
@@ -0,0 +1,171 @@
+"""
+Monday.com Complexity Rate Limiter
+Paces Monday.com calls by the complexity points each query costs, using the
+complexity block Monday returns with every query, instead of a fixed interval
+"""
+
+import hashlib
+import logging
+import re
+import time
+from datetime import timedelta
+from typing import Dict, Any, Optional
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import MondayComplexityBudget
+
+logger = logging.getLogger('apps.core.monday_rate_limiter')
+
+COMPLEXITY_FIELD = 'complexity { query before after reset_in_x_seconds }'
+
+# "Complexity budget exhausted, query cost 30001 budget remaining 8969 out of 1000000 reset in 20 seconds"
+RESET_PATTERN = re.compile(r'reset in (\d+) seconds', re.IGNORECASE)
+
+
+def with_complexity(query: str) -> str:
+    """Add the complexity field to the top-level selection of a query or mutation"""
+    if 'complexity {' in query:
+        return query
+    brace = query.find('{')
+    if brace == -1:
+        return query
+    return f"{query[:brace + 1]} {COMPLEXITY_FIELD}{query[brace + 1:]}"
+
+
+def parse_reset_seconds(error_text: str) -> Optional[int]:
+    """Seconds until the budget resets, from a complexity-exhausted error message"""
+    match = RESET_PATTERN.search(error_text or '')
+    return int(match.group(1)) if match else None
+
+
+class ComplexityRateLimiter:
+    """
+    Shared complexity budget for one Monday.com API token
+
+    Before a call, the query's expected cost (learned from earlier responses to
+    the same document) is drawn from the budget row; it goes out immediately if
+    the budget covers it and waits for the reset otherwise. Every response
+    overwrites the row with Monday's own figures. A scope (e.g. a board id)
+    gives a delivery lane its own budget row under the same token; because
+    Monday charges the token, scoped limiters also draw from the token's row.
+    """
+
+    def __init__(self, api_key: str, config: Optional[Dict[str, Any]] = None, scope: str = ''):
+        if config is None:
+            config = settings.EXTERNAL_APIS['MONDAY'].get('COMPLEXITY_BUDGET', {})
+
+        self.enabled = config.get('ENABLED', True)
+        self.budget_per_minute = config.get('BUDGET_PER_MINUTE', 10000000)
+        self.default_query_cost = config.get('DEFAULT_QUERY_COST', 1000)
+        self.max_wait_seconds = config.get('MAX_WAIT_SECONDS', 60)
+
+        self.scope = scope
+        identity = f"{api_key}:{scope}" if scope else api_key
+        self.token_key = hashlib.sha256(identity.encode()).hexdigest()[:32]
+        # The token-wide row every lane draws from too; None for an unscoped limiter
+        self.shared_key = hashlib.sha256(api_key.encode()).hexdigest()[:32] if scope else None
+        self._query_costs: Dict[str, int] = {}
+
+    @staticmethod
+    def _query_key(query: str) -> str:
+        return hashlib.md5(query.encode()).hexdigest()
+
+    def estimate(self, query: str) -> int:
+        """Last observed cost of this exact document, or the configured default"""
+        return self._query_costs.get(self._query_key(query), self.default_query_cost)
+
+    def reserve(self, cost: int) -> float:
+        """Draw cost from the shared budget; returns seconds to wait if it cannot be afforded yet"""
+        now = timezone.now()
+        if self.shared_key is None:
+            return self._reserve_row(self.token_key, cost, now)
+
+        # Token first, so lanes together never overdraw what Monday actually allows
+        wait = self._reserve_row(self.shared_key, cost, now)
+        if wait > 0:
+            return wait
+        wait = self._reserve_row(self.token_key, cost, now)
+        if wait > 0:
+            MondayComplexityBudget.objects.filter(token_key=self.shared_key, reset_at__gt=now).update(
+                budget_remaining=F('budget_remaining') + cost, updated_at=now
+            )
+        return wait
+
+    @staticmethod
+    def _reserve_row(token_key: str, cost: int, now) -> float:
+        budget = MondayComplexityBudget.objects.filter(token_key=token_key).first()
+        if budget is None or budget.reset_at <= now:
+            # Unknown or already refilled: the response will report the real budget
+            return 0.0
+
+        reserved = MondayComplexityBudget.objects.filter(
+            pk=budget.pk, budget_remaining__gte=cost, reset_at__gt=now
+        ).update(budget_remaining=F('budget_remaining') - cost, updated_at=now)
+        if reserved:
+            return 0.0
+        return max(0.0, (budget.reset_at - now).total_seconds())
+
+    def acquire(self, query: str):
+        """Block until the shared budget can pay for this query"""
+        if not self.enabled:
+            return
+
+        cost = self.estimate(query)
+        while True:
+            wait = self.reserve(cost)
+            if wait <= 0:
+                return
+            wait = min(wait, self.max_wait_seconds)
+            logger.info(f"⏳ Monday.com complexity budget too low for a {cost}-point query - waiting {wait:.1f}s for reset")
+            time.sleep(wait)
+
+    def record(self, query: str, complexity: Optional[Dict[str, Any]]):
+        """Store the budget reported in a response's complexity block"""
+        if not self.enabled or not complexity or complexity.get('after') is None:
+            return
+
+        cost = complexity.get('query')
+        if cost is not None:
+            self._query_costs[self._query_key(query)] = int(cost)
+        self._store(int(complexity['after']), complexity.get('reset_in_x_seconds') or 60, cost)
+
+    def record_exhausted(self, reset_in_seconds: int):
+        """Mark the budget empty until Monday's reported reset"""
+        if self.enabled:
+            logger.warning(f"🚫 Monday.com complexity budget exhausted - resets in {reset_in_seconds}s")
+            self._store(0, reset_in_seconds)
+
+    def _store(self, remaining: int, reset_in_seconds: int, last_query_cost: Optional[int] = None):
+        values = {
+            'budget_remaining': remaining,
+            'reset_at': timezone.now() + timedelta(seconds=int(reset_in_seconds)),
+        }
+        if last_query_cost is not None:
+            values['last_query_cost'] = int(last_query_cost)
+
+        # Monday reports the token's budget, so the token row is refreshed along with the lane's
+        for token_key in filter(None, (self.token_key, self.shared_key)):
+            try:
+                with transaction.atomic():
+                    MondayComplexityBudget.objects.update_or_create(token_key=token_key, defaults=values)
+            except IntegrityError:
+                # Another worker created the row first
+                MondayComplexityBudget.objects.filter(token_key=token_key).update(**values, updated_at=timezone.now())
+
+    def status(self) -> Dict[str, Any]:
+        """Current budget for stats endpoints"""
+        budget = MondayComplexityBudget.objects.filter(token_key=self.token_key).first()
+        if budget is None or budget.reset_at <= timezone.now():
+            return {'enabled': self.enabled, 'budget_remaining': None, 'reset_in_seconds': 0}
+
+        return {
+            'enabled': self.enabled,
+            'budget_remaining': budget.budget_remaining,
+            'budget_per_minute': self.budget_per_minute,
+            'budget_used_pct': round((1 - budget.budget_remaining / self.budget_per_minute) * 100, 1) if self.budget_per_minute else 0.0,
+            'reset_in_seconds': round((budget.reset_at - timezone.now()).total_seconds(), 1),
+            'last_query_cost': budget.last_query_cost,
+        }
@@ -0,0 +1,123 @@
+"""
+Monday.com Delivery Routing
+Resolves each task to a board and group from the MondayRoute table (by meeting
+title and assignees) and builds per-board clients, so every board is delivered
+by its own lane with its own complexity budget and circuit breaker
+"""
+
+import logging
+import re
+import threading
+import time
+from typing import List, Dict, Any, Optional, Tuple
+from django.conf import settings
+
+from .models import MondayRoute
+
+logger = logging.getLogger('apps.core.monday_routing')
+
+
+class MondayRouter:
+    """
+    First-match routing table over active MondayRoute rows
+
+    Routes are compiled once and reloaded after CACHE_SECONDS (or invalidate());
+    rules with an invalid pattern are logged and skipped.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        if config is None:
+            config = settings.EXTERNAL_APIS['MONDAY'].get('ROUTING', {})
+
+        self.cache_seconds = config.get('CACHE_SECONDS', 60)
+        self.default = (
+            str(settings.EXTERNAL_APIS['MONDAY']['BOARD_ID']),
+            str(settings.EXTERNAL_APIS['MONDAY']['GROUP_ID'])
+        )
+
+        self._routes: Optional[List[Tuple[Any, Any, Tuple[str, str]]]] = None
+        self._loaded_at = 0.0
+        self._routes_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> 'MondayRouter':
+        """Get singleton instance of MondayRouter"""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @staticmethod
+    def _compile(pattern: str):
+        return re.compile(pattern, re.IGNORECASE) if pattern else None
+
+    def _load(self) -> List[Tuple[Any, Any, Tuple[str, str]]]:
+        with self._routes_lock:
+            if self._routes is not None and time.time() - self._loaded_at < self.cache_seconds:
+                return self._routes
+
+            routes = []
+            for route in MondayRoute.objects.filter(is_active=True).order_by('priority', 'name'):
+                try:
+                    meeting, assignee = self._compile(route.meeting_pattern), self._compile(route.assignee_pattern)
+                except re.error as e:
+                    logger.warning(f"⚠️  Skipping Monday.com route '{route.name}': invalid pattern ({e})")
+                    continue
+                routes.append((meeting, assignee, (route.board_id, route.group_id)))
+
+            self._routes, self._loaded_at = routes, time.time()
+            return routes
+
+    def resolve(self, meeting_title: str = '', assignees: str = '') -> Tuple[str, str]:
+        """(board_id, group_id) for a task from its meeting title and assignee names/emails"""
+        for meeting, assignee, target in self._load():
+            if meeting and not meeting.search(meeting_title or ''):
+                continue
+            if assignee and not assignee.search(assignees or ''):
+                continue
+            return target
+        return self.default
+
+    def targets(self) -> List[Tuple[str, str]]:
+        """Distinct (board_id, group_id) pairs tasks can be routed to, default first"""
+        targets = [self.default]
+        for _, _, target in self._load():
+            if target not in targets:
+                targets.append(target)
+        return targets
+
+    def invalidate(self):
+        """Reload routes on next use"""
+        with self._routes_lock:
+            self._routes = None
+
+
+def get_monday_router() -> MondayRouter:
+    """Convenience function to get the delivery router"""
+    return MondayRouter.get_instance()
+
+
+def lane_client(board_id: str, group_id: str):
+    """
+    EnhancedMondayClient for one routed board and group
+    The complexity budget row and circuit breaker are scoped to the board, so a
+    board that is failing or out of budget does not hold back the others
+    """
+    from .circuit_breaker import CircuitBreakerRegistry
+    from .monday_client import EnhancedMondayClient
+    from .monday_rate_limiter import ComplexityRateLimiter
+
+    monday_config = settings.EXTERNAL_APIS['MONDAY']
+    api_key = monday_config['API_KEY']
+    client = EnhancedMondayClient(api_key, board_id, group_id, monday_config.get('RATE_LIMIT_PER_MINUTE', 30))
+    client.complexity_limiter = ComplexityRateLimiter(api_key, scope=str(board_id))
+    client.circuit_breaker = CircuitBreakerRegistry.get_instance().get_or_create(
+        f'monday_api:{board_id}',
+        failure_threshold=5,
+        timeout=300
+    )
+    return client
@@ -0,0 +1,282 @@
+"""
+Monday.com Board Schema
+Board columns, status label indices and groups cached with a TTL (in process and
+in the shared Django cache) with change detection, and a column serializer
+precompiled from the schema that validates and encodes a task's column values
+in one pass
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from datetime import datetime, date
+from typing import List, Dict, Any, Optional, Callable, Tuple
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger('apps.core.monday_schema')
+
+# task_data field -> board column; optional columns are skipped when the board lacks them
+DEFAULT_COLUMN_MAP = [
+    {'field': 'assignee(s)_full_names', 'column': 'text_mkr7jgkp'},
+    {'field': 'assignee_emails', 'column': 'text_mkr0hqsb', 'optional': True},
+    {'field': 'priority', 'column': 'status_1', 'default': 'Medium'},
+    {'field': 'status', 'column': 'status', 'default': 'To Do'},
+    {'field': 'brief_description', 'column': 'long_text'},
+    {'field': 'due_date', 'column': 'date_mkr7ymmh'},
+]
+
+STATUS_COLUMN_TYPES = {'status', 'color'}
+
+
+class BoardSchemaError(Exception):
+    """The board no longer has columns the column map needs"""
+    pass
+
+
+class ColumnValueError(ValueError):
+    """A task value the board's column cannot accept"""
+    pass
+
+
+class BoardSchema:
+    """Parsed board structure used to compile column serializers"""
+
+    def __init__(self, board: Dict[str, Any]):
+        self.raw = board
+        self.board_id = str(board.get('id', ''))
+        self.name = board.get('name', '')
+        self.groups = {group['id']: group.get('title', '') for group in board.get('groups') or []}
+        self.columns = {column['id']: column for column in board.get('columns') or []}
+        self.status_labels = {
+            column_id: self._label_indices(column)
+            for column_id, column in self.columns.items()
+            if column.get('type') in STATUS_COLUMN_TYPES
+        }
+
+        canonical = {
+            'columns': sorted((c['id'], c.get('type'), c.get('settings_str') or '') for c in self.columns.values()),
+            'groups': sorted(self.groups),
+        }
+        self.fingerprint = hashlib.sha256(json.dumps(canonical).encode()).hexdigest()[:16]
+
+    @staticmethod
+    def _label_indices(column: Dict[str, Any]) -> Dict[str, int]:
+        try:
+            labels = json.loads(column.get('settings_str') or '{}').get('labels') or {}
+        except (ValueError, AttributeError):
+            return {}
+        return {label: int(index) for index, label in labels.items() if label}
+
+    def diff(self, other: 'BoardSchema') -> Dict[str, List[str]]:
+        """Columns and groups added or removed since another version of the schema"""
+        return {
+            'added_columns': sorted(set(self.columns) - set(other.columns)),
+            'removed_columns': sorted(set(other.columns) - set(self.columns)),
+            'changed_columns': sorted(
+                column_id for column_id in set(self.columns) & set(other.columns)
+                if self.columns[column_id] != other.columns[column_id]
+            ),
+            'added_groups': sorted(set(self.groups) - set(other.groups)),
+            'removed_groups': sorted(set(other.groups) - set(self.groups)),
+        }
+
+
+def _encode_text(value) -> str:
+    return str(value)
+
+
+def _encode_long_text(value) -> Dict[str, str]:
+    return {'text': str(value)}
+
+
+def _encode_date(value) -> Dict[str, str]:
+    """UTC milliseconds, a date/datetime, or an ISO date string -> {'date': 'YYYY-MM-DD'}"""
+    if isinstance(value, (datetime, date)):
+        return {'date': value.strftime('%Y-%m-%d')}
+    if isinstance(value, (int, float)):
+        try:
+            return {'date': datetime.fromtimestamp(value / 1000.0).strftime('%Y-%m-%d')}
+        except (ValueError, OverflowError, OSError):
+            raise ColumnValueError(f"Invalid due date timestamp: {value}")
+    try:
+        return {'date': datetime.strptime(str(value)[:10], '%Y-%m-%d').strftime('%Y-%m-%d')}
+    except ValueError:
+        raise ColumnValueError(f"Invalid due date: {value}")
+
+
+class ColumnSerializer:
+    """
+    Column-value encoder compiled once per board schema
+    Each mapped column gets its encoder and status label index up front, so
+    serializing a task is one pass with dict lookups and no schema checks
+    """
+
+    def __init__(self, schema: BoardSchema, column_map: List[Dict[str, Any]], delivery_key_column: str = ''):
+        self.board_id = schema.board_id
+        self.fingerprint = schema.fingerprint
+        self._encoders: List[Tuple[str, str, Callable, Any]] = []
+
+        column_map = list(column_map)
+        if delivery_key_column:
+            column_map.append({'field': 'delivery_key', 'column': delivery_key_column})
+
+        missing = []
+        for entry in column_map:
+            column = schema.columns.get(entry['column'])
+            if column is None:
+                if not entry.get('optional'):
+                    missing.append(entry['column'])
+                continue
+            self._encoders.append((entry['field'], entry['column'], self._encoder_for(column, schema), entry.get('default')))
+
+        if missing:
+            raise BoardSchemaError(f"Board {schema.board_id} is missing columns: {', '.join(missing)}")
+
+    @staticmethod
+    def _encoder_for(column: Dict[str, Any], schema: BoardSchema) -> Callable:
+        column_type = column.get('type')
+        if column_type in STATUS_COLUMN_TYPES:
+            labels = schema.status_labels.get(column['id'], {})
+
+            def encode_status(value):
+                if value not in labels:
+                    raise ColumnValueError(f"'{value}' is not a label of status column {column['id']}")
+                return {'index': labels[value]}
+            return encode_status
+        if column_type == 'date':
+            return _encode_date
+        if column_type == 'long_text':
+            return _encode_long_text
+        return _encode_text
+
+    def serialize(self, task_data: Dict[str, Any], strict: bool = False) -> Dict[str, Any]:
+        """
+        Column values for one task
+        A value the board cannot accept (unknown label, bad date) is logged and its
+        column left empty, so the item is still created; strict=True raises ColumnValueError
+        """
+        values = {}
+        for field, column_id, encode, default in self._encoders:
+            value = task_data.get(field, default)
+            if value in (None, ''):
+                continue
+            try:
+                values[column_id] = encode(value)
+            except ColumnValueError as e:
+                if strict:
+                    raise
+                logger.warning(f"Skipping column {column_id} for '{task_data.get('task_item', '')[:50]}': {e}")
+        return values
+
+    def validate(self, task_data: Dict[str, Any]) -> Optional[str]:
+        """Error message for the first value the board would not accept, or None"""
+        try:
+            self.serialize(task_data, strict=True)
+        except ColumnValueError as e:
+            return str(e)
+        return None
+
+
+class BoardSchemaCache:
+    """
+    Per-board schema and compiled serializer cache
+
+    Schemas are kept in process and in the shared Django cache for TTL_SECONDS.
+    Every fresh fetch is fingerprinted; a changed fingerprint is logged with a
+    diff and published as a board schema change, and serializers compiled from
+    the old schema are dropped.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        if config is None:
+            config = settings.EXTERNAL_APIS['MONDAY'].get('BOARD_SCHEMA', {})
+
+        self.ttl_seconds = config.get('TTL_SECONDS', 3600)
+        self.column_map = config.get('COLUMN_MAP') or DEFAULT_COLUMN_MAP
+
+        self._schemas: Dict[str, Tuple[BoardSchema, float]] = {}
+        self._serializers: Dict[Tuple[str, str, str], ColumnSerializer] = {}
+        self._cache_lock = threading.RLock()
+
+    @classmethod
+    def get_instance(cls) -> 'BoardSchemaCache':
+        """Get singleton instance of BoardSchemaCache"""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @staticmethod
+    def _cache_key(board_id: str) -> str:
+        return f"monday_board_schema:{board_id}"
+
+    @staticmethod
+    def _fingerprint_key(board_id: str) -> str:
+        return f"monday_board_schema_fingerprint:{board_id}"
+
+    def get(self, client, force: bool = False) -> BoardSchema:
+        """Schema for the client's board, fetched only when the cached copy expired"""
+        board_id = str(client.board_id)
+        with self._cache_lock:
+            entry = self._schemas.get(board_id)
+            if entry and not force and time.time() - entry[1] < self.ttl_seconds:
+                return entry[0]
+
+            board = None if force else cache.get(self._cache_key(board_id))
+            if board is None:
+                board = client.fetch_board()
+                cache.set(self._cache_key(board_id), board, self.ttl_seconds)
+            schema = BoardSchema(board)
+
+            self._detect_change(schema, entry[0] if entry else None)
+            self._schemas[board_id] = (schema, time.time())
+            return schema
+
+    def _detect_change(self, schema: BoardSchema, previous: Optional[BoardSchema]):
+        previous_fingerprint = cache.get(self._fingerprint_key(schema.board_id))
+        cache.set(self._fingerprint_key(schema.board_id), schema.fingerprint, None)
+        if previous_fingerprint is None or previous_fingerprint == schema.fingerprint:
+            return
+
+        diff = schema.diff(previous) if previous else {}
+        logger.warning(f"🧩 Monday.com board {schema.board_id} schema changed: {diff or 'fingerprint differs'}")
+        self._serializers = {key: value for key, value in self._serializers.items() if key[0] != schema.board_id}
+
+        from .event_bus import publish_event, EventTypes
+        publish_event(
+            EventTypes.BOARD_SCHEMA_CHANGED,
+            {'board_id': schema.board_id, 'fingerprint': schema.fingerprint, **diff},
+            source_module='monday_schema'
+        )
+
+    def serializer(self, client, force: bool = False) -> ColumnSerializer:
+        """Compiled serializer for the client's board; raises BoardSchemaError on drift"""
+        schema = self.get(client, force=force)
+        key = (schema.board_id, schema.fingerprint, client.delivery_key_column)
+        with self._cache_lock:
+            if key not in self._serializers:
+                self._serializers[key] = ColumnSerializer(schema, self.column_map, client.delivery_key_column)
+            return self._serializers[key]
+
+    def invalidate(self, board_id):
+        """Forget a board's schema so the next use fetches it again"""
+        with self._cache_lock:
+            self._schemas.pop(str(board_id), None)
+            cache.delete(self._cache_key(str(board_id)))
+
+    def clear(self):
+        with self._cache_lock:
+            self._schemas.clear()
+            self._serializers.clear()
+
+
+def get_board_schema_cache() -> BoardSchemaCache:
+    """Convenience function to get the board schema cache"""
+    return BoardSchemaCache.get_instance()
@@ -0,0 +1,281 @@
+"""
+People Directory
+Person rows built incrementally from meeting_attendees (plus speaker names that
+unambiguously match an attendee), with an in-process alias map and trigram index
+for fuzzy name -> email resolution and a memo of resolved names
+"""
+
+import logging
+import re
+import threading
+from collections import Counter, defaultdict
+from typing import List, Dict, Any, Optional, Set
+from django.conf import settings
+from django.db import transaction
+
+logger = logging.getLogger('apps.core.people_directory')
+
+
+def normalize_name(name: Optional[str]) -> str:
+    """Lowercase letters-only form of a name, single-spaced"""
+    return ' '.join(re.sub(r'[^a-z]+', ' ', (name or '').lower()).split())
+
+
+def email_local_name(email: str) -> str:
+    """Name-like form of an email local part: 'joe.maina+x@' -> 'joe maina'"""
+    local = email.split('@', 1)[0].split('+', 1)[0]
+    return normalize_name(local)
+
+
+def name_trigrams(normalized: str) -> Set[str]:
+    padded = f"  {normalized} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def observed_people(fireflies_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    People seen in one meeting: {email: {'display_name', 'aliases'}}
+    Speaker names become aliases only when they match exactly one attendee
+    """
+    people: Dict[str, Dict[str, Any]] = {}
+    for attendee in fireflies_data.get('meeting_attendees') or []:
+        email = (attendee.get('email') or '').strip().lower()
+        if '@' not in email:
+            continue
+        person = people.setdefault(email, {'display_name': '', 'aliases': set()})
+        display_name = (attendee.get('displayName') or '').strip()
+        if display_name:
+            person['display_name'] = display_name
+            person['aliases'].add(display_name)
+        if email_local_name(email):
+            person['aliases'].add(email_local_name(email))
+
+    speakers = {
+        sentence.get('speaker_name') for sentence in fireflies_data.get('sentences') or []
+        if sentence.get('speaker_name')
+    }
+    for speaker in speakers:
+        tokens = normalize_name(speaker).split()
+        if not tokens:
+            continue
+        matches = [
+            email for email, person in people.items()
+            if tokens[0] in email_local_name(email).split()
+            or normalize_name(speaker) in {normalize_name(alias) for alias in person['aliases']}
+        ]
+        if len(matches) == 1:
+            person = people[matches[0]]
+            person['aliases'].add(speaker)
+            person['display_name'] = person['display_name'] or speaker
+
+    return people
+
+
+class PeopleDirectory:
+    """
+    In-process name/email index over Person rows
+
+    Loaded lazily from the database and kept current by signals. Exact aliases
+    resolve with one dict lookup; other names go through the trigram index once
+    and the answer is memoized until the directory changes.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        if config is None:
+            config = settings.SYSTEM_CONFIG.get('PEOPLE_DIRECTORY', {})
+
+        self.enabled = config.get('ENABLED', False)
+        self.fuzzy_threshold = config.get('FUZZY_THRESHOLD', 0.5)
+        self.memo_size = config.get('MEMO_SIZE', 4096)
+
+        self._people: Dict[str, Dict[str, Any]] = {}
+        self._alias_emails: Dict[str, Set[str]] = defaultdict(set)
+        self._trigrams: Dict[str, Set[str]] = defaultdict(set)
+        self._trigram_counts: Dict[str, int] = {}
+        self._memo: Dict[str, Optional[str]] = {}
+        self._index_lock = threading.RLock()
+        self._loaded = False
+
+    @classmethod
+    def get_instance(cls) -> 'PeopleDirectory':
+        """Get singleton instance of PeopleDirectory"""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def add(self, email: str, display_name: str = '', aliases: Optional[List[str]] = None):
+        """Index (or re-index) one person"""
+        email = email.lower()
+        names = {normalize_name(alias) for alias in list(aliases or []) + [display_name, email_local_name(email)]}
+        names.discard('')
+
+        with self._index_lock:
+            self._remove_locked(email)
+            self._people[email] = {'display_name': display_name, 'aliases': names}
+            for name in names:
+                self._alias_emails[name].add(email)
+                if name not in self._trigram_counts:
+                    trigrams = name_trigrams(name)
+                    self._trigram_counts[name] = len(trigrams)
+                    for trigram in trigrams:
+                        self._trigrams[trigram].add(name)
+            self._memo.clear()
+
+    def remove(self, email: str):
+        with self._index_lock:
+            self._remove_locked(email.lower())
+            self._memo.clear()
+
+    def _remove_locked(self, email: str):
+        person = self._people.pop(email, None)
+        if person is None:
+            return
+        for name in person['aliases']:
+            emails = self._alias_emails.get(name)
+            if emails is None:
+                continue
+            emails.discard(email)
+            if not emails:
+                del self._alias_emails[name]
+                for trigram in name_trigrams(name):
+                    self._trigrams[trigram].discard(name)
+                self._trigram_counts.pop(name, None)
+
+    def ensure_loaded(self):
+        """Build the index from Person rows the first time it is used"""
+        if self._loaded:
+            return
+
+        with self._index_lock:
+            if self._loaded:
+                return
+
+            from .models import Person
+            for email, display_name, aliases in Person.objects.values_list('email', 'display_name', 'aliases').iterator():
+                self.add(email, display_name, aliases)
+
+            self._loaded = True
+            logger.info(f"📇 People directory loaded with {len(self._people)} people")
+
+    def is_known(self, email: str) -> bool:
+        self.ensure_loaded()
+        return (email or '').strip().lower() in self._people
+
+    def display_name(self, email: str) -> str:
+        self.ensure_loaded()
+        person = self._people.get((email or '').strip().lower())
+        return person['display_name'] if person else ''
+
+    def resolve(self, name: str) -> Optional[str]:
+        """Email for a person's name, or None if unknown or ambiguous"""
+        self.ensure_loaded()
+        normalized = normalize_name(name)
+        if not normalized:
+            return None
+
+        with self._index_lock:
+            if normalized in self._memo:
+                return self._memo[normalized]
+
+            emails = self._alias_emails.get(normalized)
+            if emails:
+                email = next(iter(emails)) if len(emails) == 1 else None
+            else:
+                email = self._fuzzy_resolve(normalized)
+
+            if len(self._memo) >= self.memo_size:
+                self._memo.clear()
+            self._memo[normalized] = email
+            return email
+
+    def _fuzzy_resolve(self, normalized: str) -> Optional[str]:
+        """Best trigram-Jaccard alias above the threshold; None when two people tie"""
+        query = name_trigrams(normalized)
+        shared = Counter()
+        for trigram in query:
+            shared.update(self._trigrams.get(trigram, ()))
+
+        best_score, best_emails = 0.0, set()
+        for alias, overlap in shared.items():
+            score = overlap / (len(query) + self._trigram_counts[alias] - overlap)
+            if score > best_score:
+                best_score, best_emails = score, set(self._alias_emails[alias])
+            elif score == best_score:
+                best_emails |= self._alias_emails[alias]
+
+        if best_score < self.fuzzy_threshold or len(best_emails) != 1:
+            return None
+        return next(iter(best_emails))
+
+    def resolve_assignees(self, full_names: str, emails: str) -> str:
+        """
+        Fill in or correct assignee emails from the directory
+        An email the directory knows is kept; otherwise the matching name is resolved
+        """
+        names = [name.strip() for name in (full_names or '').split(',') if name.strip()]
+        given = [email.strip() for email in (emails or '').split(',') if email.strip()]
+        if not names:
+            return emails or ''
+
+        resolved = []
+        for index, name in enumerate(names):
+            email = given[index] if index < len(given) else ''
+            if not self.is_known(email):
+                email = self.resolve(name) or email
+            if email and email not in resolved:
+                resolved.append(email)
+        resolved.extend(email for email in given[len(names):] if email not in resolved)
+
+        if resolved == given:
+            return emails
+        return ', '.join(resolved)
+
+    def observe_meeting(self, fireflies_data: Dict[str, Any], meeting_date=None, count_meeting: bool = True) -> int:
+        """Upsert the people seen in one meeting; returns how many were new"""
+        from .models import Person
+
+        created_count = 0
+        for email, seen in observed_people(fireflies_data or {}).items():
+            with transaction.atomic():
+                person, created = Person.objects.select_for_update().get_or_create(
+                    email=email,
+                    defaults={'display_name': seen['display_name']}
+                )
+                aliases = sorted(set(person.aliases) | seen['aliases'])
+                changed = created or aliases != sorted(person.aliases)
+                person.aliases = aliases
+                if seen['display_name'] and not person.display_name:
+                    person.display_name = seen['display_name']
+                    changed = True
+                if count_meeting:
+                    person.meeting_count += 1
+                    if meeting_date and (person.last_seen_at is None or meeting_date > person.last_seen_at):
+                        person.last_seen_at = meeting_date
+                    changed = True
+                if changed:
+                    person.save()
+            created_count += int(created)
+        return created_count
+
+    def clear(self):
+        """Drop all entries; the next lookup reloads from the database"""
+        with self._index_lock:
+            self._people.clear()
+            self._alias_emails.clear()
+            self._trigrams.clear()
+            self._trigram_counts.clear()
+            self._memo.clear()
+            self._loaded = False
+
+    def __len__(self):
+        return len(self._people)
+
+
+def get_people_directory() -> PeopleDirectory:
+    """Convenience function to get the people directory"""
+    return PeopleDirectory.get_instance()
@@ -7,17 +7,37 @@ import json
 import logging
 import re
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Iterator
 from django.utils import timezone as django_timezone
 from django.utils.dateparse import parse_datetime
 from django.conf import settings
 
 from .gemini_client import get_gemini_client
-from .models import RawTranscriptCache, ProcessedTaskData, Transcript
+from .cache_manager import get_cache_manager
+from .chunked_extraction import (
+    split_sentence_windows, window_content_hash, merge_window_tasks, IncompleteExtractionError
+)
+from .prompt_template import get_prompt_template
+from .transcript_compaction import compact_transcript_data, estimate_prompt_budget
+from .ai_output_parser import IncompleteStreamError, IncrementalTaskArrayParser, recover_task_array, recover_missing_tail
+from .source_attribution import SentenceIndex
+from .model_router import get_model_router
+from .people_directory import get_people_directory
+from .models import RawTranscriptCache, ProcessedTaskData, Transcript, GeminiProcessedTask
 
 logger = logging.getLogger(__name__)
 
+# N8N placeholder expressions used in temp/prompt.md
+N8N_TITLE = '$json.title'
+N8N_DATE = '$json.date'
+N8N_ORGANIZER_EMAIL = '$json.organizer_email'
+N8N_ATTENDEES = '$json.meeting_attendees.map(a => `- ${a.displayName} <${a.email}>`).join("\\n")'
+N8N_ACTION_ITEMS = '$json.summary.action_items'
+N8N_OVERVIEW = '$json.summary.overview'
+N8N_SENTENCES = '$json.sentences.map(s => `${s.speaker_name}: ${s.text} (t=${s.start_time_ms})`).join("\\n")'
+
 
 class PrecisionTaskExtractor:
     """
@@ -25,71 +45,312 @@ class PrecisionTaskExtractor:
     Uses exact prompt.md logic for maximum accuracy
     """
     
-    def __init__(self):
+    def __init__(self, chunked: Optional[bool] = None):
         self.gemini_client = get_gemini_client()
+        
+        # None = decide per transcript from CHUNKED_EXTRACTION settings
+        self.chunked = chunked
+        self.chunk_config = settings.EXTERNAL_APIS['GEMINI'].get('CHUNKED_EXTRACTION', {})
+        self.model_router = get_model_router()
+        
+        # Source attribution index, rebuilt only when a different transcript is attributed
+        self._indexed_sentences = None
+        self._source_index_cache = None
     
     def extract_tasks_from_cache(self, cache_item: RawTranscriptCache) -> List[ProcessedTaskData]:
         """
         Extract tasks from cached Fireflies data using N8N precision prompt
         ALWAYS runs AI extraction - never echoes Fireflies action items directly
         """
+        processed_tasks, _ = self.extract_tasks_with_status(cache_item)
+        return processed_tasks
+    
+    def extract_tasks_with_status(self, cache_item: RawTranscriptCache) -> Tuple[List[ProcessedTaskData], bool]:
+        """
+        Extract tasks and report whether the whole transcript was covered
+        
+        Returns (processed_tasks, complete). complete is False when Gemini gave no
+        response, its output was truncated beyond recovery or a chunked window
+        failed, so the caller must not mark the transcript's sentences as extracted.
+        """
+        complete = True
         try:
-            fireflies_data = cache_item.raw_fireflies_data
+            fireflies_data = self._compact_transcript(cache_item.raw_fireflies_data, cache_item.fireflies_id)
             
             # CRITICAL: Always use N8N prompt regardless of what Fireflies provides
             # Never echo Fireflies action_items directly - always run through AI
-            n8n_prompt = self._build_n8n_prompt_from_file(fireflies_data)
-            
-            logger.info(f"🎯 PRECISION EXTRACTION: Running N8N prompt on {cache_item.fireflies_id}")
-            logger.info(f"📝 Prompt length: {len(n8n_prompt)} characters")
-            
-            # Get Gemini client and run extraction
-            gemini_client = get_gemini_client()
-            
-            # Force AI extraction - never skip this step
-            ai_response = gemini_client._execute_request_with_retry(n8n_prompt)
-            
-            if not ai_response or 'candidates' not in ai_response:
-                logger.error(f"❌ No AI response for {cache_item.fireflies_id}")
-                return []
-            
-            # Extract the AI-generated content
-            ai_content = ai_response['candidates'][0]['content']['parts'][0]['text']
-            logger.info(f"🤖 AI Response length: {len(ai_content)} characters")
+            if self._should_chunk(fireflies_data):
+                try:
+                    tasks_data, ai_output_length = self._extract_chunked(fireflies_data, cache_item.fireflies_id)
+                except IncompleteExtractionError as e:
+                    # Keep what the successful windows found; the transcript stays unmarked for a retry
+                    tasks_data, ai_output_length, complete = e.tasks, e.output_length, False
+            else:
+                n8n_prompt = self._build_n8n_prompt_from_file(fireflies_data)
+                
+                logger.info(f"🎯 PRECISION EXTRACTION: Running N8N prompt on {cache_item.fireflies_id}")
+                logger.info(f"📝 Prompt length: {len(n8n_prompt)} characters")
+                self._log_prompt_budget(n8n_prompt, cache_item.fireflies_id)
+                
+                route = self.model_router.route_transcript(fireflies_data, n8n_prompt)
+                tasks_data, ai_content, complete = self._run_prompt_with_status(n8n_prompt, route['model'])
+                if tasks_data is None:
+                    logger.error(f"❌ No AI response for {cache_item.fireflies_id}")
+                    return [], False
+                if not complete:
+                    logger.warning(f"⚠️  Truncated AI output for {cache_item.fireflies_id} - transcript left unmarked")
+                ai_output_length = len(ai_content)
             
-            # Parse AI output into structured tasks
-            tasks_data = self._parse_ai_output(ai_content)
             logger.info(f"📋 Parsed {len(tasks_data)} tasks from AI output")
             
             # Create ProcessedTaskData objects
             processed_tasks = []
             for task_data in tasks_data:
-                processed_task = self._create_processed_task(task_data, cache_item, ai_content)
+                processed_task = self._create_processed_task(task_data, cache_item, ai_output_length)
                 if processed_task:
                     processed_tasks.append(processed_task)
             
             logger.info(f"✅ Created {len(processed_tasks)} ProcessedTaskData objects")
-            return processed_tasks
+            return processed_tasks, complete
             
         except Exception as e:
             logger.error(f"❌ Error extracting tasks from cache {cache_item.fireflies_id}: {str(e)}")
-            return []
+            return [], False
+    
+    def stream_tasks(self, cache_item: RawTranscriptCache) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the N8N prompt through streamGenerateContent and yield each task
+        object as soon as it is complete, instead of waiting for the whole array
+        """
+        fireflies_data, n8n_prompt = self.prepare_prompt(cache_item)
+        route = self.model_router.route_transcript(fireflies_data, n8n_prompt)
+        return self.stream_prompt(n8n_prompt, cache_item.fireflies_id, route['model'])
+    
+    def prepare_prompt(self, cache_item: RawTranscriptCache) -> Tuple[Dict[str, Any], str]:
+        """Compact a cached transcript and render its N8N prompt"""
+        fireflies_data = self._compact_transcript(cache_item.raw_fireflies_data, cache_item.fireflies_id)
+        return fireflies_data, self._build_n8n_prompt_from_file(fireflies_data)
+    
+    def stream_prompt(self, n8n_prompt: str, fireflies_id: str, model: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream a rendered prompt and yield each task object as soon as it is complete
+        Raises IncompleteStreamError once the stream ends if the task array was never closed
+        """
+        logger.info(f"🌊 STREAMING EXTRACTION: Running N8N prompt on {fireflies_id}")
+        self._log_prompt_budget(n8n_prompt, fireflies_id)
+        
+        parser = IncrementalTaskArrayParser()
+        for chunk in self.gemini_client.stream_generate_content(n8n_prompt, model):
+            for task_data in parser.feed(chunk):
+                yield task_data
+        
+        if parser.has_partial_object:
+            logger.warning(f"⚠️  Stream for {fireflies_id} ended inside a task object")
+        if not parser.array_closed:
+            raise IncompleteStreamError(
+                f"Stream for {fireflies_id} ended before the task array was closed "
+                f"({parser.objects_parsed} tasks parsed)",
+                parser.objects_parsed
+            )
+        logger.info(
+            f"🌊 Stream complete: {parser.objects_parsed} tasks parsed, "
+            f"{parser.objects_failed} unparseable"
+        )
+    
+    def _compact_transcript(self, fireflies_data: Dict[str, Any], fireflies_id: str) -> Dict[str, Any]:
+        """Apply the transcript compaction stage - the cached raw data is never modified"""
+        compacted_data, report = compact_transcript_data(fireflies_data)
+        
+        if report['enabled']:
+            logger.info(
+                f"🗜️  Compacted {fireflies_id}: {report['sentences_before']} → {report['sentences_after']} sentences, "
+                f"~{report['tokens_before']} → ~{report['tokens_after']} tokens ({report['reduction_pct']}% smaller)"
+            )
+        return compacted_data
+    
+    def _log_prompt_budget(self, prompt: str, fireflies_id: str):
+        """Warn when a prompt exceeds the configured token budget"""
+        max_tokens = settings.EXTERNAL_APIS['GEMINI'].get('TRANSCRIPT_COMPACTION', {}).get('MAX_PROMPT_TOKENS')
+        if not max_tokens:
+            return
+        
+        budget = estimate_prompt_budget(prompt, max_tokens)
+        if not budget['within_budget']:
+            logger.warning(
+                f"⚠️  Prompt for {fireflies_id} is ~{budget['estimated_tokens']} tokens, "
+                f"over the {max_tokens} token budget ({budget['budget_used_pct']}%)"
+            )
+    
+    def _run_prompt_with_status(
+        self,
+        prompt: str,
+        model: Optional[str] = None
+    ) -> Tuple[Optional[List[Dict[str, Any]]], str, bool]:
+        """
+        Run a single prompt through Gemini and parse the task array
+        Returns (tasks, ai_content, complete); complete is False when truncated output
+        could not be fully recovered, and tasks is None when Gemini returned no candidates
+        """
+        # Force AI extraction - never skip this step
+        ai_response = self.gemini_client._execute_request_with_retry(prompt, model)
+        
+        if not ai_response or 'candidates' not in ai_response:
+            return None, '', False
+        
+        # Extract the AI-generated content
+        ai_content = ai_response['candidates'][0]['content']['parts'][0]['text']
+        logger.info(f"🤖 AI Response length: {len(ai_content)} characters")
+        
+        # Parse AI output into structured tasks, salvaging truncated or malformed arrays
+        tasks, report = recover_task_array(ai_content)
+        complete = True
+        if report['truncated']:
+            max_continuations = settings.EXTERNAL_APIS['GEMINI'].get('OUTPUT_RECOVERY', {}).get('MAX_CONTINUATIONS', 1)
+            tasks, complete = recover_missing_tail(
+                prompt, tasks, lambda tail_prompt: self._generate_text(tail_prompt, model), max_continuations
+            )
+        return tasks, ai_content, complete
+    
+    def _generate_text(self, prompt: str, model: Optional[str] = None) -> Optional[str]:
+        """Run a prompt and return the raw model text, or None on failure"""
+        try:
+            ai_response = self.gemini_client._execute_request_with_retry(prompt, model)
+            return ai_response['candidates'][0]['content']['parts'][0]['text']
+        except Exception as e:
+            logger.error(f"❌ Continuation request failed: {e}")
+            return None
+    
+    def _should_chunk(self, fireflies_data: Dict[str, Any]) -> bool:
+        """Use chunked extraction when forced, or when the transcript is long enough"""
+        if self.chunked is not None:
+            return self.chunked
+        
+        if not self.chunk_config.get('ENABLED', False):
+            return False
+        
+        sentences = fireflies_data.get('sentences') or []
+        return len(sentences) > self.chunk_config.get('MIN_SENTENCES', 600)
+    
+    def _extract_chunked(self, fireflies_data: Dict[str, Any], fireflies_id: str) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Map-reduce extraction: run overlapping sentence windows in parallel
+        (serialised by the Gemini client's rate limiter) and merge the results
+        
+        Returns (merged_tasks, total_ai_output_length). Raises IncompleteExtractionError,
+        carrying the merged tasks of the successful windows, when any window failed.
+        """
+        windows = split_sentence_windows(
+            fireflies_data.get('sentences') or [],
+            window_size=self.chunk_config.get('WINDOW_SENTENCES', 300),
+            overlap=self.chunk_config.get('OVERLAP_SENTENCES', 30)
+        )
+        max_workers = max(1, min(self.chunk_config.get('MAX_WORKERS', 3), len(windows)))
+        
+        logger.info(
+            f"🧩 CHUNKED EXTRACTION: {fireflies_id} split into {len(windows)} windows "
+            f"({max_workers} workers)"
+        )
+        
+        def extract_window(window):
+            start_index, window_sentences = window
+            return self._extract_window(fireflies_data, start_index, window_sentences)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(extract_window, windows))
+        
+        window_results = [result for result in results if result is not None]
+        # A truncated window keeps the tasks it recovered but still counts as failed
+        failed_windows = len(results) - sum(1 for _, _, complete in window_results if complete)
+        
+        merged_tasks = merge_window_tasks([tasks for tasks, _, _ in window_results])
+        total_output_length = sum(output_length for _, output_length, _ in window_results)
+        
+        logger.info(
+            f"🧩 Merged {sum(len(tasks) for tasks, _, _ in window_results)} window tasks "
+            f"into {len(merged_tasks)} unique tasks"
+        )
+        if failed_windows:
+            raise IncompleteExtractionError(
+                f"{failed_windows}/{len(windows)} windows of {fireflies_id} failed",
+                merged_tasks, total_output_length, failed_windows
+            )
+        return merged_tasks, total_output_length
+    
+    def _extract_window(
+        self,
+        fireflies_data: Dict[str, Any],
+        start_index: int,
+        window_sentences: List[Dict[str, Any]]
+    ) -> Optional[Tuple[List[Dict[str, Any]], int, bool]]:
+        """
+        Extract one window, reusing a cached result for identical window content
+        Returns (tasks, output_length, complete), or None when the window failed
+        after the client's retries
+        """
+        cache_manager = get_cache_manager()
+        window_key = f"window_{self.prompt_template_version()}_{window_content_hash(fireflies_data, window_sentences)}"
+        
+        cached = cache_manager.get_gemini_extraction(window_key)
+        if cached is not None:
+            logger.info(f"♻️  Window @{start_index} served from cache")
+            return cached['result']['tasks'], cached['result']['output_length'], True
+        
+        window_data = dict(fireflies_data, sentences=window_sentences)
+        prompt = self._build_n8n_prompt_from_file(window_data)
+        route = self.model_router.route_transcript(window_data, prompt)
+        
+        try:
+            tasks_data, ai_content, complete = self._run_prompt_with_status(prompt, route['model'])
+        except Exception as e:
+            # A failed window must not discard the windows that succeeded
+            logger.error(f"❌ Window @{start_index} extraction failed: {e}")
+            return None
+        
+        if tasks_data is None:
+            logger.warning(f"⚠️  No AI response for window @{start_index}")
+            return None
+        
+        if complete:
+            cache_manager.set_gemini_extraction(
+                window_key,
+                {'tasks': tasks_data, 'output_length': len(ai_content)}
+            )
+        else:
+            logger.warning(f"⚠️  Truncated AI output for window @{start_index}")
+        return tasks_data, len(ai_content), complete
+    
+    def _prompt_template_path(self) -> str:
+        """Location of the N8N TaskForge MVP prompt template"""
+        return os.path.join(settings.BASE_DIR, 'temp', 'prompt.md')
+    
+    def prompt_template_version(self) -> str:
+        """
+        Version hash of the active prompt template
+        Extraction caches include it so they invalidate when prompt.md changes
+        """
+        try:
+            return get_prompt_template(self._prompt_template_path()).version
+        except FileNotFoundError:
+            return 'fallback'
     
     def _build_n8n_prompt_from_file(self, fireflies_data: Dict[str, Any]) -> str:
         """
         Build the exact N8N TaskForge MVP prompt from temp/prompt.md file
+        The template is compiled once and recompiled only when the file's mtime changes
         """
-        
-        # Read the prompt template from file
-        prompt_file_path = os.path.join(settings.BASE_DIR, 'temp', 'prompt.md')
+        prompt_file_path = self._prompt_template_path()
         
         try:
-            with open(prompt_file_path, 'r', encoding='utf-8') as f:
-                prompt_template = f.read()
+            prompt_template = get_prompt_template(prompt_file_path)
         except FileNotFoundError:
             logger.warning(f"Prompt file not found: {prompt_file_path}, using fallback")
             return self._build_n8n_prompt_fallback(fireflies_data)
         
+        return prompt_template.render(self._n8n_template_values(fireflies_data))
+    
+    def _n8n_template_values(self, fireflies_data: Dict[str, Any]) -> Dict[str, str]:
+        """Map each N8N placeholder expression in prompt.md to its rendered value"""
+        
         # Extract meeting data
         meeting_title = fireflies_data.get('title', 'Untitled Meeting')
         meeting_date_ms = fireflies_data.get('date', 0)
@@ -120,51 +381,21 @@ class PrecisionTaskExtractor:
             for sentence in sentences
         ])
         
-        # Replace template variables in the prompt
-        final_prompt = prompt_template.replace('{{ $json.title }}', meeting_title)
-        final_prompt = final_prompt.replace('{{ $json.date }}', str(meeting_date_ms))
-        final_prompt = final_prompt.replace('{{ $json.organizer_email }}', organizer_email)
-        final_prompt = final_prompt.replace('{{ $json.meeting_attendees.map(a => `- ${a.displayName} <${a.email}>`).join("\\n") }}', attendees_text)
-        final_prompt = final_prompt.replace('{{ $json.summary.action_items }}', str(action_items))
-        final_prompt = final_prompt.replace('{{ $json.summary.overview }}', str(overview))
-        final_prompt = final_prompt.replace('{{ $json.sentences.map(s => `${s.speaker_name}: ${s.text} (t=${s.start_time_ms})`).join("\\n") }}', transcript_text)
-        
-        return final_prompt
+        return {
+            N8N_TITLE: str(meeting_title),
+            N8N_DATE: str(meeting_date_ms),
+            N8N_ORGANIZER_EMAIL: str(organizer_email),
+            N8N_ATTENDEES: attendees_text,
+            N8N_ACTION_ITEMS: str(action_items),
+            N8N_OVERVIEW: str(overview),
+            N8N_SENTENCES: transcript_text,
+        }
 
     def _build_n8n_prompt_fallback(self, fireflies_data: Dict[str, Any]) -> str:
         """
         Fallback N8N prompt if file not found - FIXED VERSION
         """
-        
-        # Extract meeting data
-        meeting_title = fireflies_data.get('title', 'Untitled Meeting')
-        meeting_date_ms = fireflies_data.get('date', 0)
-        organizer_email = fireflies_data.get('organizer_email', '')
-        
-        # Format attendees
-        attendees = fireflies_data.get('meeting_attendees', [])
-        if attendees is None:
-            attendees = []
-        attendees_text = '\n'.join([
-            f"- {attendee.get('displayName', 'Unknown')} <{attendee.get('email', 'no-email')}>"
-            for attendee in attendees
-        ])
-        
-        # Extract action items
-        summary = fireflies_data.get('summary', {})
-        if summary is None:
-            summary = {}
-        action_items = summary.get('action_items', 'No explicit action items listed.')
-        overview = summary.get('overview', 'No overview available.')
-        
-        # Format transcript
-        sentences = fireflies_data.get('sentences', [])
-        if sentences is None:
-            sentences = []
-        transcript_text = '\n'.join([
-            f"{sentence.get('speaker_name', 'Unknown')}: {sentence.get('text', '')} (t={sentence.get('start_time', 0)})"
-            for sentence in sentences
-        ])
+        values = self._n8n_template_values(fireflies_data)
         
         # Build the exact N8N prompt - FIXED VERSION
         prompt = f"""=== System ===
@@ -259,21 +490,21 @@ If no items meet these rules, return `[]`. OR any done items discussed. Not all
 === User ===
 Process only this meeting-transcript JSON:
 
-* title                → {meeting_title}  
-* meeting_date_ms      → {meeting_date_ms}  
-* organizer_email      → {organizer_email}  
+* title                → {values[N8N_TITLE]}  
+* meeting_date_ms      → {values[N8N_DATE]}  
+* organizer_email      → {values[N8N_ORGANIZER_EMAIL]}  
 
 Attendees (name ↔ email):  
-{attendees_text}
+{values[N8N_ATTENDEES]}
 
 Explicit Action Items:  
-{action_items}
+{values[N8N_ACTION_ITEMS]}
 
 Meeting Overview:  
-{overview}
+{values[N8N_OVERVIEW]}
 
 Full Transcript:  
-{transcript_text}
+{values[N8N_SENTENCES]}
 
 Return ONLY the JSON array described above."""
 
@@ -281,42 +512,17 @@ Return ONLY the JSON array described above."""
     
     def _parse_ai_output(self, ai_output: str) -> List[Dict[str, Any]]:
         """
-        Parse AI output using N8N approach - handle fenced code blocks
+        Parse AI output using N8N approach - fenced code blocks, prose and
+        truncated arrays are tolerated; every complete task object is kept
         """
-        cleaned_output = ai_output.strip()
-        
-        # Remove markdown fencing like N8N does
-        if cleaned_output.startswith("```json"):
-            cleaned_output = cleaned_output[7:]
-        elif cleaned_output.startswith("```"):
-            cleaned_output = cleaned_output[3:]
-        
-        if cleaned_output.endswith("```"):
-            cleaned_output = cleaned_output[:-3]
-        
-        cleaned_output = cleaned_output.strip()
-        
-        try:
-            tasks_data = json.loads(cleaned_output)
-            
-            # Handle single object (wrap in array like N8N)
-            if isinstance(tasks_data, dict):
-                tasks_data = [tasks_data]
-            
-            # Validate it's an array
-            if not isinstance(tasks_data, list):
-                return []
-            
-            return tasks_data
-            
-        except json.JSONDecodeError:
-            return []
+        tasks, _ = recover_task_array(ai_output)
+        return tasks
     
     def _create_processed_task(
         self, 
         task_data: Dict[str, Any], 
         cache_item: RawTranscriptCache,
-        ai_output: str
+        ai_output_length: int
     ) -> Optional[ProcessedTaskData]:
         """
         Create ProcessedTaskData from parsed task data
@@ -364,7 +570,7 @@ Return ONLY the JSON array described above."""
             processed_task = ProcessedTaskData(
                 transcript=transcript,
                 task_item=task_data['task_item'][:500],  # Ensure max length
-                assignee_emails=task_data['assignee_emails'][:500],
+                assignee_emails=resolve_task_assignees(task_data)[:500],
                 assignee_full_names=task_data['assignee(s)_full_names'][:500],
                 priority=task_data['priority'] if task_data['priority'] in ['High', 'Medium', 'Low'] else 'Medium',
                 brief_description=task_data['brief_description'],
@@ -377,7 +583,7 @@ Return ONLY the JSON array described above."""
                     task_data['task_item'], 
                     cache_item.raw_fireflies_data.get('sentences', [])
                 ),
-                processing_notes=f"Extracted using N8N precision approach. AI output length: {len(ai_output)} chars."
+                processing_notes=f"Extracted using N8N precision approach. AI output length: {ai_output_length} chars."
             )
             
             return processed_task
@@ -397,27 +603,91 @@ Return ONLY the JSON array described above."""
         return '\n'.join(content_parts)
     
     def _find_source_sentences(self, task_item: str, sentences: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Find sentences that likely generated this task"""
-        source_sentences = []
-        task_words = set(task_item.lower().split())
+        """Find sentences that likely generated this task (BM25 over a per-transcript index)"""
+        return self._source_index(sentences).source_sentences(task_item, top_k=3)
+    
+    def _source_index(self, sentences: List[Dict[str, Any]]) -> SentenceIndex:
+        """Build the inverted index once per sentence list and reuse it for every task"""
+        if self._indexed_sentences is not sentences or len(self._source_index_cache.sentences) != len(sentences):
+            self._source_index_cache = SentenceIndex(sentences)
+            self._indexed_sentences = sentences
+        return self._source_index_cache
+
+
+def resolve_task_assignees(task_data: Dict[str, Any]) -> str:
+    """Assignee emails checked against the people directory, filling in names Gemini left unmatched"""
+    emails = task_data.get('assignee_emails', '') or ''
+    directory = get_people_directory()
+    if not directory.enabled:
+        return emails
+    return directory.resolve_assignees(task_data.get('assignee(s)_full_names', '') or '', emails)
+
+
+def create_gemini_processed_task(
+    cache_item: RawTranscriptCache,
+    task_data: Dict[str, Any],
+    extraction_order: int,
+    model_version: str = 'gemini-2.5-flash',
+    source_sentences: Optional[List[Dict[str, Any]]] = None,
+    prompt_source: str = 'temp/prompt.md',
+    **response_metadata
+) -> GeminiProcessedTask:
+    """Create and save a GeminiProcessedTask from one prompt.md task object"""
+    return GeminiProcessedTask.objects.create(
+        raw_transcript=cache_item,
         
-        for sentence in sentences:
-            sentence_text = sentence.get('text', '').lower()
-            sentence_words = set(sentence_text.split())
-            
-            # Check for word overlap
-            overlap = len(task_words.intersection(sentence_words))
-            if overlap >= 2:  # At least 2 words in common
-                source_sentences.append({
-                    'speaker_name': sentence.get('speaker_name'),
-                    'text': sentence.get('text'),
-                    'start_time': sentence.get('start_time'),
-                    'overlap_score': overlap
-                })
+        # Exact prompt.md fields (in order)
+        task_item=task_data.get('task_item', '') or '',
+        assignee_emails=resolve_task_assignees(task_data),
+        assignee_full_names=task_data.get('assignee(s)_full_names', '') or '',
+        priority=task_data.get('priority') if task_data.get('priority') in dict(GeminiProcessedTask.PRIORITY_CHOICES) else 'Medium',
+        brief_description=task_data.get('brief_description', '') or '',
+        due_date_ms=task_data.get('due_date') if isinstance(task_data.get('due_date'), (int, float)) else None,
+        status=task_data.get('status') if task_data.get('status') in dict(GeminiProcessedTask.STATUS_CHOICES) else 'To Do',
         
-        # Sort by overlap score and return top 3
-        source_sentences.sort(key=lambda x: x['overlap_score'], reverse=True)
-        return source_sentences[:3]
+        # Processing metadata
+        extraction_order=extraction_order,
+        gemini_model_version=model_version,
+        extraction_confidence=0.9,
+        source_sentences=source_sentences or [],
+        raw_gemini_response={
+            'task': task_data,
+            'task_index': extraction_order,
+            'model': model_version,
+            'timestamp': django_timezone.now().isoformat(),
+            'meeting_id': cache_item.fireflies_id,
+            'prompt_source': prompt_source,
+            **response_metadata,
+        }
+    )
+
+
+def stream_gemini_tasks_for_cache(cache_item: RawTranscriptCache) -> Iterator[GeminiProcessedTask]:
+    """
+    Stream extraction for a cached meeting, saving each GeminiProcessedTask as
+    soon as Gemini finishes generating it so it shows up in the admin immediately
+    The sentences are marked extracted only after a complete stream; a truncated
+    one raises IncompleteStreamError and leaves the meeting for the next run
+    """
+    extractor = PrecisionTaskExtractor()
+    sentences = cache_item.raw_fireflies_data.get('sentences') or []
+    
+    fireflies_data, n8n_prompt = extractor.prepare_prompt(cache_item)
+    route = extractor.model_router.route_transcript(fireflies_data, n8n_prompt)
+    
+    task_stream = extractor.stream_prompt(n8n_prompt, cache_item.fireflies_id, route['model'])
+    for extraction_order, task_data in enumerate(task_stream):
+        yield create_gemini_processed_task(
+            cache_item,
+            task_data,
+            extraction_order,
+            model_version=route['model'],
+            source_sentences=extractor._find_source_sentences(task_data.get('task_item') or '', sentences),
+            streamed=True,
+            routing_reason=route['reason']
+        )
+    
+    cache_item.mark_sentences_extracted()
 
 
 def process_raw_cache_item(cache_item: RawTranscriptCache) -> List[ProcessedTaskData]:
@@ -425,7 +695,7 @@ def process_raw_cache_item(cache_item: RawTranscriptCache) -> List[ProcessedTask
     Process a raw cache item and extract precision tasks
     """
     extractor = PrecisionTaskExtractor()
-    tasks = extractor.extract_tasks_from_cache(cache_item)
+    tasks, complete = extractor.extract_tasks_with_status(cache_item)
     
     # Save tasks to database
     saved_tasks = []
@@ -433,8 +703,14 @@ def process_raw_cache_item(cache_item: RawTranscriptCache) -> List[ProcessedTask
         task.save()
         saved_tasks.append(task)
     
+    if not complete:
+        # Leave the sentences unmarked so the missing part is extracted on the next run
+        logger.warning(f"⚠️  Extraction of {cache_item.fireflies_id} was incomplete - not marking it processed")
+        return saved_tasks
+    
     # Mark cache item as processed
     cache_item.processed = True
+    cache_item.extracted_sentence_hashes = cache_item.current_sentence_hashes()
     cache_item.save()
     
     return saved_tasks 
\ No newline at end of file
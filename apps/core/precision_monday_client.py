@@ -9,6 +9,7 @@ from typing import Dict, Any, List, Optional
 from django.conf import settings
 
 from .monday_client import EnhancedMondayClient
+from .monday_delivery import IdempotentDelivery
 from .models import ProcessedTaskData
 from .event_bus import publish_event, EventTypes
 import logging
@@ -35,6 +36,7 @@ class PrecisionMondayClient:
             board_id=settings.EXTERNAL_APIS['MONDAY']['BOARD_ID'],
             group_id=settings.EXTERNAL_APIS['MONDAY']['GROUP_ID']
         )
+        self.delivery = IdempotentDelivery(self.base_client)
     
     def deliver_processed_task(self, processed_task: ProcessedTaskData) -> bool:
         """
@@ -50,105 +52,88 @@ class PrecisionMondayClient:
             return False
         
         try:
-            # Build task data in the format expected by create_task_item
-            task_data = {
-                'task_item': processed_task.task_item,
-                'assignee_emails': processed_task.assignee_emails or '',
-                'assignee(s)_full_names': processed_task.assignee_full_names or '',
-                'priority': processed_task.priority,
-                'brief_description': processed_task.brief_description or '',
-                'status': processed_task.status,
-                'due_date': int(processed_task.due_date.timestamp() * 1000) if processed_task.due_date else None
-            }
+            # Attempt delivery (at most one item per task, however often this is retried)
+            result = self.delivery.deliver([(processed_task, self._build_task_data(processed_task))])[0]
             
-            # Attempt delivery
-            monday_item_id = self.base_client.create_task_item(task_data)
-            
-            if monday_item_id:
-                # Mark as delivered
-                processed_task.mark_delivered(monday_item_id)
-                
-                # Publish success event
-                publish_event(
-                    EventTypes.TASK_DELIVERED,
-                    {
-                        'task_id': str(processed_task.id),
-                        'monday_item_id': monday_item_id,
-                        'task_item': processed_task.task_item[:100],
-                        'assignee': processed_task.assignee_full_names,
-                    },
-                    source_module='precision_monday_client'
-                )
-                
-                logger.info(f"Successfully delivered task {processed_task.id} to Monday.com: {monday_item_id}")
+            if result['item_id']:
+                self._record_delivered(processed_task, result['item_id'])
                 return True
+            elif result['in_progress']:
+                logger.info(f"Task {processed_task.id} is already being delivered elsewhere")
+                return False
             else:
-                # Mark delivery failed
-                processed_task.delivery_status = 'failed'
-                processed_task.delivery_errors.append('Monday.com delivery returned no item ID')
-                processed_task.save()
-                
-                logger.error(f"Failed to deliver task {processed_task.id}: No Monday item ID returned")
+                error = result['error'] or 'Monday.com delivery returned no item ID'
+                self._record_failed(processed_task, error)
+                self._schedule_retry([(processed_task, error, result.get('permanent', False))])
                 return False
                 
         except Exception as e:
-            # Record delivery error
-            processed_task.delivery_status = 'failed'
-            processed_task.delivery_errors.append(str(e))
-            processed_task.save()
-            
-            logger.error(f"Error delivering task {processed_task.id} to Monday.com: {str(e)}")
+            self._record_failed(processed_task, str(e))
+            self._schedule_retry([(processed_task, str(e), False)])
             return False
     
+    def _build_task_data(self, processed_task: ProcessedTaskData) -> Dict[str, Any]:
+        """Task data in the format expected by create_task_item"""
+        return {
+            'task_item': processed_task.task_item,
+            'assignee_emails': processed_task.assignee_emails or '',
+            'assignee(s)_full_names': processed_task.assignee_full_names or '',
+            'priority': processed_task.priority,
+            'brief_description': processed_task.brief_description or '',
+            'status': processed_task.status,
+            'due_date': int(processed_task.due_date.timestamp() * 1000) if processed_task.due_date else None
+        }
+    
+    def _record_delivered(self, processed_task: ProcessedTaskData, monday_item_id: str):
+        processed_task.mark_delivered(monday_item_id)
+        
+        publish_event(
+            EventTypes.TASK_DELIVERED,
+            {
+                'task_id': str(processed_task.id),
+                'monday_item_id': monday_item_id,
+                'task_item': processed_task.task_item[:100],
+                'assignee': processed_task.assignee_full_names,
+            },
+            source_module='precision_monday_client'
+        )
+        
+        logger.info(f"Successfully delivered task {processed_task.id} to Monday.com: {monday_item_id}")
+    
+    def _record_failed(self, processed_task: ProcessedTaskData, error: str):
+        processed_task.delivery_status = 'failed'
+        processed_task.delivery_errors.append(error)
+        processed_task.save()
+        
+        logger.error(f"Error delivering task {processed_task.id} to Monday.com: {error}")
+    
+    def _schedule_retry(self, failures: list):
+        """Hand (task, error, permanent) failures to the outbox drainer, which retries them with backoff"""
+        from .monday_outbox import schedule_retry
+        try:
+            schedule_retry(failures)
+        except Exception as e:
+            logger.error(f"Could not schedule Monday.com delivery retry: {e}")
+    
     def _build_n8n_column_values(self, processed_task: ProcessedTaskData) -> str:
         """
-        Build exact N8N TaskForge MVP column values JSON string
+        Build N8N TaskForge MVP column values JSON string
         
-        Column mappings from N8N TaskForge MVP:
-        - text_mkr7jgkp: assignee_full_names
-        - text_mkr0hqsb: assignee_emails  
-        - status_1: priority (mapped to status)
-        - long_text: brief_description
+        Encoded by the serializer compiled from the cached board schema (see
+        monday_schema.DEFAULT_COLUMN_MAP for the column mappings), so labels and
+        column IDs are validated against the live board.
         
         Args:
             processed_task: ProcessedTaskData with N8N fields
             
         Returns:
-            str: JSON string with exact N8N column mappings
+            str: JSON string with the board's column values
         """
-        column_values = {
-            "text_mkr7jgkp": processed_task.assignee_full_names or "",
-            "text_mkr0hqsb": processed_task.assignee_emails or "",
-            "status_1": {
-                "label": processed_task.priority
-            },
-            "long_text": processed_task.brief_description or ""
-        }
-        
-        # Add due date if available
-        if processed_task.due_date:
-            # Convert to Monday.com date format (YYYY-MM-DD)
-            date_str = processed_task.due_date.strftime('%Y-%m-%d')
-            column_values["date"] = date_str
-        
-        # Add status mapping
-        status_mapping = {
-            'To Do': 'To Do',
-            'Stuck': 'Stuck', 
-            'Working on it': 'Working on it',
-            'Waiting for review': 'Waiting for review',
-            'Approved': 'Approved',
-            'Done': 'Done'
-        }
-        
-        monday_status = status_mapping.get(processed_task.status, 'To Do')
-        column_values["status"] = monday_status
-        
-        return json.dumps(column_values)
+        return json.dumps(self.base_client.build_column_values(self._build_task_data(processed_task)))
 
     def bulk_deliver_tasks(self, processed_tasks: list) -> dict:
         """
-        Deliver multiple processed tasks with rate limiting
+        Deliver multiple processed tasks using batched multi-item mutations
         
         Args:
             processed_tasks: List of ProcessedTaskData instances
@@ -162,12 +147,34 @@ class PrecisionMondayClient:
             'errors': []
         }
         
+        ready_tasks = []
         for task in processed_tasks:
-            if self.deliver_processed_task(task):
+            if task.is_ready_for_delivery:
+                ready_tasks.append(task)
+            else:
+                results['failed'] += 1
+                results['errors'].append(f"Task {task.id}: Not ready for delivery")
+        
+        batch_results = self.delivery.deliver(
+            [(task, self._build_task_data(task)) for task in ready_tasks]
+        )
+        
+        failed_tasks = []
+        for task, result in zip(ready_tasks, batch_results):
+            if result['item_id']:
+                self._record_delivered(task, result['item_id'])
                 results['delivered'] += 1
+            elif result['in_progress']:
+                results['failed'] += 1
+                results['errors'].append(f"Task {task.id}: {result['error']}")
             else:
+                self._record_failed(task, result['error'])
+                failed_tasks.append((task, result['error'], result.get('permanent', False)))
                 results['failed'] += 1
-                results['errors'].append(f"Task {task.id}: {task.delivery_errors[-1] if task.delivery_errors else 'Unknown error'}")
+                results['errors'].append(f"Task {task.id}: {result['error']}")
+        
+        if failed_tasks:
+            self._schedule_retry(failed_tasks)
         
         return results
 
@@ -0,0 +1,103 @@
+"""
+Prompt Template Engine
+Compiles N8N-style {{ $json.* }} prompt templates once and renders them in a single join
+"""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+from typing import Dict, List, Tuple
+
+logger = logging.getLogger('apps.core.prompt_template')
+
+PLACEHOLDER_PATTERN = re.compile(r'\{\{\s*(.*?)\s*\}\}', re.DOTALL)
+
+
+class CompiledPromptTemplate:
+    """
+    A prompt template split into literal segments and placeholder expressions
+
+    Placeholders are keyed by their stripped expression text, e.g. '$json.title'.
+    Placeholders without a value are rendered verbatim, matching str.replace semantics.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self.version = hashlib.sha256(source.encode('utf-8')).hexdigest()[:16]
+        self.literals: List[str] = []
+        self.placeholders: List[Tuple[str, str]] = []  # (expression, raw placeholder text)
+
+        position = 0
+        for match in PLACEHOLDER_PATTERN.finditer(source):
+            self.literals.append(source[position:match.start()])
+            self.placeholders.append((match.group(1), match.group(0)))
+            position = match.end()
+        self.literals.append(source[position:])
+
+    @property
+    def expressions(self) -> List[str]:
+        """Placeholder expressions in template order"""
+        return [expression for expression, _ in self.placeholders]
+
+    def render(self, values: Dict[str, str]) -> str:
+        """Render the template with a single join over precompiled segments"""
+        parts = [self.literals[0]]
+        for (expression, raw), literal in zip(self.placeholders, self.literals[1:]):
+            value = values.get(expression)
+            parts.append(raw if value is None else value)
+            parts.append(literal)
+        return ''.join(parts)
+
+
+class PromptTemplateCache:
+    """Process-wide cache of compiled templates keyed by path and file mtime"""
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self):
+        self._templates: Dict[str, Tuple[int, int, CompiledPromptTemplate]] = {}
+        self._templates_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> 'PromptTemplateCache':
+        """Get singleton instance of PromptTemplateCache"""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def get(self, path: str) -> CompiledPromptTemplate:
+        """
+        Return the compiled template for path, recompiling only when the file changed
+        Raises FileNotFoundError if the template file does not exist
+        """
+        stat = os.stat(path)
+
+        with self._templates_lock:
+            cached = self._templates.get(path)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                return cached[2]
+
+            with open(path, 'r', encoding='utf-8') as f:
+                template = CompiledPromptTemplate(f.read())
+
+            self._templates[path] = (stat.st_mtime_ns, stat.st_size, template)
+            logger.info(
+                f"Compiled prompt template {os.path.basename(path)} "
+                f"(version {template.version}, {len(template.placeholders)} placeholders)"
+            )
+            return template
+
+    def clear(self):
+        """Drop all compiled templates"""
+        with self._templates_lock:
+            self._templates.clear()
+
+
+def get_prompt_template(path: str) -> CompiledPromptTemplate:
+    """Convenience function to get a compiled prompt template"""
+    return PromptTemplateCache.get_instance().get(path)
@@ -0,0 +1,204 @@
+"""
+Gemini Quota Ledger
+Durable per-model request and token counters (per minute and per day) shared
+across workers and restarts, used to pace Gemini calls before they hit 429s
+"""
+
+import logging
+import time
+from datetime import timedelta
+from typing import Dict, Any, Optional
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import GeminiQuotaUsage
+
+logger = logging.getLogger('apps.core.quota_ledger')
+
+
+class QuotaLedger:
+    """Records Gemini usage in GeminiQuotaUsage rows and answers pacing questions"""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        gemini_config = settings.EXTERNAL_APIS['GEMINI']
+        if config is None:
+            config = gemini_config.get('QUOTA', {})
+
+        self.requests_per_minute = config.get('REQUESTS_PER_MINUTE', gemini_config.get('RATE_LIMIT_PER_MINUTE', 15))
+        self.requests_per_day = config.get('REQUESTS_PER_DAY', 1000)
+        self.tokens_per_minute = config.get('TOKENS_PER_MINUTE')
+        self.warning_threshold = gemini_config.get('QUOTA_WARNING_THRESHOLD', 80)
+        self.retention_days = config.get('RETENTION_DAYS', 7)
+
+    @staticmethod
+    def _window_starts(now=None):
+        now = now or timezone.now()
+        minute = now.replace(second=0, microsecond=0)
+        day = minute.replace(hour=0, minute=0)
+        return {'minute': minute, 'day': day}
+
+    def _increment(self, model_name: str, window: str, window_start, **increments) -> bool:
+        """Atomically add to one window row, creating it on first use; returns True if created"""
+        updates = {field: F(field) + amount for field, amount in increments.items()}
+        updated = GeminiQuotaUsage.objects.filter(
+            model_name=model_name, window=window, window_start=window_start
+        ).update(**updates, updated_at=timezone.now())
+        if updated:
+            return False
+
+        try:
+            with transaction.atomic():
+                GeminiQuotaUsage.objects.create(
+                    model_name=model_name, window=window, window_start=window_start, **increments
+                )
+            return True
+        except IntegrityError:
+            # Another worker created the row first
+            GeminiQuotaUsage.objects.filter(
+                model_name=model_name, window=window, window_start=window_start
+            ).update(**updates, updated_at=timezone.now())
+            return False
+
+    def record_request(self, model_name: str):
+        """Count one request against the current minute and day"""
+        new_day = False
+        for window, window_start in self._window_starts().items():
+            created = self._increment(model_name, window, window_start, request_count=1)
+            new_day = new_day or (created and window == 'day')
+
+        self._after_request(model_name, new_day)
+
+    def reserve_request(self, model_name: str) -> float:
+        """
+        Count one request only if the shared minute budget still has room
+
+        The check and the increment are a single conditional F() update, so
+        concurrent workers cannot both take the last slot. Returns 0.0 when the
+        request was counted, otherwise the seconds until the next minute window.
+        """
+        starts = self._window_starts()
+        conditions = {}
+        if self.requests_per_minute:
+            conditions['request_count__lt'] = self.requests_per_minute
+        if self.tokens_per_minute:
+            conditions['prompt_tokens__lt'] = self.tokens_per_minute - F('output_tokens')
+
+        minute_row = GeminiQuotaUsage.objects.filter(
+            model_name=model_name, window='minute', window_start=starts['minute']
+        )
+        reserved = False
+        for _ in range(2):
+            reserved = bool(minute_row.filter(**conditions).update(
+                request_count=F('request_count') + 1, updated_at=timezone.now()
+            ))
+            if reserved or minute_row.exists():
+                break
+            # First request this minute: create the empty window row, then reserve against it
+            self._increment(model_name, 'minute', starts['minute'])
+
+        if not reserved:
+            next_minute = starts['minute'] + timedelta(minutes=1)
+            return max(0.0, (next_minute - timezone.now()).total_seconds())
+
+        new_day = self._increment(model_name, 'day', starts['day'], request_count=1)
+        self._after_request(model_name, new_day)
+        return 0.0
+
+    def _after_request(self, model_name: str, new_day: bool):
+        """Prune old windows on a new day and warn as the daily quota fills"""
+        if new_day:
+            self.prune()
+
+        usage = self.usage(model_name)
+        if usage['daily_usage_pct'] >= self.warning_threshold:
+            logger.warning(
+                f"Gemini API quota warning: {usage['daily_usage_pct']:.1f}% used "
+                f"({usage['requests_today']}/{self.requests_per_day}) for {model_name}"
+            )
+
+    def record_tokens(self, model_name: str, usage_metadata: Optional[Dict[str, Any]]):
+        """Add token counts from a Gemini usageMetadata block"""
+        if not usage_metadata:
+            return
+
+        prompt_tokens = usage_metadata.get('promptTokenCount', 0) or 0
+        output_tokens = usage_metadata.get('candidatesTokenCount', 0) or 0
+        if not prompt_tokens and not output_tokens:
+            return
+
+        for window, window_start in self._window_starts().items():
+            self._increment(
+                model_name, window, window_start,
+                prompt_tokens=prompt_tokens, output_tokens=output_tokens
+            )
+
+    def usage(self, model_name: str) -> Dict[str, Any]:
+        """Current minute and day usage for a model"""
+        starts = self._window_starts()
+        rows = {
+            row.window: row
+            for row in GeminiQuotaUsage.objects.filter(
+                model_name=model_name,
+                window__in=['minute', 'day'],
+                window_start__in=[starts['minute'], starts['day']]
+            )
+            if row.window_start == starts[row.window]
+        }
+        minute, day = rows.get('minute'), rows.get('day')
+        requests_today = day.request_count if day else 0
+
+        return {
+            'model': model_name,
+            'requests_this_minute': minute.request_count if minute else 0,
+            'tokens_this_minute': minute.total_tokens if minute else 0,
+            'requests_today': requests_today,
+            'tokens_today': day.total_tokens if day else 0,
+            'requests_per_minute_limit': self.requests_per_minute,
+            'requests_per_day_limit': self.requests_per_day,
+            'daily_usage_pct': round(requests_today / self.requests_per_day * 100, 1) if self.requests_per_day else 0.0,
+        }
+
+    def has_daily_headroom(self, model_name: str, requests_needed: int = 1) -> bool:
+        """True if the daily request budget still allows requests_needed more calls"""
+        if not self.requests_per_day:
+            return True
+        return self.usage(model_name)['requests_today'] + requests_needed <= self.requests_per_day
+
+    def seconds_until_allowed(self, model_name: str) -> float:
+        """Seconds to wait before the per-minute request/token budget allows another call"""
+        usage = self.usage(model_name)
+        minute_full = self.requests_per_minute and usage['requests_this_minute'] >= self.requests_per_minute
+        tokens_full = self.tokens_per_minute and usage['tokens_this_minute'] >= self.tokens_per_minute
+        if not (minute_full or tokens_full):
+            return 0.0
+
+        next_minute = self._window_starts()['minute'] + timedelta(minutes=1)
+        return max(0.0, (next_minute - timezone.now()).total_seconds())
+
+    def pace(self, model_name: str):
+        """Reserve a request in the shared per-minute budget, sleeping until one is free"""
+        while True:
+            wait = self.reserve_request(model_name)
+            if wait <= 0:
+                return
+            logger.info(f"⏳ Gemini minute budget for {model_name} used up across workers - waiting {wait:.1f}s")
+            time.sleep(wait)
+
+    def summary(self) -> Dict[str, Any]:
+        """Per-model usage for today, for stats endpoints"""
+        today = self._window_starts()['day']
+        models = GeminiQuotaUsage.objects.filter(window='day', window_start=today).values_list('model_name', flat=True)
+        return {model_name: self.usage(model_name) for model_name in models}
+
+    def prune(self) -> int:
+        """Delete usage rows older than the retention window"""
+        cutoff = timezone.now() - timedelta(days=self.retention_days)
+        deleted, _ = GeminiQuotaUsage.objects.filter(window_start__lt=cutoff).delete()
+        return deleted
+
+
+def get_quota_ledger() -> QuotaLedger:
+    """Get the Gemini quota ledger"""
+    return QuotaLedger()
@@ -3,11 +3,14 @@ Django signals for core event handling
 """
 
 import logging
+import uuid
 from django.db.models.signals import post_save, post_delete, pre_save
 from django.dispatch import receiver
 from django.contrib.auth.signals import user_logged_in, user_logged_out
-from .models import ActionItem, Transcript, SystemEvent
+from .models import ActionItem, Transcript, SystemEvent, GeminiProcessedTask, RawTranscriptCache, Person
 from .event_bus import publish_event, EventTypes
+from .task_dedupe import get_task_dedupe_index
+from .people_directory import get_people_directory
 
 logger = logging.getLogger('apps.core.signals')
 
@@ -95,6 +98,107 @@ def action_item_saved(sender, instance, created, **kwargs):
                 )
 
 
+@receiver(pre_save, sender=GeminiProcessedTask)
+def gemini_task_check_duplicates(sender, instance, **kwargs):
+    """Flag (or merge) a new task that near-duplicates an open task"""
+    index = get_task_dedupe_index()
+    if not index.enabled or not instance._state.adding or instance.duplicate_of_id:
+        return
+    
+    matches = index.find_duplicates(instance.task_item, instance.assignee_emails, exclude_id=str(instance.id))
+    if not matches:
+        return
+    
+    # The index is in-process; confirm the match is still an open task
+    open_ids = {
+        str(task_id) for task_id in GeminiProcessedTask.objects.filter(
+            id__in=[task_id for task_id, _ in matches]
+        ).exclude(approval_status='rejected').exclude(status='Done').values_list('id', flat=True)
+    }
+    for task_id, _ in matches:
+        if task_id not in open_ids:
+            index.remove(task_id)
+    
+    match = next(((task_id, score) for task_id, score in matches if task_id in open_ids), None)
+    if match is None:
+        return
+    
+    instance.duplicate_of_id = uuid.UUID(match[0])
+    instance.duplicate_similarity = match[1]
+    if index.mode == 'merge':
+        instance.approval_status = 'rejected'
+        instance.auto_mute_enabled = True
+        instance.rejection_reason = f"Near-duplicate of task {match[0]} (similarity {match[1]:.2f})"
+        if instance.due_date_ms:
+            GeminiProcessedTask.objects.filter(id=match[0], due_date_ms__isnull=True).update(
+                due_date_ms=instance.due_date_ms
+            )
+    
+    logger.info(f"Near-duplicate task detected: '{instance.task_item[:50]}' ~ {match[0]} ({match[1]:.2f})")
+
+
+@receiver(post_save, sender=GeminiProcessedTask)
+def gemini_task_saved(sender, instance, **kwargs):
+    """Keep the dedupe index in step with open tasks"""
+    index = get_task_dedupe_index()
+    if not index.enabled:
+        return
+    
+    if instance.approval_status == 'rejected' or instance.status == 'Done' or instance.duplicate_of_id:
+        index.remove(str(instance.id))
+    else:
+        index.add(str(instance.id), instance.task_item, instance.assignee_emails)
+
+
+@receiver(post_delete, sender=GeminiProcessedTask)
+def gemini_task_deleted(sender, instance, **kwargs):
+    """Drop deleted tasks from the dedupe index"""
+    get_task_dedupe_index().remove(str(instance.id))
+
+
+@receiver(pre_save, sender=RawTranscriptCache)
+def raw_transcript_speaker_analytics(sender, instance, update_fields=None, **kwargs):
+    """Precompute speaker analytics at ingestion and whenever the cached data changes"""
+    if update_fields is not None and 'raw_fireflies_data' not in update_fields:
+        return
+    if (instance.speaker_analytics or {}).get('source_hash') == instance.data_hash:
+        return
+    
+    try:
+        from .speaker_analytics import compute_speaker_analytics
+    except ImportError:
+        logger.warning("⚠️  numpy is not installed - speaker analytics not computed")
+        return
+    
+    sentences = (instance.raw_fireflies_data or {}).get('sentences') or []
+    instance.speaker_analytics = compute_speaker_analytics(sentences, instance.data_hash)
+
+
+@receiver(post_save, sender=RawTranscriptCache)
+def raw_transcript_update_people(sender, instance, created, update_fields=None, **kwargs):
+    """Grow the people directory from each newly cached meeting's attendees"""
+    directory = get_people_directory()
+    if not directory.enabled:
+        return
+    if update_fields is not None and 'raw_fireflies_data' not in update_fields:
+        return
+    
+    new_people = directory.observe_meeting(instance.raw_fireflies_data, instance.meeting_date, count_meeting=created)
+    if new_people:
+        logger.info(f"📇 {new_people} new people added to the directory from {instance.fireflies_id}")
+
+
+@receiver(post_save, sender=Person)
+def person_saved(sender, instance, **kwargs):
+    """Keep the people directory index in step with Person rows"""
+    get_people_directory().add(instance.email, instance.display_name, instance.aliases)
+
+
+@receiver(post_delete, sender=Person)
+def person_deleted(sender, instance, **kwargs):
+    get_people_directory().remove(instance.email)
+
+
 @receiver(user_logged_in)
 def user_logged_in_handler(sender, request, user, **kwargs):
     """Handle user login events"""
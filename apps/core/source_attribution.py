@@ -0,0 +1,115 @@
+"""
+Source Sentence Attribution
+Per-transcript inverted index with BM25 scoring, built once per extraction and
+queried once per task to find the sentences that produced it
+"""
+
+import math
+import re
+from collections import Counter, defaultdict
+from typing import List, Dict, Any, Tuple
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+STOP_WORDS = {
+    'a', 'about', 'after', 'all', 'also', 'am', 'an', 'and', 'any', 'are', 'as', 'at',
+    'be', 'been', 'before', 'being', 'but', 'by', 'can', 'could', 'did', 'do', 'does',
+    'for', 'from', 'get', 'go', 'going', 'gonna', 'had', 'has', 'have', 'he', 'her',
+    'him', 'his', 'how', 'i', "i'll", "i'm", 'if', 'in', 'into', 'is', 'it', "it's",
+    'its', 'just', 'let', "let's", 'like', 'me', 'my', 'need', 'of', 'on', 'or', 'our',
+    'out', 'over', 'so', 'some', 'that', "that's", 'the', 'their', 'them', 'then',
+    'there', 'these', 'they', 'this', 'those', 'to', 'up', 'us', 'was', 'we', "we'll",
+    'were', 'what', 'when', 'which', 'who', 'will', 'with', 'would', 'yeah', 'you',
+    "you'll", 'your', 'okay', 'ok', 'um', 'uh', 'really', 'very', 'make', 'sure',
+}
+
+
+def _stem(token: str) -> str:
+    """Very light suffix stripping so 'invoices'/'invoicing' match 'invoice'"""
+    if len(token) <= 4:
+        return token
+    if token.endswith('ies'):
+        return token[:-3] + 'y'
+    for suffix in ('ing', 'ed', 'es', 's'):
+        if token.endswith(suffix) and not token.endswith('ss'):
+            return token[:-len(suffix)]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, drop stop words and stem"""
+    return [
+        _stem(token)
+        for token in TOKEN_PATTERN.findall((text or '').lower())
+        if token not in STOP_WORDS
+    ]
+
+
+class SentenceIndex:
+    """
+    Inverted index over one transcript's sentences
+
+    postings maps token -> [(sentence_id, term_frequency)]; idf uses the
+    BM25 formulation with +1 smoothing so common tokens never go negative.
+    """
+
+    def __init__(self, sentences: List[Dict[str, Any]], k1: float = 1.5, b: float = 0.75):
+        self.sentences = sentences
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self.lengths: List[int] = []
+
+        for sentence_id, sentence in enumerate(sentences):
+            tokens = tokenize(sentence.get('text') or sentence.get('raw_text') or '')
+            self.lengths.append(len(tokens))
+            for token, frequency in Counter(tokens).items():
+                self.postings[token].append((sentence_id, frequency))
+
+        count = len(sentences)
+        self.average_length = (sum(self.lengths) / count) if count else 0.0
+        self.idf = {
+            token: math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for token, postings in self.postings.items()
+        }
+
+    def search(self, query: str, top_k: int = 3, min_matched_terms: int = 2) -> List[Tuple[int, float]]:
+        """
+        Score sentences for a query, touching only the postings of the query's tokens
+        Returns up to top_k (sentence_id, score) pairs, best first
+        """
+        query_tokens = set(tokenize(query))
+        if not query_tokens or not self.average_length:
+            return []
+
+        # Short queries can't reach two matched terms
+        min_matched_terms = min(min_matched_terms, len(query_tokens))
+
+        scores: Dict[int, float] = defaultdict(float)
+        matched: Dict[int, int] = defaultdict(int)
+        for token in query_tokens:
+            idf = self.idf.get(token)
+            if idf is None:
+                continue
+            for sentence_id, frequency in self.postings[token]:
+                norm = self.k1 * (1 - self.b + self.b * self.lengths[sentence_id] / self.average_length)
+                scores[sentence_id] += idf * frequency * (self.k1 + 1) / (frequency + norm)
+                matched[sentence_id] += 1
+
+        ranked = sorted(
+            (item for item in scores.items() if matched[item[0]] >= min_matched_terms),
+            key=lambda item: (-item[1], item[0])
+        )
+        return ranked[:top_k]
+
+    def source_sentences(self, task_item: str, top_k: int = 3) -> List[Dict[str, Any]]:
+        """Top-k source sentences for a task, in the shape stored on task rows"""
+        return [
+            {
+                'speaker_name': self.sentences[sentence_id].get('speaker_name'),
+                'text': self.sentences[sentence_id].get('text'),
+                'start_time': self.sentences[sentence_id].get('start_time'),
+                'score': round(score, 3),
+            }
+            for sentence_id, score in self.search(task_item, top_k)
+        ]
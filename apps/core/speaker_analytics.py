@@ -0,0 +1,133 @@
+"""
+Speaker Analytics
+Per-meeting talk time, turns, words per minute and silence gaps, computed once at
+ingestion with NumPy over the sentence list and stored as a compact columnar
+summary on RawTranscriptCache.speaker_analytics
+"""
+
+import logging
+from collections import defaultdict
+from typing import List, Dict, Any, Optional
+import numpy as np
+
+logger = logging.getLogger('apps.core.speaker_analytics')
+
+ANALYTICS_VERSION = 1
+
+# Fireflies occasionally reports a sentence spanning many minutes; cap its weight
+MAX_SENTENCE_SECONDS = 60.0
+
+# Pauses shorter than this are normal turn-taking, not silence
+MIN_SILENCE_SECONDS = 2.0
+
+
+def _speaker_label(sentence: Dict[str, Any]) -> str:
+    name = sentence.get('speaker_name')
+    if name:
+        return str(name)
+    return f"Speaker {sentence.get('speaker_id', '?')}"
+
+
+def _round(values: np.ndarray, decimals: int = 1) -> List[float]:
+    return [float(value) for value in np.round(values, decimals)]
+
+
+def compute_speaker_analytics(sentences: List[Dict[str, Any]], source_hash: str = '') -> Dict[str, Any]:
+    """
+    Vectorized per-speaker and per-meeting metrics for one transcript
+    Speaker metrics are stored as parallel columns indexed by 'names'
+    """
+    summary = {'version': ANALYTICS_VERSION, 'source_hash': source_hash}
+    timed = [s for s in sentences or [] if s.get('start_time') is not None]
+    if not timed:
+        summary.update({
+            'meeting': {'sentences': 0, 'speaker_count': 0, 'duration_seconds': 0.0, 'words': 0, 'words_per_minute': 0.0},
+            'speakers': {'names': [], 'talk_seconds': [], 'talk_share': [], 'turns': [], 'words': [], 'words_per_minute': []},
+            'silence': {'total_seconds': 0.0, 'gaps': 0, 'longest_seconds': 0.0, 'median_seconds': 0.0},
+        })
+        return summary
+
+    start = np.array([float(s['start_time']) for s in timed])
+    end = np.array([float(s.get('end_time') if s.get('end_time') is not None else s['start_time']) for s in timed])
+    words = np.array([len(str(s.get('text') or s.get('raw_text') or '').split()) for s in timed])
+    names, codes = np.unique([_speaker_label(s) for s in timed], return_inverse=True)
+
+    order = np.argsort(start, kind='stable')
+    start, end, words, codes = start[order], end[order], words[order], codes[order]
+    duration = np.clip(end - start, 0.0, MAX_SENTENCE_SECONDS)
+
+    # Talk time, words and turns per speaker
+    speaker_count = len(names)
+    talk_seconds = np.bincount(codes, weights=duration, minlength=speaker_count)
+    speaker_words = np.bincount(codes, weights=words, minlength=speaker_count)
+    turn_starts = np.r_[True, codes[1:] != codes[:-1]]
+    turns = np.bincount(codes[turn_starts], minlength=speaker_count)
+    talk_minutes = talk_seconds / 60.0
+    speaker_wpm = np.divide(speaker_words, talk_minutes, out=np.zeros(speaker_count), where=talk_minutes > 0)
+    total_talk = talk_seconds.sum()
+    talk_share = talk_seconds / total_talk if total_talk > 0 else np.zeros(speaker_count)
+
+    # Silence: gaps between the furthest end so far and the next sentence start
+    spoken_until = np.maximum.accumulate(start + duration)
+    gaps = start[1:] - spoken_until[:-1]
+    silences = gaps[gaps >= MIN_SILENCE_SECONDS]
+
+    meeting_seconds = float(spoken_until[-1] - start[0])
+    summary.update({
+        'meeting': {
+            'sentences': int(len(timed)),
+            'speaker_count': int(speaker_count),
+            'duration_seconds': round(meeting_seconds, 1),
+            'words': int(words.sum()),
+            'words_per_minute': round(float(words.sum() / (total_talk / 60.0)), 1) if total_talk > 0 else 0.0,
+        },
+        'speakers': {
+            'names': [str(name) for name in names],
+            'talk_seconds': _round(talk_seconds),
+            'talk_share': _round(talk_share, 3),
+            'turns': [int(count) for count in turns],
+            'words': [int(count) for count in speaker_words],
+            'words_per_minute': _round(speaker_wpm),
+        },
+        'silence': {
+            'total_seconds': round(float(silences.sum()), 1),
+            'gaps': int(len(silences)),
+            'longest_seconds': round(float(silences.max()), 1) if len(silences) else 0.0,
+            'median_seconds': round(float(np.median(silences)), 1) if len(silences) else 0.0,
+        },
+    })
+    return summary
+
+
+def speaker_rows(summary: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Expand the columnar speaker block into one dict per speaker"""
+    speakers = (summary or {}).get('speakers') or {}
+    columns = [key for key in speakers if key != 'names']
+    return [
+        {'name': name, **{column: speakers[column][index] for column in columns}}
+        for index, name in enumerate(speakers.get('names', []))
+    ]
+
+
+def meeting_load_by_person(queryset=None) -> List[Dict[str, Any]]:
+    """
+    Meetings attended, talk time, turns and words per person across many meetings
+    Reads only the precomputed summary column, never the raw transcript JSON
+    """
+    if queryset is None:
+        from .models import RawTranscriptCache
+        queryset = RawTranscriptCache.objects.all()
+
+    load = defaultdict(lambda: {'meetings': 0, 'talk_seconds': 0.0, 'turns': 0, 'words': 0})
+    for summary in queryset.exclude(speaker_analytics={}).values_list('speaker_analytics', flat=True).iterator():
+        for row in speaker_rows(summary):
+            person = load[row['name']]
+            person['meetings'] += 1
+            person['talk_seconds'] += row['talk_seconds']
+            person['turns'] += row['turns']
+            person['words'] += row['words']
+
+    return sorted(
+        [{'name': name, **totals, 'talk_seconds': round(totals['talk_seconds'], 1)} for name, totals in load.items()],
+        key=lambda person: -person['talk_seconds']
+    )
@@ -0,0 +1,217 @@
+"""
+Near-Duplicate Task Detection
+MinHash signatures over task_item shingles, bucketed with LSH per assignee set,
+so a new task is compared only against the few open tasks it collides with
+"""
+
+import logging
+import random
+import threading
+import zlib
+from collections import defaultdict
+from datetime import timedelta
+from typing import List, Dict, Any, Optional, Set, Tuple
+from django.conf import settings
+from django.utils import timezone
+
+from .chunked_extraction import normalize_task_key
+
+logger = logging.getLogger('apps.core.task_dedupe')
+
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+
+def task_shingles(task_item: str, size: int = 3) -> Set[str]:
+    """Word shingles of the normalised task text (single words for very short tasks)"""
+    words = normalize_task_key(task_item).split()
+    if len(words) < size:
+        return set(words)
+    return {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def assignee_key(assignee_emails: str) -> str:
+    """Order-insensitive key for a comma-separated assignee list"""
+    emails = sorted(email.strip().lower() for email in (assignee_emails or '').split(',') if email.strip())
+    return ','.join(emails)
+
+
+class MinHasher:
+    """MinHash with universal hash functions (a*x + b) mod p over crc32 shingle hashes"""
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.permutations = [
+            (rng.randint(1, MERSENNE_PRIME - 1), rng.randint(0, MERSENNE_PRIME - 1))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, shingles: Set[str]) -> Tuple[int, ...]:
+        if not shingles:
+            return tuple([MAX_HASH] * self.num_perm)
+
+        rows = [
+            [((a * value + b) % MERSENNE_PRIME) & MAX_HASH for a, b in self.permutations]
+            for value in (zlib.crc32(shingle.encode('utf-8')) for shingle in shingles)
+        ]
+        return tuple(map(min, zip(*rows)))
+
+    @staticmethod
+    def similarity(first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        return sum(1 for a, b in zip(first, second) if a == b) / len(first)
+
+
+class TaskDedupeIndex:
+    """
+    In-process LSH index of open GeminiProcessedTask rows
+
+    Built lazily from the database on first use and kept current by signals.
+    Tasks saved by other processes are picked up before each lookup by reloading
+    rows updated since a watermark (indexed updated_at), with a small overlap
+    for transactions that committed late. Bucket keys include the assignee set,
+    so tasks for different people never collide.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        if config is None:
+            config = settings.SYSTEM_CONFIG.get('TASK_DEDUPE', {})
+
+        self.enabled = config.get('ENABLED', False)
+        self.mode = config.get('MODE', 'flag')
+        self.threshold = config.get('THRESHOLD', 0.7)
+        self.bands = config.get('BANDS', 16)
+        self.rows = config.get('NUM_PERM', 64) // self.bands
+        self.hasher = MinHasher(self.bands * self.rows)
+        self.refresh_overlap = timedelta(seconds=config.get('REFRESH_OVERLAP_SECONDS', 60))
+
+        self._buckets: Dict[Tuple[str, int, Tuple[int, ...]], Set[str]] = defaultdict(set)
+        self._entries: Dict[str, Tuple[str, Tuple[int, ...]]] = {}
+        self._index_lock = threading.RLock()
+        self._loaded = False
+        self._watermark = None
+
+    @classmethod
+    def get_instance(cls) -> 'TaskDedupeIndex':
+        """Get singleton instance of TaskDedupeIndex"""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def _band_keys(self, owner: str, signature: Tuple[int, ...]):
+        for band in range(self.bands):
+            yield (owner, band, signature[band * self.rows:(band + 1) * self.rows])
+
+    def add(self, task_id: str, task_item: str, assignee_emails: str):
+        """Index (or re-index) an open task"""
+        owner = assignee_key(assignee_emails)
+        signature = self.hasher.signature(task_shingles(task_item))
+
+        with self._index_lock:
+            self._remove_locked(task_id)
+            self._entries[task_id] = (owner, signature)
+            for key in self._band_keys(owner, signature):
+                self._buckets[key].add(task_id)
+
+    def remove(self, task_id: str):
+        """Drop a task that was deleted or closed"""
+        with self._index_lock:
+            self._remove_locked(task_id)
+
+    def _remove_locked(self, task_id: str):
+        entry = self._entries.pop(task_id, None)
+        if entry is None:
+            return
+        owner, signature = entry
+        for key in self._band_keys(owner, signature):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(task_id)
+                if not bucket:
+                    del self._buckets[key]
+
+    def find_duplicates(self, task_item: str, assignee_emails: str, exclude_id: Optional[str] = None) -> List[Tuple[str, float]]:
+        """
+        Open tasks that look like near-duplicates, best first
+        Returns [(task_id, estimated_similarity)] at or above the threshold
+        """
+        self.ensure_loaded()
+        self.refresh()
+        owner = assignee_key(assignee_emails)
+        signature = self.hasher.signature(task_shingles(task_item))
+
+        with self._index_lock:
+            candidates = set()
+            for key in self._band_keys(owner, signature):
+                candidates.update(self._buckets.get(key, ()))
+            candidates.discard(exclude_id)
+
+            scored = [
+                (task_id, self.hasher.similarity(signature, self._entries[task_id][1]))
+                for task_id in candidates
+            ]
+
+        return sorted(
+            [(task_id, score) for task_id, score in scored if score >= self.threshold],
+            key=lambda item: -item[1]
+        )
+
+    def ensure_loaded(self):
+        """Build the index from open tasks in the database the first time it is used"""
+        if self._loaded:
+            return
+
+        with self._index_lock:
+            if self._loaded:
+                return
+
+            from .models import GeminiProcessedTask
+            self._watermark = timezone.now()
+            open_tasks = GeminiProcessedTask.objects.filter(duplicate_of__isnull=True).exclude(
+                approval_status='rejected'
+            ).exclude(status='Done').values_list('id', 'task_item', 'assignee_emails')
+
+            for task_id, task_item, assignee_emails in open_tasks.iterator():
+                self.add(str(task_id), task_item, assignee_emails)
+
+            self._loaded = True
+            logger.info(f"🧮 Task dedupe index built with {len(self._entries)} open tasks")
+
+    def refresh(self):
+        """Apply tasks created, closed or edited by other processes since the last refresh"""
+        from .models import GeminiProcessedTask
+
+        with self._index_lock:
+            since = self._watermark - self.refresh_overlap
+            self._watermark = timezone.now()
+            changed = GeminiProcessedTask.objects.filter(updated_at__gte=since).values_list(
+                'id', 'task_item', 'assignee_emails', 'approval_status', 'status', 'duplicate_of_id'
+            )
+
+            for task_id, task_item, assignee_emails, approval_status, status, duplicate_of_id in changed.iterator():
+                if approval_status == 'rejected' or status == 'Done' or duplicate_of_id:
+                    self.remove(str(task_id))
+                else:
+                    self.add(str(task_id), task_item, assignee_emails)
+
+    def clear(self):
+        """Drop all entries; the next query rebuilds from the database"""
+        with self._index_lock:
+            self._buckets.clear()
+            self._entries.clear()
+            self._loaded = False
+            self._watermark = None
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def get_task_dedupe_index() -> TaskDedupeIndex:
+    """Convenience function to get the task dedupe index"""
+    return TaskDedupeIndex.get_instance()
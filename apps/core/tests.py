@@ -15,6 +15,24 @@ import json
 from datetime import datetime
 
 
+def create_meeting_tasks(fireflies_id, title, task_items, **task_fields):
+    """Cache a meeting and create one GeminiProcessedTask per task_item, in extraction order"""
+    from .models import RawTranscriptCache, GeminiProcessedTask
+    
+    cache_item = RawTranscriptCache.objects.create(
+        fireflies_id=fireflies_id,
+        raw_fireflies_data={'title': title, 'sentences': []},
+        meeting_date=timezone.now(),
+        meeting_title=title
+    )
+    return [
+        GeminiProcessedTask.objects.create(
+            raw_transcript=cache_item, task_item=task_item, extraction_order=index, **task_fields
+        )
+        for index, task_item in enumerate(task_items)
+    ]
+
+
 class HealthMonitorTests(TestCase):
     """Test health monitoring system"""
     
@@ -232,4 +250,1725 @@ class GuardianIntegrationTests(TestCase):
         from django.conf import settings
         knowledge_dir = getattr(settings, 'GUARDIAN_KNOWLEDGE_DIR', None)
         self.assertIsNotNone(knowledge_dir)
-        self.assertTrue(knowledge_dir.exists()) 
\ No newline at end of file
+        self.assertTrue(knowledge_dir.exists())
+
+
+class ChunkedExtractionTests(TestCase):
+    """Test map-reduce chunked extraction"""
+    
+    def _sentences(self, count):
+        return [
+            {'speaker_name': 'Alice', 'text': f'Sentence number {i}', 'start_time': float(i)}
+            for i in range(count)
+        ]
+    
+    def test_windows_overlap_and_cover_transcript(self):
+        """Test windows overlap and cover every sentence"""
+        from .chunked_extraction import split_sentence_windows
+        
+        windows = split_sentence_windows(self._sentences(25), window_size=10, overlap=2)
+        
+        self.assertEqual([start for start, _ in windows], [0, 8, 16])
+        self.assertEqual(windows[-1][1][-1]['text'], 'Sentence number 24')
+    
+    def test_merge_dedupes_overlap_and_keeps_order(self):
+        """Test duplicates from overlapping windows collapse to the first occurrence"""
+        from .chunked_extraction import merge_window_tasks
+        
+        first = {'task_item': 'Send the budget report to finance', 'assignee_emails': 'a@x.com', 'due_date': None}
+        merged = merge_window_tasks([
+            [first, {'task_item': 'Book the venue', 'assignee_emails': 'b@x.com'}],
+            [{'task_item': 'send the budget report to Finance.', 'assignee_emails': 'a@x.com', 'due_date': 123},
+             {'task_item': 'Draft the launch email', 'assignee_emails': 'c@x.com'}],
+        ])
+        
+        self.assertEqual(
+            [task['task_item'] for task in merged],
+            ['Send the budget report to finance', 'Book the venue', 'Draft the launch email']
+        )
+        self.assertEqual(merged[0]['due_date'], 123)
+    
+    def test_chunked_extraction_runs_each_window_once(self):
+        """Test chunked extraction calls Gemini per window and caches by content hash"""
+        from unittest import mock
+        from django.core.cache import caches
+        from .precision_extractor import PrecisionTaskExtractor
+        
+        caches['gemini'].clear()
+        fake_client = mock.Mock()
+        fake_client._execute_request_with_retry.return_value = {
+            'candidates': [{'content': {'parts': [{'text': json.dumps([
+                {'task_item': 'Prepare the quarterly roadmap review deck', 'assignee_emails': 'a@x.com'}
+            ])}]}}]
+        }
+        
+        with mock.patch('apps.core.precision_extractor.get_gemini_client', return_value=fake_client):
+            extractor = PrecisionTaskExtractor(chunked=True)
+            extractor.chunk_config = {'WINDOW_SENTENCES': 10, 'OVERLAP_SENTENCES': 2, 'MAX_WORKERS': 2}
+            fireflies_data = {'title': 'Planning', 'sentences': self._sentences(25)}
+            
+            tasks, _ = extractor._extract_chunked(fireflies_data, 'ff-chunked')
+            self.assertEqual(len(tasks), 1)
+            self.assertEqual(fake_client._execute_request_with_retry.call_count, 3)
+            
+            extractor._extract_chunked(fireflies_data, 'ff-chunked')
+            self.assertEqual(fake_client._execute_request_with_retry.call_count, 3)
+    
+    def test_failed_window_leaves_transcript_unmarked(self):
+        """Test a failed window is reported and the sentences are not marked extracted"""
+        from unittest import mock
+        from django.core.cache import caches
+        from .chunked_extraction import IncompleteExtractionError
+        from .models import RawTranscriptCache
+        from .precision_extractor import PrecisionTaskExtractor, process_raw_cache_item
+        
+        caches['gemini'].clear()
+        
+        def respond(prompt, model=None):
+            if 'Sentence number 20' in prompt:
+                raise RuntimeError('quota exhausted')
+            return {'candidates': [{'content': {'parts': [{'text': json.dumps([
+                {'task_item': 'Prepare the quarterly roadmap review deck', 'assignee_emails': 'a@x.com'}
+            ])}]}}]}
+        
+        fake_client = mock.Mock()
+        fake_client._execute_request_with_retry.side_effect = respond
+        cache_item = RawTranscriptCache.objects.create(
+            fireflies_id='ff-chunk-fail',
+            raw_fireflies_data={'title': 'Planning', 'sentences': self._sentences(25)},
+            meeting_date=timezone.now(),
+            meeting_title='Planning'
+        )
+        
+        with mock.patch('apps.core.precision_extractor.get_gemini_client', return_value=fake_client):
+            extractor = PrecisionTaskExtractor(chunked=True)
+            extractor.chunk_config = {'WINDOW_SENTENCES': 10, 'OVERLAP_SENTENCES': 2, 'MAX_WORKERS': 2}
+            with self.assertRaises(IncompleteExtractionError) as raised:
+                extractor._extract_chunked(cache_item.raw_fireflies_data, cache_item.fireflies_id)
+            
+            with mock.patch('apps.core.precision_extractor.PrecisionTaskExtractor', return_value=extractor):
+                process_raw_cache_item(cache_item)
+        
+        self.assertEqual(raised.exception.failed_windows, 1)
+        self.assertEqual(len(raised.exception.tasks), 1)
+        cache_item.refresh_from_db()
+        self.assertFalse(cache_item.processed)
+        self.assertEqual(cache_item.extracted_sentence_hashes, [])
+
+
+class PromptTemplateTests(TestCase):
+    """Test the compiled prompt template engine"""
+    
+    def test_render_replaces_known_placeholders_only(self):
+        """Test rendering substitutes known expressions and keeps unknown ones verbatim"""
+        from .prompt_template import CompiledPromptTemplate
+        
+        template = CompiledPromptTemplate("Title: {{ $json.title }}\nOther: {{ $json.unknown }}")
+        
+        self.assertEqual(template.expressions, ['$json.title', '$json.unknown'])
+        self.assertEqual(
+            template.render({'$json.title': 'Weekly Sync'}),
+            "Title: Weekly Sync\nOther: {{ $json.unknown }}"
+        )
+    
+    def test_template_recompiles_when_file_changes(self):
+        """Test compiled templates are cached by mtime and versioned by content"""
+        import os
+        import tempfile
+        from .prompt_template import get_prompt_template
+        
+        with tempfile.NamedTemporaryFile('w', suffix='.md', delete=False) as f:
+            f.write("Hello {{ $json.title }}")
+        try:
+            first = get_prompt_template(f.name)
+            self.assertIs(get_prompt_template(f.name), first)
+            
+            with open(f.name, 'w') as changed:
+                changed.write("Hi {{ $json.title }}!")
+            os.utime(f.name, ns=(os.stat(f.name).st_atime_ns, os.stat(f.name).st_mtime_ns + 1_000_000))
+            
+            second = get_prompt_template(f.name)
+            self.assertNotEqual(first.version, second.version)
+            self.assertEqual(second.render({'$json.title': 'team'}), "Hi team!")
+        finally:
+            os.unlink(f.name)
+
+
+class TranscriptCompactionTests(TestCase):
+    """Test transcript compaction before prompt rendering"""
+    
+    def test_compaction_merges_runs_and_drops_acknowledgements(self):
+        """Test filler turns are dropped and same-speaker runs merged"""
+        from .transcript_compaction import TranscriptCompactor
+        
+        sentences = [
+            {'speaker_name': 'Alice', 'text': 'Can you send the deck', 'start_time': 1.234},
+            {'speaker_name': 'Bob', 'text': 'Yeah.', 'start_time': 2.5},
+            {'speaker_name': 'Alice', 'text': 'by Friday please?', 'start_time': 3.9},
+            {'speaker_name': 'Bob', 'text': 'I will send it tomorrow', 'start_time': 5.1},
+        ]
+        compactor = TranscriptCompactor({'ENABLED': True, 'DROP_ACKNOWLEDGEMENTS_UNDER_WORDS': 3})
+        
+        compacted, report = compactor.compact(sentences)
+        
+        self.assertEqual(len(compacted), 2)
+        self.assertEqual(compacted[0]['text'], 'Can you send the deck by Friday please?')
+        self.assertEqual(compacted[0]['start_time'], 1)
+        self.assertEqual(report['acknowledgements_dropped'], 1)
+        self.assertLess(report['tokens_after'], report['tokens_before'])
+        self.assertEqual(sentences[0]['start_time'], 1.234)  # input untouched
+    
+    def test_compaction_keeps_non_latin_sentences(self):
+        """Test sentences outside ASCII are never mistaken for acknowledgements"""
+        from .transcript_compaction import TranscriptCompactor
+        
+        sentences = [
+            {'speaker_name': 'Ivan', 'text': 'Отправь отчёт до пятницы', 'start_time': 1.0},
+            {'speaker_name': 'Li', 'text': '请明天发送报告', 'start_time': 2.0},
+            {'speaker_name': 'Bob', 'text': 'Okay.', 'start_time': 3.0},
+        ]
+        compactor = TranscriptCompactor({'ENABLED': True, 'MERGE_SPEAKER_RUNS': False})
+        
+        compacted, report = compactor.compact(sentences)
+        
+        self.assertEqual([s['text'] for s in compacted], ['Отправь отчёт до пятницы', '请明天发送报告'])
+        self.assertEqual(report['acknowledgements_dropped'], 1)
+    
+    def test_disabled_compaction_is_passthrough(self):
+        """Test disabled compaction returns sentences unchanged"""
+        from .transcript_compaction import TranscriptCompactor
+        
+        sentences = [{'speaker_name': 'Alice', 'text': 'ok', 'start_time': 1.5}]
+        compacted, report = TranscriptCompactor({'ENABLED': False}).compact(sentences)
+        
+        self.assertEqual(compacted, sentences)
+        self.assertEqual(report['tokens_before'], report['tokens_after'])
+
+
+class StreamingExtractionTests(TestCase):
+    """Test streaming Gemini output with incremental task parsing"""
+    
+    def test_parser_yields_tasks_as_objects_close(self):
+        """Test each task is emitted when its closing brace arrives"""
+        from .ai_output_parser import IncrementalTaskArrayParser
+        
+        parser = IncrementalTaskArrayParser()
+        
+        self.assertEqual(parser.feed('```json\n[{"task_item": "Fix {the} \\"bug\\"", "tags": ["a"'), [])
+        first = parser.feed(']}, {"task_item": "Ship')
+        second = parser.feed(' it"}]\n```')
+        
+        self.assertEqual(first, [{'task_item': 'Fix {the} "bug"', 'tags': ['a']}])
+        self.assertEqual(second, [{'task_item': 'Ship it'}])
+        self.assertTrue(parser.array_closed)
+    
+    def test_streamed_tasks_are_saved_incrementally(self):
+        """Test GeminiProcessedTask rows exist before the stream finishes"""
+        from unittest import mock
+        from .models import RawTranscriptCache, GeminiProcessedTask
+        from .precision_extractor import stream_gemini_tasks_for_cache
+        
+        cache_item = RawTranscriptCache.objects.create(
+            fireflies_id='ff-stream',
+            raw_fireflies_data={'title': 'Standup', 'sentences': []},
+            meeting_date=timezone.now(),
+            meeting_title='Standup'
+        )
+        chunks = [
+            '[{"task_item": "Write the release notes for version two", "priority": "High"}',
+            ', {"task_item": "Review the onboarding flow with design", "status": "Done"}]',
+        ]
+        fake_client = mock.Mock()
+        fake_client.stream_generate_content.return_value = iter(chunks)
+        
+        with mock.patch('apps.core.precision_extractor.get_gemini_client', return_value=fake_client):
+            stream = stream_gemini_tasks_for_cache(cache_item)
+            first = next(stream)
+            self.assertEqual(GeminiProcessedTask.objects.filter(raw_transcript=cache_item).count(), 1)
+            rest = list(stream)
+        
+        self.assertEqual(first.priority, 'High')
+        self.assertEqual([task.extraction_order for task in [first] + rest], [0, 1])
+        self.assertEqual(rest[0].status, 'Done')
+        cache_item.refresh_from_db()
+        self.assertEqual(cache_item.extracted_sentence_hashes, cache_item.current_sentence_hashes())
+    
+    def test_truncated_stream_leaves_meeting_unmarked(self):
+        """Test a stream cut off inside the array raises after its tasks and marks nothing"""
+        from unittest import mock
+        from .ai_output_parser import IncompleteStreamError
+        from .models import RawTranscriptCache
+        from .precision_extractor import stream_gemini_tasks_for_cache
+        
+        cache_item = RawTranscriptCache.objects.create(
+            fireflies_id='ff-stream-cut',
+            raw_fireflies_data={'title': 'Standup', 'sentences': [{'speaker_name': 'Alice', 'text': 'I will ship it', 'start_time': 1}]},
+            meeting_date=timezone.now(),
+            meeting_title='Standup'
+        )
+        fake_client = mock.Mock()
+        fake_client.stream_generate_content.return_value = iter([
+            '[{"task_item": "Write the release notes for version two"}, {"task_item": "Rev'
+        ])
+        
+        saved = []
+        with mock.patch('apps.core.precision_extractor.get_gemini_client', return_value=fake_client):
+            with self.assertRaises(IncompleteStreamError) as raised:
+                for task in stream_gemini_tasks_for_cache(cache_item):
+                    saved.append(task)
+        
+        self.assertEqual((len(saved), raised.exception.tasks_parsed), (1, 1))
+        cache_item.refresh_from_db()
+        self.assertEqual(cache_item.extracted_sentence_hashes, [])
+
+
+class BatchExtractionTests(TestCase):
+    """Test packing short meetings into one Gemini request"""
+    
+    def _cache_item(self, fireflies_id, text):
+        from .models import RawTranscriptCache
+        return RawTranscriptCache.objects.create(
+            fireflies_id=fireflies_id,
+            raw_fireflies_data={
+                'title': f'Meeting {fireflies_id}',
+                'sentences': [{'speaker_name': 'Alice', 'text': text, 'start_time': 1}],
+            },
+            meeting_date=timezone.now(),
+            meeting_title=f'Meeting {fireflies_id}'
+        )
+    
+    def test_short_meetings_share_one_request_and_are_demultiplexed(self):
+        """Test one batched call returns per-meeting task lists"""
+        import json
+        from unittest import mock
+        from .batch_extraction import MeetingBatchExtractor
+        
+        first = self._cache_item('ff-a', 'Bob please send the invoice by Friday')
+        second = self._cache_item('ff-b', 'Carol will book the venue for the offsite')
+        keyed_output = {
+            'ff-a': [{'task_item': 'Send the invoice'}],
+            'ff-b': [{'task_item': 'Book the offsite venue'}, {'task_item': 'Share venue options'}],
+        }
+        fake_client = mock.Mock()
+        fake_client._execute_request_with_retry.return_value = {
+            'candidates': [{'content': {'parts': [{'text': '```json\n' + json.dumps(keyed_output) + '\n```'}]}}]
+        }
+        
+        with mock.patch('apps.core.precision_extractor.get_gemini_client', return_value=fake_client):
+            results = MeetingBatchExtractor().extract([first, second])
+        
+        fake_client._execute_request_with_retry.assert_called_once()
+        prompt = fake_client._execute_request_with_retry.call_args[0][0]
+        self.assertEqual(prompt.count('=== System ==='), 1)
+        self.assertIn('=== Meeting "ff-b" ===', prompt)
+        self.assertEqual(len(results['ff-a']), 1)
+        self.assertEqual(len(results['ff-b']), 2)
+    
+    def test_missing_meeting_key_falls_back_to_single_extraction(self):
+        """Test a meeting absent from the keyed output is re-run on its own"""
+        from unittest import mock
+        from .batch_extraction import MeetingBatchExtractor
+        
+        first = self._cache_item('ff-c', 'Dan will update the roadmap')
+        second = self._cache_item('ff-d', 'Eve will renew the domain')
+        fake_client = mock.Mock()
+        fake_client._execute_request_with_retry.side_effect = [
+            {'candidates': [{'content': {'parts': [{'text': '{"ff-c": []}'}]}}]},
+            {'candidates': [{'content': {'parts': [{'text': '[{"task_item": "Renew the domain"}]'}]}}]},
+        ]
+        
+        with mock.patch('apps.core.precision_extractor.get_gemini_client', return_value=fake_client):
+            results = MeetingBatchExtractor().extract([first, second])
+        
+        self.assertEqual(fake_client._execute_request_with_retry.call_count, 2)
+        self.assertEqual(results['ff-c'], [])
+        self.assertEqual(results['ff-d'], [{'task_item': 'Renew the domain'}])
+    
+    def test_long_single_meeting_is_still_chunked(self):
+        """Test a meeting too long to batch goes through windowed extraction"""
+        import json
+        from unittest import mock
+        from django.core.cache import caches
+        from .batch_extraction import MeetingBatchExtractor
+        from .models import RawTranscriptCache
+        
+        caches['gemini'].clear()
+        long_meeting = RawTranscriptCache.objects.create(
+            fireflies_id='ff-long',
+            raw_fireflies_data={'title': 'All hands', 'sentences': [
+                {'speaker_name': ['Alice', 'Bob'][i % 2], 'text': f'Agenda point number {i}', 'start_time': float(i)}
+                for i in range(25)
+            ]},
+            meeting_date=timezone.now(),
+            meeting_title='All hands'
+        )
+        fake_client = mock.Mock()
+        fake_client._execute_request_with_retry.return_value = {
+            'candidates': [{'content': {'parts': [{'text': json.dumps([{'task_item': 'Publish the all hands notes'}])}]}}]
+        }
+        
+        with mock.patch('apps.core.precision_extractor.get_gemini_client', return_value=fake_client):
+            batch_extractor = MeetingBatchExtractor(config={'MAX_MEETING_TOKENS': 10})
+            batch_extractor.extractor.chunk_config = {
+                'ENABLED': True, 'MIN_SENTENCES': 20, 'WINDOW_SENTENCES': 10, 'OVERLAP_SENTENCES': 2, 'MAX_WORKERS': 1
+            }
+            results = batch_extractor.extract([long_meeting])
+        
+        self.assertEqual(fake_client._execute_request_with_retry.call_count, 3)
+        self.assertEqual(results['ff-long'], [{'task_item': 'Publish the all hands notes'}])
+
+
+class DeltaExtractionTests(TestCase):
+    """Test incremental re-extraction of updated transcripts"""
+    
+    def test_diff_finds_appended_and_inserted_spans(self):
+        """Test only new sentence ranges are reported, with context merged"""
+        from .delta_extraction import diff_new_spans, expand_spans
+        
+        spans = diff_new_spans(['a', 'b', 'c'], ['a', 'x', 'b', 'c', 'd', 'e'])
+        
+        self.assertEqual(spans, [(1, 2), (4, 6)])
+        self.assertEqual(expand_spans(spans, 2), [(0, 6)])
+    
+    def test_delta_sends_only_new_sentences_and_keeps_existing_tasks(self):
+        """Test new tasks are appended after existing ones and duplicates skipped"""
+        from unittest import mock
+        from .models import RawTranscriptCache, GeminiProcessedTask
+        from .delta_extraction import DeltaExtractor
+        
+        sentences = [
+            {'speaker_name': 'Alice', 'text': f'Status update number {i}', 'start_time': i}
+            for i in range(50)
+        ]
+        cache_item = RawTranscriptCache.objects.create(
+            fireflies_id='ff-delta',
+            raw_fireflies_data={'title': 'Planning', 'sentences': sentences},
+            meeting_date=timezone.now(),
+            meeting_title='Planning'
+        )
+        cache_item.mark_sentences_extracted()
+        existing = GeminiProcessedTask.objects.create(
+            raw_transcript=cache_item,
+            task_item='Prepare the quarterly planning document for leadership',
+            extraction_order=0,
+            monday_item_id='12345'
+        )
+        
+        updated = sentences + [{'speaker_name': 'Bob', 'text': 'I will migrate the billing database', 'start_time': 50}]
+        fake_client = mock.Mock()
+        fake_client._execute_request_with_retry.return_value = {'candidates': [{'content': {'parts': [{'text': (
+            '[{"task_item": "Prepare the quarterly planning document for leadership"},'
+            ' {"task_item": "Migrate the billing database to the new cluster"}]'
+        )}]}}]}
+        
+        with mock.patch('apps.core.precision_extractor.get_gemini_client', return_value=fake_client):
+            report = DeltaExtractor(config={'CONTEXT_SENTENCES': 5}).extract_delta(
+                cache_item, dict(cache_item.raw_fireflies_data, sentences=updated)
+            )
+        
+        prompt = fake_client._execute_request_with_retry.call_args[0][0]
+        self.assertNotIn('Status update number 40', prompt)
+        self.assertIn('Status update number 45', prompt)
+        self.assertEqual(report['new_sentences'], 1)
+        self.assertEqual(report['tasks_created'], 1)
+        self.assertEqual(report['duplicates_skipped'], 1)
+        
+        tasks = list(GeminiProcessedTask.objects.filter(raw_transcript=cache_item))
+        self.assertEqual([task.extraction_order for task in tasks], [0, 1])
+        self.assertEqual(tasks[0].pk, existing.pk)
+        self.assertEqual(tasks[0].monday_item_id, '12345')
+        
+        cache_item.refresh_from_db()
+        self.assertEqual(len(cache_item.extracted_sentence_hashes), 51)
+
+
+class SourceAttributionTests(TestCase):
+    """Test BM25 source-sentence attribution"""
+    
+    def test_rare_terms_outrank_common_ones(self):
+        """Test stop words are ignored and distinctive terms drive the ranking"""
+        from .source_attribution import SentenceIndex
+        
+        sentences = [
+            {'speaker_name': 'Alice', 'text': 'We need to send the update to the team', 'start_time': 1},
+            {'speaker_name': 'Bob', 'text': 'I will send the invoices to Acme by Friday', 'start_time': 2},
+            {'speaker_name': 'Carol', 'text': 'The team will review the update', 'start_time': 3},
+        ]
+        index = SentenceIndex(sentences)
+        
+        results = index.source_sentences('Send the Acme invoice before Friday')
+        
+        self.assertEqual(results[0]['speaker_name'], 'Bob')
+        self.assertEqual(len(results), 1)
+        self.assertEqual(index.search('the to and we'), [])
+    
+    def test_extractor_builds_index_once_per_transcript(self):
+        """Test repeated attribution over one sentence list reuses the index"""
+        from unittest import mock
+        from .precision_extractor import PrecisionTaskExtractor
+        from .source_attribution import SentenceIndex
+        
+        sentences = [{'speaker_name': 'Alice', 'text': 'Deploy the billing service tonight', 'start_time': 1}]
+        with mock.patch('apps.core.precision_extractor.get_gemini_client'):
+            extractor = PrecisionTaskExtractor()
+        
+        with mock.patch('apps.core.precision_extractor.SentenceIndex', wraps=SentenceIndex) as index_class:
+            extractor._find_source_sentences('Deploy billing service', sentences)
+            extractor._find_source_sentences('Deploy the service', sentences)
+        
+        self.assertEqual(index_class.call_count, 1)
+
+
+class OutputRecoveryTests(TestCase):
+    """Test tolerant recovery of malformed or truncated Gemini output"""
+    
+    def test_truncated_array_with_trailing_commas_is_salvaged(self):
+        """Test complete objects are kept and truncation is reported"""
+        from .ai_output_parser import recover_task_array
+        
+        output = (
+            'Sure! Here are the tasks:\n```json\n'
+            '[{"task_item": "Draft the launch plan", "tags": ["a", "b",],},\n'
+            ' {"task_item": "Email the vendor, then", "priority": "Hi'
+        )
+        
+        tasks, report = recover_task_array(output)
+        
+        self.assertEqual(tasks, [{'task_item': 'Draft the launch plan', 'tags': ['a', 'b']}])
+        self.assertTrue(report['truncated'])
+        self.assertEqual(report['repaired'], 1)
+    
+    def test_truncated_response_requests_only_the_tail(self):
+        """Test one continuation call fetches the remaining tasks and they are merged"""
+        from unittest import mock
+        from .precision_extractor import PrecisionTaskExtractor
+        
+        fake_client = mock.Mock()
+        fake_client._execute_request_with_retry.side_effect = [
+            {'candidates': [{'content': {'parts': [{'text': '[{"task_item": "Book the venue"}, {"task_item": "Send'}]}}]},
+            {'candidates': [{'content': {'parts': [{'text': '[{"task_item": "Send the invitations to all guests"}]'}]}}]},
+        ]
+        with mock.patch('apps.core.precision_extractor.get_gemini_client', return_value=fake_client):
+            extractor = PrecisionTaskExtractor()
+        
+        tasks, _, complete = extractor._run_prompt_with_status('PROMPT')
+        
+        continuation_prompt = fake_client._execute_request_with_retry.call_args_list[1][0][0]
+        self.assertIn('- Book the venue', continuation_prompt)
+        self.assertEqual([task['task_item'] for task in tasks], ['Book the venue', 'Send the invitations to all guests'])
+        self.assertTrue(complete)
+    
+    def test_unrecovered_truncation_is_not_cached(self):
+        """Test a partial task list is returned but never cached as the full result"""
+        from unittest import mock
+        from .gemini_client import get_gemini_client
+        
+        cache.clear()
+        client = get_gemini_client()
+        truncated = {'candidates': [{'content': {'parts': [{'text': '[{"task_item": "Book the venue"}, {"task_item": "Send'}]}}]}
+        transcript = {'title': 'Offsite', 'sentences': [{'speaker_name': 'Alice', 'text': 'Book the venue', 'start_time': 1}]}
+        
+        with mock.patch.object(client, '_execute_request_with_retry', return_value=truncated) as execute, \
+                mock.patch.object(client, '_generate_text', return_value=None):
+            first = client.extract_tasks_from_transcript(transcript)
+            _, complete = client.extract_tasks_with_status(transcript)
+        
+        self.assertEqual([task['task_item'] for task in first], ['Book the venue'])
+        self.assertFalse(complete)
+        self.assertEqual(execute.call_count, 2)
+
+
+class QuotaLedgerTests(TestCase):
+    """Test the durable Gemini quota ledger"""
+    
+    def test_usage_is_shared_between_client_instances(self):
+        """Test counters persist across separately constructed clients"""
+        from unittest import mock
+        from .gemini_client import get_gemini_client
+        
+        response = mock.Mock()
+        response.json.return_value = {
+            'candidates': [{'content': {'parts': [{'text': '[]'}]}}],
+            'usageMetadata': {'promptTokenCount': 1200, 'candidatesTokenCount': 300},
+        }
+        
+        for _ in range(2):
+            client = get_gemini_client()
+            client.min_request_interval = 0
+            with mock.patch.object(client.session, 'post', return_value=response):
+                client._execute_request_with_retry('PROMPT')
+        
+        status = get_gemini_client().get_quota_status()
+        self.assertEqual(status['model'], 'gemini-2.5-flash')
+        self.assertEqual(status['requests_today'], 2)
+        self.assertEqual(status['tokens_today'], 3000)
+    
+    def test_pacing_waits_when_minute_budget_is_used(self):
+        """Test the ledger asks callers to wait once the per-minute limit is reached"""
+        from datetime import datetime, timezone as dt_timezone
+        from unittest import mock
+        from .quota_ledger import QuotaLedger
+        
+        ledger = QuotaLedger({'REQUESTS_PER_MINUTE': 2, 'REQUESTS_PER_DAY': 3})
+        now = datetime(2025, 6, 18, 13, 37, 20, tzinfo=dt_timezone.utc)
+        
+        with mock.patch('apps.core.quota_ledger.timezone.now', return_value=now):
+            ledger.record_request('gemini-test')
+            self.assertEqual(ledger.seconds_until_allowed('gemini-test'), 0.0)
+            
+            ledger.record_request('gemini-test')
+            
+            self.assertEqual(ledger.seconds_until_allowed('gemini-test'), 40.0)
+            self.assertTrue(ledger.has_daily_headroom('gemini-test'))
+            self.assertFalse(ledger.has_daily_headroom('gemini-test', requests_needed=2))
+    
+    def test_reservation_never_exceeds_minute_budget(self):
+        """Test reserving counts the request only while the minute window has room"""
+        from datetime import datetime, timezone as dt_timezone
+        from unittest import mock
+        from .quota_ledger import QuotaLedger
+        
+        ledger = QuotaLedger({'REQUESTS_PER_MINUTE': 2, 'REQUESTS_PER_DAY': 10})
+        now = datetime(2025, 6, 18, 13, 37, 20, tzinfo=dt_timezone.utc)
+        
+        with mock.patch('apps.core.quota_ledger.timezone.now', return_value=now):
+            waits = [ledger.reserve_request('gemini-test') for _ in range(3)]
+            usage = ledger.usage('gemini-test')
+        
+        self.assertEqual(waits, [0.0, 0.0, 40.0])
+        self.assertEqual(usage['requests_this_minute'], 2)
+        self.assertEqual(usage['requests_today'], 2)
+
+
+class ModelRoutingTests(TestCase):
+    """Test size-aware Gemini model routing"""
+    
+    def test_short_and_summary_only_meetings_use_light_model(self):
+        """Test thresholds choose between the light and full models"""
+        from .model_router import ModelRouter
+        
+        router = ModelRouter({
+            'ENABLED': True, 'FULL_MODEL': 'full', 'LIGHT_MODEL': 'light',
+            'LIGHT_MAX_PROMPT_TOKENS': 100, 'LIGHT_MAX_SPEAKERS': 2,
+        })
+        short = {'sentences': [{'speaker_name': 'Alice', 'text': 'Ship it'}]}
+        crowded = {'sentences': [{'speaker_name': name, 'text': 'Hi'} for name in ('A', 'B', 'C')]}
+        
+        self.assertEqual(router.route_transcript(short)['model'], 'light')
+        self.assertEqual(router.route_transcript({'summary': {'overview': 'x'}})['reason'], 'summary_only')
+        self.assertEqual(router.route_transcript(crowded)['model'], 'full')
+        self.assertEqual(router.route_transcript(short, prompt='x' * 800)['model'], 'full')
+    
+    def test_routed_model_is_requested_and_recorded(self):
+        """Test the client calls the routed endpoint and tasks record the model"""
+        from unittest import mock
+        from .models import RawTranscriptCache
+        from .gemini_client import get_gemini_client
+        from .precision_extractor import stream_gemini_tasks_for_cache
+        
+        client = get_gemini_client()
+        self.assertTrue(client.model_url('gemini-2.5-flash-lite').endswith('/models/gemini-2.5-flash-lite:generateContent'))
+        
+        cache_item = RawTranscriptCache.objects.create(
+            fireflies_id='ff-route',
+            raw_fireflies_data={'title': 'Sync', 'sentences': [{'speaker_name': 'Alice', 'text': 'Quick one', 'start_time': 1}]},
+            meeting_date=timezone.now(),
+            meeting_title='Sync'
+        )
+        fake_client = mock.Mock()
+        fake_client.stream_generate_content.return_value = iter(['[{"task_item": "Send the weekly metrics summary to the team"}]'])
+        
+        with mock.patch('apps.core.precision_extractor.get_gemini_client', return_value=fake_client):
+            tasks = list(stream_gemini_tasks_for_cache(cache_item))
+        
+        self.assertEqual(fake_client.stream_generate_content.call_args[0][1], 'gemini-2.5-flash-lite')
+        self.assertEqual(tasks[0].gemini_model_version, 'gemini-2.5-flash-lite')
+        self.assertEqual(tasks[0].raw_gemini_response['routing_reason'], 'short_meeting')
+
+
+class TaskDedupeTests(TestCase):
+    """Test MinHash/LSH near-duplicate detection at task creation"""
+    
+    def setUp(self):
+        from .models import RawTranscriptCache
+        from .task_dedupe import get_task_dedupe_index
+        
+        get_task_dedupe_index().clear()
+        self.weeks = [
+            RawTranscriptCache.objects.create(
+                fireflies_id=f'ff-weekly-{week}',
+                raw_fireflies_data={'title': 'Weekly sync', 'sentences': []},
+                meeting_date=timezone.now(),
+                meeting_title='Weekly sync'
+            )
+            for week in range(2)
+        ]
+    
+    def test_recurring_follow_up_is_flagged(self):
+        """Test a near-identical task for the same assignee points at the open original"""
+        from .models import GeminiProcessedTask
+        
+        original = GeminiProcessedTask.objects.create(
+            raw_transcript=self.weeks[0],
+            task_item='Follow up with the Acme legal team about the renewal contract redlines',
+            assignee_emails='bob@example.com'
+        )
+        repeat = GeminiProcessedTask.objects.create(
+            raw_transcript=self.weeks[1],
+            task_item='Follow up with the Acme legal team about the renewal contract redlines.',
+            assignee_emails='bob@example.com'
+        )
+        other_person = GeminiProcessedTask.objects.create(
+            raw_transcript=self.weeks[1],
+            task_item='Follow up with the Acme legal team about the renewal contract redlines',
+            assignee_emails='carol@example.com'
+        )
+        
+        self.assertEqual(repeat.duplicate_of_id, original.id)
+        self.assertGreaterEqual(repeat.duplicate_similarity, 0.7)
+        self.assertEqual(repeat.approval_status, 'pending')
+        self.assertIsNone(other_person.duplicate_of_id)
+    
+    def test_task_saved_by_another_process_is_matched(self):
+        """Test a task this process never indexed is found through the watermark refresh"""
+        from .models import GeminiProcessedTask
+        from .task_dedupe import get_task_dedupe_index
+        
+        get_task_dedupe_index().ensure_loaded()
+        # bulk_create skips the signals, like a save made in another worker
+        elsewhere, = GeminiProcessedTask.objects.bulk_create([GeminiProcessedTask(
+            raw_transcript=self.weeks[0],
+            task_item='Send the signed statement of work to the Globex procurement team',
+            assignee_emails='dana@example.com'
+        )])
+        
+        repeat = GeminiProcessedTask.objects.create(
+            raw_transcript=self.weeks[1],
+            task_item='Send the signed statement of work to the Globex procurement team',
+            assignee_emails='dana@example.com'
+        )
+        
+        self.assertEqual(repeat.duplicate_of_id, elsewhere.id)
+    
+    def test_merge_mode_rejects_duplicate_and_ignores_closed_tasks(self):
+        """Test merge mode auto-rejects duplicates and Done tasks are not matched"""
+        from .models import GeminiProcessedTask
+        from .task_dedupe import get_task_dedupe_index
+        
+        index = get_task_dedupe_index()
+        original_mode, index.mode = index.mode, 'merge'
+        self.addCleanup(setattr, index, 'mode', original_mode)
+        
+        done = GeminiProcessedTask.objects.create(
+            raw_transcript=self.weeks[0],
+            task_item='Publish the quarterly security review summary to the wiki',
+            status='Done'
+        )
+        first = GeminiProcessedTask.objects.create(
+            raw_transcript=self.weeks[1],
+            task_item='Publish the quarterly security review summary to the wiki'
+        )
+        second = GeminiProcessedTask.objects.create(
+            raw_transcript=self.weeks[1],
+            task_item='Publish the quarterly security review summary to the wiki',
+            due_date_ms=1750000000000
+        )
+        
+        self.assertIsNone(first.duplicate_of_id)
+        self.assertNotEqual(first.duplicate_of_id, done.id)
+        self.assertEqual(second.duplicate_of_id, first.id)
+        self.assertEqual(second.approval_status, 'rejected')
+        first.refresh_from_db()
+        self.assertEqual(first.due_date_ms, 1750000000000)
+
+
+class FakeGeminiTests(TestCase):
+    """Test the deterministic local Gemini stand-in"""
+    
+    ACTION_ITEMS = '\n**Alice Smith**\nSend the signed contract to the legal team for final review (03:12)\n\n**Bob Jones**\nBook the venue for the quarterly planning offsite next month (10:45)\n'
+    
+    def test_client_extracts_tasks_derived_from_action_items(self):
+        """Test generateContent and streaming return schema-valid tasks with resolved emails"""
+        from .gemini_client import get_gemini_client
+        from .fake_gemini import install_fake_gemini
+        
+        client = get_gemini_client()
+        install_fake_gemini(client, {'LATENCY_MS': 0})
+        transcript = {
+            'title': 'Planning', 'organizer_email': 'alice@example.com',
+            'meeting_attendees': [{'displayName': None, 'email': 'alice@example.com'}, {'displayName': None, 'email': 'bob@example.com'}],
+            'summary': {'action_items': self.ACTION_ITEMS, 'overview': 'Planning sync'},
+            'sentences': [{'speaker_name': 'Alice', 'text': 'Let us plan the offsite'}],
+        }
+        
+        tasks = client.extract_tasks_from_transcript(transcript)
+        
+        self.assertEqual([task['assignee_emails'] for task in tasks], ['alice@example.com', 'bob@example.com'])
+        self.assertEqual(tasks[0]['task_item'], 'Send the signed contract to the legal team for final review')
+        self.assertEqual(list(tasks[0].keys())[0], 'task_item')
+        self.assertEqual(tasks[1]['status'], 'To Do')
+        
+        client.last_request_time = 0
+        streamed = ''.join(client.stream_generate_content('Explicit Action Items:\n' + self.ACTION_ITEMS))
+        self.assertEqual(len(json.loads(streamed)), 2)
+    
+    def test_fault_injection_is_reproducible(self):
+        """Test 429s and malformed output are injected identically for the same seed"""
+        import requests
+        from .fake_gemini import FakeGeminiAdapter, GEMINI_HOST
+        
+        url = f"{GEMINI_HOST}v1beta/models/fake:generateContent"
+        payload = {'contents': [{'parts': [{'text': 'Explicit Action Items:\n' + self.ACTION_ITEMS}]}]}
+        
+        def run(config):
+            session = requests.Session()
+            session.mount(GEMINI_HOST, FakeGeminiAdapter(config))
+            return [session.post(url, json=payload) for _ in range(3)]
+        
+        throttled = run({'RATE_LIMIT_RATE': 1.0})
+        self.assertEqual({response.status_code for response in throttled}, {429})
+        
+        config = {'MALFORMED_RATE': 0.5, 'SEED': 7}
+        first = [response.json()['candidates'][0]['content']['parts'][0]['text'] for response in run(config)]
+        second = [response.json()['candidates'][0]['content']['parts'][0]['text'] for response in run(config)]
+        self.assertEqual(first, second)
+        for text in first:
+            self.assertTrue(text.startswith('[') or text.startswith('```json'))
+
+
+class ExtractionJobTests(TestCase):
+    """Test checkpointed, leased extraction jobs"""
+    
+    def setUp(self):
+        from .models import RawTranscriptCache
+        
+        self.cache_item = RawTranscriptCache.objects.create(
+            fireflies_id='ff-job',
+            raw_fireflies_data={'title': 'Sync', 'sentences': [{'speaker_name': 'Alice', 'text': 'I will send the report', 'start_time': 1}]},
+            meeting_date=timezone.now(),
+            meeting_title='Sync'
+        )
+    
+    def make_extractor(self, tasks):
+        from unittest import mock
+        from .model_router import ModelRouter
+        
+        extractor = mock.Mock()
+        extractor.prepare_prompt.return_value = (self.cache_item.raw_fireflies_data, 'prompt')
+        extractor.model_router = ModelRouter({'ENABLED': False, 'FULL_MODEL': 'full'})
+        extractor._should_chunk.return_value = False
+        extractor._run_prompt_with_status.return_value = (tasks, '[]', True)
+        extractor._find_source_sentences.return_value = []
+        return extractor
+    
+    def test_job_commits_tasks_and_is_not_requeued(self):
+        """Test a claimed job saves its tasks, finishes, and enqueue skips the meeting afterwards"""
+        from .models import ExtractionJob, GeminiProcessedTask
+        from .extraction_jobs import ExtractionJobRunner, enqueue_extraction_jobs, extraction_job_summary
+        
+        self.assertEqual(enqueue_extraction_jobs()['created'], 1)
+        runner = ExtractionJobRunner(workers=1, config={'LEASE_SECONDS': 60})
+        job = runner.claim_next('worker-a')
+        self.assertEqual((job.status, job.attempts), ('running', 1))
+        self.assertIsNone(runner.claim_next('worker-b'))
+        
+        extractor = self.make_extractor([{'task_item': 'Send the quarterly report to the finance team'}])
+        self.assertEqual(runner.process_job(job, 'worker-a', extractor), 1)
+        
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.tasks_created, job.lease_owner), ('done', 1, ''))
+        self.assertEqual(set(job.stage_seconds), {'prepare', 'extract', 'save'})
+        self.assertEqual(GeminiProcessedTask.objects.filter(raw_transcript=self.cache_item).count(), 1)
+        self.assertEqual(enqueue_extraction_jobs()['created'], 0)
+        self.assertEqual(extraction_job_summary()['done'], 1)
+    
+    def test_truncated_output_is_not_saved_or_marked_done(self):
+        """Test a job whose output was cut off saves nothing and leaves the meeting unmarked"""
+        from .models import ExtractionJob, GeminiProcessedTask
+        from .extraction_jobs import ExtractionJobRunner, enqueue_extraction_jobs
+        
+        enqueue_extraction_jobs()
+        runner = ExtractionJobRunner(workers=1, config={'LEASE_SECONDS': 60})
+        job = runner.claim_next('worker-a')
+        extractor = self.make_extractor([{'task_item': 'Send the quarterly report to the finance team'}])
+        extractor._run_prompt_with_status.return_value = (extractor._run_prompt_with_status.return_value[0], '[', False)
+        
+        with self.assertRaisesMessage(RuntimeError, 'Truncated AI output'):
+            runner.process_job(job, 'worker-a', extractor)
+        
+        job.refresh_from_db()
+        self.cache_item.refresh_from_db()
+        self.assertEqual(job.status, 'running')
+        self.assertFalse(self.cache_item.processed)
+        self.assertFalse(GeminiProcessedTask.objects.filter(raw_transcript=self.cache_item).exists())
+    
+    def test_expired_lease_is_reclaimed_and_stale_worker_cannot_commit(self):
+        """Test crash recovery: an expired lease moves to another worker and the old one is fenced off"""
+        from datetime import timedelta
+        from .models import ExtractionJob, GeminiProcessedTask
+        from .extraction_jobs import ExtractionJobRunner, LeaseLostError, enqueue_extraction_jobs
+        
+        enqueue_extraction_jobs(max_attempts=2)
+        runner = ExtractionJobRunner(workers=1, config={'LEASE_SECONDS': 60})
+        stale_job = runner.claim_next('worker-a')
+        ExtractionJob.objects.filter(id=stale_job.id).update(lease_expires_at=timezone.now() - timedelta(seconds=1))
+        
+        job = runner.claim_next('worker-b')
+        self.assertEqual((job.lease_owner, job.attempts), ('worker-b', 2))
+        
+        with self.assertRaises(LeaseLostError):
+            runner.process_job(stale_job, 'worker-a', self.make_extractor([{'task_item': 'Stale task'}]))
+        self.assertFalse(GeminiProcessedTask.objects.exists())
+        
+        ExtractionJob.objects.filter(id=job.id).update(lease_expires_at=timezone.now() - timedelta(seconds=1))
+        self.assertIsNone(runner.claim_next('worker-c'))
+        self.assertEqual(ExtractionJob.objects.get(id=job.id).status, 'failed')
+
+
+class SpeakerAnalyticsTests(TestCase):
+    """Test vectorized speaker analytics computed at ingestion"""
+    
+    SENTENCES = [
+        {'speaker_id': 0, 'speaker_name': 'Alice', 'text': 'Let us start with the roadmap', 'start_time': 0.0, 'end_time': 3.0},
+        {'speaker_id': 0, 'speaker_name': 'Alice', 'text': 'Two items today', 'start_time': 3.0, 'end_time': 5.0},
+        {'speaker_id': 1, 'speaker_name': 'Bob', 'text': 'Sounds good', 'start_time': 10.0, 'end_time': 11.0},
+        {'speaker_id': 0, 'speaker_name': 'Alice', 'text': 'First the launch', 'start_time': 11.5, 'end_time': 13.5},
+    ]
+    
+    def test_metrics_per_speaker_and_silence(self):
+        """Test talk time, turns, WPM and silence gaps"""
+        from .speaker_analytics import compute_speaker_analytics, speaker_rows
+        
+        summary = compute_speaker_analytics(self.SENTENCES)
+        rows = {row['name']: row for row in speaker_rows(summary)}
+        
+        self.assertEqual(rows['Alice']['talk_seconds'], 7.0)
+        self.assertEqual(rows['Alice']['turns'], 2)
+        self.assertEqual(rows['Bob']['turns'], 1)
+        self.assertEqual(rows['Alice']['words'], 12)
+        self.assertEqual(rows['Bob']['words_per_minute'], 120.0)
+        self.assertEqual(summary['silence'], {'total_seconds': 5.0, 'gaps': 1, 'longest_seconds': 5.0, 'median_seconds': 5.0})
+        self.assertEqual(summary['meeting']['duration_seconds'], 13.5)
+    
+    def test_summary_stored_at_ingestion_and_aggregated(self):
+        """Test saving a cache item stores the summary and meeting load reads it"""
+        from .models import RawTranscriptCache
+        from .speaker_analytics import meeting_load_by_person
+        
+        for index in range(2):
+            RawTranscriptCache.objects.create(
+                fireflies_id=f'ff-analytics-{index}',
+                raw_fireflies_data={'title': 'Sync', 'sentences': self.SENTENCES},
+                meeting_date=timezone.now(),
+                meeting_title='Sync'
+            )
+        
+        cache_item = RawTranscriptCache.objects.get(fireflies_id='ff-analytics-0')
+        self.assertEqual(cache_item.speaker_analytics['source_hash'], cache_item.data_hash)
+        
+        load = {person['name']: person for person in meeting_load_by_person()}
+        self.assertEqual(load['Alice']['meetings'], 2)
+        self.assertEqual(load['Alice']['talk_seconds'], 14.0)
+        self.assertEqual(load['Bob']['turns'], 2)
+
+
+class PeopleDirectoryTests(TestCase):
+    """Test the attendee-built people directory and fuzzy name resolution"""
+    
+    def setUp(self):
+        from .models import RawTranscriptCache
+        from .people_directory import get_people_directory
+        
+        get_people_directory().clear()
+        RawTranscriptCache.objects.create(
+            fireflies_id='ff-people',
+            raw_fireflies_data={
+                'title': 'Sync',
+                'meeting_attendees': [
+                    {'displayName': None, 'email': 'Joe@coophive.network'},
+                    {'displayName': 'Andrew Hemingway', 'email': 'andrew@coophive.network'},
+                ],
+                'sentences': [{'speaker_name': 'Joe Maina', 'text': 'Morning', 'start_time': 1}],
+            },
+            meeting_date=timezone.now(),
+            meeting_title='Sync'
+        )
+    
+    def test_directory_built_from_attendees_and_speakers(self):
+        """Test attendees become people and a matching speaker name becomes an alias"""
+        from .models import Person
+        from .people_directory import get_people_directory
+        
+        joe = Person.objects.get(email='joe@coophive.network')
+        self.assertEqual(joe.display_name, 'Joe Maina')
+        self.assertIn('Joe Maina', joe.aliases)
+        self.assertEqual(joe.meeting_count, 1)
+        
+        directory = get_people_directory()
+        self.assertEqual(directory.resolve('joe maina'), 'joe@coophive.network')
+        self.assertEqual(directory.resolve('Andrw Hemingway'), 'andrew@coophive.network')
+        self.assertIsNone(directory.resolve('Levy'))
+    
+    def test_extracted_task_emails_are_resolved(self):
+        """Test unknown or missing assignee emails are filled in from the directory"""
+        from .models import RawTranscriptCache
+        from .precision_extractor import create_gemini_processed_task
+        
+        task = create_gemini_processed_task(
+            RawTranscriptCache.objects.get(fireflies_id='ff-people'),
+            {
+                'task_item': 'Share the onboarding checklist with the new contractors',
+                'assignee_emails': 'joe.maina@gmail.com',
+                'assignee(s)_full_names': 'Joe Maina, Andrew Hemingway',
+            },
+            0
+        )
+        self.assertEqual(task.assignee_emails, 'joe@coophive.network, andrew@coophive.network')
+
+
+class MondayBatchDeliveryTests(TestCase):
+    """Test aliased multi-item create_item mutations"""
+    
+    def _client(self, response_payload):
+        from unittest import mock
+        from .monday_client import EnhancedMondayClient
+        
+        client = EnhancedMondayClient('test-key', '123', 'group_a')
+        client.min_request_interval = 0
+        client.board_schema_enabled = False  # Static column map; schema encoding is tested separately
+        response = mock.Mock(status_code=200)
+        response.json.return_value = response_payload
+        client.session.post = mock.Mock(return_value=response)
+        return client
+    
+    def test_batch_mutation_aliases_each_task(self):
+        """Test one document carries an aliased create_item per task"""
+        client = self._client({})
+        mutation, variables = client.build_create_items_mutation([
+            {'task_item': 'First task', 'priority': 'High'},
+            {'task_item': 'Second task', 'status': 'Stuck'},
+        ])
+        
+        self.assertIn('t0: create_item(', mutation)
+        self.assertIn('t1: create_item(', mutation)
+        self.assertEqual(variables['name1'], 'Second task')
+        self.assertEqual(json.loads(variables['values0']), {'status_1': 'High', 'status': 'To Do'})
+    
+    def test_per_alias_results_and_errors(self):
+        """Test a field error fails only its own task"""
+        client = self._client({
+            'data': {'t0': {'id': '501', 'name': 'A'}, 't1': None, 't2': {'id': '503', 'name': 'C'}},
+            'errors': [{'message': 'Column value invalid', 'path': ['t1']}],
+        })
+        
+        results = client.create_items_batch([{'task_item': name} for name in 'ABC'])
+        
+        self.assertEqual(client.session.post.call_count, 1)
+        self.assertEqual([r['item_id'] for r in results], ['501', None, '503'])
+        self.assertEqual(results[1]['error'], 'Column value invalid')
+
+
+class MondayComplexityBudgetTests(TestCase):
+    """Test complexity-budget pacing for Monday.com calls"""
+    
+    def test_complexity_requested_and_recorded(self):
+        """Test every query asks for its complexity and the response updates the shared budget"""
+        from unittest import mock
+        from .models import MondayComplexityBudget
+        from .monday_client import EnhancedMondayClient
+        
+        client = EnhancedMondayClient('test-key', '123', 'group_a')
+        response = mock.Mock(status_code=200)
+        response.json.return_value = {'data': {
+            'boards': [],
+            'complexity': {'query': 1200, 'before': 10000000, 'after': 9998800, 'reset_in_x_seconds': 40},
+        }}
+        client.session.post = mock.Mock(return_value=response)
+        
+        query = 'query { boards(ids: [123]) { id } }'
+        self.assertEqual(client._execute_query_with_retry(query), {'boards': []})
+        sent = client.session.post.call_args.kwargs['json']['query']
+        self.assertIn('complexity { query before after reset_in_x_seconds }', sent)
+        
+        budget = MondayComplexityBudget.objects.get()
+        self.assertEqual(budget.budget_remaining, 9998800)
+        self.assertEqual(client.complexity_limiter.estimate(sent), 1200)
+    
+    def test_cheap_queries_pass_and_expensive_ones_wait(self):
+        """Test the budget is drawn down per query and exhausted budgets wait for the reset"""
+        from .monday_rate_limiter import ComplexityRateLimiter
+        
+        limiter = ComplexityRateLimiter('test-key', {'ENABLED': True})
+        limiter.record('q', {'query': 100, 'after': 500, 'reset_in_x_seconds': 30})
+        
+        self.assertEqual(limiter.reserve(400), 0.0)
+        self.assertGreater(limiter.reserve(400), 0.0)
+        self.assertEqual(limiter.status()['budget_remaining'], 100)
+
+
+class IdempotentDeliveryTests(TestCase):
+    """Test delivery keys and the ledger make Monday.com retries safe"""
+    
+    def setUp(self):
+        from unittest import mock
+        
+        self.task, = create_meeting_tasks(
+            'ff-delivery', 'Planning', ['Send the signed vendor agreement to finance for processing']
+        )
+        self.client = mock.Mock(board_id='123', delivery_key_column='text_delivery_key')
+    
+    def test_timed_out_create_is_found_not_recreated(self):
+        """Test a retry after an unknown outcome looks the key up instead of creating again"""
+        from .models import MondayDelivery
+        from .monday_delivery import IdempotentDelivery, delivery_key
+        
+        key = delivery_key(self.task)
+        self.client.create_items_batch.return_value = [{'item_id': None, 'error': 'Read timed out', 'outcome_unknown': True}]
+        first = IdempotentDelivery(self.client).deliver([(self.task, self.task.to_prompt_format())])
+        self.assertIsNone(first[0]['item_id'])
+        self.assertEqual(self.client.create_items_batch.call_args.args[0][0]['delivery_key'], key)
+        
+        self.client.find_items_by_delivery_keys.return_value = {key: '777'}
+        second = IdempotentDelivery(self.client).deliver([(self.task, self.task.to_prompt_format())])
+        self.assertEqual(second[0]['item_id'], '777')
+        self.assertTrue(second[0]['reused'])
+        self.assertEqual(self.client.create_items_batch.call_count, 1)
+        
+        third = IdempotentDelivery(self.client).deliver([(self.task, self.task.to_prompt_format())])
+        self.assertEqual(third[0]['item_id'], '777')
+        self.assertEqual(self.client.find_items_by_delivery_keys.call_count, 1)
+        self.assertEqual(MondayDelivery.objects.get(delivery_key=key).status, 'created')
+    
+    def test_leased_delivery_is_skipped(self):
+        """Test a task being sent by another worker is not sent again"""
+        from datetime import timedelta
+        from .models import MondayDelivery
+        from .monday_delivery import IdempotentDelivery, delivery_key
+        
+        MondayDelivery.objects.create(
+            delivery_key=delivery_key(self.task),
+            task_type='core.geminiprocessedtask',
+            task_id=str(self.task.pk),
+            attempts=1,
+            lease_owner='other-worker',
+            lease_expires_at=timezone.now() + timedelta(minutes=5)
+        )
+        
+        result = IdempotentDelivery(self.client).deliver([(self.task, self.task.to_prompt_format())])
+        self.assertTrue(result[0]['in_progress'])
+        self.client.create_items_batch.assert_not_called()
+    
+    def test_unknown_outcome_is_held_back_without_key_column(self):
+        """Test a retry is not sent blind when the board has no delivery key column"""
+        from .monday_delivery import IdempotentDelivery
+        
+        self.client.delivery_key_column = ''
+        self.client.create_items_batch.return_value = [{'item_id': None, 'error': 'Read timed out', 'outcome_unknown': True}]
+        IdempotentDelivery(self.client).deliver([(self.task, self.task.to_prompt_format())])
+        
+        retry = IdempotentDelivery(self.client).deliver([(self.task, self.task.to_prompt_format())])
+        
+        self.assertIsNone(retry[0]['item_id'])
+        self.assertIn('MONDAY_DELIVERY_KEY_COLUMN', retry[0]['error'])
+        self.assertEqual(self.client.create_items_batch.call_count, 1)
+        self.client.find_items_by_delivery_keys.assert_not_called()
+    
+    def test_rejected_create_is_resent_without_key_column(self):
+        """Test an attempt Monday.com certainly rejected is retried and delivered under the default config"""
+        from .models import MondayDelivery
+        from .monday_delivery import IdempotentDelivery, delivery_key
+        
+        self.client.delivery_key_column = ''
+        self.client.create_items_batch.side_effect = [
+            [{'item_id': None, 'error': 'Monday.com rate limit exceeded', 'outcome_unknown': False}],
+            [{'item_id': '555', 'error': None}],
+        ]
+        IdempotentDelivery(self.client).deliver([(self.task, self.task.to_prompt_format())])
+        
+        retry = IdempotentDelivery(self.client).deliver([(self.task, self.task.to_prompt_format())])
+        
+        self.assertEqual(retry[0]['item_id'], '555')
+        self.assertEqual(self.client.create_items_batch.call_count, 2)
+        self.client.find_items_by_delivery_keys.assert_not_called()
+        self.assertEqual(MondayDelivery.objects.get(delivery_key=delivery_key(self.task)).status, 'created')
+    
+    def test_only_unsent_failures_are_known_rejections(self):
+        """Test timeouts after sending count as unknown outcomes and rate limits do not"""
+        import requests
+        from .monday_client import MondayRateLimitError, may_have_reached_monday
+        
+        self.assertTrue(may_have_reached_monday(requests.exceptions.ReadTimeout()))
+        self.assertTrue(may_have_reached_monday(requests.exceptions.ConnectionError()))
+        self.assertFalse(may_have_reached_monday(requests.exceptions.ConnectTimeout()))
+        self.assertFalse(may_have_reached_monday(MondayRateLimitError('rate limited')))
+        self.assertFalse(may_have_reached_monday(ValueError('Field error')))
+
+
+class MondayOutboxTests(TestCase):
+    """Test the transactional outbox and its background drainer"""
+    
+    def setUp(self):
+        self.tasks = create_meeting_tasks(
+            'ff-outbox', 'Review', [f'Prepare the migration runbook for service number {index}' for index in range(2)]
+        )
+    
+    def _drainer(self, results):
+        from unittest import mock
+        from .monday_outbox import OutboxDrainer
+        
+        precision_client = mock.Mock()
+        precision_client.delivery.deliver.return_value = results
+        return OutboxDrainer(config={'MAX_ATTEMPTS': 2, 'RETRY_BASE_SECONDS': 0}, precision_client=precision_client)
+    
+    def test_enqueue_is_deduplicated_and_drained(self):
+        """Test re-queueing an open task is a no-op and the drainer marks tasks delivered"""
+        from .models import MondayOutbox
+        from .monday_outbox import enqueue_delivery
+        
+        enqueue_delivery(self.tasks, source='approval')
+        enqueue_delivery(self.tasks, source='push_now')
+        self.assertEqual(MondayOutbox.objects.filter(status='queued').count(), 2)
+        
+        drainer = self._drainer([
+            {'item_id': '901', 'error': None, 'in_progress': False},
+            {'item_id': None, 'error': 'Column value invalid', 'in_progress': False},
+        ])
+        self.assertEqual(drainer.drain_once(), 2)
+        
+        self.tasks[0].refresh_from_db()
+        self.assertTrue(self.tasks[0].delivered_to_monday)
+        self.assertEqual(self.tasks[0].monday_item_id, '901')
+        failed = MondayOutbox.objects.get(task_id=str(self.tasks[1].pk))
+        self.assertEqual((failed.status, failed.attempts, failed.last_error), ('queued', 1, 'Column value invalid'))
+    
+    def test_entry_fails_after_max_attempts(self):
+        """Test an entry that keeps failing ends as failed instead of retrying forever"""
+        from .models import MondayOutbox
+        from .monday_outbox import enqueue_delivery
+        
+        enqueue_delivery(self.tasks[:1], source='approval')
+        drainer = self._drainer([{'item_id': None, 'error': 'Board not found', 'in_progress': False}])
+        MondayOutbox.objects.update(max_attempts=2)
+        
+        drainer.run(once=True)
+        
+        entry = MondayOutbox.objects.get()
+        self.assertEqual((entry.status, entry.attempts), ('failed', 2))
+        self.assertEqual(drainer.delivery.deliver.call_count, 2)
+    
+    def test_transient_failure_is_delivered_on_retry(self):
+        """Test a rejected create backs off, is re-sent and delivered, with no delivery key column"""
+        from unittest import mock
+        from .fake_monday import FakeMondayAdapter, install_fake_monday
+        from .models import MondayDelivery, MondayOutbox
+        from .monday_client import EnhancedMondayClient
+        from .monday_delivery import IdempotentDelivery
+        from .monday_outbox import OutboxDrainer, enqueue_delivery, retry_failed_deliveries
+        from .monday_schema import get_board_schema_cache
+        
+        cache.clear()
+        get_board_schema_cache().clear()
+        client = EnhancedMondayClient('fake-test-key', '123', 'group_mkqyryrz')
+        adapter = install_fake_monday(client, FakeMondayAdapter({'LATENCY_MS': 0, 'ITEM_ERROR_RATE': 1.0}))
+        client.delivery_key_column = ''
+        drainer = OutboxDrainer(
+            config={'RETRY_BASE_SECONDS': 0},
+            precision_client=mock.Mock(delivery=IdempotentDelivery(client))
+        )
+        
+        enqueue_delivery(self.tasks[:1], source='approval')
+        drainer.run(once=True)
+        self.assertEqual(MondayOutbox.objects.get().status, 'failed')
+        
+        self.assertEqual(retry_failed_deliveries(), 1)
+        ledger = MondayDelivery.objects.get()
+        self.assertEqual((ledger.attempts, ledger.last_error, ledger.outcome_unknown), (0, '', False))
+        
+        adapter.item_error_rate = 0.0
+        drainer.run(once=True)
+        
+        entry = MondayOutbox.objects.get()
+        self.assertEqual(entry.status, 'sent')
+        self.assertEqual(list(adapter.items), [entry.monday_item_id])
+        self.tasks[0].refresh_from_db()
+        self.assertEqual(self.tasks[0].monday_item_id, entry.monday_item_id)
+
+
+class MondayBoardSchemaTests(TestCase):
+    """Test the cached board schema and compiled column serializer"""
+    
+    BOARD = {
+        'id': '123',
+        'name': 'Tasks',
+        'groups': [{'id': 'group_a', 'title': 'Inbox'}],
+        'columns': [
+            {'id': 'text_mkr7jgkp', 'title': 'Team member', 'type': 'text', 'settings_str': '{}'},
+            {'id': 'status_1', 'title': 'Priority', 'type': 'status',
+             'settings_str': '{"labels": {"0": "Medium", "1": "High", "2": "Low"}}'},
+            {'id': 'status', 'title': 'Status', 'type': 'status',
+             'settings_str': '{"labels": {"0": "Working on it", "1": "Done", "5": "To Do"}}'},
+            {'id': 'long_text', 'title': 'Description', 'type': 'long_text', 'settings_str': '{}'},
+            {'id': 'date_mkr7ymmh', 'title': 'Date expected', 'type': 'date', 'settings_str': '{}'},
+        ],
+    }
+    
+    def setUp(self):
+        from unittest import mock
+        from .monday_client import EnhancedMondayClient
+        from .monday_schema import get_board_schema_cache
+        
+        cache.clear()
+        get_board_schema_cache().clear()
+        self.client = EnhancedMondayClient('test-key', '123', 'group_a')
+        self.client.fetch_board = mock.Mock(return_value=self.BOARD)
+    
+    def test_schema_cached_and_values_encoded(self):
+        """Test the schema is fetched once and values are encoded with status label indices"""
+        values = self.client.build_column_values({
+            'assignee(s)_full_names': 'Ann Lee', 'priority': 'High', 'due_date': '2025-07-01',
+            'brief_description': 'Update the vendor list',
+        })
+        self.client.build_column_values({'priority': 'Low'})
+        
+        self.assertEqual(self.client.fetch_board.call_count, 1)
+        self.assertEqual(values, {
+            'text_mkr7jgkp': 'Ann Lee',
+            'status_1': {'index': 1},
+            'status': {'index': 5},
+            'long_text': {'text': 'Update the vendor list'},
+            'date_mkr7ymmh': {'date': '2025-07-01'},
+        })
+    
+    def test_drift_caught_before_batch_is_sent(self):
+        """Test a removed column fails the batch up front and a bad label only empties its column"""
+        from unittest import mock
+        
+        self.client.session.post = mock.Mock()
+        drifted = dict(self.BOARD, columns=[c for c in self.BOARD['columns'] if c['id'] != 'date_mkr7ymmh'])
+        self.client.fetch_board = mock.Mock(return_value=drifted)
+        
+        results = self.client.create_items_batch([{'task_item': 'A'}, {'task_item': 'B'}])
+        self.assertTrue(all('date_mkr7ymmh' in r['error'] for r in results))
+        self.client.session.post.assert_not_called()
+        
+        self.client.fetch_board = mock.Mock(return_value=self.BOARD)
+        from .monday_schema import get_board_schema_cache
+        get_board_schema_cache().invalidate('123')
+        values = self.client.build_column_values({'task_item': 'A', 'priority': 'Urgent', 'status': ''})
+        self.assertNotIn('status_1', values)
+        self.assertNotIn('status', values)
+        serializer = get_board_schema_cache().serializer(self.client)
+        self.assertIn("'Urgent' is not a label", serializer.validate({'priority': 'Urgent'}))
+        self.client.session.post.assert_not_called()
+
+
+class MondayStatusSyncTests(TestCase):
+    """Test the incremental Monday.com status pull"""
+    
+    def setUp(self):
+        self.task, = create_meeting_tasks(
+            'ff-sync', 'Standup', ['Renew the staging TLS certificates before they expire'],
+            monday_item_id='501', delivered_to_monday=True
+        )
+    
+    def _item(self, item_id, updated_at, status, priority='Medium'):
+        return {'id': item_id, 'updated_at': updated_at, 'column_values': [
+            {'id': 'status', 'text': status}, {'id': 'status_1', 'text': priority},
+        ]}
+    
+    def test_pages_followed_and_tasks_updated(self):
+        """Test cursor pages are followed and changed items update tasks by monday_item_id"""
+        from unittest import mock
+        from .models import MondaySyncState
+        from .monday_client import EnhancedMondayClient
+        from .monday_sync import MondayStatusSync
+        
+        client = EnhancedMondayClient('test-key', '123', 'group_a')
+        client._execute_query_with_retry = mock.Mock(side_effect=[
+            {'boards': [{'groups': [{'items_page': {
+                'cursor': 'page-2', 'items': [self._item('501', '2025-07-01T10:00:00Z', 'Working on it', 'High')],
+            }}]}]},
+            {'next_items_page': {'cursor': None, 'items': [self._item('999', '2025-07-01T11:00:00Z', 'Done')]}},
+        ])
+        
+        stats = MondayStatusSync(client).sync()
+        
+        self.assertEqual((stats['pages'], stats['items_seen'], stats['updated']), (2, 2, 1))
+        self.task.refresh_from_db()
+        self.assertEqual((self.task.status, self.task.priority), ('Working on it', 'High'))
+        self.assertEqual(MondaySyncState.objects.get().watermark.isoformat(), '2025-07-01T11:00:00+00:00')
+    
+    def test_sync_resumes_from_watermark(self):
+        """Test the next run asks only for items since the watermark and skips older ones"""
+        from datetime import timezone as dt_timezone
+        from unittest import mock
+        from .models import MondaySyncState
+        from .monday_sync import MondayStatusSync
+        
+        MondaySyncState.objects.create(
+            board_id='123', group_id='group_a', watermark=datetime(2025, 7, 1, 11, 0, tzinfo=dt_timezone.utc)
+        )
+        client = mock.Mock(board_id='123', group_id='group_a')
+        client.iter_items_updated_since.return_value = [[
+            self._item('501', '2025-07-01T09:00:00Z', 'Done'),
+            self._item('501', '2025-07-01T12:30:00Z', 'Stuck'),
+        ]]
+        
+        stats = MondayStatusSync(client).sync()
+        
+        self.assertEqual(client.iter_items_updated_since.call_args.args[0].hour, 11)
+        self.assertEqual(stats['changed_items'], 1)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.status, 'Stuck')
+
+
+class FakeMondayTests(TestCase):
+    """Test the local Monday.com stand-in used for delivery benchmarks"""
+    
+    def setUp(self):
+        from .models import RawTranscriptCache
+        from .monday_client import EnhancedMondayClient
+        from .monday_schema import get_board_schema_cache
+        
+        cache.clear()
+        get_board_schema_cache().clear()
+        self.cache_item = RawTranscriptCache.objects.create(
+            fireflies_id='ff-fake-monday',
+            raw_fireflies_data={'title': 'Planning', 'sentences': []},
+            meeting_date=timezone.now(),
+            meeting_title='Planning'
+        )
+        self.client = EnhancedMondayClient('fake-test-key', '123', 'group_mkqyryrz')
+    
+    def test_batch_created_with_schema_complexity_and_field_errors(self):
+        """Test aliased creates are validated against the fake board and charged complexity"""
+        import requests
+        from .fake_monday import FakeMondayAdapter, MONDAY_HOST, install_fake_monday
+        from .monday_rate_limiter import parse_reset_seconds
+        
+        adapter = install_fake_monday(self.client, FakeMondayAdapter({'LATENCY_MS': 0}))
+        results = self.client.create_items_batch([
+            {'task_item': f'Task {n}', 'assignee(s)_full_names': 'Ann Lee', 'priority': 'High', 'due_date': '2025-07-01'}
+            for n in range(3)
+        ])
+        
+        self.assertTrue(all(result['item_id'] for result in results))
+        self.assertEqual({item['column_values']['status_1'] for item in adapter.items.values()}, {'High'})
+        self.assertEqual(self.client.complexity_limiter.status()['last_query_cost'], 1000 + 3 * 30000)
+        
+        install_fake_monday(self.client, FakeMondayAdapter({'LATENCY_MS': 0, 'ITEM_ERROR_RATE': 1.0}))
+        results = self.client.create_items_batch([{'task_item': 'A'}, {'task_item': 'B'}])
+        self.assertEqual([result['error'] for result in results], ['Internal server error while creating item'] * 2)
+        
+        session = requests.Session()
+        session.mount(MONDAY_HOST, FakeMondayAdapter({'BUDGET_PER_MINUTE': 500}))
+        errors = session.post(self.client.base_url, json={'query': 'query { me { id } }'}).json()['errors']
+        self.assertEqual(parse_reset_seconds(errors[0]['message']), 60)
+    
+    def test_timed_out_batch_is_not_duplicated_on_retry(self):
+        """Test items created behind a timeout are found by delivery key instead of re-created"""
+        from .fake_monday import FakeMondayAdapter, DELIVERY_KEY_COLUMN, install_fake_monday
+        from .models import GeminiProcessedTask
+        from .monday_delivery import IdempotentDelivery
+        
+        adapter = install_fake_monday(self.client, FakeMondayAdapter({'LATENCY_MS': 0, 'TIMEOUT_RATE': 1.0}))
+        self.client.delivery_key_column = DELIVERY_KEY_COLUMN
+        tasks = [
+            GeminiProcessedTask.objects.create(raw_transcript=self.cache_item, task_item=f'Follow up on invoice {n}')
+            for n in range(2)
+        ]
+        pairs = [(task, task.to_prompt_format()) for task in tasks]
+        
+        first = IdempotentDelivery(self.client).deliver(pairs)
+        self.assertEqual([result['item_id'] for result in first], [None, None])
+        self.assertEqual(len(adapter.items), 2)
+        
+        adapter.timeout_rate = 0.0
+        second = IdempotentDelivery(self.client).deliver(pairs)
+        self.assertTrue(all(result['item_id'] and result['reused'] for result in second))
+        self.assertEqual(len(adapter.items), 2)
+        self.assertEqual(adapter.duplicate_deliveries(), 0)
+
+
+class MondayRoutingTests(TestCase):
+    """Test routing tasks to boards and draining each board in its own lane"""
+    
+    def setUp(self):
+        from .models import MondayRoute
+        from .monday_routing import get_monday_router
+        
+        MondayRoute.objects.create(name='Marketing owner', priority=10, assignee_pattern=r'@marketing\.', board_id='200', group_id='g_mkt')
+        MondayRoute.objects.create(name='Sales syncs', priority=20, meeting_pattern=r'^sales', board_id='300', group_id='g_sales')
+        MondayRoute.objects.create(name='Invalid', priority=5, meeting_pattern='(', board_id='400', group_id='g_bad')
+        get_monday_router().invalidate()
+        
+        def task(title, email):
+            return create_meeting_tasks(
+                f'ff-route-{title}-{email}', title, [f'Draft the follow-up summary for the {title} meeting'],
+                assignee_emails=email
+            )[0]
+        
+        self.tasks = [
+            task('Sales weekly', 'ann@marketing.example.com'),
+            task('Sales weekly', 'bob@example.com'),
+            task('Engineering standup', 'cy@example.com'),
+        ]
+    
+    def test_enqueue_routes_by_priority_with_default_fallback(self):
+        """Test the first matching route wins, bad patterns are skipped and unmatched tasks use the default board"""
+        from django.conf import settings
+        from .models import MondayOutbox
+        from .monday_outbox import enqueue_delivery, lane_summary
+        
+        enqueue_delivery(self.tasks, source='approval')
+        
+        targets = [
+            MondayOutbox.objects.values_list('board_id', 'group_id').get(task_id=str(task.pk)) for task in self.tasks
+        ]
+        default = (settings.EXTERNAL_APIS['MONDAY']['BOARD_ID'], settings.EXTERNAL_APIS['MONDAY']['GROUP_ID'])
+        self.assertEqual(targets, [('200', 'g_mkt'), ('300', 'g_sales'), default])
+        self.assertEqual(set(lane_summary()), {'200', '300', default[0]})
+    
+    def test_routing_loads_meetings_in_one_query(self):
+        """Test enqueueing fresh task rows reads their meetings once, not once per task"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from .models import GeminiProcessedTask
+        from .monday_outbox import enqueue_delivery
+        
+        tasks = list(GeminiProcessedTask.objects.filter(id__in=[task.pk for task in self.tasks]))
+        with CaptureQueriesContext(connection) as queries:
+            enqueue_delivery(tasks, source='approval')
+        
+        meeting_queries = [query for query in queries if 'core_raw_transcript_cache' in query['sql']]
+        self.assertEqual(len(meeting_queries), 1)
+    
+    def test_board_lane_only_claims_its_board(self):
+        """Test a lane delivers its own board's entries through that board's client"""
+        from unittest import mock
+        from .models import MondayOutbox
+        from .monday_outbox import OutboxDrainer, enqueue_delivery
+        
+        enqueue_delivery(self.tasks, source='approval')
+        lane_delivery = mock.Mock()
+        lane_delivery.deliver.return_value = [{'item_id': '701', 'error': None, 'in_progress': False}]
+        
+        with mock.patch('apps.core.monday_outbox.lane_client') as lane_client, \
+                mock.patch('apps.core.monday_delivery.IdempotentDelivery', return_value=lane_delivery):
+            drainer = OutboxDrainer(precision_client=mock.Mock(), board_id='300')
+            self.assertEqual(drainer.run(once=True), {'sent': 1})
+        
+        lane_client.assert_called_once_with('300', 'g_sales')
+        drainer.delivery.deliver.assert_not_called()
+        self.assertEqual(MondayOutbox.objects.get(board_id='300').status, 'sent')
+        self.assertEqual(MondayOutbox.objects.filter(status='queued').count(), 2)
+    
+    def test_slow_lane_does_not_hold_back_others(self):
+        """Test lanes run concurrently so a fast board finishes while a slow one is still sending"""
+        import time
+        from .monday_outbox import LaneScheduler, enqueue_delivery
+        
+        enqueue_delivery(self.tasks, source='approval')
+        finished = {}
+        
+        class FakeDrainer:
+            def __init__(self, board_id):
+                self.board_id, self.stats = board_id, {}
+            
+            def _lane_label(self):
+                return f" (board {self.board_id})"
+            
+            def run(self, once, max_batches):
+                time.sleep(0.3 if self.board_id == '300' else 0)
+                finished[self.board_id] = time.monotonic()
+                return {'sent': 1}
+        
+        scheduler = LaneScheduler(config={'MAX_LANES': 4, 'POLL_SECONDS': 0.05}, drainer_factory=FakeDrainer)
+        stats = scheduler.run(max_batches=1)
+        
+        self.assertEqual(stats, {'sent': 3})
+        self.assertLess(finished['200'], finished['300'])
+    
+    def test_lanes_share_the_token_budget(self):
+        """Test lane limiters each keep a row but together never draw more than the token has"""
+        from .monday_rate_limiter import ComplexityRateLimiter
+        
+        first = ComplexityRateLimiter('lane-key', {'ENABLED': True}, scope='200')
+        second = ComplexityRateLimiter('lane-key', {'ENABLED': True}, scope='300')
+        first.record('q', {'query': 100, 'after': 500, 'reset_in_x_seconds': 30})
+        second.record('q', {'query': 100, 'after': 500, 'reset_in_x_seconds': 30})
+        
+        self.assertEqual(first.reserve(400), 0.0)
+        self.assertGreater(second.reserve(400), 0.0)
+        self.assertEqual(second.status()['budget_remaining'], 500)
+    
+    def test_status_sync_covers_every_routed_board(self):
+        """Test status sync runs once per distinct routed board and group plus the default"""
+        from unittest import mock
+        from django.conf import settings
+        from django.core.management import call_command
+        from io import StringIO
+        
+        sync_stats = {'pages': 0, 'items_seen': 0, 'changed_items': 0, 'updated': 0, 'unknown_values': 0, 'watermark': None}
+        with mock.patch('apps.core.management.commands.sync_monday_status.lane_client') as lane_client, \
+                mock.patch('apps.core.management.commands.sync_monday_status.MondayStatusSync') as status_sync:
+            status_sync.return_value.sync.return_value = sync_stats
+            call_command('sync_monday_status', stdout=StringIO())
+        
+        default = (settings.EXTERNAL_APIS['MONDAY']['BOARD_ID'], settings.EXTERNAL_APIS['MONDAY']['GROUP_ID'])
+        self.assertEqual(
+            [call.args for call in lane_client.call_args_list],
+            [default, ('200', 'g_mkt'), ('300', 'g_sales')]
+        )
+
+
+class MondayPushJobTests(TestCase):
+    """Test admin bulk pushes run as tracked background jobs"""
+    
+    def setUp(self):
+        self.tasks = create_meeting_tasks(
+            'ff-push-job', 'Roadmap', [f'Publish the revised roadmap section number {index} to the wiki' for index in range(3)]
+        )
+    
+    def test_job_tracks_new_and_already_queued_entries(self):
+        """Test a job adopts open entries and reports counts, errors and completion"""
+        from .models import MondayOutbox
+        from .monday_outbox import enqueue_delivery, start_push_job, push_job_progress
+        
+        enqueue_delivery(self.tasks[:1], source='approval')
+        job = start_push_job(self.tasks, requested_by='ops')
+        self.assertEqual((job.total, MondayOutbox.objects.filter(job=job).count()), (3, 3))
+        
+        entries = list(MondayOutbox.objects.filter(job=job).order_by('created_at'))
+        MondayOutbox.objects.filter(id=entries[0].id).update(status='sent', monday_item_id='11', sent_at=timezone.now())
+        MondayOutbox.objects.filter(id=entries[1].id).update(status='queued', attempts=1, last_error='Rate limited')
+        
+        progress = push_job_progress(job)
+        self.assertEqual((progress['counts']['sent'], progress['done'], progress['finished']), (1, 1, False))
+        self.assertEqual(progress['errors'][0]['error'], 'Rate limited')
+        self.assertEqual(len(progress['tasks']), 3)
+        
+        MondayOutbox.objects.filter(job=job).exclude(status='sent').update(status='failed')
+        progress = push_job_progress(job)
+        self.assertEqual((progress['percent'], progress['finished']), (100.0, True))
+        job.refresh_from_db()
+        self.assertIsNotNone(job.finished_at)
+    
+    def test_admin_push_returns_job_and_progress_is_polled(self):
+        """Test the push action starts a job shown on the changelist and served to staff only"""
+        from django.contrib.auth import get_user_model
+        from django.urls import reverse
+        from .models import MondayPushJob
+        
+        url = reverse('admin:core_geminiprocessedtask_changelist')
+        admin_user = get_user_model().objects.create_superuser('pusher', 'pusher@example.com', 'secret-pass')
+        self.client.force_login(admin_user)
+        
+        self.client.post(url, {'action': 'push_to_monday_now', '_selected_action': [str(task.pk) for task in self.tasks]})
+        job = MondayPushJob.objects.get()
+        self.assertEqual((job.total, job.requested_by), (3, 'pusher'))
+        
+        progress_url = reverse('monday_push_job_progress', args=[job.id])
+        self.assertContains(self.client.get(url), progress_url)
+        response = self.client.get(progress_url)
+        self.assertEqual(response.json()['counts']['queued'], 3)
+        
+        self.client.logout()
+        self.assertEqual(self.client.get(progress_url).status_code, 403)
+    
+    def test_job_changelist_reads_annotated_counts(self):
+        """Test the job changelist shows progress from annotations and writes nothing"""
+        from django.contrib.auth import get_user_model
+        from django.urls import reverse
+        from .models import MondayOutbox, MondayPushJob
+        from .monday_outbox import start_push_job
+        
+        job = start_push_job(self.tasks, requested_by='ops')
+        MondayOutbox.objects.filter(job=job).update(status='sent')
+        self.client.force_login(get_user_model().objects.create_superuser('viewer', 'viewer@example.com', 'secret-pass'))
+        
+        response = self.client.get(reverse('admin:core_mondaypushjob_changelist'))
+        
+        self.assertContains(response, '100.0% - ✅ 3 sent')
+        self.assertContains(self.client.get(reverse('admin:core_mondaypushjob_change', args=[job.id])), '3 sent')
+        self.assertIsNone(MondayPushJob.objects.get(id=job.id).finished_at)
+
+
+class DeliveryRetrySchedulerTests(TestCase):
+    """Test failed deliveries are retried on a jittered backoff schedule"""
+    
+    def setUp(self):
+        from .models import Transcript, ProcessedTaskData
+        
+        transcript = Transcript.objects.create(fireflies_id='ff-retry', title='Ops review', meeting_date=timezone.now())
+        self.task = ProcessedTaskData.objects.create(
+            transcript=transcript,
+            task_item='Rotate the shared deploy credentials for the staging cluster',
+            assignee_emails='ops@example.com',
+            brief_description='Rotate credentials',
+            human_approved=True
+        )
+    
+    def test_backoff_grows_with_jitter_and_cap(self):
+        """Test delays double per attempt, stay in the jittered upper half and respect the ceiling"""
+        from .monday_outbox import backoff_delay
+        
+        config = {'RETRY_BASE_SECONDS': 10, 'RETRY_MAX_SECONDS': 60}
+        for attempt, ceiling in [(1, 10), (2, 20), (3, 40), (4, 60), (9, 60)]:
+            delays = [backoff_delay(attempt, config) for _ in range(50)]
+            self.assertTrue(all(ceiling / 2 <= delay <= ceiling for delay in delays))
+        self.assertGreater(len({round(backoff_delay(3, config), 3) for _ in range(20)}), 1)
+    
+    def test_failed_delivery_waits_until_due_then_dead_letters(self):
+        """Test a direct failure is scheduled, skipped until due, and dead-lettered after max attempts"""
+        from datetime import timedelta
+        from unittest import mock
+        from .models import MondayOutbox
+        from .monday_outbox import OutboxDrainer
+        from .precision_monday_client import PrecisionMondayClient
+        
+        precision_client = PrecisionMondayClient.__new__(PrecisionMondayClient)
+        precision_client.delivery = mock.Mock()
+        precision_client.delivery.deliver.return_value = [{'item_id': None, 'error': 'Board unavailable', 'in_progress': False}]
+        self.assertFalse(precision_client.deliver_processed_task(self.task))
+        
+        entry = MondayOutbox.objects.get()
+        self.assertEqual((entry.source, entry.attempts, entry.last_error), ('retry', 1, 'Board unavailable'))
+        self.assertGreater(entry.next_attempt_at, timezone.now())
+        
+        drainer = OutboxDrainer(precision_client=precision_client)
+        self.assertEqual(drainer.claim_batch(), [])
+        
+        MondayOutbox.objects.update(max_attempts=2, next_attempt_at=timezone.now() - timedelta(seconds=1))
+        self.assertEqual(drainer.drain_once(), 1)
+        entry.refresh_from_db()
+        self.assertEqual((entry.status, entry.attempts), ('failed', 2))
+        self.assertEqual(precision_client.delivery.deliver.call_count, 2)
+    
+    def test_bulk_failures_scheduled_once_and_permanent_errors_dead_lettered(self):
+        """Test a failed bulk delivery schedules retries in one pass and board-schema errors skip the backoff"""
+        from unittest import mock
+        from . import monday_outbox
+        from .models import MondayOutbox, ProcessedTaskData
+        from .precision_monday_client import PrecisionMondayClient
+        
+        second = ProcessedTaskData.objects.create(
+            transcript=self.task.transcript,
+            task_item='Archive the retired staging dashboards',
+            assignee_emails='ops@example.com',
+            brief_description='Archive dashboards',
+            human_approved=True
+        )
+        precision_client = PrecisionMondayClient.__new__(PrecisionMondayClient)
+        precision_client.delivery = mock.Mock()
+        precision_client.delivery.deliver.return_value = [
+            {'item_id': None, 'error': 'Read timed out', 'in_progress': False, 'permanent': False},
+            {'item_id': None, 'error': 'Board 123 is missing columns: status_1', 'in_progress': False, 'permanent': True},
+        ]
+        
+        with mock.patch.object(monday_outbox, 'schedule_retry', wraps=monday_outbox.schedule_retry) as schedule:
+            precision_client.bulk_deliver_tasks([self.task, second])
+        
+        schedule.assert_called_once()
+        statuses = dict(MondayOutbox.objects.values_list('task_id', 'status'))
+        self.assertEqual(statuses, {str(self.task.pk): 'queued', str(second.pk): 'failed'})
@@ -0,0 +1,136 @@
+"""
+Transcript Compaction
+Shrinks the transcript section of the Gemini prompt without changing the output schema:
+drops filler acknowledgements, merges same-speaker runs and rounds timestamps
+"""
+
+import logging
+import re
+from typing import List, Dict, Any, Optional, Tuple
+from django.conf import settings
+
+logger = logging.getLogger('apps.core.transcript_compaction')
+
+# Backchannel turns that never carry an action item on their own
+DEFAULT_ACKNOWLEDGEMENT_WORDS = {
+    'yeah', 'yep', 'yup', 'okay', 'ok', 'right', 'alright', 'mm', 'mhm', 'mmhmm',
+    'mm-hmm', 'uh-huh', 'hmm', 'uh', 'um', 'huh', 'oh', 'ah', 'cool', 'nice',
+    'got', 'it', 'i', 'see', 'exactly', 'gotcha',
+}
+
+WORD_PATTERN = re.compile(r"[\w'-]+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough Gemini token estimate (~4 characters per token)"""
+    return (len(text) + 3) // 4
+
+
+def estimate_prompt_budget(prompt: str, max_prompt_tokens: int) -> Dict[str, Any]:
+    """Estimate prompt tokens against a configured budget"""
+    estimated = estimate_tokens(prompt)
+    return {
+        'estimated_tokens': estimated,
+        'budget': max_prompt_tokens,
+        'within_budget': estimated <= max_prompt_tokens,
+        'budget_used_pct': round(estimated / max_prompt_tokens * 100, 1) if max_prompt_tokens else None,
+    }
+
+
+def _transcript_line(sentence: Dict[str, Any]) -> str:
+    """Same line format the N8N prompt uses for each sentence"""
+    return f"{sentence.get('speaker_name', 'Unknown')}: {sentence.get('text', '')} (t={sentence.get('start_time', 0)})"
+
+
+class TranscriptCompactor:
+    """Configurable compaction stage applied to sentences before prompt rendering"""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        if config is None:
+            config = settings.EXTERNAL_APIS['GEMINI'].get('TRANSCRIPT_COMPACTION', {})
+
+        self.enabled = config.get('ENABLED', False)
+        self.merge_speaker_runs = config.get('MERGE_SPEAKER_RUNS', True)
+        self.max_run_words = config.get('MAX_RUN_WORDS', 150)
+        self.drop_under_words = config.get('DROP_ACKNOWLEDGEMENTS_UNDER_WORDS', 3)
+        self.timestamp_decimals = config.get('TIMESTAMP_DECIMALS', 0)
+        self.acknowledgement_words = set(config.get('ACKNOWLEDGEMENT_WORDS', DEFAULT_ACKNOWLEDGEMENT_WORDS))
+
+    def compact(self, sentences: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Compact a sentence list
+
+        Returns (compacted_sentences, report). Input sentences are never mutated.
+        """
+        sentences = sentences or []
+        tokens_before = estimate_tokens('\n'.join(_transcript_line(s) for s in sentences))
+
+        if not self.enabled:
+            compacted = list(sentences)
+            dropped = 0
+        else:
+            kept = [s for s in sentences if not self._is_acknowledgement(s)]
+            dropped = len(sentences) - len(kept)
+            compacted = self._merge_runs(kept) if self.merge_speaker_runs else [dict(s) for s in kept]
+            for sentence in compacted:
+                sentence['start_time'] = self._round_time(sentence.get('start_time'))
+                if 'end_time' in sentence:
+                    sentence['end_time'] = self._round_time(sentence.get('end_time'))
+
+        tokens_after = estimate_tokens('\n'.join(_transcript_line(s) for s in compacted))
+        report = {
+            'enabled': self.enabled,
+            'sentences_before': len(sentences),
+            'sentences_after': len(compacted),
+            'acknowledgements_dropped': dropped,
+            'tokens_before': tokens_before,
+            'tokens_after': tokens_after,
+            'reduction_pct': round((1 - tokens_after / tokens_before) * 100, 1) if tokens_before else 0.0,
+        }
+        return compacted, report
+
+    def _is_acknowledgement(self, sentence: Dict[str, Any]) -> bool:
+        """Short turns made only of backchannel words"""
+        words = WORD_PATTERN.findall((sentence.get('text') or '').lower())
+        if not words:
+            return False
+        return len(words) < self.drop_under_words and all(w in self.acknowledgement_words for w in words)
+
+    def _merge_runs(self, sentences: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Merge consecutive sentences from the same speaker, capped at max_run_words"""
+        merged: List[Dict[str, Any]] = []
+        run_words = 0
+
+        for sentence in sentences:
+            text = sentence.get('text') or ''
+            words = len(text.split())
+            previous = merged[-1] if merged else None
+
+            if (
+                previous is not None
+                and previous.get('speaker_name') == sentence.get('speaker_name')
+                and run_words + words <= self.max_run_words
+            ):
+                previous['text'] = f"{previous.get('text', '')} {text}".strip()
+                if 'end_time' in sentence:
+                    previous['end_time'] = sentence['end_time']
+                run_words += words
+            else:
+                merged.append(dict(sentence))
+                run_words = words
+
+        return merged
+
+    def _round_time(self, value):
+        """Round a timestamp to the configured precision"""
+        if not isinstance(value, (int, float)):
+            return value
+        if self.timestamp_decimals <= 0:
+            return int(round(value))
+        return round(value, self.timestamp_decimals)
+
+
+def compact_transcript_data(fireflies_data: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Return a copy of fireflies_data with compacted sentences, plus the compaction report"""
+    compacted, report = TranscriptCompactor().compact(fireflies_data.get('sentences') or [])
+    return dict(fireflies_data, sentences=compacted), report
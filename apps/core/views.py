@@ -81,6 +81,10 @@ def system_stats(request):
             }
         }
         
+        # Gemini usage from the shared quota ledger
+        from .quota_ledger import get_quota_ledger
+        stats['gemini_quota'] = get_quota_ledger().summary()
+        
         # Add timestamp
         stats['generated_at'] = timezone.now().isoformat()
         
@@ -94,6 +98,27 @@ def system_stats(request):
         }, status=500)
 
 
+@require_GET
+def monday_push_job_progress(request, job_id):
+    """
+    Progress of an admin bulk push to Monday.com, polled by the task changelist
+    Staff only; returns per-task status, throughput and recent errors
+    """
+    if not (request.user.is_active and request.user.is_staff):
+        return JsonResponse({'error': 'Forbidden', 'message': 'Staff access required'}, status=403)
+    
+    from .models import MondayPushJob
+    from .monday_outbox import push_job_progress
+    
+    job = MondayPushJob.objects.filter(id=job_id).first()
+    if job is None:
+        return JsonResponse({'error': 'Not Found', 'message': 'No such push job'}, status=404)
+    
+    response = JsonResponse(push_job_progress(job))
+    response['Cache-Control'] = 'no-store'
+    return response
+
+
 # Error handlers
 def handler404(request, exception):
     """Custom 404 handler"""
@@ -316,6 +316,56 @@ EXTERNAL_APIS = {
         'RETRY_ATTEMPTS': 3,
         'BACKOFF_FACTOR': 2.0,
         'TIMEOUT': 60,
+        'CHUNKED_EXTRACTION': {
+            'ENABLED': True,
+            'MIN_SENTENCES': 600,      # Only chunk transcripts longer than this
+            'WINDOW_SENTENCES': 300,
+            'OVERLAP_SENTENCES': 30,
+            'MAX_WORKERS': 3,
+        },
+        'TRANSCRIPT_COMPACTION': {
+            'ENABLED': True,
+            'MERGE_SPEAKER_RUNS': True,
+            'MAX_RUN_WORDS': 150,                    # Cap merged runs to keep source attribution useful
+            'DROP_ACKNOWLEDGEMENTS_UNDER_WORDS': 3,  # "yeah", "okay", "got it"
+            'TIMESTAMP_DECIMALS': 0,
+            'MAX_PROMPT_TOKENS': 30000,              # Warn above this estimated prompt size
+        },
+        'BATCH_EXTRACTION': {
+            'MAX_MEETING_TOKENS': 4000,     # Only meetings below this are packed together
+            'MAX_BATCH_TOKENS': 24000,
+            'MAX_MEETINGS_PER_BATCH': 6,
+        },
+        'DELTA_EXTRACTION': {
+            'CONTEXT_SENTENCES': 20,        # Earlier sentences sent alongside each new span
+            'SIMILARITY_THRESHOLD': 0.8,    # New tasks this close to an existing one are skipped
+        },
+        'MODEL_ROUTING': {
+            'ENABLED': True,
+            'FULL_MODEL': 'gemini-2.5-flash',        # Long, multi-speaker transcripts
+            'LIGHT_MODEL': 'gemini-2.5-flash-lite',  # Short meetings and summary-only prompts
+            'LIGHT_MAX_PROMPT_TOKENS': 6000,
+            'LIGHT_MAX_SPEAKERS': 3,
+        },
+        'QUOTA': {
+            'REQUESTS_PER_DAY': 1000,
+            'TOKENS_PER_MINUTE': 1000000,
+            'RETENTION_DAYS': 7,            # Older ledger rows are pruned at day rollover
+        },
+        'OUTPUT_RECOVERY': {
+            'MAX_CONTINUATIONS': 1,         # Re-requests for the tail of a truncated task array
+        },
+        'FAKE_TRANSPORT': {
+            # Local deterministic stand-in for load tests - never enable in production
+            'ENABLED': config('GEMINI_FAKE_TRANSPORT', default=False, cast=bool),
+            'LATENCY_MS': 800,
+            'JITTER_MS': 400,
+            'RATE_LIMIT_RATE': 0.0,         # Fraction of requests answered with 429
+            'MALFORMED_RATE': 0.0,          # Fraction of responses truncated or fenced with trailing commas
+            'STREAM_CHUNK_CHARS': 200,
+            'STREAM_CHUNK_DELAY_MS': 50,
+            'SEED': 1,
+        },
     },
     'MONDAY': {
         'BASE_URL': 'https://api.monday.com/v2',
@@ -329,6 +379,47 @@ EXTERNAL_APIS = {
         'QUOTA_WARNING_THRESHOLD': 80,
         'BACKOFF_FACTOR': 2.0,
         'MAX_BACKOFF_TIME': 300,
+        'BATCH_DELIVERY': {
+            'MAX_ITEMS_PER_MUTATION': config('MONDAY_BATCH_SIZE', default=25, cast=int),
+            'CREATE_ITEM_COMPLEXITY': 30000,     # Estimated points per aliased create_item
+            'MAX_QUERY_COMPLEXITY': 5000000,     # Monday.com per-query complexity cap
+        },
+        # Required for safe retries: id of a hidden text column on every target board that
+        # stores each item's delivery key. Without it, a task whose earlier attempt has an
+        # unknown outcome (e.g. a timeout after the create) is held back, never re-sent blind.
+        'DELIVERY_KEY_COLUMN': config('MONDAY_DELIVERY_KEY_COLUMN', default=''),
+        'DELIVERY_LEASE_SECONDS': 300,
+        'BOARD_SCHEMA': {
+            'ENABLED': config('MONDAY_BOARD_SCHEMA_ENABLED', default=True, cast=bool),
+            'TTL_SECONDS': 3600,                 # Columns, status labels and groups are re-fetched after this
+        },
+        'STATUS_SYNC': {
+            'PAGE_SIZE': 100,                    # Items per items_page / next_items_page request
+        },
+        'ROUTING': {
+            'CACHE_SECONDS': 60,                 # MondayRoute rules are reloaded after this
+        },
+        'COMPLEXITY_BUDGET': {
+            'ENABLED': config('MONDAY_COMPLEXITY_BUDGET_ENABLED', default=True, cast=bool),
+            'BUDGET_PER_MINUTE': 10000000,       # Monday.com per-minute budget for API tokens
+            'DEFAULT_QUERY_COST': 1000,          # Assumed cost of a document not seen before
+            'MAX_WAIT_SECONDS': 60,
+        },
+        'FAKE_TRANSPORT': {
+            # Local in-memory board for delivery benchmarks - never enable in production
+            'ENABLED': config('MONDAY_FAKE_TRANSPORT', default=False, cast=bool),
+            'LATENCY_MS': 300,
+            'JITTER_MS': 100,
+            'PER_ITEM_MS': 20,                   # Extra latency per create_item in a mutation
+            'BUDGET_PER_MINUTE': 10000000,
+            'CREATE_ITEM_COMPLEXITY': 30000,
+            'QUERY_COMPLEXITY': 1000,
+            'ITEM_READ_COMPLEXITY': 10,
+            'RATE_LIMIT_RATE': 0.0,              # Fraction of requests answered with 429
+            'ITEM_ERROR_RATE': 0.0,              # Fraction of create_item aliases failing with a field error
+            'TIMEOUT_RATE': 0.0,                 # Fraction of mutations that create items but time out
+            'SEED': 1,
+        },
     },
 }
 
@@ -338,6 +429,33 @@ SYSTEM_CONFIG = {
     'CIRCUIT_BREAKER_FAILURE_THRESHOLD': 5,
     'CIRCUIT_BREAKER_TIMEOUT': 60,
     'HEALTH_CHECK_INTERVAL': 300,  # 5 minutes
+    'TASK_DEDUPE': {
+        'ENABLED': True,
+        'MODE': 'flag',      # 'flag' sets duplicate_of; 'merge' also auto-rejects the duplicate
+        'THRESHOLD': 0.7,    # Estimated Jaccard similarity of task_item shingles
+        'NUM_PERM': 64,
+        'BANDS': 16,
+        'REFRESH_OVERLAP_SECONDS': 60,  # Re-read tasks saved this close to the last refresh
+    },
+    'EXTRACTION_JOBS': {
+        'WORKERS': 3,
+        'LEASE_SECONDS': 900,   # A crashed worker's job is re-claimable after this
+        'MAX_ATTEMPTS': 3,
+    },
+    'PEOPLE_DIRECTORY': {
+        'ENABLED': True,
+        'FUZZY_THRESHOLD': 0.5,  # Trigram Jaccard similarity needed for a fuzzy name match
+        'MEMO_SIZE': 4096,       # Resolved names kept before the memo is reset
+    },
+    'MONDAY_OUTBOX': {
+        'BATCH_SIZE': 25,        # Entries claimed per drain cycle
+        'LEASE_SECONDS': 300,    # A crashed drainer's batch is re-claimed after this
+        'MAX_ATTEMPTS': 5,       # Attempts before an entry is dead-lettered as failed
+        'POLL_SECONDS': 5,       # Idle wait between polls of an empty outbox
+        'MAX_LANES': 4,          # Boards drained concurrently, one lane each
+        'RETRY_BASE_SECONDS': 30,    # First retry after 15-30s, doubling per failed attempt
+        'RETRY_MAX_SECONDS': 3600,   # Backoff ceiling
+    },
 }
 
 # Guardian Settings
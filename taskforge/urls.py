@@ -6,7 +6,7 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 from django.http import HttpResponse
-from apps.core.views import health_check, home, system_stats
+from apps.core.views import health_check, home, system_stats, monday_push_job_progress
 
 urlpatterns = [
     # Admin
@@ -17,6 +17,7 @@ urlpatterns = [
     path('health/', lambda r: HttpResponse("OK"), name='health'),  # Guaranteed 200 for Railway
     path('ready/', health_check, name='health_check'),  # Deeper health check
     path('stats/', system_stats, name='system_stats'),
+    path('api/monday/push-jobs/<uuid:job_id>/', monday_push_job_progress, name='monday_push_job_progress'),
 ]
 
 # Serve static and media files in development